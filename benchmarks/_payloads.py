@@ -0,0 +1,102 @@
+"""벤치마크용 키움 응답 페이로드.
+
+실제 응답을 저장한 JSON 파일이 있으면 ``load()``에 경로를 넘겨 그 파일로 잰다.
+없으면 키움 REST API 문서의 응답 예시와 같은 키·값 형식으로 만든 표본을 쓴다.
+값은 시드를 고정한 난수로 채워 실행마다 같다.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+# 0B(주식체결) 실시간 FID. 문서 예시에 나오는 필드 순서를 따른다.
+_0B_FIDS = (
+    "20", "10", "11", "12", "27", "28", "15", "13", "14", "16", "17", "18", "25", "26", "29",
+    "30", "31", "32", "228", "311", "290", "691", "567", "568", "851", "1890", "1891", "1892",
+    "1030", "1031", "1032", "1071", "1072", "1313", "1315", "1316", "1314", "1497", "1498",
+    "620", "732", "852", "9081",
+)
+
+
+def _signed(rng: random.Random, value: int) -> str:
+    return f"{rng.choice('+-')}{value}"
+
+
+def realtime_0b(items: list[str], *, entries: int = 1, seed: int = 0) -> dict[str, Any]:
+    """``trnm="REAL"`` 0B 메시지. ``entries``개 항목이 ``items``를 돌아가며 담긴다."""
+    rng = random.Random(seed)
+    data = []
+    for n in range(entries):
+        price = rng.randint(1_000, 900_000)
+        values = {fid: str(rng.randint(0, 10_000_000)) for fid in _0B_FIDS}
+        values.update({
+            "20": f"{90000 + n % 60000:06d}",
+            "10": _signed(rng, price),
+            "11": _signed(rng, rng.randint(0, price // 10)),
+            "12": f"{rng.choice('+-')}{rng.random() * 30:.2f}",
+            "27": _signed(rng, price + 100),
+            "28": _signed(rng, price - 100),
+            "15": _signed(rng, rng.randint(1, 5_000)),
+            "25": rng.choice("12345"),
+        })
+        data.append({"type": "0B", "name": "주식체결", "item": items[n % len(items)], "values": values})
+    return {"trnm": "REAL", "data": data}
+
+
+def day_chart(rows: int = 600, *, seed: int = 0) -> dict[str, Any]:
+    """ka10081(주식일봉차트조회) 응답 한 페이지."""
+    rng = random.Random(seed)
+    items = []
+    for n in range(rows):
+        close = rng.randint(1_000, 900_000)
+        items.append({
+            "cur_prc": str(close),
+            "trde_qty": str(rng.randint(1_000, 50_000_000)),
+            "trde_prica": str(rng.randint(1_000, 5_000_000)),
+            "dt": f"{2025 - n // 250:04d}{(n // 21) % 12 + 1:02d}{n % 21 + 1:02d}",
+            "open_pric": str(close + rng.randint(-500, 500)),
+            "high_pric": str(close + rng.randint(0, 1_000)),
+            "low_pric": str(close - rng.randint(0, 1_000)),
+            "pred_pre": _signed(rng, rng.randint(0, 5_000)),
+            "pred_pre_sig": rng.choice("12345"),
+            "trde_tern_rt": f"{rng.choice('+-')}{rng.random():.2f}",
+        })
+    return {
+        "return_code": 0,
+        "return_msg": "정상적으로 처리되었습니다",
+        "stk_cd": "005930",
+        "stk_dt_pole_chart_qry": items,
+    }
+
+
+def stock_list(rows: int = 2_500, *, seed: int = 0) -> dict[str, Any]:
+    """ka10099(종목정보 리스트) 응답."""
+    rng = random.Random(seed)
+    items = [
+        {
+            "code": f"{n:06d}",
+            "name": f"종목{n}",
+            "listCount": f"{rng.randint(1_000_000, 5_000_000_000):016d}",
+            "auditInfo": "정상",
+            "regDay": f"{rng.randint(1975, 2024)}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+            "lastPrice": f"{rng.randint(100, 900_000):08d}",
+            "state": "증거금20%|담보대출|신용가능",
+            "marketCode": "0",
+            "marketName": "거래소",
+            "upName": "전기/전자",
+            "upSizeName": "대형주",
+            "companyClassName": "",
+            "orderWarning": "0",
+            "nxtEnable": rng.choice("YN"),
+        }
+        for n in range(rows)
+    ]
+    return {"return_code": 0, "return_msg": "정상적으로 처리되었습니다", "list": items}
+
+
+def load(path: str | Path) -> Any:
+    """저장해 둔 응답 JSON 파일을 읽는다."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
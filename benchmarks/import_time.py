@@ -0,0 +1,59 @@
+"""``import kiwoompy`` 시작 시간 벤치마크.
+
+새 인터프리터를 여러 번 띄워 시나리오별 import 시간의 중앙값을 잰다.
+``eager``는 지연 로딩 이전처럼 모든 하위 모듈을 한꺼번에 불러오는 경우다.
+
+사용법::
+
+    PYTHONPATH=src python benchmarks/import_time.py [--runs 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS: dict[str, str] = {
+    "import kiwoompy": "import kiwoompy",
+    "from kiwoompy import KiwoomApi": "from kiwoompy import KiwoomApi",
+    "from kiwoompy import KiwoomClient": "from kiwoompy import KiwoomClient",
+    "eager (all submodules)": (
+        "import kiwoompy.models, kiwoompy.api, kiwoompy.auth, kiwoompy.client, kiwoompy.cond,"
+        " kiwoompy.order, kiwoompy.realtime, kiwoompy.query;"
+        " import kiwoompy.query.account, kiwoompy.query.chart, kiwoompy.query.market,"
+        " kiwoompy.query.ranking, kiwoompy.query.stock_info"
+    ),
+}
+
+
+def measure(code: str, runs: int) -> float:
+    """새 인터프리터에서 ``code``를 ``runs``번 실행한 wall-clock 시간의 중앙값(ms)."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    # 바이트코드 캐시를 먼저 만들어 첫 실행의 컴파일 비용을 빼고 잰다.
+    measure(SCENARIOS["eager (all submodules)"], 1)
+    base = measure("pass", args.runs)
+    print(f"{'python -c pass':<36} {base:8.1f} ms")
+    for name, code in SCENARIOS.items():
+        elapsed = measure(code, args.runs)
+        print(f"{name:<36} {elapsed:8.1f} ms  (+{elapsed - base:6.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""JSON 코덱 벤치마크 — 키움 응답·실시간 메시지의 백엔드별 디코딩·인코딩 시간.
+
+설치된 백엔드(``json``, ``orjson``, ``msgspec``)마다 같은 페이로드를 여러 번 변환해
+한 번당 중앙값을 잰다. 비교용으로 예전 REST 경로인 ``httpx.Response.json()``도 잰다.
+
+페이로드는 ``--payload``로 저장해 둔 응답 JSON 파일을 여러 개 넘길 수 있고, 생략하면
+ka10081(일봉 600행)·ka10099(종목 2,500개)·0B 실시간 메시지 표본을 쓴다.
+
+사용법::
+
+    PYTHONPATH=src python benchmarks/json_codec.py [--payload ka10081.json ...] [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import importlib.util
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import _payloads
+import httpx
+
+from kiwoompy.codec import set_json_codec
+
+
+def _median_us(func: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", type=Path, nargs="*", default=[])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.payload:
+        samples = {path.name: _payloads.load(path) for path in args.payload}
+    else:
+        samples = {
+            "ka10081 (600 rows)": _payloads.day_chart(600),
+            "ka10099 (2500 rows)": _payloads.stock_list(2_500),
+            "0B REAL (1 entry)": _payloads.realtime_0b(["005930"]),
+        }
+    backends = ["json", *(name for name in ("orjson", "msgspec") if importlib.util.find_spec(name))]
+
+    for name, sample in samples.items():
+        data = set_json_codec("json").dumps(sample)
+        print(f"\n{name} — {len(data):,} bytes")
+        response = httpx.Response(200, content=data, headers={"Content-Type": "application/json"})
+        print(f"  {'httpx Response.json()':<22} decode {_median_us(response.json, args.repeat):10.1f} µs")
+        for backend in backends:
+            codec = set_json_codec(backend)
+            decode = _median_us(functools.partial(codec.loads, data), args.repeat)
+            encode = _median_us(functools.partial(codec.dumps, sample), args.repeat)
+            print(f"  {backend:<22} decode {decode:10.1f} µs   encode {encode:10.1f} µs")
+    set_json_codec("auto")
+
+
+if __name__ == "__main__":
+    main()
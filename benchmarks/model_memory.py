@@ -0,0 +1,65 @@
+"""응답 모델 메모리 벤치마크 — 행(row)당 바이트, ``slots=True`` 전후 비교.
+
+같은 필드를 가진 ``__slots__`` 없는 dataclass를 만들어 같은 TR 스키마 디코더로
+응답 페이지를 변환하고, ``tracemalloc``으로 늘어난 메모리를 행 수로 나눈다.
+필드 문자열은 응답 딕셔너리와 공유하므로 빼고, 객체와 목록 슬롯만 잰다.
+
+사용법::
+
+    PYTHONPATH=src python benchmarks/model_memory.py [--rows 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import tracemalloc
+from collections.abc import Callable
+
+import _payloads
+
+from kiwoompy.query import chart, stock_info  # noqa: F401 — 스키마 등록
+from kiwoompy.query._schema import TrSchema, get_schema
+
+
+def unslotted(model: type) -> type:
+    """``model``과 같은 필드를 가진 ``slots=False`` frozen dataclass."""
+    fields = [(f.name, f.type) for f in dataclasses.fields(model)]
+    return dataclasses.make_dataclass(f"{model.__name__}NoSlots", fields, frozen=True)
+
+
+def measure(decode: Callable[[dict], list], page: dict) -> float:
+    """``decode(page)``로 만든 목록의 행당 바이트."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        rows = decode(page)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    pages = {
+        "ka10081": _payloads.day_chart(args.rows),
+        "ka10099": _payloads.stock_list(args.rows),
+    }
+    print(f"{'TR / model':<34} {'slots':>14} {'no slots':>14} {'saved':>7}")
+    for api_id, page in pages.items():
+        schema = get_schema(api_id)
+        baseline = TrSchema(api_id, schema.path, schema.list_key, unslotted(schema.model), schema.renames)
+        slotted_bytes = measure(schema.decode, page)
+        plain_bytes = measure(baseline.decode, page)
+        print(
+            f"{api_id} {schema.model.__name__:<26} {slotted_bytes:8.1f} B/row {plain_bytes:8.1f} B/row"
+            f" {1 - slotted_bytes / plain_bytes:6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""실시간 수신 처리량 벤치마크 — ``KiwoomRealtime._handle_message``의 초당 이벤트 수.
+
+WebSocket 없이 0B(주식체결) 메시지를 수신 루프와 같은 경로로 넣는다.
+
+- ``dispatch``: 파싱된 메시지 → 이벤트 생성 → 구독자 큐. 최신값 슬롯(``subscribe_latest``)에
+  넣어 소비자 비용을 빼고 수신 루프만 잰다.
+- ``decode+dispatch``: 위에 JSON 디코딩(``json_loads``)을 더한 수신 루프 전체.
+- ``callback price("10")``: 콜백 큐와 소비 태스크까지 거쳐 콜백이 현재가 하나를 읽을 때.
+- ``eager copy``: 비교용. 예전처럼 ``values``를 복사하고 모든 FID를 미리 숫자로 바꾸는 경우.
+
+사용법::
+
+    PYTHONPATH=src python benchmarks/realtime_dispatch.py [--messages 20000] [--payload REAL.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+import _payloads
+
+from kiwoompy import KiwoomApi, KiwoomRealtime, RealtimeEvent, parse_number
+from kiwoompy.codec import get_json_codec, json_dumps, json_loads
+
+_ITEMS = [f"{n:06d}" for n in range(100)]
+
+
+def _subscriptions(sample: dict) -> dict[str, list[str]]:
+    """메시지에 나오는 TR 타입 → 종목 목록."""
+    keys: dict[str, list[str]] = {}
+    for entry in sample["data"]:
+        items = keys.setdefault(entry.get("type", ""), [])
+        if entry.get("item", "") not in items:
+            items.append(entry.get("item", ""))
+    return keys
+
+
+def _report(name: str, events: int, elapsed: float) -> None:
+    print(f"{name:<24} {events / elapsed:12,.0f} events/s  ({elapsed * 1e6 / events:6.2f} µs/event)")
+
+
+async def _dispatch(messages: list[dict], events: int) -> None:
+    rt = KiwoomRealtime(KiwoomApi(env="demo"))
+    for type, items in _subscriptions(messages[0]).items():
+        await rt.subscribe_latest(type, items)
+    started = time.perf_counter()
+    for message in messages:
+        await rt._handle_message(message)
+    _report("dispatch", events, time.perf_counter() - started)
+
+
+async def _decode_dispatch(frames: list[bytes], events: int) -> None:
+    rt = KiwoomRealtime(KiwoomApi(env="demo"))
+    for type, items in _subscriptions(json_loads(frames[0])).items():
+        await rt.subscribe_latest(type, items)
+    started = time.perf_counter()
+    for frame in frames:
+        await rt._handle_message(json_loads(frame))
+    _report("decode+dispatch", events, time.perf_counter() - started)
+
+
+async def _callback(messages: list[dict], events: int) -> None:
+    rt = KiwoomRealtime(KiwoomApi(env="demo"), queue_size=len(messages) * len(messages[0]["data"]))
+    done = asyncio.Event()
+    seen = 0
+
+    async def on_trade(event: RealtimeEvent) -> None:
+        nonlocal seen
+        event.price("10")
+        seen += 1
+        if seen == events:
+            done.set()
+
+    for type, items in _subscriptions(messages[0]).items():
+        await rt.subscribe(type, items, on_trade)
+    started = time.perf_counter()
+    for message in messages:
+        await rt._handle_message(message)
+    await done.wait()
+    _report('callback price("10")', events, time.perf_counter() - started)
+    await rt.close()
+
+
+def _eager_copy(messages: list[dict], events: int) -> None:
+    started = time.perf_counter()
+    for message in messages:
+        for entry in message["data"]:
+            values = dict(entry.get("values", {}))
+            numbers = {fid: parse_number(value) for fid, value in values.items()}
+            RealtimeEvent(entry["type"], entry.get("name", ""), entry.get("item", ""), values)
+            numbers.get("10")
+    _report("eager copy", events, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--entries", type=int, default=1, help="메시지당 data 항목 수")
+    parser.add_argument("--payload", type=Path, help="저장해 둔 REAL 메시지 JSON (생략하면 표본)")
+    args = parser.parse_args()
+
+    if args.payload is not None:
+        sample = _payloads.load(args.payload)
+    else:
+        sample = _payloads.realtime_0b(_ITEMS, entries=args.entries)
+    frame = json_dumps(sample)
+    frames = [frame] * args.messages
+    messages = [json_loads(frame) for frame in frames]
+    events = args.messages * len(sample["data"])
+
+    print(f"codec={get_json_codec().name}, messages={args.messages}, entries/message={len(sample['data'])}")
+    asyncio.run(_dispatch(messages, events))
+    asyncio.run(_decode_dispatch(frames, events))
+    asyncio.run(_callback(messages, events))
+    _eager_copy(messages, events)
+
+
+if __name__ == "__main__":
+    main()
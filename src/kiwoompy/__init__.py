@@ -1,391 +1,468 @@
 """kiwoompy — 키움증권 REST API Python 라이브러리."""
 
-from kiwoompy.api import KiwoomApi
-from kiwoompy.auth import KiwoomAuth
-from kiwoompy.client import KiwoomClient
-from kiwoompy.cond import KiwoomCond
-from kiwoompy.exceptions import KiwoomApiError, KiwoomAuthError, KiwoomError
-from kiwoompy.models import (
-    AllSectorIndex,
-    AllSectorIndexItem,
-    ForeignTrade,
-    ForeignTradeItem,
-    FrgnDuration,
-    FrgnStockSectType,
-    InstFrgnConsecutiveItem,
-    InstFrgnConsecutiveTrade,
-    InstitutionTrade,
-    SectAmtQtyType,
-    SectExchangeType,
-    SectMrktType,
-    SectorDailyPrice,
-    SectorDailyPriceItem,
-    SectorInvestorNetBuy,
-    SectorInvestorNetBuyItem,
-    SectorPrice,
-    SectorPriceTmItem,
-    SectorProgram,
-    SectorStockPriceItem,
-    SectorStockPrices,
-    ShortSellItem,
-    ShortSellTrend,
-    SlbMrktType,
-    StockLoanByStock,
-    StockLoanByStockItem,
-    StockLoanHistory,
-    StockLoanHistoryItem,
-    StockLoanItem,
-    StockLoanTop10,
-    StockLoanTop10Item,
-    StockLoanTrend,
-    ElwAccessRate,
-    ElwAccessRateItem,
-    ElwBalRank,
-    ElwBalRankItem,
-    ElwBrokerNetTrade,
-    ElwBrokerNetTradeItem,
-    ElwDailySens,
-    ElwDailySensItem,
-    ElwDetail,
-    ElwFlucRank,
-    ElwFlucRankItem,
-    ElwFlucType,
-    ElwGap,
-    ElwGapItem,
-    ElwLpDaily,
-    ElwLpDailyItem,
-    ElwPriceSurge,
-    ElwPriceSurgeItem,
-    ElwRightType,
-    ElwSearch,
-    ElwSearchItem,
-    ElwSens,
-    ElwSensItem,
-    ElwSortType,
-    EtfAllQuote,
-    EtfAllQuoteItem,
-    EtfDailyFill,
-    EtfDailyFillItem,
-    EtfDailyTrend,
-    EtfDailyTrendItem,
-    EtfDuration,
-    EtfInfo,
-    EtfNav,
-    EtfNavItem,
-    EtfReturn,
-    EtfReturnItem,
-    EtfTimeFill,
-    EtfTimeFillItem,
-    EtfTimeTrend,
-    EtfTimeTrendItem,
-    EtfTimeTrend2,
-    EtfTimeTrend2Item,
-    ProgramAccTrend,
-    ProgramAccTrendItem,
-    ProgramArbitrageBal,
-    ProgramArbitrageBalItem,
-    ProgramTop50,
-    ProgramTop50Item,
-    ProgramTrend,
-    ProgramTrendItem,
-    StockDailyProgram,
-    StockDailyProgramItem,
-    StockProgramStatus,
-    StockProgramStatusItem,
-    StockTimeProgram,
-    StockTimeProgramItem,
-    ThemeGroup,
-    ThemeGroupItem,
-    ThemeSearchType,
-    ThemeStockItem,
-    ThemeStocks,
-    AfterHoursRank,
-    AfterHoursRankItem,
-    BidQtySurge,
-    BidQtySurgeItem,
-    BidQtyUpper,
-    BidQtyUpperItem,
-    ChartAdjustedPrice,
-    ChartAmtQtyType,
-    ChartMinScope,
-    ChartSectorMarket,
-    ChartTickScope,
-    ChartTradeType,
-    ChartUnitType,
-    InvestorChart,
-    InvestorChartItem,
-    IntraInvestorChart,
-    IntraInvestorChartItem,
-    SectorCandleItem,
-    SectorDayChart,
-    SectorDayChartItem,
-    SectorMinChart,
-    SectorMinChartItem,
-    SectorMonthChart,
-    SectorTickChart,
-    SectorWeekChart,
-    SectorYearChart,
-    StockCandleItem,
-    StockDayChart,
-    StockDayChartItem,
-    StockMinChart,
-    StockMinChartItem,
-    StockMonthChart,
-    StockMonthChartItem,
-    StockTickChart,
-    StockWeekChart,
-    StockWeekChartItem,
-    StockYearChart,
-    StockYearChartItem,
-    BrokerTradeUpper,
-    BrokerTradeUpperItem,
-    CreditRatioUpper,
-    CreditRatioUpperItem,
-    DailyMainBroker,
-    DailyMainBrokerEntry,
-    DailyTopExit,
-    DailyTopExitItem,
-    DailyTradeQtyUpper,
-    DailyTradeQtyUpperItem,
-    ExpectedTradeUpper,
-    ExpectedTradeUpperItem,
-    ForeignBrokerTradeUpper,
-    ForeignBrokerTradeUpperItem,
-    ForeignConsecTradeUpper,
-    ForeignConsecTradeUpperItem,
-    ForeignInstitutionTradeUpper,
-    ForeignInstitutionTradeUpperItem,
-    ForeignLimitExhaustUpper,
-    ForeignLimitExhaustUpperItem,
-    ForeignPeriodTradeUpper,
-    ForeignPeriodTradeUpperItem,
-    InvestorTradeUpper,
-    InvestorTradeUpperItem,
-    NetBuyBrokerRank,
-    NetBuyBrokerRankItem,
-    PriceChangeUpper,
-    PriceChangeUpperItem,
-    PrevTradeQtyUpper,
-    PrevTradeQtyUpperItem,
-    QtyRatioSurge,
-    QtyRatioSurgeItem,
-    RkinfoBidSortType,
-    RkinfoBidTradeType,
-    RkinfoBaseDateType,
-    RkinfoMarketType,
-    RkinfoOrgType,
-    RkinfoPriceChangeSortType,
-    RkinfoSortCndType,
-    RkinfoStexType,
-    RkinfoSurgeSort2Type,
-    SameNetTradeRank,
-    SameNetTradeRankItem,
-    StockBrokerRank,
-    StockBrokerRankItem,
-    TradeAmtUpper,
-    TradeAmtUpperItem,
-    TradeQtySurge,
-    TradeQtySurgeItem,
-    AccountBalance,
-    AccountEvaluation,
-    AccountEvaluationItem,
-    AccountNo,
-    AccountNumbers,
-    AccountReturnItem,
-    AfterCloseInvestorItem,
-    AfterCloseInvestorTrading,
-    AfterhoursOrderbook,
-    AmtQtyType,
-    AfterAmtQtyType,
-    AfterTradeType,
-    BrokerEntry,
-    BrokerInstantVolume,
-    BrokerInstantVolumeItem,
-    BrokerItem,
-    BrokerList,
-    BrokerStockTrend,
-    BrokerStockTrendItem,
-    BrokerSupplyAnalysis,
-    BrokerSupplyItem,
-    CancelOrderResponse,
-    CreditOrderableQuantity,
-    CreditQueryType,
-    CreditTradingItem,
-    CreditTradingTrend,
-    DailyAccountReturn,
-    DailyAccountStatus,
-    DailyBalanceReturn,
-    DailyBalanceReturnItem,
-    DailyEstimatedAssetItem,
-    DailyInstitutionStockItem,
-    DailyInstitutionStocks,
-    DailyPriceItem,
-    DailyPrices,
-    DailyRealizedProfit,
-    DailyRealizedProfitDetail,
-    DailyRealizedProfitDetailItem,
-    DailyRealizedProfitItem,
-    DailyTradeJournal,
-    DailyTradeJournalItem,
-    DailyTradingDetail,
-    DailyTradingDetailItem,
-    DepositDetail,
-    DisplayType,
-    Env,
-    EstimatedAsset,
-    EstimatedPriceType,
-    ExecutionBalance,
-    ExecutionBalanceItem,
-    ExecutionInfo,
-    ExecutionInfoItem,
-    ExecutionStrength,
-    ExecutionStrengthItem,
-    FilledOrderItem,
-    FxDepositItem,
-    HighLowPER,
-    HighLowPERItem,
-    HighLowSelectType,
-    HighLowStockItem,
-    HighLowStocks,
-    HoldingItem,
-    InstitutionTradeType,
-    IntradayInvestorItem,
-    IntradayInvestorTrading,
-    InvestorDailyStockItem,
-    InvestorDailyStocks,
-    InvestorTradeType,
-    InvestorType,
-    InvestorType2,
-    LimitStockItem,
-    LimitStocks,
-    MarginDetail,
-    MarketSummary,
-    ModifyOrderResponse,
-    MrkcondExchangeType,
-    MrktType3,
-    MrktType3Ext,
-    NearHighLow,
-    NearHighLowItem,
-    NewStockRightsItem,
-    NewStockRightsPrices,
-    NewStockRightsType,
-    NextDaySettlement,
-    NextDaySettlementItem,
-    OpenPriceChange,
-    OpenPriceChangeItem,
-    OrderableAmount,
-    OrderableQuantity,
-    Orderbook,
-    OrderbookLevel,
-    OrderExchange,
-    OrderExecutionStatus,
-    OrderExecutionStatusItem,
-    OrderHistoryDetailItem,
-    OrderResponse,
-    OrderTradeType,
-    PERType,
-    PriceSurgeItem,
-    PriceSurgeStocks,
-    RealizedProfitByDateItem,
-    RealizedProfitByPeriodItem,
-    RevokeTokenRequest,
-    SectorItem,
-    SectorList,
-    SectorMarketType,
-    SplitOrderDetailItem,
-    StockBrokers,
-    StockDetail,
-    StockInfo,
-    StockInstitutionTrend,
-    StockInstitutionTrendItem,
-    StockInvestorByDay,
-    StockInvestorItem,
-    StockInvestorTotal,
-    StockList,
-    StockListItem,
-    StockMinutes,
-    StockPeriodItem,
-    StockPeriods,
-    StkMarketType,
-    SupplyConcentration,
-    SupplyConcentrationItem,
-    TickMinType,
-    TodayPrevExecution,
-    TodayPrevExecutionItem,
-    TodayPrevExecutionQty,
-    TodayPrevExecutionQtyItem,
-    TodayPrevType,
-    TokenRequest,
-    TokenResponse,
-    TransactionHistoryItem,
-    UnfilledOrderItem,
-    UnitType,
-    VIStockItem,
-    VIStocks,
-    VolumeUpdatedItem,
-    VolumeUpdatedStocks,
-    WatchlistInfo,
-    WatchlistStockItem,
-    GoldBalance,
-    GoldBalanceItem,
-    GoldBid,
-    GoldBidItem,
-    GoldCancelOrderResponse,
-    GoldContractTrend,
-    GoldContractTrendItem,
-    GoldDailyChart,
-    GoldDailyChartItem,
-    GoldDailyMinuteChart,
-    GoldDailyMinuteChartItem,
-    GoldDailyTickChart,
-    GoldDailyTickChartItem,
-    GoldDailyTrend,
-    GoldDailyTrendItem,
-    GoldDeposit,
-    GoldExpectedContract,
-    GoldExpectedContractItem,
-    GoldInvestorStatus,
-    GoldInvestorStatusItem,
-    GoldMarketInfo,
-    GoldMinuteChart,
-    GoldMinuteChartItem,
-    GoldModifyOrderResponse,
-    GoldMonthlyChart,
-    GoldMonthlyChartItem,
-    GoldOrderDetail,
-    GoldOrderDetailItem,
-    GoldOrderResponse,
-    GoldOrderStatus,
-    GoldOrderStatusItem,
-    GoldOrderTradeType,
-    GoldStockCode,
-    GoldTickChart,
-    GoldTickChartItem,
-    GoldTradeHistory,
-    GoldTradeHistoryItem,
-    GoldUnfilled,
-    GoldUnfilledItem,
-    GoldWeeklyChart,
-    GoldWeeklyChartItem,
-    ConditionItem,
-    ConditionList,
-    ConditionRealtimeItem,
-    ConditionRealtimeValues,
-    ConditionSearchItem,
-    ConditionSearchResult,
-    ConditionStopResult,
-    CreditLoanAvailability,
-    CreditLoanStockItem,
-    CreditLoanStocks,
-    CreditMarketType,
-    CreditStockGradeType,
-    RealtimeEvent,
-    RealtimeType,
-)
-from kiwoompy.order import KiwoomOrder
-from kiwoompy.query import KiwoomQuery
-from kiwoompy.realtime import KiwoomRealtime, RealtimeCallback
-from kiwoompy.utils import normalize_account_no
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kiwoompy.api import ApiResponse, AsyncKiwoomApi, HttpConfig, KiwoomApi, PageIterator
+    from kiwoompy.auth import AsyncKiwoomAuth, KiwoomAuth
+    from kiwoompy.cache import FileResponseCache, MemoryResponseCache, ResponseCache
+    from kiwoompy.client import KiwoomClient
+    from kiwoompy.codec import JsonBackend, JsonCodec, get_json_codec, set_json_codec
+    from kiwoompy.cond import KiwoomCond
+    from kiwoompy.exceptions import KiwoomApiError, KiwoomAuthError, KiwoomError, KiwoomRateLimitError
+    from kiwoompy.models import (
+        AllSectorIndex,
+        AllSectorIndexItem,
+        ForeignTrade,
+        ForeignTradeItem,
+        FrgnDuration,
+        FrgnStockSectType,
+        InstFrgnConsecutiveItem,
+        InstFrgnConsecutiveTrade,
+        InstitutionTrade,
+        SectAmtQtyType,
+        SectExchangeType,
+        SectMrktType,
+        SectorDailyPrice,
+        SectorDailyPriceItem,
+        SectorInvestorNetBuy,
+        SectorInvestorNetBuyItem,
+        SectorPrice,
+        SectorPriceTmItem,
+        SectorProgram,
+        SectorStockPriceItem,
+        SectorStockPrices,
+        ShortSellItem,
+        ShortSellTrend,
+        SlbMrktType,
+        StockLoanByStock,
+        StockLoanByStockItem,
+        StockLoanHistory,
+        StockLoanHistoryItem,
+        StockLoanItem,
+        StockLoanTop10,
+        StockLoanTop10Item,
+        StockLoanTrend,
+        ElwAccessRate,
+        ElwAccessRateItem,
+        ElwBalRank,
+        ElwBalRankItem,
+        ElwBrokerNetTrade,
+        ElwBrokerNetTradeItem,
+        ElwDailySens,
+        ElwDailySensItem,
+        ElwDetail,
+        ElwFlucRank,
+        ElwFlucRankItem,
+        ElwFlucType,
+        ElwGap,
+        ElwGapItem,
+        ElwLpDaily,
+        ElwLpDailyItem,
+        ElwPriceSurge,
+        ElwPriceSurgeItem,
+        ElwRightType,
+        ElwSearch,
+        ElwSearchItem,
+        ElwSens,
+        ElwSensItem,
+        ElwSortType,
+        EtfAllQuote,
+        EtfAllQuoteItem,
+        EtfDailyFill,
+        EtfDailyFillItem,
+        EtfDailyTrend,
+        EtfDailyTrendItem,
+        EtfDuration,
+        EtfInfo,
+        EtfNav,
+        EtfNavItem,
+        EtfReturn,
+        EtfReturnItem,
+        EtfTimeFill,
+        EtfTimeFillItem,
+        EtfTimeTrend,
+        EtfTimeTrendItem,
+        EtfTimeTrend2,
+        EtfTimeTrend2Item,
+        ProgramAccTrend,
+        ProgramAccTrendItem,
+        ProgramArbitrageBal,
+        ProgramArbitrageBalItem,
+        ProgramTop50,
+        ProgramTop50Item,
+        ProgramTrend,
+        ProgramTrendItem,
+        StockDailyProgram,
+        StockDailyProgramItem,
+        StockProgramStatus,
+        StockProgramStatusItem,
+        StockTimeProgram,
+        StockTimeProgramItem,
+        ThemeGroup,
+        ThemeGroupItem,
+        ThemeSearchType,
+        ThemeStockItem,
+        ThemeStocks,
+        AfterHoursRank,
+        AfterHoursRankItem,
+        BidQtySurge,
+        BidQtySurgeItem,
+        BidQtyUpper,
+        BidQtyUpperItem,
+        ChartAdjustedPrice,
+        ChartAmtQtyType,
+        ChartMinScope,
+        ChartSectorMarket,
+        ChartTickScope,
+        ChartTradeType,
+        ChartUnitType,
+        InvestorChart,
+        InvestorChartItem,
+        IntraInvestorChart,
+        IntraInvestorChartItem,
+        SectorCandleItem,
+        SectorDayChart,
+        SectorDayChartItem,
+        SectorMinChart,
+        SectorMinChartItem,
+        SectorMonthChart,
+        SectorTickChart,
+        SectorWeekChart,
+        SectorYearChart,
+        StockCandleItem,
+        StockDayChart,
+        StockDayChartItem,
+        StockMinChart,
+        StockMinChartItem,
+        StockMonthChart,
+        StockMonthChartItem,
+        StockTickChart,
+        StockWeekChart,
+        StockWeekChartItem,
+        StockYearChart,
+        StockYearChartItem,
+        BrokerTradeUpper,
+        BrokerTradeUpperItem,
+        CreditRatioUpper,
+        CreditRatioUpperItem,
+        DailyMainBroker,
+        DailyMainBrokerEntry,
+        DailyTopExit,
+        DailyTopExitItem,
+        DailyTradeQtyUpper,
+        DailyTradeQtyUpperItem,
+        ExpectedTradeUpper,
+        ExpectedTradeUpperItem,
+        ForeignBrokerTradeUpper,
+        ForeignBrokerTradeUpperItem,
+        ForeignConsecTradeUpper,
+        ForeignConsecTradeUpperItem,
+        ForeignInstitutionTradeUpper,
+        ForeignInstitutionTradeUpperItem,
+        ForeignLimitExhaustUpper,
+        ForeignLimitExhaustUpperItem,
+        ForeignPeriodTradeUpper,
+        ForeignPeriodTradeUpperItem,
+        InvestorTradeUpper,
+        InvestorTradeUpperItem,
+        NetBuyBrokerRank,
+        NetBuyBrokerRankItem,
+        PriceChangeUpper,
+        PriceChangeUpperItem,
+        PrevTradeQtyUpper,
+        PrevTradeQtyUpperItem,
+        QtyRatioSurge,
+        QtyRatioSurgeItem,
+        RkinfoBidSortType,
+        RkinfoBidTradeType,
+        RkinfoBaseDateType,
+        RkinfoMarketType,
+        RkinfoOrgType,
+        RkinfoPriceChangeSortType,
+        RkinfoSortCndType,
+        RkinfoStexType,
+        RkinfoSurgeSort2Type,
+        SameNetTradeRank,
+        SameNetTradeRankItem,
+        StockBrokerRank,
+        StockBrokerRankItem,
+        TradeAmtUpper,
+        TradeAmtUpperItem,
+        TradeQtySurge,
+        TradeQtySurgeItem,
+        AccountBalance,
+        AccountEvaluation,
+        AccountEvaluationItem,
+        AccountNo,
+        AccountNumbers,
+        AccountReturnItem,
+        AfterCloseInvestorItem,
+        AfterCloseInvestorTrading,
+        AfterhoursOrderbook,
+        AmtQtyType,
+        AfterAmtQtyType,
+        AfterTradeType,
+        BrokerEntry,
+        BrokerInstantVolume,
+        BrokerInstantVolumeItem,
+        BrokerItem,
+        BrokerList,
+        BrokerStockTrend,
+        BrokerStockTrendItem,
+        BrokerSupplyAnalysis,
+        BrokerSupplyItem,
+        CancelOrderResponse,
+        CreditOrderableQuantity,
+        CreditQueryType,
+        CreditTradingItem,
+        CreditTradingTrend,
+        DailyAccountReturn,
+        DailyAccountStatus,
+        DailyBalanceReturn,
+        DailyBalanceReturnItem,
+        DailyEstimatedAssetItem,
+        DailyInstitutionStockItem,
+        DailyInstitutionStocks,
+        DailyPriceItem,
+        DailyPrices,
+        DailyRealizedProfit,
+        DailyRealizedProfitDetail,
+        DailyRealizedProfitDetailItem,
+        DailyRealizedProfitItem,
+        DailyTradeJournal,
+        DailyTradeJournalItem,
+        DailyTradingDetail,
+        DailyTradingDetailItem,
+        DepositDetail,
+        DisplayType,
+        Env,
+        EstimatedAsset,
+        EstimatedPriceType,
+        ExecutionBalance,
+        ExecutionBalanceItem,
+        ExecutionInfo,
+        ExecutionInfoItem,
+        ExecutionStrength,
+        ExecutionStrengthItem,
+        FilledOrderItem,
+        FxDepositItem,
+        HighLowPER,
+        HighLowPERItem,
+        HighLowSelectType,
+        HighLowStockItem,
+        HighLowStocks,
+        HoldingItem,
+        InstitutionTradeType,
+        IntradayInvestorItem,
+        IntradayInvestorTrading,
+        InvestorDailyStockItem,
+        InvestorDailyStocks,
+        InvestorTradeType,
+        InvestorType,
+        InvestorType2,
+        LimitStockItem,
+        LimitStocks,
+        MarginDetail,
+        MarketSummary,
+        ModifyOrderResponse,
+        MrkcondExchangeType,
+        MrktType3,
+        MrktType3Ext,
+        NearHighLow,
+        NearHighLowItem,
+        NewStockRightsItem,
+        NewStockRightsPrices,
+        NewStockRightsType,
+        NextDaySettlement,
+        NextDaySettlementItem,
+        OpenPriceChange,
+        OpenPriceChangeItem,
+        OrderableAmount,
+        OrderableQuantity,
+        Orderbook,
+        OrderbookLevel,
+        OrderExchange,
+        OrderExecutionStatus,
+        OrderExecutionStatusItem,
+        OrderHistoryDetailItem,
+        OrderResponse,
+        OrderTradeType,
+        PERType,
+        PriceSurgeItem,
+        PriceSurgeStocks,
+        RealizedProfitByDateItem,
+        RealizedProfitByPeriodItem,
+        RequestPriority,
+        RevokeTokenRequest,
+        SectorItem,
+        SectorList,
+        SectorMarketType,
+        SplitOrderDetailItem,
+        StockBrokers,
+        StockDetail,
+        StockInfo,
+        StockInstitutionTrend,
+        StockInstitutionTrendItem,
+        StockInvestorByDay,
+        StockInvestorItem,
+        StockInvestorTotal,
+        StockList,
+        StockListItem,
+        StockMinutes,
+        StockPeriodItem,
+        StockPeriods,
+        StkMarketType,
+        SupplyConcentration,
+        SupplyConcentrationItem,
+        TickMinType,
+        TodayPrevExecution,
+        TodayPrevExecutionItem,
+        TodayPrevExecutionQty,
+        TodayPrevExecutionQtyItem,
+        TodayPrevType,
+        TokenRequest,
+        TokenResponse,
+        TransactionHistoryItem,
+        UnfilledOrderItem,
+        UnitType,
+        VIStockItem,
+        VIStocks,
+        VolumeUpdatedItem,
+        VolumeUpdatedStocks,
+        WatchlistInfo,
+        WatchlistStockItem,
+        GoldBalance,
+        GoldBalanceItem,
+        GoldBid,
+        GoldBidItem,
+        GoldCancelOrderResponse,
+        GoldContractTrend,
+        GoldContractTrendItem,
+        GoldDailyChart,
+        GoldDailyChartItem,
+        GoldDailyMinuteChart,
+        GoldDailyMinuteChartItem,
+        GoldDailyTickChart,
+        GoldDailyTickChartItem,
+        GoldDailyTrend,
+        GoldDailyTrendItem,
+        GoldDeposit,
+        GoldExpectedContract,
+        GoldExpectedContractItem,
+        GoldInvestorStatus,
+        GoldInvestorStatusItem,
+        GoldMarketInfo,
+        GoldMinuteChart,
+        GoldMinuteChartItem,
+        GoldModifyOrderResponse,
+        GoldMonthlyChart,
+        GoldMonthlyChartItem,
+        GoldOrderDetail,
+        GoldOrderDetailItem,
+        GoldOrderResponse,
+        GoldOrderStatus,
+        GoldOrderStatusItem,
+        GoldOrderTradeType,
+        GoldStockCode,
+        GoldTickChart,
+        GoldTickChartItem,
+        GoldTradeHistory,
+        GoldTradeHistoryItem,
+        GoldUnfilled,
+        GoldUnfilledItem,
+        GoldWeeklyChart,
+        GoldWeeklyChartItem,
+        ConditionItem,
+        ConditionList,
+        ConditionRealtimeItem,
+        ConditionRealtimeValues,
+        ConditionSearchItem,
+        ConditionSearchResult,
+        ConditionStopResult,
+        CreditLoanAvailability,
+        CreditLoanStockItem,
+        CreditLoanStocks,
+        CreditMarketType,
+        CreditStockGradeType,
+        RealtimeEvent,
+        RealtimeType,
+    )
+    from kiwoompy.metrics import LatencyHistogram, MetricsHook, MetricsRecorder, RequestMetrics
+    from kiwoompy.numeric import (
+        NumericKind,
+        numeric_fields,
+        parse_number,
+        to_arrays,
+        to_columns,
+        to_numeric,
+    )
+    from kiwoompy.order import AsyncKiwoomOrder, KiwoomOrder
+    from kiwoompy.query import AsyncKiwoomQuery, KiwoomQuery
+    from kiwoompy.realtime import (
+        KiwoomRealtime,
+        KiwoomRealtimePool,
+        LatestEvents,
+        OverflowPolicy,
+        RealtimeCallback,
+        SubscriberStats,
+    )
+    from kiwoompy.shared import FileRateLimitStore, FileTokenStore, RateLimitStore, TokenStore
+    from kiwoompy.utils import normalize_account_no
+
+# 공개 이름 → 정의 모듈. 첫 접근 시 해당 모듈만 import한다 (PEP 562).
+# 여기 없는 ``__all__`` 이름은 모두 ``kiwoompy.models``에 정의돼 있다.
+_LAZY_MODULES: dict[str, str] = {
+    "ApiResponse": "kiwoompy.api",
+    "AsyncKiwoomApi": "kiwoompy.api",
+    "HttpConfig": "kiwoompy.api",
+    "KiwoomApi": "kiwoompy.api",
+    "PageIterator": "kiwoompy.api",
+    "AsyncKiwoomAuth": "kiwoompy.auth",
+    "KiwoomAuth": "kiwoompy.auth",
+    "FileResponseCache": "kiwoompy.cache",
+    "MemoryResponseCache": "kiwoompy.cache",
+    "ResponseCache": "kiwoompy.cache",
+    "KiwoomClient": "kiwoompy.client",
+    "JsonBackend": "kiwoompy.codec",
+    "JsonCodec": "kiwoompy.codec",
+    "get_json_codec": "kiwoompy.codec",
+    "set_json_codec": "kiwoompy.codec",
+    "KiwoomCond": "kiwoompy.cond",
+    "KiwoomApiError": "kiwoompy.exceptions",
+    "KiwoomAuthError": "kiwoompy.exceptions",
+    "KiwoomError": "kiwoompy.exceptions",
+    "KiwoomRateLimitError": "kiwoompy.exceptions",
+    "LatencyHistogram": "kiwoompy.metrics",
+    "MetricsHook": "kiwoompy.metrics",
+    "MetricsRecorder": "kiwoompy.metrics",
+    "RequestMetrics": "kiwoompy.metrics",
+    "NumericKind": "kiwoompy.numeric",
+    "numeric_fields": "kiwoompy.numeric",
+    "parse_number": "kiwoompy.numeric",
+    "to_arrays": "kiwoompy.numeric",
+    "to_columns": "kiwoompy.numeric",
+    "to_numeric": "kiwoompy.numeric",
+    "AsyncKiwoomOrder": "kiwoompy.order",
+    "KiwoomOrder": "kiwoompy.order",
+    "AsyncKiwoomQuery": "kiwoompy.query",
+    "KiwoomQuery": "kiwoompy.query",
+    "KiwoomRealtime": "kiwoompy.realtime",
+    "KiwoomRealtimePool": "kiwoompy.realtime",
+    "LatestEvents": "kiwoompy.realtime",
+    "OverflowPolicy": "kiwoompy.realtime",
+    "SubscriberStats": "kiwoompy.realtime",
+    "RealtimeCallback": "kiwoompy.realtime",
+    "FileRateLimitStore": "kiwoompy.shared",
+    "FileTokenStore": "kiwoompy.shared",
+    "RateLimitStore": "kiwoompy.shared",
+    "TokenStore": "kiwoompy.shared",
+    "normalize_account_no": "kiwoompy.utils",
+}
+_MODELS_MODULE = "kiwoompy.models"
 
 __all__ = [
     # 클라이언트
@@ -395,13 +472,50 @@ __all__ = [
     "KiwoomQuery",
     "KiwoomOrder",
     "KiwoomCond",
+    # 비동기 클라이언트
+    "AsyncKiwoomApi",
+    "AsyncKiwoomAuth",
+    "AsyncKiwoomQuery",
+    "AsyncKiwoomOrder",
+    # HTTP 설정·응답·연속조회
+    "HttpConfig",
+    "ApiResponse",
+    "PageIterator",
+    # 프로세스 간 공유 저장소
+    "RateLimitStore",
+    "TokenStore",
+    "FileRateLimitStore",
+    "FileTokenStore",
+    # 응답 캐시
+    "ResponseCache",
+    "MemoryResponseCache",
+    "FileResponseCache",
+    # 요청 계측
+    "RequestMetrics",
+    "MetricsHook",
+    "MetricsRecorder",
+    "LatencyHistogram",
+    # JSON 코덱
+    "JsonBackend",
+    "JsonCodec",
+    "get_json_codec",
+    "set_json_codec",
+    # 숫자 변환
+    "NumericKind",
+    "numeric_fields",
+    "parse_number",
+    "to_arrays",
+    "to_columns",
+    "to_numeric",
     # 예외
     "KiwoomError",
     "KiwoomApiError",
     "KiwoomAuthError",
+    "KiwoomRateLimitError",
     # 타입 별칭
     "Env",
     "AccountNo",
+    "RequestPriority",
     # 인증 모델
     "TokenRequest",
     "TokenResponse",
@@ -741,6 +855,49 @@ __all__ = [
     "StockTimeProgram",
     "StockDailyProgramItem",
     "StockDailyProgram",
+    # 9단계 — 금현물 타입
+    "GoldOrderTradeType",
+    "GoldStockCode",
+    # 9단계 — 금현물 모델
+    "GoldBalance",
+    "GoldBalanceItem",
+    "GoldBid",
+    "GoldBidItem",
+    "GoldCancelOrderResponse",
+    "GoldContractTrend",
+    "GoldContractTrendItem",
+    "GoldDailyChart",
+    "GoldDailyChartItem",
+    "GoldDailyMinuteChart",
+    "GoldDailyMinuteChartItem",
+    "GoldDailyTickChart",
+    "GoldDailyTickChartItem",
+    "GoldDailyTrend",
+    "GoldDailyTrendItem",
+    "GoldDeposit",
+    "GoldExpectedContract",
+    "GoldExpectedContractItem",
+    "GoldInvestorStatus",
+    "GoldInvestorStatusItem",
+    "GoldMarketInfo",
+    "GoldMinuteChart",
+    "GoldMinuteChartItem",
+    "GoldModifyOrderResponse",
+    "GoldMonthlyChart",
+    "GoldMonthlyChartItem",
+    "GoldOrderDetail",
+    "GoldOrderDetailItem",
+    "GoldOrderResponse",
+    "GoldOrderStatus",
+    "GoldOrderStatusItem",
+    "GoldTickChart",
+    "GoldTickChartItem",
+    "GoldTradeHistory",
+    "GoldTradeHistoryItem",
+    "GoldUnfilled",
+    "GoldUnfilledItem",
+    "GoldWeeklyChart",
+    "GoldWeeklyChartItem",
     # 10단계 — 조건검색 모델
     "ConditionItem",
     "ConditionList",
@@ -758,7 +915,27 @@ __all__ = [
     "CreditLoanAvailability",
     # 12단계 — 실시간 WebSocket
     "KiwoomRealtime",
+    "KiwoomRealtimePool",
+    "LatestEvents",
+    "OverflowPolicy",
     "RealtimeCallback",
+    "SubscriberStats",
     "RealtimeEvent",
     "RealtimeType",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """공개 이름을 처음 접근할 때 정의 모듈을 import해 모듈 전역에 캐시한다."""
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        if name not in __all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        module = _MODELS_MODULE
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,935 @@
+"""응답 모델 필드별 숫자 종류 표 — ``kiwoompy.numeric``이 쓴다.
+
+``kiwoompy.models``의 문자열 필드를 이름마다 한 줄씩 적는다. 값이 ``None``인 필드는
+코드·이름·일자·시각·부호·구분값처럼 숫자로 바꾸지 않는 텍스트다. 모델에 필드를 더하면
+이 표에도 적어야 하며, ``tests/test_numeric.py``가 빠지거나 남은 이름을 잡는다.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kiwoompy.numeric import NumericKind
+
+# 필드 이름 → 숫자 종류. 주석은 키움 문서의 필드 설명이다.
+_FIELD_KINDS: dict[str, NumericKind | None] = {
+    "able_qty": "int",                  # 가능수량
+    "acc_netprps": "int",               # 누적순매수
+    "acc_netprps_amt": "int",           # 누적 순매수 금액(억)
+    "acc_netprps_qty": "int",           # 누적 순매수 수량(천)
+    "acc_trde_prica": "int",            # 누적 거래대금
+    "acc_trde_qty": "int",              # 누적 거래량
+    "acc_trde_qty_n": "int",            # 누적거래량
+    "acnt_nm": None,                    # 계좌명
+    "acnt_no": None,                    # 계좌번호
+    "acnt_print": None,
+    "acpt_tp": None,                    # 접수구분
+    "af_mkrt_pred_rt": "float",         # 장후전일비
+    "af_mkrt_trde_amt": "int",          # 장후거래금액
+    "af_mkrt_trde_qty": "int",          # 장후거래량
+    "af_mkrt_trde_rt": "float",         # 장후거래회전율
+    "alacc_rt": "float",                # 근접율
+    "all_acc": "int",                   # 전체누적
+    "all_buy": "int",                   # 전체매수
+    "all_dfrt_trst_buy_amt": "int",     # 전체차익위탁매수금액
+    "all_dfrt_trst_buy_qty": "int",     # 전체차익위탁매수수량
+    "all_dfrt_trst_netprps_amt": "int",  # 전체차익위탁순매수금액
+    "all_dfrt_trst_netprps_qty": "int",  # 전체차익위탁순매수수량
+    "all_dfrt_trst_sell_amt": "int",    # 전체차익위탁매도금액
+    "all_dfrt_trst_sell_qty": "int",    # 전체차익위탁매도수량
+    "all_hgst_pric": "price",           # 전체최고가
+    "all_lwst_pric": "price",           # 전체최저가
+    "all_netprps": "int",               # 전체순매수
+    "all_sel": "int",                   # 전체매도
+    "all_tdy": "int",                   # 전체당일
+    "all_trde_rt": "float",             # 전체거래비율
+    "aplc_rt": "float",                 # 적용증거금율
+    "appkey": None,
+    "aset_cd": None,                    # 자산코드
+    "aset_evlt_amt": "int",             # 예탁자산평가액
+    "assr_30ord_alow_amt": "int",       # 보증금30%주문가능금액
+    "assr_30ord_alowq": "int",          # 보증금30%주문가능수량
+    "assr_40ord_alow_amt": "int",       # 보증금40%주문가능금액
+    "assr_40ord_alowq": "int",          # 보증금40%주문가능수량
+    "assr_50ord_alow_amt": "int",       # 보증금50%주문가능금액
+    "assr_50ord_alowq": "int",          # 보증금50%주문가능수량
+    "assr_60ord_alow_amt": "int",       # 보증금60%주문가능금액
+    "assr_60ord_alowq": "int",          # 보증금60%주문가능수량
+    "avg_prc": "price",                 # 평균단가
+    "bank": "int",                      # 은행
+    "bank_netprps": "int",              # 은행순매수
+    "base_aset_nm": None,               # 기초자산명
+    "base_limit_exh_rt": "float",       # 기준한도소진율
+    "base_orig_ord_no": None,           # 모주문번호
+    "base_pre": "int",                  # 기준대비
+    "base_pric": "price",               # 기준가
+    "base_pric_tm": None,               # 기준가시간
+    "base_rt": "float",                 # 기준률 (응답필드명 int)
+    "base_time": None,                  # 호가잔량기준시간
+    "basis": "float",                   # BASIS
+    "bf_mkrt_pred_rt": "float",         # 장전전일비
+    "bf_mkrt_trde_amt": "int",          # 장전거래금액
+    "bf_mkrt_trde_qty": "int",          # 장전거래량
+    "bf_mkrt_trde_rt": "float",         # 장전거래회전율
+    "book_amt2": "int",                 # 매입금액
+    "brch_nm": None,                    # 지점명
+    "bsis_aset_1": None,                # 기초자산1
+    "bsis_aset_2": None,                # 기초자산2
+    "bsis_aset_3": None,                # 기초자산3
+    "bsis_aset_4": None,                # 기초자산4
+    "bsis_aset_5": None,                # 기초자산5
+    "bsis_aset_comp_rt_1": "float",     # 기초자산구성비율1
+    "bsis_aset_comp_rt_2": "float",     # 기초자산구성비율2
+    "bsis_aset_comp_rt_3": "float",     # 기초자산구성비율3
+    "bsis_aset_comp_rt_4": "float",     # 기초자산구성비율4
+    "bsis_aset_comp_rt_5": "float",     # 기초자산구성비율5
+    "buy_amt": "int",                   # 매수금액
+    "buy_amt_irds": "int",              # 투자자별 매수 금액 증감(억)
+    "buy_amt_sum": "int",               # 매수정산합
+    "buy_avg_pric": "price",            # 매수평균가
+    "buy_bid": "price",                 # 매수호가
+    "buy_bid_tot": "int",               # 매수호가총잔량
+    "buy_cntr_amt": "int",              # 매수체결금액
+    "buy_cntr_qty": "int",              # 매수체결수량
+    "buy_dfrt_trde_amt": "int",         # 매수차익거래금액
+    "buy_dfrt_trde_irds_amt": "int",    # 매수차익거래증감액
+    "buy_dfrt_trde_qty": "int",         # 매수차익거래수량
+    "buy_engg_amt": "int",              # 매수약정금액
+    "buy_exct_amt": "int",              # 매수정산금
+    "buy_qty": "int",                   # 매수량
+    "buy_qty_irds": "int",              # 투자자별 매수 수량 증감(천)
+    "buy_req": "int",                   # 매수잔량
+    "buy_rt": "float",                  # 매수비율
+    "buy_scesn_tm": None,               # 매수이탈시간
+    "buy_tot_req": "int",               # 매수총잔량
+    "buy_trde_ori_1": None,
+    "buy_trde_ori_2": None,
+    "buy_trde_ori_3": None,
+    "buy_trde_ori_4": None,
+    "buy_trde_ori_5": None,
+    "buy_trde_ori_irds_1": "int",
+    "buy_trde_ori_irds_2": "int",
+    "buy_trde_ori_irds_3": "int",
+    "buy_trde_ori_irds_4": "int",
+    "buy_trde_ori_irds_5": "int",
+    "buy_trde_ori_qty_1": "int",
+    "buy_trde_ori_qty_2": "int",
+    "buy_trde_ori_qty_3": "int",
+    "buy_trde_ori_qty_4": "int",
+    "buy_trde_ori_qty_5": "int",
+    "buy_trde_qty": "int",              # 매수거래량
+    "buy_upper_scesn_ori": None,        # 매수상위이탈원
+    "buy_uv": "price",                  # 매입단가
+    "buy_wght": "float",                # 매수비중
+    "cap": "int",                       # 자본금
+    "cfp": "float",                     # 자본지지점
+    "ch_uncla": "int",                  # 현금미수금
+    "change": "int",                    # 전일대비 (11)
+    "change_rate": "float",             # 등락율 (12)
+    "change_sign": None,                # 전일대비기호 (25)
+    "chck_ina_amt": "int",              # 수표입금액
+    "chg_qty": "int",                   # 변동수량
+    "close_pric": "price",              # 종가
+    "clrn_alow_qty": "int",             # 청산가능수량
+    "clsprd_end_elwocr": None,          # 종기종료ELW발생
+    "cmsn": "int",                      # 수수료
+    "cmsn_alm_tax": "int",              # 수수료_제세금
+    "cncl_qty": "int",                  # 취소수량
+    "cnfm_qty": "int",                  # 확인수량
+    "cnfm_tm": None,                    # 확인시간
+    "cnt": "int",                       # 횟수
+    "cntr_dt": None,                    # 체결일
+    "cntr_no": None,                    # 체결번호
+    "cntr_prft_rt": "float",            # 체결수익률
+    "cntr_pric": "price",               # 체결가
+    "cntr_qty": "int",                  # 체결량
+    "cntr_str": "float",                # 체결강도
+    "cntr_str_20": "float",             # 체결강도 20분/20일
+    "cntr_str_5": "float",              # 체결강도 5분/5일
+    "cntr_str_60": "float",             # 체결강도 60분/60일
+    "cntr_tm": None,                    # 체결시간
+    "cntr_trde_qty": "int",             # 거래량(체결량)
+    "cntr_uv": "price",                 # 체결단가
+    "cnvt_rt": "float",                 # 전환비율
+    "code": None,                       # 거래원 코드
+    "comm_ord_tp": None,                # 통신구분
+    "cond_uv": "int",                   # 스톱가
+    "cont_yn": None,
+    "conv_pric": "price",               # 환산가격
+    "crd_alow_yn": None,                # 신용가능여부
+    "crd_amt": "int",                   # 신용금액
+    "crd_assr_rt": "float",             # 신용보증금율
+    "crd_deal_tp": None,                # 신용거래구분
+    "crd_deal_tp_nm": None,             # 신용거래구분명
+    "crd_grnt_rt": "float",             # 신용담보비율
+    "crd_int": "int",                   # 신용이자
+    "crd_limit_over_txt": None,         # 신용한도초과 텍스트
+    "crd_limit_over_yn": None,          # 신용한도초과여부
+    "crd_loan": "int",                  # 신용융자금
+    "crd_loan_able": None,
+    "crd_loan_d2": "int",               # 신용융자금D+2
+    "crd_loan_dt": None,                # 대출일
+    "crd_remn_rt": "float",             # 신용잔고율
+    "crd_rt": "float",                  # 신용비율
+    "crd_tp": None,                     # 신용구분
+    "crd_tp_nm": None,                  # 신용구분명
+    "crnc_cd": None,                    # 통화코드
+    "cur_prc": "price",                 # 종가
+    "cur_prc_n": "price",               # 현재가
+    "cur_qty": "int",                   # 현재잔고
+    "current_price": "price",           # 현재가 (10)
+    "d1_entra": "int",                  # d+1추정예수금
+    "d1_fx_entr": "int",                # d+1외화예수금
+    "d1_pymn_alow_amt": "int",          # d+1출금가능금액
+    "d2_entra": "int",                  # D+2추정예수금
+    "d2_fx_entr": "int",                # d+2외화예수금
+    "d2_pymn_alow_amt": "int",          # d+2출금가능금액
+    "d2ch_ord_alow_amt": "int",         # D2현금주문가능금액
+    "d2entra": "int",                   # D2추정예수금
+    "d2vexct_entr": "int",              # D2가정산예수금
+    "d3_fx_entr": "int",                # d+3외화예수금
+    "d4_fx_entr": "int",                # d+4외화예수금
+    "data_send_end_tp": None,           # 접수구분
+    "date": None,                       # 날짜
+    "day_stk_asst": "int",              # 추정자산
+    "dbrt_trde_cntrcnt": "int",         # 대차거래체결주수
+    "dbrt_trde_cntrcnt_rt": "float",    # 대차거래체결주수비율
+    "dbrt_trde_cntrcnt_sum": "int",     # 대차거래체결주수합
+    "dbrt_trde_irds": "int",            # 대차거래증감
+    "dbrt_trde_rpy": "int",             # 대차거래상환주수
+    "dbrt_trde_rpy_rt": "float",        # 대차거래상환주수비율
+    "dbrt_trde_rpy_sum": "int",         # 대차거래상환주수합
+    "dbst_bal": "int",                  # 예수금
+    "dcd_tp_nm": None,                  # 결제구분
+    "dcsn_pay_amt": "int",              # 확정지급액
+    "deal_amt": "int",                  # 거래금액
+    "deal_dt": None,                    # 거래일자
+    "deal_no": None,                    # 거래번호
+    "deal_qty": "int",                  # 거래수량
+    "delta": "float",                   # 델타
+    "dept_nm": None,                    # 관리자지점
+    "dfrt_trde_acc": "int",             # 차익거래누적
+    "dfrt_trde_buy": "int",             # 차익거래매수
+    "dfrt_trde_buy_qty": "int",         # 차익거래매수수량
+    "dfrt_trde_netprps": "int",         # 차익거래순매수
+    "dfrt_trde_netprps_qty": "int",     # 차익거래순매수수량
+    "dfrt_trde_sel": "int",             # 차익거래매도
+    "dfrt_trde_sell_qty": "int",        # 차익거래매도수량
+    "dfrt_trde_tdy": "int",             # 차익거래당일
+    "dfrt_trst_buy_amt": "int",         # 차익위탁매수금액
+    "dfrt_trst_buy_qty": "int",         # 차익위탁매수수량
+    "dfrt_trst_netprps_amt": "int",     # 차익위탁순매수금액
+    "dfrt_trst_netprps_qty": "int",     # 차익위탁순매수수량
+    "dfrt_trst_sell_amt": "int",        # 차익위탁매도금액
+    "dfrt_trst_sell_qty": "int",        # 차익위탁매도수량
+    "dispty_rt": "float",               # 괴리율
+    "dly_amt": "int",                   # 미수변제소요금
+    "dly_sum": "int",                   # 연체합
+    "dm1": "int",                       # D-1
+    "dm2": "int",                       # D-2
+    "dm3": "int",                       # D-3
+    "dmst_stex_tp": None,               # 국내거래소구분
+    "drng": "float",                    # 배수
+    "drstk": "float",                   # DR/주
+    "dt": None,                         # 일자
+    "dt_n": None,                       # 일자
+    "dt_prft_rt": "float",              # 기간수익률
+    "dt_prft_rt_n": "float",            # 기간수익률n
+    "dvid_bf_base": "price",            # 배당전기준
+    "dvida_amt": "int",                 # 배당금액
+    "elwappr_way": None,                # ELW결재방법
+    "elwcmpn_rt": "float",              # ELW보상율
+    "elwcnvt_rt": "float",              # ELW전환비율
+    "elwexec_pric": "price",            # ELW행사가
+    "elwexpr_evlt_pric": "price",       # ELW만기평가가격
+    "elwfin_trde_dt": None,             # ELW최종거래일
+    "elwflo_dt": None,                  # ELW상장일
+    "elwgear": "float",                 # ELW기어링
+    "elwinnr_vltl": "float",            # ELW내재변동성
+    "elwinvt_ix_comput": None,          # ELW투자지표산출
+    "elwlpord_pos": None,               # ELWLP주문가능
+    "elwpay_agnt": None,                # ELW지급대리인
+    "elwpay_dt": None,                  # ELW지급일
+    "elwpblicte_orgn": None,            # ELW발행기관
+    "elwpl_qutr_rt": "float",           # ELW손익분기율
+    "elwpric_rising_part_rt": "float",  # ELW가격상승참여율
+    "elwprty": "float",                 # ELW패리티
+    "elwrght_cntn": None,               # ELW권리내용
+    "elwrght_exec_way": None,           # ELW권리행사방식
+    "elwrght_type": None,               # ELW권리유형
+    "elwspread": "float",               # ELW스프레드
+    "elwsrvive_dys": "int",             # ELW잔존일수
+    "elwtheory_pric": "price",          # ELW이론가
+    "endw_netprps": "int",              # 기금순매수
+    "engg_amt": "int",                  # 약정금액
+    "entr": "int",                      # 예수금
+    "entr_d1": "int",                   # 예수금D+1
+    "entr_d2": "int",                   # 예수금D+2
+    "entr_fr": "int",                   # 예수금_초
+    "entr_to": "int",                   # 예수금_말
+    "entra": "int",                     # 예수금
+    "entra_remn": "int",                # 예수금잔고
+    "eps": "int",                       # EPS
+    "est_amt": "int",                   # 평가금액
+    "est_lspft": "int",                 # 손익금액
+    "est_ratio": "float",               # 손익율 (단위: %)
+    "etc_corp": "int",                  # 기타법인
+    "etc_corp_netprps": "int",          # 기타법인순매수
+    "etc_fnnc": "int",                  # 기타금융
+    "etc_loan": "int",                  # 기타대여금
+    "etc_loan_dlfe": "int",             # 기타대여금연체료
+    "etc_loan_tot": "int",              # 기타대여금합계
+    "etfobjt_idex_cd": None,            # ETF대상지수코드
+    "etfobjt_idex_nm": None,            # ETF대상지수명
+    "etfprft_rt": "float",              # ETF수익률
+    "etftxon_type": None,               # ETF과세유형
+    "etntxon_type": None,               # ETN과세유형
+    "evlt_amt": "int",                  # 평가금액
+    "evlt_amt_tot": "int",              # 평가금액합계
+    "evlt_end_tm": None,                # 평가종료시간
+    "evlt_fnsh_yn": None,               # 평가완료여부
+    "evlt_pric": "price",               # 평가가격
+    "evlt_wght": "float",               # 평가비중
+    "evltv_prft": "int",                # 평가손익
+    "exct_amt": "int",                  # 정산금액
+    "exec_dt": None,                    # 행사일
+    "exec_pric": "price",               # 행사가격
+    "exec_time": None,                  # 체결시간 (20)
+    "exh_rt_incrs": "float",            # 소진율증가
+    "exp_acc_trde_qty": "int",          # 예상 체결 수량(누적)
+    "exp_cntr_pric": "price",           # 예상 체결가
+    "exp_cntr_qty": "int",              # 예상체결량
+    "exp_cntr_trde_qty": "int",         # 예상 체결 수량
+    "exp_flu_rt": "float",              # 예상 체결가 등락율
+    "exp_pre_sig": None,                # 예상 체결가 전일대비기호
+    "exp_pred_pre": "int",              # 예상 체결가 전일대비
+    "exp_rght_pric": "price",           # 예상권리가
+    "exp_tm": None,                     # 예상 체결 시간 (HHMMSS)
+    "expires_dt": None,
+    "expr_dt": None,                    # 만기일
+    "fall": "int",                      # 하락
+    "fall_stk_num": "int",              # 하락종목수
+    "fc_ch_uncla": "int",               # 외화현금미수금
+    "fc_krw_repl_evlta": "int",         # 원화대용평가금
+    "fc_trst_profa": "int",             # 해외주식증거금
+    "fc_uncla": "int",                  # 외화미수(합계)
+    "fin_trde_dt": None,                # 최종거래일
+    "flo_dt": None,                     # 상장일
+    "flo_stk": "int",                   # 상장주식수
+    "flo_stk_num": "int",               # 상장종목수
+    "flu_rt": "float",                  # 등락률
+    "flu_rt_n": "float",                # 등락률
+    "flu_sig": None,                    # 등락기호
+    "fnnc_invt": "int",                 # 금융투자
+    "for_daly_nettrde_qty": "int",      # 외인일별순매매수량
+    "for_dt_acc": "int",                # 외인기간누적
+    "for_netprps": "int",               # 외국인 순매수 수량
+    "for_netprps_amt": "int",           # 외인순매수금액
+    "for_netprps_qty": "int",           # 외인순매수수량
+    "for_netprps_stk_cd": None,         # 외인순매수종목코드
+    "for_netprps_stk_nm": None,         # 외인순매수종목명
+    "for_netslmt_amt": "int",           # 외인순매도금액
+    "for_netslmt_qty": "int",           # 외인순매도수량
+    "for_netslmt_stk_cd": None,         # 외인순매도종목코드
+    "for_netslmt_stk_nm": None,         # 외인순매도종목명
+    "for_nettrde_amt": "int",           # 외인순매매금액
+    "for_nettrde_avg_pric": "price",    # 외인순매매평균가
+    "for_nettrde_qty": "int",           # 외인순매매수량
+    "for_poss": "int",                  # 외인보유
+    "for_prsm_avg_pric": "price",
+    "for_rmnd_qty": "int",              # 외인보유수량
+    "for_wght": "float",                # 외인비중
+    "fr_dt": None,                      # 평가시작일자
+    "fr_tm": None,                      # 평가시작시간
+    "frgn": "int",                      # 외국계
+    "frgn_buy_prsm_sum": "int",
+    "frgn_buy_prsm_sum_chang": "int",
+    "frgn_sel_prsm_sum": "int",
+    "frgn_sel_prsm_sum_chang": "int",
+    "frgnr_cont_netprps_amt": "int",    # 외국인연속순매수금액
+    "frgnr_cont_netprps_dys": "int",    # 외국인연속순매수일수
+    "frgnr_cont_netprps_qty": "int",    # 외국인연속순매수량
+    "frgnr_daly_nettrde": "int",        # 외국인일별순매매
+    "frgnr_invsr": "int",               # 외국인투자자
+    "frgnr_limit": "int",               # 외국인한도
+    "frgnr_limit_irds": "int",          # 외국인한도증감
+    "frgnr_netprps": "int",             # 외국인순매수
+    "frgnr_nettrde_amt": "int",         # 외국인순매매액
+    "frgnr_nettrde_qty": "int",         # 외국인순매매량
+    "frgnr_qota_rt": "float",           # 외국인지분율
+    "fx_entr": "int",
+    "gain_pos_stkcnt": "int",           # 취득가능주식수
+    "gam": "float",                     # 감마
+    "gb": None,                         # 구분
+    "gear_rt": "float",                 # 기어링비율
+    "gnrl_stk_evlt_amt_d2": "int",      # 일반주식평가금액D+2
+    "gold_spot_vat": "int",             # 금현물부가가치세
+    "grant_type": None,
+    "grnt_use_amt": "int",              # 담보대출금
+    "group": None,                      # 그룹
+    "high_pric": "price",               # 고가
+    "high_price": "price",              # 고가 (17)
+    "imaf_hgst_pric": "price",          # 직후최고가
+    "imaf_lwst_pric": "price",          # 직후최저가
+    "ina_amt": "int",                   # 입금금액
+    "incm_tax": "int",                  # 소득세
+    "ind_invsr": "int",                 # 개인투자자
+    "ind_netprps": "int",               # 개인순매수
+    "inds_cd": None,                    # 업종코드
+    "inds_nm": None,                    # 업종명
+    "innr_vltl": "float",               # 내재변동성
+    "insert_delete": None,              # 삽입삭제 구분 I:삽입 D:삭제 (843)
+    "insrnc": "int",                    # 보험
+    "insrnc_netprps": "int",            # 보험순매수
+    "invtrt": "int",                    # 투신
+    "invtrt_netprps": "int",            # 투신순매수
+    "io_tp_nm": None,                   # 입출구분명
+    "isscomp_nm": None,                 # 발행사명
+    "item": None,                       # 종목코드
+    "iv": "float",                      # IV
+    "jmp_rt": "float",                  # 급등률
+    "jnsinkm_netprps": "int",           # 종신금순매수
+    "kobarr": "price",                  # KO베리어
+    "kospi200": "float",                # KOSPI200
+    "last_price": "price",              # 전일종가
+    "last_tic_cnt": "int",
+    "law": "float",                     # 로
+    "limit_exh_rt": "float",            # 한도소진률
+    "list_count": "int",                # 상장주식수
+    "loan_dt": None,                    # 대출일
+    "low_pric": "price",                # 저가
+    "low_price": "price",               # 저가 (18)
+    "lp": "int",                        # LP
+    "lpinitlast_suply_dt": None,        # LP초종공급일
+    "lpmmcm_nm": None,                  # LP회원사명
+    "lpmmcm_nm_1": None,                # LP회원사명1
+    "lpmmcm_nm_2": None,                # LP회원사명2
+    "lpposs_rt": "float",               # LP보유비율
+    "lprmnd_qty": "int",                # LP보유수량
+    "lpsuply_end_dt": None,             # LP공급종료일
+    "ls_grnt": "int",                   # 대주담보금
+    "lspft_ratio": "float",             # 당월손익율
+    "lspft_rt": "float",                # 누적손익율
+    "lst": "int",                       # 하한
+    "lst_pric": "price",                # 하한가
+    "lvrg": "float",                    # 레버리지
+    "mac": "int",                       # 시가총액
+    "main_stk": None,                   # 주요종목
+    "mang_empno": None,                 # 관리사원번호
+    "market_code": None,                # 시장구분코드
+    "market_name": None,                # 시장명
+    "mdfy_cncl": None,                  # 정정취소
+    "mdfy_cncl_tp": None,               # 정정/취소구분
+    "mdfy_qty": "int",                  # 정정수량
+    "mdia_nm": None,                    # 매체구분명
+    "min_amt": "int",                   # 미수불가금액
+    "mmcm_cd": None,                    # 회원사코드
+    "mmcm_nm": None,                    # 회원사명
+    "mngr_nm": None,                    # 관리자명
+    "mont_trde_qty": "int",             # 순간거래량
+    "motn_pric": "price",               # 발동가격
+    "mrkt_deal_tp": None,               # 시장구분
+    "name": None,                       # 거래원명
+    "natfor": "int",                    # 내외국인
+    "native_trmt_frgnr_netprps": "int",  # 내국인대우외국인순매수
+    "natn": "int",                      # 국가
+    "natn_netprps": "int",              # 국가순매수
+    "nav": "float",                     # NAV
+    "navetf": "float",                  # NAVETF
+    "navetfdispty_rt": "float",         # NAV/ETF괴리율
+    "navflu_rt": "float",               # NAV등락율
+    "navidex": "float",                 # NAV지수
+    "navidex_dispty_rt": "float",       # NAV/지수괴리율
+    "navpred_pre": "int",               # NAV전일대비
+    "ndiffpro_trde_acc": "int",         # 비차익거래누적
+    "ndiffpro_trde_buy": "int",         # 비차익거래매수
+    "ndiffpro_trde_buy_qty": "int",     # 비차익거래매수수량
+    "ndiffpro_trde_netprps": "int",     # 비차익거래순매수
+    "ndiffpro_trde_netprps_qty": "int",  # 비차익거래순매수수량
+    "ndiffpro_trde_sel": "int",         # 비차익거래매도
+    "ndiffpro_trde_sell_qty": "int",    # 비차익거래매도수량
+    "ndiffpro_trde_tdy": "int",         # 비차익거래당일
+    "ndiffpro_trst_buy_amt": "int",     # 비차익위탁매수금액
+    "ndiffpro_trst_buy_qty": "int",     # 비차익위탁매수수량
+    "ndiffpro_trst_netprps_amt": "int",  # 비차익위탁순매수금액
+    "ndiffpro_trst_netprps_qty": "int",  # 비차익위탁순매수수량
+    "ndiffpro_trst_sell_amt": "int",    # 비차익위탁매도금액
+    "ndiffpro_trst_sell_qty": "int",    # 비차익위탁매도수량
+    "net_amt": "int",                   # 예탁자산평가액
+    "net_entr": "int",                  # 추정예수금
+    "netprps": "int",                   # 순매수
+    "netprps_amt": "int",               # 순매수금액
+    "netprps_amt_irds": "int",          # 투자자별 순매수 금액 증감(억)
+    "netprps_prica": "int",             # 순매수대금
+    "netprps_qty": "int",               # 순매수량
+    "netprps_qty_irds": "int",          # 투자자별 순매수 수량 증감(천)
+    "netprps_req": "int",               # 순매수잔량
+    "netprps_trde_qty": "int",          # 순매수거래량
+    "netslmt": "int",                   # 순매도
+    "netslmt_amt": "int",               # 순매도금액
+    "netslmt_qty": "int",               # 순매도수량
+    "nettrde_amt": "int",               # 순매매금액
+    "nettrde_qty": "int",               # 순매매량
+    "new": "int",                       # 신규
+    "next_key": None,
+    "now": "int",                       # 현재
+    "now_rank": "int",                  # 현재순위
+    "now_rt": "float",                  # 현재비율
+    "now_trde_qty": "int",              # 현재거래량
+    "nrpy_loan": "int",                 # 미상환융자금
+    "nxdy_wthd_alowa": "int",           # 익일인출가능금액
+    "nxt_enable": None,                 # NXT가능여부
+    "objt_idex_pre_rt": "float",        # 대상지수대비율
+    "open_pric": "price",               # 시가
+    "open_pric_pre": "int",             # 시가대비
+    "open_price": "price",              # 시가 (16)
+    "opmr_pred_rt": "float",            # 장중전일비
+    "opmr_trde_amt": "int",             # 장중거래금액
+    "opmr_trde_qty": "int",             # 장중거래량
+    "opmr_trde_rt": "float",            # 장중거래회전율
+    "ord_alow_100": "int",              # 100%주문가능금액
+    "ord_alow_20": "int",               # 20%주문가능금액
+    "ord_alow_30": "int",               # 30%주문가능금액
+    "ord_alow_40": "int",               # 40%주문가능금액
+    "ord_alow_50": "int",               # 50%주문가능금액
+    "ord_alow_60": "int",               # 60%주문가능금액
+    "ord_alow_amt": "int",              # 주문가능금액
+    "ord_alow_amt_entr": "int",         # 주문가능금액(예수금)
+    "ord_alowa": "int",                 # 주문가능현금
+    "ord_no": None,                     # 주문번호
+    "ord_pric": "price",                # 주문가격
+    "ord_qty": "int",                   # 주문수량
+    "ord_remnq": "int",                 # 미체결수량
+    "ord_stt": None,                    # 주문상태
+    "ord_tm": None,                     # 주문시간
+    "ord_uv": "price",                  # 주문단가
+    "orgn": "int",                      # 기관계
+    "orgn_cont_netprps_amt": "int",     # 기관계연속순매수금액
+    "orgn_cont_netprps_dys": "int",     # 기관계연속순매수일수
+    "orgn_cont_netprps_qty": "int",     # 기관계연속순매수량
+    "orgn_daly_nettrde": "int",         # 기관일별순매매
+    "orgn_daly_nettrde_qty": "int",     # 기관일별순매매수량
+    "orgn_dt_acc": "int",               # 기관기간누적
+    "orgn_netprps": "int",              # 기관 순매수 수량
+    "orgn_netprps_amt": "int",          # 기관순매수금액
+    "orgn_netprps_qty": "int",          # 기관순매수수량
+    "orgn_netprps_stk_cd": None,        # 기관순매수종목코드
+    "orgn_netprps_stk_nm": None,        # 기관순매수종목명
+    "orgn_netslmt_amt": "int",          # 기관순매도금액
+    "orgn_netslmt_qty": "int",          # 기관순매도수량
+    "orgn_netslmt_stk_cd": None,        # 기관순매도종목코드
+    "orgn_netslmt_stk_nm": None,        # 기관순매도종목명
+    "orgn_nettrde_amt": "int",          # 기관순매매금액
+    "orgn_nettrde_avg_pric": "price",   # 기관순매매평균가
+    "orgn_nettrde_qty": "int",          # 기관순매매량
+    "orgn_prsm_avg_pric": "price",
+    "ori_ord": None,                    # 원주문
+    "orig_deal_no": None,               # 원거래번호
+    "orig_ord_no": None,                # 원주문번호
+    "oso_qty": "int",                   # 미체결수량
+    "osop_qty": "int",                  # 미체결수량
+    "out_alowa": "int",                 # 미수가능금액
+    "outa": "int",                      # 출금금액
+    "ovr_shrts_qty": "int",             # 누적공매도량
+    "ovt_acc_trde_qty": "int",          # 시간외단일가 누적거래량
+    "ovt_buy_qty": "int",               # 시간외매수잔량
+    "ovt_buy_qty_change": "int",        # 시간외매수잔량대비
+    "ovt_buy_tot": "int",               # 시간외단일가 매수호가총잔량
+    "ovt_cur_prc": "price",             # 시간외단일가 현재가
+    "ovt_flu_rt": "float",              # 시간외단일가 등락률
+    "ovt_sell_qty": "int",              # 시간외매도잔량
+    "ovt_sell_qty_change": "int",       # 시간외매도잔량대비
+    "ovt_sell_tot": "int",              # 시간외단일가 매도호가총잔량
+    "oyr_hgst": "price",                # 연중최고
+    "oyr_lwst": "price",                # 연중최저
+    "paym_alowa": "int",                # 출금가능금액
+    "pbr": "float",                     # PBR
+    "penfnd_etc": "int",                # 연기금등
+    "per": "float",                     # PER
+    "pl_amt": "int",                    # 손익금액
+    "pl_prch_prc": "price",             # 손익분기매입가
+    "pl_qutr_pt": "price",              # 손익분기점
+    "pl_qutr_rt": "float",              # 손익분기율
+    "pl_rt": "float",                   # 손익률
+    "poss_rt": "float",                 # 보유비중(%)
+    "poss_stkcnt": "int",               # 보유주식수
+    "prcsr": None,                      # 처리자
+    "pre": "int",                       # 대비
+    "pre_rt": "float",                  # 대비율
+    "pre_sig": None,                    # 대비기호
+    "pre_sig_n": None,                  # 대비기호n
+    "pre_smbol": None,                  # 대비부호
+    "pre_tp": None,                     # 대비구분
+    "pred_buyq": "int",                 # 전일매수수량
+    "pred_close_pric": "price",         # 전일종가
+    "pred_dvida": "int",                # 전일배당금
+    "pred_pre": "int",                  # 전일 대비
+    "pred_pre_1": "int",                # 전일대비1
+    "pred_pre_2": "int",                # 전일대비2
+    "pred_pre_3": "int",                # 전일대비3
+    "pred_pre_n": "int",                # 전일대비
+    "pred_pre_sig": None,               # 전일대비기호
+    "pred_pre_sig_n": None,             # 전일대비기호
+    "pred_rank": "int",                 # 전일순위
+    "pred_reu_alowa": "int",            # 전일재사용가능금액
+    "pred_reu_alowa_fin": "int",        # 전일재사용가능금액최종
+    "pred_rt": "float",                 # 전일비
+    "pred_sellq": "int",                # 전일매도수량
+    "pred_trde_qty": "int",             # 전일거래량
+    "prev_trde_qty": "int",             # 이전거래량
+    "prft_rt": "float",                 # 수익률
+    "pri_buy_bid_unit": "price",        # 매수호가
+    "pri_sel_bid_unit": "price",        # 매도호가
+    "pric_end": "price",                # 가격대끝
+    "pric_strt": "price",               # 가격대시작
+    "price": "price",                   # 호가 (원)
+    "prid_stkpc_flu": "int",            # 기간중주가등락
+    "prid_stkpc_flu_rt": "float",       # 기간중주가등락률
+    "prid_trde_qty": "int",             # 기간중거래량
+    "prm": "int",                       # 프로그램
+    "prm_buy_amt": "int",               # 프로그램매수금액
+    "prm_buy_qty": "int",               # 프로그램매수수량
+    "prm_netprps_amt": "int",           # 프로그램순매수금액
+    "prm_netprps_amt_irds": "int",      # 프로그램순매수금액증감
+    "prm_netprps_qty": "int",           # 프로그램순매수수량
+    "prm_netprps_qty_irds": "int",      # 프로그램순매수수량증감
+    "prm_sell_amt": "int",              # 프로그램매도금액
+    "prm_sell_qty": "int",              # 프로그램매도수량
+    "proc_brch_nm": None,               # 처리점
+    "proc_time": None,                  # 처리시간
+    "proc_tm": None,                    # 처리시간
+    "profa_100ord_alow_amt": "int",     # 증거금100%주문가능금액
+    "profa_100ord_alowq": "int",        # 증거금100%주문가능수량
+    "profa_20ord_alow_amt": "int",      # 증거금20%주문가능금액
+    "profa_20ord_alowq": "int",         # 증거금20%주문가능수량
+    "profa_30ord_alow_amt": "int",      # 증거금30%주문가능금액
+    "profa_30ord_alowq": "int",         # 증거금30%주문가능수량
+    "profa_40ord_alow_amt": "int",      # 증거금40%주문가능금액
+    "profa_40ord_alowq": "int",         # 증거금40%주문가능수량
+    "profa_50ord_alow_amt": "int",      # 증거금50%주문가능금액
+    "profa_50ord_alowq": "int",         # 증거금50%주문가능수량
+    "profa_60ord_alow_amt": "int",      # 증거금60%주문가능금액
+    "profa_60ord_alowq": "int",         # 증거금60%주문가능수량
+    "profa_ch": "int",                  # 주식증거금현금
+    "profa_rt": "float",                # 계좌증거금율
+    "prps_qty": "int",                  # 매물량
+    "prps_rt": "float",                 # 매물비
+    "prsm_dpst_aset_amt": "int",        # 추정예탁자산
+    "prsm_dpst_aset_amt_bncr_skip": "int",  # 추정예탁자산수익증권제외
+    "prsm_entra": "int",                # 추정예수금
+    "prsm_pymn_alow_amt": "int",        # 추정출금가능금액
+    "prty": "float",                    # 패리티
+    "pur_amt": "int",                   # 매입금액
+    "pur_cmsn": "int",                  # 매입수수료
+    "pur_pric": "price",                # 매입가
+    "pymn_alow_amt": "int",             # 출금가능금액
+    "pymn_alow_amt_entr": "int",        # 출금가능금액(예수금)
+    "qry_dt": None,                     # 조회일자
+    "qry_tm": None,                     # 조회시간
+    "qty": "int",                       # 거래량
+    "qty_change": "int",                # 잔량직전대비
+    "rank": "int",                      # 순위
+    "rank_1": "int",
+    "rank_2": "int",
+    "rank_3": "int",
+    "rcpy_no": None,                    # 출납번호
+    "real_qty": "int",                  # 보유수량
+    "reg_day": None,                    # 상장일
+    "remn": "int",                      # 잔고
+    "remn_amt": "int",                  # 잔고금액
+    "remn_amt_rt": "float",             # 잔고금액비율
+    "remn_amt_sum": "int",              # 잔고금액합
+    "remn_rcvord_sum": "int",           # 잔고수주합
+    "remn_rt": "float",                 # 잔고율
+    "repl_amt": "int",                  # 대용금
+    "repl_pric": "price",               # 대용가
+    "resi_tax": "int",                  # 주민세
+    "rght_tp": None,                    # 권리구분
+    "rising": "int",                    # 상승
+    "rising_stk_num": "int",            # 상승종목수
+    "rlzt_pl": "int",                   # 실현손익
+    "rmnd": "int",                      # 잔고주수
+    "rmnd_qty": "int",                  # 보유수량
+    "rmnd_rt": "float",                 # 잔고주수비율
+    "rmnd_sum": "int",                  # 잔고주수합
+    "rmrk_nm": None,                    # 적요명
+    "roe": "float",                     # ROE
+    "rpya": "int",                      # 상환
+    "rpym_sum": "int",                  # 변제합
+    "rsrv_oppo": None,                  # 예약/반대
+    "rsrv_tp": None,                    # 반대여부
+    "rstx": "int",                      # 농특세
+    "samo_fund": "int",                 # 사모펀드
+    "samo_fund_netprps": "int",         # 사모펀드순매수
+    "sc_netprps": "int",                # 증권순매수
+    "scrt_evlt_amt_fr": "int",          # 유가증권평가금액_초
+    "scrt_evlt_amt_to": "int",          # 유가증권평가금액_말
+    "sdnin_qty": "int",                 # 급증량
+    "sdnin_rt": "float",                # 급증률
+    "secretkey": None,
+    "sel_avg_pric": "price",            # 매도평균가
+    "sel_bid": "price",                 # 매도호가
+    "sel_bid_tot": "int",               # 매도호가총잔량
+    "sel_cntr_amt": "int",              # 매도체결금액
+    "sel_cntr_qty": "int",              # 매도체결수량
+    "sel_dfrt_trde_amt": "int",         # 매도차익거래금액
+    "sel_dfrt_trde_irds_amt": "int",    # 매도차익거래증감액
+    "sel_dfrt_trde_qty": "int",         # 매도차익거래수량
+    "sel_qty": "int",                   # 매도량
+    "sel_req": "int",                   # 매도잔량
+    "sel_scesn_tm": None,               # 매도이탈시간
+    "sel_tot_req": "int",               # 매도총잔량
+    "sel_trde_ori_1": None,
+    "sel_trde_ori_2": None,
+    "sel_trde_ori_3": None,
+    "sel_trde_ori_4": None,
+    "sel_trde_ori_5": None,
+    "sel_trde_ori_irds_1": "int",
+    "sel_trde_ori_irds_2": "int",
+    "sel_trde_ori_irds_3": "int",
+    "sel_trde_ori_irds_4": "int",
+    "sel_trde_ori_irds_5": "int",
+    "sel_trde_ori_qty_1": "int",
+    "sel_trde_ori_qty_2": "int",
+    "sel_trde_ori_qty_3": "int",
+    "sel_trde_ori_qty_4": "int",
+    "sel_trde_ori_qty_5": "int",
+    "sel_trde_qty": "int",              # 매도거래량
+    "sel_upper_scesn_ori": None,        # 매도상위이탈원
+    "sell_amt": "int",                  # 매도금액
+    "sell_amt_irds": "int",             # 투자자별 매도 금액 증감(억)
+    "sell_amt_sum": "int",              # 매도정산합
+    "sell_buy": None,                   # 매도/수 구분 (907)
+    "sell_buy_exct_amt": "int",         # 매도매수정산금
+    "sell_cmsn": "int",                 # 평가수수료
+    "sell_exct_amt": "int",             # 매도정산금
+    "sell_grntl_engg_amt": "int",       # 매도약정금액
+    "sell_qty": "int",                  # 매도수량
+    "sell_qty_irds": "int",             # 투자자별 매도 수량 증감(천)
+    "sell_tp": None,                    # 매도/수 구분
+    "sell_uv": "price",                 # 투자자별 매도 단가
+    "seq": None,                        # 일련번호
+    "serial": None,                     # 일련번호 (841)
+    "setl_dt": None,                    # 결제일자
+    "setl_remn": "int",                 # 결제잔고
+    "setl_tp": None,                    # 결제구분
+    "shrts_avg_pric": "price",          # 공매도평균가
+    "shrts_qty": "int",                 # 공매도량
+    "shrts_trde_prica": "int",          # 공매도거래대금
+    "sndhalf_mrkt_hgst_pric": "price",  # 후반장최고가
+    "sndhalf_mrkt_lwst_pric": "price",  # 후반장최저가
+    "sor_yn": None,                     # SOR 여부
+    "spot_remn": "int",                 # 현물잔고
+    "sqnc": None,                       # 회차
+    "srvive_dys": "int",                # 잔존일수
+    "state": None,                      # 종목상태
+    "stdns": "int",                     # 보합
+    "stex_tp": None,                    # 거래소 구분
+    "stex_tp_txt": None,                # 거래소구분텍스트
+    "stk_assr_rt": "float",             # 종목보증금율
+    "stk_assr_rt_nm": None,             # 종목보증금율명
+    "stk_bond_tp": None,                # 주식채권구분
+    "stk_cd": None,                     # 종목코드
+    "stk_cls": None,                    # 종목분류
+    "stk_infr": None,                   # 종목정보
+    "stk_nm": None,                     # 종목명
+    "stk_num": "int",                   # 종목수
+    "stk_profa_rt": "float",            # 종목증거금율
+    "stkcnt": "int",                    # 주식수
+    "stkpc_flu": "int",                 # 주가등락
+    "stock_code": None,                 # 종목코드 (9001)
+    "stock_name": None,                 # 종목명 (302)
+    "sum_cmsn": "int",                  # 수수료합
+    "tax": "int",                       # 세금
+    "tax_tot_amt": "int",               # 소득/주민세
+    "tdy_buyq": "int",                  # 금일매수수량
+    "tdy_close_pric": "price",          # 당일종가
+    "tdy_close_pric_flu_rt": "float",   # 당일종가등락률
+    "tdy_high_pric": "price",           # 당일고가
+    "tdy_htssel_cmsn": "int",           # 당일hts매도수수료
+    "tdy_low_pric": "price",            # 당일저가
+    "tdy_lspft": "int",                 # 당일투자손익
+    "tdy_lspft_rt": "float",            # 당일손익율
+    "tdy_reu_alowa": "int",             # 금일재사용가능금액
+    "tdy_reu_alowa_fin": "int",         # 금일재사용가능금액최종
+    "tdy_rlzt_pl": "int",
+    "tdy_sel_pl": "int",                # 당일매도손익
+    "tdy_sellq": "int",                 # 금일매도수량
+    "tdy_trde_cmsn": "int",             # 당일매매수수료
+    "tdy_trde_tax": "int",              # 당일매매세금
+    "termin_tot_pymn": "int",           # 기간내총출금
+    "termin_tot_trns": "int",           # 기간내총입금
+    "tern_rt": "float",                 # 회전율
+    "thema_grp_cd": None,               # 테마그룹코드
+    "thema_nm": None,                   # 테마명
+    "theory_pric": "price",             # 이론가
+    "theta": "float",                   # 쎄타
+    "time_or_dt": None,                 # 시간 또는 일자
+    "tm": None,                         # 시간
+    "tm_n": None,                       # 시간
+    "to_dt": None,                      # 평가종료일자
+    "token": None,
+    "token_type": None,
+    "tot": "int",                       # 합계
+    "tot_1": "int",                     # 매수체결수량합계
+    "tot_2": "int",                     # 매수체결금액합계
+    "tot_3": "int",                     # 매도체결수량합계
+    "tot_4": "int",                     # 매도체결금액합계
+    "tot_5": "int",                     # 순매수대금합계
+    "tot_6": "int",                     # 합계6
+    "tot_amt_fr": "int",                # 순자산액계_초
+    "tot_amt_to": "int",                # 순자산액계_말
+    "tot_book_amt2": "int",             # 총매입금액
+    "tot_buy_amt": "int",               # 총매수금액
+    "tot_buy_qty": "int",               # 총매수량
+    "tot_buy_qty_change": "int",        # 총매수잔량직전대비
+    "tot_buy_req": "int",               # 총매수잔량
+    "tot_cmsn_tax": "int",              # 총수수료_세금
+    "tot_cont_netprps_amt": "int",      # 합계연속순매수금액
+    "tot_cont_netprps_dys": "int",      # 합계연속순매수일수
+    "tot_cont_nettrde_qty": "int",      # 합계연속순매매수량
+    "tot_crd_loan_amt": "int",          # 총융자금액
+    "tot_crd_ls_amt": "int",            # 총대주금액
+    "tot_dep_amt": "int",               # 추정예탁자산
+    "tot_entr": "int",                  # 예수금
+    "tot_est_amt": "int",               # 유가잔고평가액
+    "tot_evlt_amt": "int",              # 총평가금액
+    "tot_evlt_pl": "int",               # 총평가손익금액
+    "tot_evltv_prft": "int",            # 총평가손익
+    "tot_exct_amt": "int",              # 총정산금액
+    "tot_loan_amt": "int",              # 총대출금
+    "tot_pl_amt": "int",                # 총손익금액
+    "tot_pl_rt": "float",               # 총손익률
+    "tot_pl_tot": "int",                # 총손익합계
+    "tot_prft_rt": "float",             # 수익률
+    "tot_pur_amt": "int",               # 총매입금액
+    "tot_sel_req": "int",               # 총매도잔량
+    "tot_sell_amt": "int",              # 총매도금액
+    "tot_sell_qty": "int",              # 총매도잔량
+    "tot_sell_qty_change": "int",       # 총매도잔량직전대비
+    "tp": None,                         # 구분
+    "trace": "float",                   # 추적
+    "trace_cur_prc": "price",           # 추적현재가
+    "trace_eor_rt": "float",            # 추적오차율
+    "trace_flu_rt": "float",            # 추적등락율
+    "trace_idex": "float",              # 추적지수
+    "trace_idex_cd": None,              # 추적지수코드
+    "trace_idex_nm": None,              # 추적지수명
+    "trace_idex_pred_pre": "int",       # 추적지수전일대비
+    "trace_idex_pred_pre_sig": None,    # 추적지수전일대비기호
+    "trace_pre_sig": None,              # 추적대비기호
+    "trace_pred_pre": "int",            # 추적전일대비
+    "trde_able_qty": "int",             # 매매가능수량
+    "trde_amt": "int",                  # 거래금액
+    "trde_cmsn": "int",                 # 매매수수료
+    "trde_dt": None,                    # 거래일자
+    "trde_end_elwbase_pric": "price",   # 거래종료ELW기준가
+    "trde_frmatn_rt": "float",          # 거래형성비율
+    "trde_frmatn_stk_num": "int",       # 거래형성종목수
+    "trde_kind_nm": None,               # 거래종류명
+    "trde_no": None,                    # 거래번호
+    "trde_ori_nm": None,                # 거래원명
+    "trde_pre": "float",                # 전일 거래량 대비 비율
+    "trde_prica": "int",                # 거래대금
+    "trde_qty": "int",                  # 거래량
+    "trde_qty_jwa_cnt": "int",          # 거래수량/좌수
+    "trde_qty_n": "int",                # 거래량
+    "trde_qty_pre": "int",              # 거래량대비
+    "trde_tax": "int",                  # 거래세
+    "trde_tern_rt": "float",            # 거래회전율
+    "trde_tp": None,                    # 매매구분
+    "trde_wght": "float",               # 거래비중
+    "txbs": "price",                    # 과표기준
+    "type": None,                       # 실시간 항목 TR명
+    "uncl_ocr": "int",                  # 미수(원/g)
+    "uncla": "int",                     # 미수금
+    "unp": "price",                     # 단가
+    "up_name": None,                    # 업종명
+    "up_size_name": None,               # 회사크기분류
+    "upl": "int",                       # 상한
+    "upl_pric": "price",                # 상한가
+    "use_pos_ch": "int",                # 사용가능현금
+    "use_pos_ch_fin": "int",            # 사용가능현금최종
+    "use_pos_repl": "int",              # 사용가능대용
+    "use_pos_repl_fin": "int",          # 사용가능대용최종
+    "uv_exrt": "price",                 # 거래단가
+    "vega": "float",                    # 베가
+    "viaplc_tp": None,                  # VI적용구분
+    "vimotn_cnt": "int",                # VI발동횟수
+    "vlad_tax": "int",                  # 부가가치세
+    "volume": "int",                    # 누적거래량 (13)
+    "wght": "float",                    # 비중
+    "wk52_hgst_pric": "price",          # 52주최고가
+    "wk52_hgst_pric_dt": None,          # 52주최고가일
+    "wk52_hgst_pric_pre_rt": "float",   # 52주최고가대비율
+    "wk52_lwst_pric": "price",          # 52주최저가
+    "wk52_lwst_pric_dt": None,          # 52주최저가일
+    "wk52_lwst_pric_pre_rt": "float",   # 52주최저가대비율
+    "wonju_pric": "price",              # 원주가격
+    "wthd_alowa": "int",                # 인출가능금액
+    "xraymont_cntr_qty_arng_trde_tp": None,  # Xray순간체결량정리매매구분
+    "xraymont_cntr_qty_profa_100tp": None,  # Xray순간체결량증거금100구분
+}
+
+# 같은 이름이 모델마다 뜻이 다른 필드. (모델 이름, 필드 이름) → 숫자 종류
+_MODEL_FIELD_KINDS: dict[tuple[str, str], NumericKind | None] = {
+    ("GoldBidItem", "lpmmcm_nm_1"): "float",  # K.O 접근도
+}
+
+# 모델 필드와 이름이 다른 응답 키 → 모델 필드. 원시 응답 dict를 열로 바꿀 때 쓴다.
+# TR 스키마의 ``renames``와 조회 메서드가 직접 옮기는 키를 함께 적는다.
+_RESPONSE_KEYS: dict[str, str] = {
+    # 종목정보 리스트 (ka10099, ka10100)
+    "listCount": "list_count",
+    "lastPrice": "last_price",
+    "regDay": "reg_day",
+    "marketCode": "market_code",
+    "marketName": "market_name",
+    "upName": "up_name",
+    "upSizeName": "up_size_name",
+    "nxtEnable": "nxt_enable",
+    # 체결강도 (ka10046, ka10047)
+    "cntr_str_5min": "cntr_str_5",
+    "cntr_str_20min": "cntr_str_20",
+    "cntr_str_60min": "cntr_str_60",
+    # 호가잔량·잔량율 급증 기준률 (ka10021, ka10022)
+    "int": "base_rt",
+    # 주식호가 (ka10004), 시간외단일가 (ka10087)
+    "bid_req_base_tm": "base_time",
+    "buy_bid_tot_req": "buy_bid_tot",
+    "sel_bid_tot_req": "sel_bid_tot",
+    "buy_fpr_bid": "price",
+    "sel_fpr_bid": "price",
+    "buy_fpr_req": "qty",
+    "sel_fpr_req": "qty",
+    "buy_1th_pre_req_pre": "qty_change",
+    "sel_1th_pre_req_pre": "qty_change",
+    "tot_buy_req": "tot_buy_qty",
+    "tot_sel_req": "tot_sell_qty",
+    "tot_buy_req_jub_pre": "tot_buy_qty_change",
+    "tot_sel_req_jub_pre": "tot_sell_qty_change",
+    "ovt_sigpric_cur_prc": "ovt_cur_prc",
+    "ovt_sigpric_flu_rt": "ovt_flu_rt",
+    "ovt_sigpric_acc_trde_qty": "ovt_acc_trde_qty",
+    "ovt_sigpric_buy_bid_tot_req": "ovt_buy_tot",
+    "ovt_sigpric_sel_bid_tot_req": "ovt_sell_tot",
+    "ovt_buy_req": "ovt_buy_qty",
+    "ovt_sel_req": "ovt_sell_qty",
+    "ovt_buy_req_pre": "ovt_buy_qty_change",
+    "ovt_sel_req_pre": "ovt_sell_qty_change",
+    # 증거금세부내역 (kt00013)
+    "100ord_alow_amt": "ord_alow_100",
+    "20ord_alow_amt": "ord_alow_20",
+    "30ord_alow_amt": "ord_alow_30",
+    "40ord_alow_amt": "ord_alow_40",
+    "50ord_alow_amt": "ord_alow_50",
+    "60ord_alow_amt": "ord_alow_60",
+    # 업종현재가 52주 최고·최저 (ka20001, ka20009)
+    "52wk_hgst_pric": "wk52_hgst_pric",
+    "52wk_hgst_pric_dt": "wk52_hgst_pric_dt",
+    "52wk_hgst_pric_pre_rt": "wk52_hgst_pric_pre_rt",
+    "52wk_lwst_pric": "wk52_lwst_pric",
+    "52wk_lwst_pric_dt": "wk52_lwst_pric_dt",
+    "52wk_lwst_pric_pre_rt": "wk52_lwst_pric_pre_rt",
+}
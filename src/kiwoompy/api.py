@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import contextvars
+import heapq
+import importlib.util
+import inspect
+import itertools
 import logging
+import re
 import threading
 import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import httpx
 from tenacity import (
+    RetryCallState,
     before_sleep_log,
     retry,
     retry_if_exception,
@@ -15,8 +30,14 @@ from tenacity import (
     wait_exponential,
 )
 
-from kiwoompy.exceptions import KiwoomApiError, KiwoomAuthError
-from kiwoompy.models import Env
+from kiwoompy.codec import json_dumps, json_key, json_loads
+from kiwoompy.exceptions import KiwoomApiError, KiwoomAuthError, KiwoomRateLimitError
+from kiwoompy.metrics import MetricsHook, _RequestSample
+
+if TYPE_CHECKING:
+    # 타입 별칭만 쓰므로 import 시간을 줄이기 위해 큰 models 모듈을 런타임에 불러오지 않는다.
+    from kiwoompy.models import Env, RequestPriority
+    from kiwoompy.shared import RateLimitStore
 
 logger = logging.getLogger(__name__)
 
@@ -34,93 +55,741 @@ _DEFAULT_RPS: dict[str, float] = {
     "demo": 2.0,
 }
 
-_TIMEOUT = 10.0   # 초
+_TIMEOUT = 10.0   # 초 — 연결·읽기·쓰기·풀 대기 각각의 기본 타임아웃
+_KEEPALIVE_EXPIRY = 30.0  # 유휴 연결 유지 시간 (초)
 _MAX_ATTEMPTS = 3  # 최초 1회 + 재시도 2회
 _WAIT_MIN = 1.0   # 지수 백오프 최소 대기 (초)
 _WAIT_MAX = 8.0   # 지수 백오프 최대 대기 (초)
+_RETRY_AFTER_MAX = 60.0  # Retry-After 최대 허용 대기 (초)
+
+# 유량 한도 초과 판별 — HTTP 상태 코드, 응답 본문 코드, 코드가 없을 때의 메시지 문구
+_RATE_LIMIT_STATUS = 429
+_RATE_LIMIT_CODE = 1700
+_RATE_LIMIT_MSG_TEXT = "허용된 요청 개수를 초과"
+
+# 응답 메시지 앞머리의 메시지 코드 (예: ``"[1700:허용된 요청 개수를 초과..."``)
+_MSG_CODE_RE = re.compile(r"(?<!\d)(\d+):")
+
+# 접근토큰 만료·무효 판별 — HTTP 상태 코드와 응답 본문 메시지 코드
+_TOKEN_INVALID_STATUS = (401, 403)
+_TOKEN_INVALID_CODE = 8005
+_TOKEN_INVALID_MSG_TEXT = "Token이 유효하지"
+_REFRESH_RETRY_WAIT = 30.0  # 백그라운드 토큰 갱신 실패 시 다시 시도하기까지 대기 (초)
+
+# AIMD 적응형 유량 제어
+#   한도 초과 응답마다 유효 RPS를 절반으로 줄이고(최소 _AIMD_MIN_RATIO × 설정 RPS),
+#   성공 응답마다 _AIMD_STEP씩 설정 RPS까지 회복한다.
+_AIMD_DECREASE = 0.5
+_AIMD_STEP = 0.1
+_AIMD_MIN_RATIO = 0.05
+
+
+# 요청 우선순위 등급 → 대기열 순위 (작을수록 먼저 전송)
+_PRIORITY_RANK: dict[str, int] = {
+    "order":   0,
+    "account": 1,
+    "market":  2,
+    "bulk":    3,
+}
+
+# api-id별 기본 우선순위 등급. 목록에 없는 조회 TR은 ``"market"``.
+_API_ID_PRIORITY: dict[str, RequestPriority] = {
+    # 인증·주문
+    "au10001": "order",
+    "au10002": "order",
+    "kt10000": "order",
+    "kt10001": "order",
+    "kt10002": "order",
+    "kt10003": "order",
+    "kt10006": "order",
+    "kt10007": "order",
+    "kt10008": "order",
+    "kt10009": "order",
+    "kt50000": "order",
+    "kt50001": "order",
+    "kt50002": "order",
+    "kt50003": "order",
+    # 계좌 조회
+    "ka00001": "account",
+    "ka01690": "account",
+    "ka10072": "account",
+    "ka10073": "account",
+    "ka10074": "account",
+    "ka10075": "account",
+    "ka10076": "account",
+    "ka10077": "account",
+    "ka10085": "account",
+    "ka10088": "account",
+    "ka10170": "account",
+    "kt00001": "account",
+    "kt00002": "account",
+    "kt00003": "account",
+    "kt00004": "account",
+    "kt00005": "account",
+    "kt00007": "account",
+    "kt00008": "account",
+    "kt00009": "account",
+    "kt00010": "account",
+    "kt00011": "account",
+    "kt00012": "account",
+    "kt00013": "account",
+    "kt00015": "account",
+    "kt00016": "account",
+    "kt00017": "account",
+    "kt00018": "account",
+    "kt50020": "account",
+    "kt50021": "account",
+    "kt50030": "account",
+    "kt50031": "account",
+    "kt50032": "account",
+    "kt50075": "account",
+    # 차트 (대량·백필)
+    "ka10060": "bulk",
+    "ka10064": "bulk",
+    "ka10079": "bulk",
+    "ka10080": "bulk",
+    "ka10081": "bulk",
+    "ka10082": "bulk",
+    "ka10083": "bulk",
+    "ka10094": "bulk",
+    "ka20004": "bulk",
+    "ka20005": "bulk",
+    "ka20006": "bulk",
+    "ka20007": "bulk",
+    "ka20008": "bulk",
+    "ka20019": "bulk",
+    "ka50079": "bulk",
+    "ka50080": "bulk",
+    "ka50081": "bulk",
+    "ka50082": "bulk",
+    "ka50083": "bulk",
+    "ka50091": "bulk",
+    "ka50092": "bulk",
+}
 
 
 def _is_retryable(exc: BaseException) -> bool:
     """재시도 대상 예외인지 판별한다.
 
     ``KiwoomApiError`` 중 4xx 인증 오류(``KiwoomAuthError``)는 재시도하지 않는다.
-    네트워크 오류·타임아웃·5xx 서버 오류만 재시도한다.
+    네트워크 오류·타임아웃·5xx 서버 오류·유량 한도 초과(``KiwoomRateLimitError``)만 재시도한다.
     """
     return isinstance(exc, KiwoomApiError) and not isinstance(exc, KiwoomAuthError)
 
 
+_wait_backoff = wait_exponential(multiplier=1, min=_WAIT_MIN, max=_WAIT_MAX)
+
+
+def _wait(retry_state: RetryCallState) -> float:
+    """재시도 대기 시간. 서버가 ``Retry-After``를 준 경우 그 값을, 아니면 지수 백오프를 쓴다."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, KiwoomRateLimitError) and exc.retry_after is not None:
+        return min(exc.retry_after, _RETRY_AFTER_MAX)
+    return _wait_backoff(retry_state)
+
+
 _retry = retry(
     retry=retry_if_exception(_is_retryable),
     stop=stop_after_attempt(_MAX_ATTEMPTS),
-    wait=wait_exponential(multiplier=1, min=_WAIT_MIN, max=_WAIT_MAX),
+    wait=_wait,
     before_sleep=before_sleep_log(logger, logging.WARNING),
     reraise=True,
 )
 
 
-class _RateLimiter:
-    """스레드 안전 토큰 버킷 기반 유량 제어기.
+# 단일 비행(single-flight) 병합에서 제외하는 주문 TR
+#   kt10000~kt10009: 주식 매수·매도·정정·취소, 신용 주문
+#   kt50000 이상: 금현물 주문 (같은 주문을 두 번 내는 것은 의도된 동작일 수 있다)
+_ORDER_TR_RANGES: tuple[tuple[int, int], ...] = ((10000, 10009), (50000, 59999))
+
+
+def _is_order_tr(api_id: str) -> bool:
+    """주문 TR(``kt10000``~``kt10009``, ``kt50000`` 이상)이면 ``True``."""
+    if not api_id.startswith("kt") or not api_id[2:].isdigit():
+        return False
+    number = int(api_id[2:])
+    return any(lo <= number <= hi for lo, hi in _ORDER_TR_RANGES)
+
+
+class _Flight:
+    """동기 클라이언트에서 진행 중인 요청 하나. 뒤따른 호출은 ``event``를 기다린다."""
+
+    __slots__ = ("event", "response", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.response: ApiResponse | None = None
+        self.error: BaseException | None = None
+
+
+class _Waiter:
+    """토큰 버킷 대기열의 단일 대기자.
+
+    동기 호출자는 ``threading.Event``, 비동기 호출자는 자신의 이벤트 루프에 묶인
+    ``asyncio.Event``로 깨어난다. 다른 스레드에서 깨워도 안전하다.
+    """
 
-    초당 ``rps``건을 초과하지 않도록 호출 간격을 제어한다.
-    멀티스레드 환경에서도 안전하게 동작한다.
+    __slots__ = ("_event", "_loop")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self._loop = loop
+        self._event: threading.Event | asyncio.Event = (
+            threading.Event() if loop is None else asyncio.Event()
+        )
+
+    def notify(self) -> None:
+        """대기 중인 호출자를 깨운다."""
+        if self._loop is None:
+            self._event.set()
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:  # 이벤트 루프가 이미 닫힌 경우
+            pass
+
+
+class _LocalRateLimitStore:
+    """프로세스 내부 토큰 버킷(GCRA) 상태. ``TokenBucket``의 잠금 안에서만 호출된다."""
+
+    def __init__(self) -> None:
+        # 이론적 도착 시각(TAT). 버킷이 가득 찬 상태면 현재 시각 이하이다.
+        self._tat = 0.0
+
+    def reserve(self, interval: float, tolerance: float) -> float:
+        """토큰 하나를 예약한다. 성공하면 ``0.0``, 아니면 남은 대기 시간(초)."""
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        delay = tat - tolerance - now
+        if delay > 0:
+            return delay
+        self._tat = tat + interval
+        return 0.0
+
+
+class TokenBucket:
+    """스레드·코루틴 공용 토큰 버킷 유량 제어기.
+
+    초당 ``rate``개의 토큰이 채워지고 최대 ``capacity``개까지 쌓인다. 쌓인 토큰만큼은
+    대기 없이 연속 호출(burst)할 수 있고, 소진 후에는 ``1/rate`` 간격으로 허용된다.
+
+    대기자는 ``priority``가 작은 순서로, 같은 우선순위 안에서는 도착 순서(FIFO)대로
+    토큰을 받는다. 우선순위가 높은 대기자가 있으면 낮은 대기자는 계속 뒤로 밀린다.
+    잠금은 상태 계산에만 사용하고 대기(sleep)는 잠금 밖에서 하므로, 대기 중인
+    호출자가 다른 호출자를 막지 않는다. 동기 호출은 ``acquire()``, 비동기 호출은
+    ``acquire_async()``를 사용한다.
 
     Args:
-        rps: 초당 최대 요청 수.
+        rate: 초당 토큰 충전 수 (초당 최대 요청 수).
+        capacity: 버킷 용량 (최대 연속 호출 수). 기본값 ``1``은 burst 없이
+            호출 간격을 ``1/rate``로 고정한다.
+        store: 버킷 상태 저장소. ``None``이면 프로세스 내부 상태를 사용한다.
+            ``FileRateLimitStore``를 주면 여러 프로세스가 한도를 공유한다.
     """
 
-    def __init__(self, rps: float) -> None:
-        self._min_interval = 1.0 / rps
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        store: RateLimitStore | None = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate!r}")
+        if capacity < 1:
+            raise ValueError(f"capacity는 1 이상이어야 합니다: {capacity!r}")
+        self._interval = 1.0 / rate
+        self._capacity = capacity
         self._lock = threading.Lock()
-        self._last_called = 0.0
+        self._store: RateLimitStore = store if store is not None else _LocalRateLimitStore()
+        # (priority, 도착 순번, 대기자) 최소 힙
+        self._waiters: list[tuple[int, int, _Waiter]] = []
+        self._seq = itertools.count()
 
-    def acquire(self) -> None:
-        """다음 요청을 허용할 때까지 필요하면 대기한다."""
+    @property
+    def rate(self) -> float:
+        """초당 토큰 충전 수."""
+        return 1.0 / self._interval
+
+    def set_rate(self, rate: float) -> None:
+        """초당 토큰 충전 수를 바꾼다. 대기 중인 호출자는 다음 확인 시점부터 적용받는다."""
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate!r}")
         with self._lock:
-            now = time.monotonic()
-            wait = self._min_interval - (now - self._last_called)
-            if wait > 0:
-                time.sleep(wait)
-            self._last_called = time.monotonic()
+            self._interval = 1.0 / rate
 
+    @property
+    def capacity(self) -> int:
+        """버킷 용량."""
+        return self._capacity
 
-class KiwoomApi:
-    """키움 REST API HTTP 클라이언트.
+    def _poll(self, waiter: _Waiter) -> float | None:
+        """잠금을 잡은 상태에서 ``waiter``의 토큰 획득을 시도한다.
 
-    모든 HTTP 호출은 이 클래스를 통해서만 이루어진다.
-    발급된 접근토큰을 내부에 보관하고, 이후 요청 헤더에 자동으로 포함한다.
+        Returns:
+            획득했으면 ``0.0``, 선두지만 토큰이 없으면 다음 토큰까지 남은 시간(초),
+            선두가 아니면 ``None`` (앞선 대기자가 깨워 줄 때까지 대기).
+        """
+        if self._waiters[0][2] is not waiter:
+            return None
+        delay = self._store.reserve(self._interval, (self._capacity - 1) * self._interval)
+        if delay > 0:
+            return delay
+        heapq.heappop(self._waiters)
+        if self._waiters:
+            self._waiters[0][2].notify()
+        return 0.0
 
-    **유량 제어**: 환경별 기본 RPS를 자동 적용한다.
+    def _abandon(self, waiter: _Waiter) -> None:
+        """취소·중단된 대기자를 대기열에서 제거하고 새 선두를 깨운다."""
+        with self._lock:
+            for i, entry in enumerate(self._waiters):
+                if entry[2] is waiter:
+                    break
+            else:
+                return
+            self._waiters.pop(i)
+            heapq.heapify(self._waiters)
+            if i == 0 and self._waiters:
+                self._waiters[0][2].notify()
 
-    - 실전(``real``): 기본 20건/초
-    - 모의(``demo``): 기본 2건/초
+    def _enqueue(self, waiter: _Waiter, priority: int) -> None:
+        """대기자를 우선순위 대기열에 넣는다."""
+        with self._lock:
+            heapq.heappush(self._waiters, (priority, next(self._seq), waiter))
 
-    ``rps`` 파라미터로 직접 조정할 수 있다.
+    def acquire(self, priority: int = 0) -> None:
+        """토큰을 하나 얻을 때까지 현재 스레드를 대기시킨다.
 
-    **재시도**: 네트워크 오류·타임아웃·5xx 서버 오류는 지수 백오프로 최대
-    ``_MAX_ATTEMPTS``회 재시도한다. 4xx 인증 오류는 재시도하지 않는다.
+        Args:
+            priority: 대기 우선순위. 작을수록 먼저 토큰을 받는다.
+        """
+        waiter = _Waiter()
+        self._enqueue(waiter, priority)
+        event: threading.Event = waiter._event  # type: ignore[assignment]
+        try:
+            while True:
+                with self._lock:
+                    delay = self._poll(waiter)
+                    if delay == 0.0:
+                        return
+                    event.clear()
+                event.wait(delay)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    async def acquire_async(self, priority: int = 0) -> None:
+        """토큰을 하나 얻을 때까지 현재 코루틴을 대기시킨다.
+
+        Args:
+            priority: 대기 우선순위. 작을수록 먼저 토큰을 받는다.
+        """
+        waiter = _Waiter(asyncio.get_running_loop())
+        self._enqueue(waiter, priority)
+        event: asyncio.Event = waiter._event  # type: ignore[assignment]
+        try:
+            while True:
+                with self._lock:
+                    delay = self._poll(waiter)
+                    if delay == 0.0:
+                        return
+                    event.clear()
+                try:
+                    async with asyncio.timeout(delay):
+                        await event.wait()
+                except TimeoutError:
+                    pass
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+
+def _raise_for_request_error(path: str, exc: httpx.RequestError) -> NoReturn:
+    """httpx 전송 예외를 ``KiwoomApiError``로 변환해 raise한다."""
+    if isinstance(exc, httpx.TimeoutException):
+        raise KiwoomApiError(f"요청 타임아웃: {path}") from exc
+    raise KiwoomApiError(f"네트워크 오류: {exc}") from exc
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """``Retry-After`` 헤더(초 또는 HTTP 날짜)를 대기 초로 변환한다."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _has_error_code(body: dict, code: int, text: str) -> bool:
+    """오류 응답 본문이 ``code`` 오류인지 판별한다.
+
+    ``return_code``가 ``code``와 같거나 ``return_msg``의 메시지 코드가 ``code``이면 참이다.
+    메시지에 코드가 없을 때만 ``text`` 문구 포함 여부로 판별한다.
+    """
+    return_code = body.get("return_code")
+    if return_code is None or return_code == 0:
+        return False
+    if str(return_code) == str(code):
+        return True
+    return _message_has_code(str(body.get("return_msg", "")), code, text)
+
+
+def _message_has_code(msg: str, code: int, text: str) -> bool:
+    """메시지의 메시지 코드가 ``code``인지 판별한다. 코드가 없으면 ``text`` 문구로 판별한다."""
+    codes = [int(found) for found in _MSG_CODE_RE.findall(msg)]
+    if codes:
+        return code in codes
+    return text in msg
+
+
+def _is_rate_limited_body(body: dict) -> bool:
+    """HTTP 200 응답 본문이 요청 개수 초과 오류인지 판별한다."""
+    return _has_error_code(body, _RATE_LIMIT_CODE, _RATE_LIMIT_MSG_TEXT)
+
+
+def _is_token_invalid_body(body: dict) -> bool:
+    """HTTP 200 응답 본문이 접근토큰 만료·무효 오류인지 판별한다."""
+    return _has_error_code(body, _TOKEN_INVALID_CODE, _TOKEN_INVALID_MSG_TEXT)
+
+
+def _is_token_error(exc: KiwoomAuthError) -> bool:
+    """인증 오류가 접근토큰 만료·무효 때문인지 판별한다 (앱 키 오류·잘못된 요청 등은 제외)."""
+    if exc.status_code in _TOKEN_INVALID_STATUS:
+        return True
+    msg = str(exc)
+    if f"(return_code={_TOKEN_INVALID_CODE})" in msg:
+        return True
+    return _message_has_code(msg, _TOKEN_INVALID_CODE, _TOKEN_INVALID_MSG_TEXT)
+
+
+def _parse_response(response: httpx.Response) -> dict:
+    """HTTP 응답의 상태 코드를 검사하고 본문 JSON을 반환한다.
 
     Args:
-        env: 환경 구분. ``"real"`` (운영) 또는 ``"demo"`` (모의투자).
-        rps: 초당 최대 요청 수. ``None``이면 환경별 기본값 사용.
+        response: httpx 응답 객체.
+
+    Returns:
+        응답 JSON을 파싱한 딕셔너리.
+
+    Raises:
+        KiwoomRateLimitError: HTTP 429 응답.
+        KiwoomAuthError: 그 밖의 HTTP 4xx 응답.
+        KiwoomApiError: HTTP 5xx 응답 또는 JSON 파싱 실패.
+    """
+    if response.status_code == _RATE_LIMIT_STATUS:
+        raise KiwoomRateLimitError(
+            f"유량 한도 초과: {response.text}",
+            status_code=response.status_code,
+            retry_after=_parse_retry_after(response.headers.get("retry-after")),
+        )
+    if 400 <= response.status_code < 500:
+        raise KiwoomAuthError(
+            f"인증 오류: {response.text}",
+            status_code=response.status_code,
+        )
+    if response.status_code >= 500:
+        raise KiwoomApiError(
+            f"서버 오류: {response.text}",
+            status_code=response.status_code,
+        )
+
+    try:
+        return json_loads(response.content)
+    except Exception as exc:
+        raise KiwoomApiError(f"응답 파싱 실패: {response.text}") from exc
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    """HTTP 연결 풀·프로토콜·타임아웃 설정.
+
+    기본값은 HTTP/1.1, 연결·읽기·쓰기·풀 대기 타임아웃 각 10초이다.
+
+    Args:
+        http2: HTTP/2 사용 여부. 하나의 TLS 연결에서 여러 요청을 동시에 주고받는다.
+            ``h2`` 패키지가 필요하다 (``pip install "kiwoompy[http2]"``).
+        max_connections: 최대 동시 연결 수.
+        max_keepalive_connections: 유휴 상태로 유지할 최대 연결 수.
+        keepalive_expiry: 유휴 연결을 유지하는 시간(초). ``warmup()``으로 미리 연 연결이
+            첫 요청 전에 닫히지 않도록 충분히 길게 잡는다.
+        connect_timeout: TCP·TLS 연결 타임아웃(초).
+        read_timeout: 응답 수신 타임아웃(초).
+        write_timeout: 요청 송신 타임아웃(초).
+        pool_timeout: 연결 풀에서 빈 연결을 기다리는 타임아웃(초).
+    """
+
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = _KEEPALIVE_EXPIRY
+    connect_timeout: float = _TIMEOUT
+    read_timeout: float = _TIMEOUT
+    write_timeout: float = _TIMEOUT
+    pool_timeout: float = _TIMEOUT
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """``httpx.Client``/``httpx.AsyncClient`` 생성 인자를 반환한다.
+
+        Raises:
+            ImportError: ``http2=True``인데 ``h2`` 패키지가 설치되지 않은 경우.
+        """
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "http2=True 사용 시 h2 패키지가 필요합니다: pip install \"kiwoompy[http2]\""
+            )
+        return {
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                write=self.write_timeout,
+                pool=self.pool_timeout,
+            ),
+        }
+
+
+@dataclass(frozen=True)
+class ApiResponse:
+    """응답 본문과 헤더를 함께 담은 REST 응답.
+
+    연속조회 TR은 다음 페이지 여부(``cont-yn``)와 연속조회키(``next-key``)를
+    응답 헤더로 돌려준다.
+
+    Args:
+        body: 응답 JSON을 파싱한 딕셔너리.
+        headers: 응답 헤더. 키는 소문자.
+    """
+
+    body: dict
+    headers: dict[str, str]
+
+    @property
+    def next_key(self) -> str:
+        """다음 페이지 요청에 사용할 연속조회키. 없으면 빈 문자열."""
+        return self.headers.get("next-key", "")
+
+    @property
+    def has_next(self) -> bool:
+        """연속조회할 다음 페이지가 있으면 ``True``."""
+        return self.headers.get("cont-yn") == "Y" and bool(self.next_key)
+
+
+class _KiwoomApiBase(ABC):
+    """동기·비동기 HTTP 클라이언트가 공유하는 base URL·접근토큰·유량 제어 기능.
+
+    서브클래스는 실행 모델(스레드 타이머·이벤트 루프)에 맞게 백그라운드 토큰 갱신
+    예약(``schedule_token_refresh``)과 취소(``_cancel_refresh``)를 구현한다.
     """
 
-    def __init__(self, env: Env = "demo", rps: float | None = None) -> None:
+    def __init__(
+        self,
+        env: Env,
+        rps: float | None,
+        burst: int,
+        priorities: dict[str, RequestPriority] | None,
+        rate_limit_store: RateLimitStore | None,
+        adaptive: bool,
+        coalesce: bool,
+        metrics: MetricsHook | None,
+    ) -> None:
+        self._env: Env = env
         self._base_url: str = _BASE_URLS[env]
         self._token: str | None = None
-        self._rate_limiter = _RateLimiter(rps if rps is not None else _DEFAULT_RPS[env])
-        self._client = httpx.Client(
-            base_url=self._base_url,
-            headers={"Content-Type": "application/json;charset=UTF-8"},
-            timeout=_TIMEOUT,
+        self._appkey: str | None = None
+        self._priorities: dict[str, RequestPriority] = {**_API_ID_PRIORITY, **(priorities or {})}
+        self._max_rps = rps if rps is not None else _DEFAULT_RPS[env]
+        self._adaptive = adaptive
+        self._rate_limiter = TokenBucket(self._max_rps, capacity=burst, store=rate_limit_store)
+        self._coalesce = coalesce
+        self._metrics = metrics
+        self._refresher: Callable[[], Any] | None = None
+
+    @property
+    def env(self) -> Env:
+        """환경 구분 (``"real"`` 또는 ``"demo"``)."""
+        return self._env
+
+    @property
+    def effective_rps(self) -> float:
+        """현재 적용 중인 초당 최대 요청 수.
+
+        ``adaptive=True``면 한도 초과 응답에 따라 설정값 아래로 내려갔다가 회복한다.
+        """
+        return self._rate_limiter.rate
+
+    def _on_throttled(self) -> None:
+        """한도 초과 응답을 받으면 유효 RPS를 곱셈 감소시킨다."""
+        if not self._adaptive:
+            return
+        floor = self._max_rps * _AIMD_MIN_RATIO
+        rate = max(floor, self._rate_limiter.rate * _AIMD_DECREASE)
+        self._rate_limiter.set_rate(rate)
+        logger.warning("유량 한도 초과 응답 — 유효 RPS를 %.2f로 낮춥니다.", rate)
+
+    def _on_success(self) -> None:
+        """정상 응답을 받으면 유효 RPS를 설정값까지 덧셈 증가시킨다."""
+        if not self._adaptive:
+            return
+        rate = self._rate_limiter.rate
+        if rate < self._max_rps:
+            self._rate_limiter.set_rate(min(self._max_rps, rate + _AIMD_STEP))
+
+    def _handle_response(self, response: httpx.Response) -> ApiResponse:
+        """HTTP 응답을 검사해 ``ApiResponse``로 변환하고 적응형 유량 제어에 반영한다.
+
+        Raises:
+            KiwoomRateLimitError: HTTP 429 또는 본문의 요청 개수 초과 오류.
+            KiwoomAuthError: 그 밖의 HTTP 4xx 응답 또는 본문의 토큰 만료·무효 오류.
+            KiwoomApiError: HTTP 5xx 응답 또는 JSON 파싱 실패.
+        """
+        try:
+            body = _parse_response(response)
+        except KiwoomRateLimitError:
+            self._on_throttled()
+            raise
+        if _is_rate_limited_body(body):
+            self._on_throttled()
+            raise KiwoomRateLimitError(
+                f"유량 한도 초과 (return_code={body.get('return_code')}): "
+                f"{body.get('return_msg', '')}",
+            )
+        if _is_token_invalid_body(body):
+            raise KiwoomAuthError(
+                f"접근토큰 만료·무효 (return_code={body.get('return_code')}): "
+                f"{body.get('return_msg', '')}",
+            )
+        self._on_success()
+        return ApiResponse(body=body, headers=dict(response.headers))
+
+    def _priority_rank(
+        self,
+        headers: dict[str, str] | None,
+        priority: RequestPriority | None,
+    ) -> int:
+        """요청의 대기열 순위를 결정한다.
+
+        ``priority``가 주어지면 그대로 쓰고, 없으면 ``api-id`` 헤더로 등급을 찾는다.
+        ``api-id``가 없는 요청(토큰 발급)은 ``"order"``, 매핑에 없는 TR은 ``"market"``.
+        """
+        if priority is None:
+            api_id = headers.get("api-id") if headers else None
+            priority = "order" if api_id is None else self._priorities.get(api_id, "market")
+        return _PRIORITY_RANK[priority]
+
+    def _flight_key(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None,
+        priority: RequestPriority | None,
+    ) -> tuple[str, ...] | None:
+        """병합 키를 만든다. 병합 대상이 아니면 ``None``.
+
+        ``api-id``가 있는 조회 TR만 병합한다. 토큰 발급(``api-id`` 없음)·주문 TR·
+        ``"order"`` 등급으로 지정된 요청은 항상 따로 전송한다. 연속조회 헤더
+        (``cont-yn``/``next-key``)가 다르면 다른 요청이다.
+        """
+        if not self._coalesce or not headers:
+            return None
+        api_id = headers.get("api-id")
+        if api_id is None or _is_order_tr(api_id):
+            return None
+        if self._priority_rank(headers, priority) == _PRIORITY_RANK["order"]:
+            return None
+        return (
+            path,
+            api_id,
+            headers.get("cont-yn", ""),
+            headers.get("next-key", ""),
+            json_key(body),
         )
 
-    def set_token(self, token: str) -> None:
+    def _report(
+        self,
+        path: str,
+        headers: dict[str, str] | None,
+        sample: _RequestSample,
+    ) -> None:
+        """계측 훅에 요청 한 건의 계측값을 전달한다. 훅의 예외는 요청 결과에 영향을 주지 않는다."""
+        if self._metrics is None:
+            return
+        api_id = headers.get("api-id", "") if headers else ""
+        try:
+            self._metrics(sample.to_metrics(api_id, path))
+        except Exception:
+            logger.exception("계측 훅 실행 중 오류 (api-id=%s)", api_id)
+
+    def _stale_token(self, headers: dict[str, str] | None, exc: KiwoomAuthError) -> str | None:
+        """토큰 갱신 후 한 번 재시도할 요청이면 요청에 실린(만료된) 토큰을 반환한다.
+
+        갱신 함수가 등록돼 있고, ``Authorization`` 헤더를 실은 요청이 토큰 만료·무효로
+        거절된 경우만 해당한다. 토큰 발급 요청은 헤더가 없으므로 재귀하지 않는다.
+        """
+        if self._refresher is None or not headers or not _is_token_error(exc):
+            return None
+        authorization = headers.get("Authorization", "")
+        if not authorization.startswith("Bearer "):
+            return None
+        return authorization.removeprefix("Bearer ")
+
+    @staticmethod
+    def _with_auth(headers: dict[str, str], token: str | None) -> dict[str, str]:
+        """``headers``의 ``Authorization``을 현재 토큰으로 바꾼 사본."""
+        return {**headers, "Authorization": f"Bearer {token}"}
+
+    @property
+    def token(self) -> str | None:
+        """현재 저장된 접근토큰. 아직 발급되지 않았으면 ``None``."""
+        return self._token
+
+    @property
+    def appkey(self) -> str | None:
+        """현재 토큰을 발급한 앱 키. ``set_token()``에 주지 않았으면 ``None``."""
+        return self._appkey
+
+    def set_token(self, token: str, appkey: str | None = None) -> None:
         """발급된 접근토큰을 저장한다. 이후 모든 요청에 자동 포함된다.
 
+        진행 중인 다른 요청에 영향을 주지 않도록 토큰·앱 키 참조만 교체한다.
+
         Args:
             token: 접근토큰 문자열.
+            appkey: 토큰을 발급한 앱 키. 응답 캐시가 계좌(앱 키)별로 항목을 나누는 데 쓴다.
+                ``KiwoomAuth``가 토큰을 발급하면 함께 넘긴다.
         """
-        self._token = token
+        self._token, self._appkey = token, appkey
+
+    def set_token_refresher(self, refresher: Callable[[], Any] | None) -> None:
+        """접근토큰 갱신 함수를 등록한다.
+
+        등록하면 ``schedule_token_refresh()``로 예약한 시각에 백그라운드에서 토큰을
+        갱신하고, 요청이 토큰 만료·무효로 거절되면 갱신 후 한 번 재시도한다.
+        ``KiwoomAuth(auto_refresh=True)``가 토큰 발급 시 등록한다.
+
+        Args:
+            refresher: 새 토큰을 발급해 ``set_token()``을 호출하는 함수.
+                ``AsyncKiwoomApi``에서는 코루틴을 반환하는 함수. ``None``이면 해제한다.
+        """
+        self._refresher = refresher
+        if refresher is None:
+            self._cancel_refresh()
+
+    @abstractmethod
+    def schedule_token_refresh(self, at: datetime) -> None:
+        """``at``에 백그라운드 토큰 갱신을 예약한다. 이전 예약은 취소된다."""
+
+    @abstractmethod
+    def _cancel_refresh(self) -> None:
+        """예약된 백그라운드 토큰 갱신을 취소한다."""
 
     def get_auth_header(self) -> dict[str, str]:
         """현재 저장된 접근토큰으로 Authorization 헤더를 반환한다.
@@ -135,52 +804,295 @@ class KiwoomApi:
             raise KiwoomAuthError("접근토큰이 없습니다. issue_token()을 먼저 호출하세요.")
         return {"Authorization": f"Bearer {self._token}"}
 
-    @_retry
-    def post(self, path: str, body: dict, headers: dict[str, str] | None = None) -> dict:
+
+class KiwoomApi(_KiwoomApiBase):
+    """키움 REST API HTTP 클라이언트.
+
+    모든 HTTP 호출은 이 클래스를 통해서만 이루어진다.
+    발급된 접근토큰을 내부에 보관하고, 이후 요청 헤더에 자동으로 포함한다.
+
+    **유량 제어**: 환경별 기본 RPS를 토큰 버킷으로 자동 적용한다.
+
+    - 실전(``real``): 기본 20건/초
+    - 모의(``demo``): 기본 2건/초
+
+    ``rps`` 파라미터로 직접 조정할 수 있다. ``burst``를 2 이상으로 주면 쌓인 토큰
+    수만큼 대기 없이 연속 호출할 수 있다 (예: 장 시작 직후 잔고·호가 일괄 조회).
+
+    **적응형 유량 제어**: 서버가 요청 개수 초과(HTTP 429 또는 해당 ``return_code``)로
+    거절하면 유효 RPS를 절반으로 줄이고, 이후 정상 응답마다 조금씩 ``rps``까지 회복한다
+    (AIMD). 현재 값은 ``effective_rps``로 확인한다. ``adaptive=False``면 고정 RPS를 쓴다.
+
+    **우선순위**: 유량 한도를 기다리는 요청은 ``api-id``별 등급 순서로 전송된다.
+
+    - ``"order"``: 주문·정정·취소, 토큰 발급
+    - ``"account"``: 계좌·잔고·체결 조회
+    - ``"market"``: 시세·종목정보·순위 등 (기본값)
+    - ``"bulk"``: 차트 조회 (대량 백필)
+
+    차트 백필로 한도가 포화돼도 취소 주문은 대기열 맨 앞에서 전송된다.
+    ``priorities``로 ``api-id``별 등급을 덮어쓸 수 있다.
+
+    **연결**: ``http``로 HTTP/2·연결 풀·단계별 타임아웃을 설정한다. 장 시작 전에
+    ``warmup()``을 호출하면 TLS 연결을 미리 열어 첫 주문의 핸드셰이크 지연을 없앤다.
+
+    **요청 병합**: ``coalesce=True``면 같은 경로·``api-id``·본문의 조회 요청이 동시에
+    진행 중일 때 뒤따른 호출은 새로 보내지 않고 먼저 보낸 요청의 응답을 함께 받는다.
+    유량 한도도 한 건만 소모한다. 주문 TR(``kt10000``~``kt10009``, ``kt50000`` 이상)과
+    토큰 발급은 병합하지 않는다. 병합된 호출은 같은 ``ApiResponse`` 객체를 공유하므로
+    응답 본문을 수정하지 않아야 한다.
+
+    **계측**: ``metrics`` 훅을 주면 서버로 전송한 요청마다 유량 대기·네트워크 지연·
+    파싱 시간, 요청·응답 크기, 시도 횟수, 오류 클래스를 담은 ``RequestMetrics``를
+    전달한다. ``MetricsRecorder``는 이를 ``api-id``별 p50/p95/p99로 집계한다.
+
+    **재시도**: 네트워크 오류·타임아웃·5xx 서버 오류·유량 한도 초과는 지수 백오프로 최대
+    ``_MAX_ATTEMPTS``회 재시도한다. 서버가 ``Retry-After``를 주면 그 시간만큼 기다린다.
+    4xx 인증 오류는 재시도하지 않는다.
+
+    Args:
+        env: 환경 구분. ``"real"`` (운영) 또는 ``"demo"`` (모의투자).
+        rps: 초당 최대 요청 수. ``None``이면 환경별 기본값 사용.
+        burst: 최대 연속 호출 수(토큰 버킷 용량). 기본값 ``1``은 호출 간격을
+            ``1/rps``로 고정한다.
+        priorities: ``api-id`` → 우선순위 등급 재정의. 기본 매핑에 덮어쓴다.
+        rate_limit_store: 유량 제어 상태 저장소. ``FileRateLimitStore``를 주면 같은
+            저장소를 쓰는 모든 프로세스가 하나의 한도를 나눠 쓴다.
+        adaptive: 한도 초과 응답에 따라 유효 RPS를 자동 조절할지 여부. 기본값 ``True``.
+        http: HTTP/2·연결 풀·타임아웃 설정. ``None``이면 ``HttpConfig()`` 기본값.
+        coalesce: 동시에 진행 중인 동일 조회 요청을 하나로 병합할지 여부. 기본값 ``False``.
+        metrics: 요청 계측 훅. 서버로 전송한 요청마다 ``RequestMetrics``로 호출된다.
+    """
+
+    def __init__(
+        self,
+        env: Env = "demo",
+        rps: float | None = None,
+        burst: int = 1,
+        priorities: dict[str, RequestPriority] | None = None,
+        rate_limit_store: RateLimitStore | None = None,
+        adaptive: bool = True,
+        http: HttpConfig | None = None,
+        coalesce: bool = False,
+        metrics: MetricsHook | None = None,
+    ) -> None:
+        super().__init__(
+            env, rps, burst, priorities, rate_limit_store, adaptive, coalesce, metrics
+        )
+        self._client = httpx.Client(
+            base_url=self._base_url,
+            headers={"Content-Type": "application/json;charset=UTF-8"},
+            **(http or HttpConfig()).client_kwargs(),
+        )
+        self._inflight: dict[tuple[str, ...], _Flight] = {}
+        self._inflight_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer: threading.Timer | None = None
+
+    def post(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> dict:
         """JSON POST 요청을 보내고 응답 JSON을 반환한다.
 
-        유량 제어 후 요청을 전송한다. 네트워크 오류·타임아웃·5xx는 지수 백오프로
+        유량 제어 후 요청을 전송한다. 네트워크 오류·타임아웃·5xx·유량 한도 초과는
         재시도한다. 4xx 응답(``KiwoomAuthError``)은 재시도하지 않고 즉시 raise한다.
 
         Args:
             path: 엔드포인트 경로 (예: ``"/oauth2/token"``).
             body: 요청 본문 딕셔너리.
             headers: 추가 요청 헤더. ``None``이면 기본 헤더만 사용.
+            priority: 유량 대기 우선순위 등급. ``None``이면 ``api-id``별 기본 등급.
 
         Returns:
             응답 JSON을 파싱한 딕셔너리.
 
         Raises:
+            KiwoomRateLimitError: 최대 재시도 후에도 유량 한도 초과가 지속되는 경우.
             KiwoomAuthError: HTTP 4xx 응답 (인증 실패 등). 재시도 없음.
             KiwoomApiError: 최대 재시도 후에도 5xx·네트워크·파싱 오류가 지속되는 경우.
         """
-        self._rate_limiter.acquire()
+        return self.request(path, body, headers, priority).body
+
+    def request(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> ApiResponse:
+        """JSON POST 요청을 보내고 응답 본문과 헤더를 함께 반환한다.
+
+        ``post()``와 같지만 연속조회(``cont-yn``/``next-key``)처럼 응답 헤더가
+        필요한 경우에 사용한다.
+
+        Args:
+            path: 엔드포인트 경로.
+            body: 요청 본문 딕셔너리.
+            headers: 추가 요청 헤더. ``None``이면 기본 헤더만 사용.
+            priority: 유량 대기 우선순위 등급. ``None``이면 ``api-id``별 기본 등급.
+
+        Returns:
+            응답 본문·헤더를 담은 ``ApiResponse``.
+
+        Raises:
+            KiwoomRateLimitError: 최대 재시도 후에도 유량 한도 초과가 지속되는 경우.
+            KiwoomAuthError: HTTP 4xx 응답 (인증 실패 등). 재시도 없음.
+            KiwoomApiError: 최대 재시도 후에도 5xx·네트워크·파싱 오류가 지속되는 경우.
+        """
+        key = self._flight_key(path, body, headers, priority)
+        if key is None:
+            return self._send(path, body, headers, priority)
+
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
 
         try:
-            response = self._client.post(path, json=body, headers=headers)
-        except httpx.TimeoutException as exc:
-            raise KiwoomApiError(f"요청 타임아웃: {path}") from exc
-        except httpx.RequestError as exc:
-            raise KiwoomApiError(f"네트워크 오류: {exc}") from exc
+            flight.response = self._send(path, body, headers, priority)
+            return flight.response
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            flight.event.set()
 
-        if 400 <= response.status_code < 500:
-            raise KiwoomAuthError(
-                f"인증 오류: {response.text}",
-                status_code=response.status_code,
-            )
-        if response.status_code >= 500:
-            raise KiwoomApiError(
-                f"서버 오류: {response.text}",
-                status_code=response.status_code,
-            )
+    def _send(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None,
+        priority: RequestPriority | None,
+    ) -> ApiResponse:
+        """요청을 전송한다. 토큰 만료·무효로 거절되면 토큰을 갱신하고 한 번 재시도한다."""
+        try:
+            return self._transmit(path, body, headers, priority)
+        except KiwoomAuthError as exc:
+            stale = self._stale_token(headers, exc)
+            if stale is None:
+                raise
+        self._refresh_token(stale)
+        return self._transmit(path, body, self._with_auth(headers, self._token), priority)
+
+    def _refresh_token(self, stale: str | None = None) -> None:
+        """등록된 갱신 함수로 토큰을 갱신한다.
+
+        여러 스레드가 같은 만료 토큰으로 실패해도 갱신은 한 번만 한다. ``stale``이
+        이미 다른 토큰으로 교체됐으면 아무것도 하지 않는다.
+        """
+        with self._refresh_lock:
+            if stale is not None and self._token != stale:
+                return
+            self._refresher()
+
+    def _refresh_in_background(self) -> None:
+        """예약된 시각에 타이머 스레드에서 토큰을 갱신한다. 실패하면 잠시 후 다시 시도한다."""
+        try:
+            self._refresh_token()
+        except Exception:
+            logger.exception("접근토큰 백그라운드 갱신 실패 — %.0f초 후 재시도합니다.", _REFRESH_RETRY_WAIT)
+            self._start_refresh_timer(_REFRESH_RETRY_WAIT)
+
+    def _start_refresh_timer(self, delay: float) -> None:
+        self._cancel_refresh()
+        timer = threading.Timer(delay, self._refresh_in_background)
+        timer.daemon = True
+        timer.name = "kiwoom-token-refresh"
+        self._refresh_timer = timer
+        timer.start()
+
+    def schedule_token_refresh(self, at: datetime) -> None:
+        """``at``에 데몬 타이머 스레드에서 토큰을 갱신하도록 예약한다. 이전 예약은 취소된다.
+
+        Args:
+            at: 갱신 시각 (로컬 시각). 이미 지났으면 즉시 갱신한다.
+        """
+        if self._refresher is None:
+            return
+        self._start_refresh_timer(max(0.0, (at - datetime.now()).total_seconds()))
 
+    def _cancel_refresh(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def _transmit(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None,
+        priority: RequestPriority | None,
+    ) -> ApiResponse:
+        """요청을 재시도를 포함해 전송하고 계측값을 보고한다."""
+        sample = _RequestSample()
         try:
-            return response.json()
+            return self._attempt(path, body, headers, priority, sample)
         except Exception as exc:
-            raise KiwoomApiError(f"응답 파싱 실패: {response.text}") from exc
+            sample.error = exc
+            raise
+        finally:
+            self._report(path, headers, sample)
+
+    @_retry
+    def _attempt(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None,
+        priority: RequestPriority | None,
+        sample: _RequestSample,
+    ) -> ApiResponse:
+        """유량 제어 후 요청을 한 건 전송한다. 재시도는 이 단위로 이루어진다."""
+        sample.attempts += 1
+        started = time.perf_counter()
+        self._rate_limiter.acquire(self._priority_rank(headers, priority))
+        sent = time.perf_counter()
+        sample.queue_wait += sent - started
+
+        try:
+            response = self._client.post(path, content=json_dumps(body), headers=headers)
+        except httpx.RequestError as exc:
+            _raise_for_request_error(path, exc)
+        finally:
+            received = time.perf_counter()
+            sample.latency += received - sent
+        sample.request_bytes += len(response.request.content)
+        sample.response_bytes += len(response.content)
+        try:
+            return self._handle_response(response)
+        finally:
+            sample.parse_time += time.perf_counter() - received
+
+    def warmup(self) -> None:
+        """서버와 TLS 연결을 미리 열어 연결 풀에 넣어 둔다.
+
+        TR 요청이 아니므로 유량 한도를 소모하지 않는다. 응답 상태 코드와 관계없이
+        연결이 열리면 성공으로 본다. 열린 연결은 ``HttpConfig.keepalive_expiry`` 동안
+        유지되므로 첫 요청 직전에 호출한다.
+
+        Raises:
+            KiwoomApiError: 연결 실패 또는 타임아웃.
+        """
+        try:
+            self._client.head("/")
+        except httpx.RequestError as exc:
+            _raise_for_request_error("/", exc)
 
     def close(self) -> None:
-        """HTTP 클라이언트 세션을 닫는다."""
+        """HTTP 클라이언트 세션을 닫고 예약된 토큰 갱신을 취소한다."""
+        self._cancel_refresh()
         self._client.close()
 
     def __enter__(self) -> KiwoomApi:
@@ -188,3 +1100,581 @@ class KiwoomApi:
 
     def __exit__(self, *_: object) -> None:
         self.close()
+
+
+class AsyncKiwoomApi(_KiwoomApiBase):
+    """키움 REST API 비동기 HTTP 클라이언트.
+
+    ``KiwoomApi``와 동일한 유량 제어·재시도·인증 규칙을 ``httpx.AsyncClient``
+    위에서 제공한다. 하나의 이벤트 루프에서 스레드 없이 여러 요청을 동시에
+    진행할 수 있다.
+
+    Args:
+        env: 환경 구분. ``"real"`` (운영) 또는 ``"demo"`` (모의투자).
+        rps: 초당 최대 요청 수. ``None``이면 환경별 기본값 사용.
+        burst: 최대 연속 호출 수(토큰 버킷 용량). 기본값 ``1``.
+        priorities: ``api-id`` → 우선순위 등급 재정의. 기본 매핑에 덮어쓴다.
+        rate_limit_store: 유량 제어 상태 저장소. ``None``이면 프로세스 내부 상태.
+        adaptive: 한도 초과 응답에 따라 유효 RPS를 자동 조절할지 여부. 기본값 ``True``.
+        http: HTTP/2·연결 풀·타임아웃 설정. ``None``이면 ``HttpConfig()`` 기본값.
+        coalesce: 동시에 진행 중인 동일 조회 요청을 하나로 병합할지 여부. 기본값 ``False``.
+        metrics: 요청 계측 훅. 서버로 전송한 요청마다 ``RequestMetrics``로 호출된다.
+
+    Example:
+        >>> import asyncio
+        >>> from kiwoompy import AsyncKiwoomApi, AsyncKiwoomAuth, AsyncKiwoomQuery
+        >>>
+        >>> async def main():
+        ...     async with AsyncKiwoomApi(env="demo") as api:
+        ...         await AsyncKiwoomAuth(api).issue_token(appkey="...", secretkey="...")
+        ...         query = AsyncKiwoomQuery(api)
+        ...         a, b = await asyncio.gather(
+        ...             query.get_orderbook("005930"),
+        ...             query.get_orderbook("000660"),
+        ...         )
+        >>>
+        >>> asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        env: Env = "demo",
+        rps: float | None = None,
+        burst: int = 1,
+        priorities: dict[str, RequestPriority] | None = None,
+        rate_limit_store: RateLimitStore | None = None,
+        adaptive: bool = True,
+        http: HttpConfig | None = None,
+        coalesce: bool = False,
+        metrics: MetricsHook | None = None,
+    ) -> None:
+        super().__init__(
+            env, rps, burst, priorities, rate_limit_store, adaptive, coalesce, metrics
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers={"Content-Type": "application/json;charset=UTF-8"},
+            **(http or HttpConfig()).client_kwargs(),
+        )
+        self._inflight: dict[tuple[str, ...], asyncio.Task[ApiResponse]] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    async def post(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> dict:
+        """JSON POST 요청을 비동기로 보내고 응답 JSON을 반환한다.
+
+        재시도·예외 규칙은 ``KiwoomApi.post()``와 같다.
+
+        Args:
+            path: 엔드포인트 경로 (예: ``"/oauth2/token"``).
+            body: 요청 본문 딕셔너리.
+            headers: 추가 요청 헤더. ``None``이면 기본 헤더만 사용.
+            priority: 유량 대기 우선순위 등급. ``None``이면 ``api-id``별 기본 등급.
+
+        Returns:
+            응답 JSON을 파싱한 딕셔너리.
+
+        Raises:
+            KiwoomRateLimitError: 최대 재시도 후에도 유량 한도 초과가 지속되는 경우.
+            KiwoomAuthError: HTTP 4xx 응답 (인증 실패 등). 재시도 없음.
+            KiwoomApiError: 최대 재시도 후에도 5xx·네트워크·파싱 오류가 지속되는 경우.
+        """
+        return (await self.request(path, body, headers, priority)).body
+
+    async def request(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> ApiResponse:
+        """JSON POST 요청을 비동기로 보내고 응답 본문과 헤더를 함께 반환한다.
+
+        Args:
+            path: 엔드포인트 경로.
+            body: 요청 본문 딕셔너리.
+            headers: 추가 요청 헤더. ``None``이면 기본 헤더만 사용.
+            priority: 유량 대기 우선순위 등급. ``None``이면 ``api-id``별 기본 등급.
+
+        Returns:
+            응답 본문·헤더를 담은 ``ApiResponse``.
+
+        Raises:
+            KiwoomRateLimitError: 최대 재시도 후에도 유량 한도 초과가 지속되는 경우.
+            KiwoomAuthError: HTTP 4xx 응답 (인증 실패 등). 재시도 없음.
+            KiwoomApiError: 최대 재시도 후에도 5xx·네트워크·파싱 오류가 지속되는 경우.
+        """
+        key = self._flight_key(path, body, headers, priority)
+        if key is None:
+            return await self._send(path, body, headers, priority)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(path, body, headers, priority))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_flight(key, done))
+        # 먼저 호출한 쪽이 취소되더라도 다른 호출이 기다리는 요청은 계속 진행한다.
+        return await asyncio.shield(task)
+
+    def _finish_flight(self, key: tuple[str, ...], task: asyncio.Task[ApiResponse]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 모든 호출이 취소된 경우 미회수 예외 경고를 막는다.
+
+    async def _send(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None,
+        priority: RequestPriority | None,
+    ) -> ApiResponse:
+        """요청을 비동기로 전송한다. 토큰 만료·무효로 거절되면 토큰을 갱신하고 한 번 재시도한다."""
+        try:
+            return await self._transmit(path, body, headers, priority)
+        except KiwoomAuthError as exc:
+            stale = self._stale_token(headers, exc)
+            if stale is None:
+                raise
+        await self._refresh_token(stale)
+        return await self._transmit(path, body, self._with_auth(headers, self._token), priority)
+
+    async def _refresh_token(self, stale: str | None = None) -> None:
+        """등록된 갱신 함수로 토큰을 갱신한다. ``KiwoomApi._refresh_token()`` 참고."""
+        async with self._refresh_lock:
+            if stale is not None and self._token != stale:
+                return
+            await self._refresher()
+
+    async def _refresh_in_background(self) -> None:
+        """예약된 시각에 토큰을 갱신한다. 실패하면 잠시 후 다시 시도한다."""
+        try:
+            await self._refresh_token()
+        except Exception:
+            logger.exception("접근토큰 백그라운드 갱신 실패 — %.0f초 후 재시도합니다.", _REFRESH_RETRY_WAIT)
+            self._start_refresh_timer(_REFRESH_RETRY_WAIT)
+
+    def _start_refresh_timer(self, delay: float) -> None:
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._refresh_handle = loop.call_later(delay, self._spawn_refresh)
+
+    def _spawn_refresh(self) -> None:
+        self._refresh_handle = None
+        self._refresh_task = asyncio.ensure_future(self._refresh_in_background())
+
+    def schedule_token_refresh(self, at: datetime) -> None:
+        """``at``에 이벤트 루프에서 토큰을 갱신하도록 예약한다. 이전 예약은 취소된다.
+
+        실행 중인 이벤트 루프 안에서 호출해야 한다. 루프 밖에서 호출하면 예약하지 않고,
+        토큰 만료로 거절된 요청을 갱신 후 재시도하는 것으로 대신한다.
+
+        Args:
+            at: 갱신 시각 (로컬 시각). 이미 지났으면 즉시 갱신한다.
+        """
+        if self._refresher is None:
+            return
+        try:
+            self._start_refresh_timer(max(0.0, (at - datetime.now()).total_seconds()))
+        except RuntimeError:
+            logger.debug("실행 중인 이벤트 루프가 없어 백그라운드 토큰 갱신을 예약하지 않습니다.")
+
+    def _cancel_refresh(self) -> None:
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task is not None and self._refresh_task is not asyncio.current_task():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+
+    async def _transmit(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None,
+        priority: RequestPriority | None,
+    ) -> ApiResponse:
+        """요청을 재시도를 포함해 비동기로 전송하고 계측값을 보고한다."""
+        sample = _RequestSample()
+        try:
+            return await self._attempt(path, body, headers, priority, sample)
+        except Exception as exc:
+            sample.error = exc
+            raise
+        finally:
+            self._report(path, headers, sample)
+
+    @_retry
+    async def _attempt(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None,
+        priority: RequestPriority | None,
+        sample: _RequestSample,
+    ) -> ApiResponse:
+        """유량 제어 후 요청을 한 건 비동기로 전송한다. 재시도는 이 단위로 이루어진다."""
+        sample.attempts += 1
+        started = time.perf_counter()
+        await self._rate_limiter.acquire_async(self._priority_rank(headers, priority))
+        sent = time.perf_counter()
+        sample.queue_wait += sent - started
+
+        try:
+            response = await self._client.post(path, content=json_dumps(body), headers=headers)
+        except httpx.RequestError as exc:
+            _raise_for_request_error(path, exc)
+        finally:
+            received = time.perf_counter()
+            sample.latency += received - sent
+        sample.request_bytes += len(response.request.content)
+        sample.response_bytes += len(response.content)
+        try:
+            return self._handle_response(response)
+        finally:
+            sample.parse_time += time.perf_counter() - received
+
+    async def warmup(self) -> None:
+        """서버와 TLS 연결을 미리 열어 연결 풀에 넣어 둔다. ``KiwoomApi.warmup()`` 참고.
+
+        Raises:
+            KiwoomApiError: 연결 실패 또는 타임아웃.
+        """
+        try:
+            await self._client.head("/")
+        except httpx.RequestError as exc:
+            _raise_for_request_error("/", exc)
+
+    async def close(self) -> None:
+        """HTTP 클라이언트 세션을 닫고 예약된 토큰 갱신을 취소한다."""
+        self._cancel_refresh()
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncKiwoomApi:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+
+# ---------------------------------------------------------------------------
+# 연속조회
+# ---------------------------------------------------------------------------
+
+
+class PageIterator[T]:
+    """연속조회(``cont-yn``/``next-key``) TR을 페이지 단위로 따라가며 항목을 내놓는 반복자.
+
+    한 페이지를 받을 때마다 그 페이지의 항목을 바로 내놓으므로 전체 결과를 메모리에
+    모으지 않고 처리할 수 있다. 반복을 중간에 멈추면 이후 페이지는 요청하지 않는다.
+    ``KiwoomQuery``의 반복자는 ``for``, ``AsyncKiwoomQuery``의 반복자는 ``async for``로 순회한다.
+
+    Args:
+        api: 요청을 전송할 ``KiwoomApi`` 또는 ``AsyncKiwoomApi``.
+        path: 엔드포인트 경로.
+        body: 요청 본문 딕셔너리. 모든 페이지에 같은 본문을 보낸다.
+        headers: 페이지마다 호출해 공통 요청 헤더(인증·``api-id``)를 만드는 함수.
+        parse: 응답 본문 한 페이지를 항목 목록으로 변환하는 함수.
+        max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        path: str,
+        body: dict,
+        headers: Callable[[], dict[str, str]],
+        parse: Callable[[dict], Iterable[T]],
+        *,
+        max_pages: int | None = None,
+    ) -> None:
+        self._api = api
+        self._path = path
+        self._body = body
+        self._headers = headers
+        self._parse = parse
+        self._max_pages = max_pages
+
+    def with_api(self, api: Any) -> PageIterator[T]:
+        """같은 요청을 ``api``로 보내는 새 반복자를 반환한다.
+
+        ``AsyncKiwoomQuery``는 ``KiwoomQuery``의 반복자를 ``AsyncKiwoomApi``로 옮겨
+        ``async for``로 순회한다.
+        """
+        return PageIterator(
+            api, self._path, self._body, self._headers, self._parse, max_pages=self._max_pages
+        )
+
+    def _page_headers(self, next_key: str | None) -> dict[str, str]:
+        """페이지 요청 헤더. 두 번째 페이지부터 연속조회 헤더를 붙인다."""
+        headers = self._headers()
+        if next_key is None:
+            return headers
+        return {**headers, "cont-yn": "Y", "next-key": next_key}
+
+    def _is_last(self, response: ApiResponse, count: int) -> bool:
+        return not response.has_next or (self._max_pages is not None and count >= self._max_pages)
+
+    def pages(self) -> Iterator[ApiResponse]:
+        """응답 페이지를 순서대로 내놓는다."""
+        next_key: str | None = None
+        count = 0
+        while True:
+            response = self._api.request(self._path, self._body, headers=self._page_headers(next_key))
+            count += 1
+            yield response
+            if self._is_last(response, count):
+                return
+            next_key = response.next_key
+
+    async def apages(self) -> AsyncIterator[ApiResponse]:
+        """응답 페이지를 순서대로 비동기로 내놓는다."""
+        next_key: str | None = None
+        count = 0
+        while True:
+            response = await self._api.request(
+                self._path, self._body, headers=self._page_headers(next_key)
+            )
+            count += 1
+            yield response
+            if self._is_last(response, count):
+                return
+            next_key = response.next_key
+
+    def __iter__(self) -> Iterator[T]:
+        for response in self.pages():
+            yield from self._parse(response.body)
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        async for response in self.apages():
+            for item in self._parse(response.body):
+                yield item
+
+
+# ---------------------------------------------------------------------------
+# 동기 TR 클래스 → 비동기 파사드 변환
+# ---------------------------------------------------------------------------
+
+
+_BRIDGE_MAX_WORKERS = 64  # 동시에 실행할 수 있는 비동기 파사드 메서드 호출 수
+_BRIDGE_EXECUTOR: concurrent.futures.ThreadPoolExecutor | None = None
+_BRIDGE_EXECUTOR_LOCK = threading.Lock()
+
+
+def _bridge_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """비동기 파사드 전용 스레드 풀. 기본 실행기(``asyncio.to_thread``)와 나눠 서로 막지 않게 한다."""
+    global _BRIDGE_EXECUTOR
+    with _BRIDGE_EXECUTOR_LOCK:
+        if _BRIDGE_EXECUTOR is None:
+            _BRIDGE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                _BRIDGE_MAX_WORKERS, thread_name_prefix="kiwoompy-async"
+            )
+        return _BRIDGE_EXECUTOR
+
+
+class _BridgeCall:
+    """워커 스레드에서 실행 중인 동기 TR 메서드 호출 하나.
+
+    호출한 코루틴의 이벤트 루프와, 그 루프에서 진행 중인 요청을 기억한다.
+    코루틴이 취소되면 진행 중인 요청을 취소하고 이후 요청도 보내지 않는다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._pending: concurrent.futures.Future[Any] | None = None
+        self._cancelled = False
+
+    def submit[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """``coro``를 이벤트 루프에서 실행하고 결과를 기다린다. 워커 스레드에서 호출한다."""
+        if self._cancelled:
+            coro.close()
+            raise asyncio.CancelledError
+        self._pending = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return self._pending.result()
+        finally:
+            self._pending = None
+
+    def cancel(self) -> None:
+        """진행 중인 요청을 취소하고 이후 요청을 막는다. 이벤트 루프에서 호출한다."""
+        self._cancelled = True
+        pending = self._pending
+        if pending is not None:
+            pending.cancel()
+
+
+class _SyncBridge:
+    """동기 TR 클래스에 ``KiwoomApi`` 대신 주입되는 어댑터.
+
+    ``run()``은 동기 메서드를 워커 스레드에서 한 번 실행한다. 그 안에서 호출한
+    ``post()``·``request()``는 요청을 호출한 코루틴의 이벤트 루프로 보내 ``AsyncKiwoomApi``로
+    전송하고, 응답이 올 때까지 워커 스레드만 기다린다. 이벤트 루프는 그동안 다른
+    코루틴을 실행하며, 캐시·토큰 저장소 같은 동기 I/O도 루프를 막지 않는다.
+    그 외 속성(``get_auth_header``, ``set_token`` 등)은 ``AsyncKiwoomApi``에 위임한다.
+    """
+
+    def __init__(self, api: AsyncKiwoomApi) -> None:
+        self._api = api
+        self._local = threading.local()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._api, name)
+
+    async def run[T](self, call: Callable[[], T]) -> T:
+        """``call``을 워커 스레드에서 실행하고 결과를 반환한다."""
+        loop = asyncio.get_running_loop()
+        bridge_call = _BridgeCall(loop)
+        context = contextvars.copy_context()
+        try:
+            return await loop.run_in_executor(
+                _bridge_executor(), context.run, self._run_in_worker, bridge_call, call
+            )
+        except asyncio.CancelledError:
+            bridge_call.cancel()
+            raise
+
+    def _run_in_worker[T](self, bridge_call: _BridgeCall, call: Callable[[], T]) -> T:
+        self._local.call = bridge_call
+        try:
+            return call()
+        finally:
+            del self._local.call
+
+    def _current(self) -> _BridgeCall:
+        bridge_call: _BridgeCall | None = getattr(self._local, "call", None)
+        if bridge_call is None:
+            raise RuntimeError("비동기 파사드의 요청은 run()으로 실행한 동기 메서드 안에서만 보낼 수 있습니다.")
+        return bridge_call
+
+    def _on_loop(self, func: Callable[..., Any], *args: Any) -> None:
+        """``AsyncKiwoomApi``의 루프 전용 메서드를 이벤트 루프에서 호출한다."""
+        bridge_call: _BridgeCall | None = getattr(self._local, "call", None)
+        if bridge_call is None:
+            func(*args)  # 이미 이벤트 루프 스레드
+            return
+
+        async def invoke() -> None:
+            func(*args)
+
+        bridge_call.submit(invoke())
+
+    def request(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> ApiResponse:
+        bridge_call = self._current()
+        return bridge_call.submit(self._api.request(path, body, headers, priority))
+
+    def post(
+        self,
+        path: str,
+        body: dict,
+        headers: dict[str, str] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> dict:
+        return self.request(path, body, headers, priority).body
+
+    def schedule_token_refresh(self, at: datetime) -> None:
+        """이벤트 루프에서 ``AsyncKiwoomApi.schedule_token_refresh()``를 호출한다."""
+        self._on_loop(self._api.schedule_token_refresh, at)
+
+    def set_token_refresher(self, refresher: Callable[[], Any] | None) -> None:
+        """동기 갱신 함수를 ``run()``으로 감싸 ``AsyncKiwoomApi``에 등록한다."""
+        wrapped = None if refresher is None else (lambda: self.run(refresher))
+        self._on_loop(self._api.set_token_refresher, wrapped)
+
+
+def _make_async_method(func: Callable[..., Any]) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """동기 TR 메서드를 같은 이름·문서의 코루틴 메서드로 감싼다 (``_SyncBridge.run()`` 참고)."""
+
+    async def method(self: _AsyncFacade, *args: Any, **kwargs: Any) -> Any:
+        return await self._bridge.run(lambda: func(self._sync, *args, **kwargs))
+
+    method.__name__ = func.__name__
+    method.__doc__ = func.__doc__
+    method.__signature__ = inspect.signature(func)  # type: ignore[attr-defined]
+    return method
+
+
+def _make_iter_method(func: Callable[..., PageIterator[Any]]) -> Callable[..., PageIterator[Any]]:
+    """연속조회 반복자를 반환하는 메서드를 ``async for``용으로 감싼다.
+
+    반복자는 생성 시점에는 요청을 보내지 않으므로, 동기 메서드로 만든 반복자와 같은
+    요청을 ``AsyncKiwoomApi``로 보내는 반복자를 돌려준다.
+    """
+
+    def method(self: _AsyncFacade, *args: Any, **kwargs: Any) -> PageIterator[Any]:
+        return func(self._sync, *args, **kwargs).with_api(self._api)
+
+    method.__name__ = func.__name__
+    method.__doc__ = func.__doc__
+    method.__signature__ = inspect.signature(func)  # type: ignore[attr-defined]
+    return method
+
+
+def _make_passthrough_method(func: Callable[..., Any]) -> Callable[..., Any]:
+    """네트워크 요청이 없는 동기 메서드를 비동기 파사드에 그대로 노출한다."""
+
+    def method(self: _AsyncFacade, *args: Any, **kwargs: Any) -> Any:
+        return func(self._sync, *args, **kwargs)
+
+    method.__name__ = func.__name__
+    method.__doc__ = func.__doc__
+    return method
+
+
+class _AsyncFacade:
+    """동기 TR 클래스의 공개 메서드를 코루틴으로 노출하는 비동기 파사드의 기반 클래스.
+
+    서브클래스는 ``sync=`` 인자로 원본 동기 클래스를 지정한다. 원본이 상속한 것까지
+    모든 공개 메서드가 같은 이름의 코루틴 메서드로 생성되며, ``passthrough``에 지정한 메서드는
+    네트워크 요청이 없으므로 동기 메서드 그대로 위임한다. ``iter_``로 시작하는
+    연속조회 메서드는 ``async for``로 순회하는 ``PageIterator``를 반환한다.
+    서브클래스가 직접 정의한 메서드는 덮어쓰지 않는다.
+
+    Args:
+        api: 인증 토큰이 설정된 ``AsyncKiwoomApi`` 인스턴스.
+        *args, **kwargs: 원본 동기 클래스 생성자의 나머지 인자.
+    """
+
+    _sync_cls: type
+
+    def __init_subclass__(
+        cls,
+        *,
+        sync: type,
+        passthrough: tuple[str, ...] = (),
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._sync_cls = sync
+        members: dict[str, Any] = {}
+        for klass in reversed(sync.__mro__):  # 상속한 공개 메서드도 포함한다
+            members.update(vars(klass))
+        for name, func in members.items():
+            if name.startswith("_") or name in vars(cls) or not inspect.isfunction(func):
+                continue
+            if name in passthrough:
+                method = _make_passthrough_method(func)
+            elif name.startswith("iter_"):
+                method = _make_iter_method(func)
+            else:
+                method = _make_async_method(func)
+            method.__qualname__ = f"{cls.__qualname__}.{name}"
+            setattr(cls, name, method)
+
+    def __init__(self, api: AsyncKiwoomApi, *args: Any, **kwargs: Any) -> None:
+        self._api = api
+        self._bridge = _SyncBridge(api)
+        self._sync = self._sync_cls(self._bridge, *args, **kwargs)
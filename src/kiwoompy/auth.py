@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
 from dataclasses import asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from kiwoompy.api import KiwoomApi
+from kiwoompy.api import AsyncKiwoomApi, KiwoomApi, _AsyncFacade
 from kiwoompy.exceptions import KiwoomApiError, KiwoomAuthError
 from kiwoompy.models import RevokeTokenRequest, TokenRequest, TokenResponse
+from kiwoompy.shared import TokenStore
 
 _EXPIRES_DT_FORMAT = "%Y%m%d%H%M%S"
 
+# 저장소의 토큰을 재사용하려면 만료까지 최소 이만큼 남아 있어야 한다
+_REUSE_MARGIN = timedelta(minutes=5)
+
+# 자동 갱신 시 만료 이만큼 전에 새 토큰을 발급한다
+_REFRESH_MARGIN = timedelta(minutes=10)
+
 
 class KiwoomAuth:
     """키움 REST API 인증 관리자.
@@ -18,41 +28,144 @@ class KiwoomAuth:
     접근토큰 발급 후 ``KiwoomApi`` 계층에 저장하여
     이후 모든 API 호출에서 자동으로 재사용되도록 한다.
 
+    **토큰 공유**: ``token_store``를 주면 같은 환경·앱 키의 유효한 토큰이 저장소에
+    있을 때 새로 발급하지 않고 재사용한다. 여러 프로세스가 동시에 시작해도
+    저장소 잠금으로 토큰은 한 번만 발급된다.
+
+    **자동 갱신**: ``auto_refresh=True``면 ``issue_token()`` 이후 만료 ``refresh_margin``
+    전에 백그라운드에서 토큰을 다시 발급해 ``KiwoomApi``의 토큰을 교체한다. 요청이
+    토큰 만료·무효로 거절되면 토큰을 갱신하고 그 요청을 한 번 재시도한다.
+    ``KiwoomRealtime``은 재연결할 때마다 현재 토큰을 사용하므로 함께 갱신된다.
+
     Args:
         api: HTTP 클라이언트 인스턴스. 토큰을 발급 즉시 이 객체에 저장한다.
+        token_store: 접근토큰 공유 저장소 (예: ``FileTokenStore``). ``None``이면 공유하지 않는다.
+        auto_refresh: 만료 전 백그라운드 갱신과 인증 실패 시 재시도를 사용할지 여부.
+            기본값 ``False``.
+        refresh_margin: 만료 몇 전에 갱신할지. 기본값 10분.
     """
 
-    def __init__(self, api: KiwoomApi) -> None:
+    def __init__(
+        self,
+        api: KiwoomApi,
+        token_store: TokenStore | None = None,
+        auto_refresh: bool = False,
+        refresh_margin: timedelta = _REFRESH_MARGIN,
+    ) -> None:
         self._api = api
+        self._token_store = token_store
+        self._auto_refresh = auto_refresh
+        self._refresh_margin = refresh_margin
+        self._credentials: tuple[str, str] | None = None
         self._expires_at: datetime | None = None
 
-    def issue_token(self, appkey: str, secretkey: str) -> TokenResponse:
+    def issue_token(self, appkey: str, secretkey: str, *, force: bool = False) -> TokenResponse:
         """접근토큰을 발급하고 API 클라이언트에 저장한다 (au10001).
 
+        ``token_store``가 있으면 저장소의 유효한 토큰을 먼저 재사용하고,
+        새로 발급한 토큰은 저장소에 기록한다. ``auto_refresh=True``면 앱 키를 기억해
+        만료 전 백그라운드 갱신을 예약한다.
+
         Args:
             appkey: 키움증권 앱 키.
             secretkey: 키움증권 시크릿 키.
+            force: ``True``면 저장소의 토큰을 무시하고 항상 새로 발급한다.
 
         Returns:
-            발급된 토큰 정보 (`TokenResponse`).
+            발급(또는 재사용)된 토큰 정보 (`TokenResponse`).
 
         Raises:
             KiwoomAuthError: 앱 키·시크릿 키가 올바르지 않거나 인증 서버 4xx 응답.
             KiwoomApiError: 서버 5xx 오류, 네트워크 타임아웃, 응답 파싱 실패.
         """
+        if self._auto_refresh:
+            self._credentials = (appkey, secretkey)
+            self._api.set_token_refresher(self._refresh)
+
+        if self._token_store is None:
+            return self._issue(appkey, secretkey)
+
+        key = self._store_key(appkey)
+        with self._token_store.lock(key):
+            cached = None if force else self._reuse_stored(appkey)
+            if cached is not None:
+                return cached
+            response = self._issue(appkey, secretkey)
+            self._token_store.save(key, response)
+            return response
+
+    def _issue(self, appkey: str, secretkey: str) -> TokenResponse:
+        """서버에 접근토큰을 발급 요청하고 결과를 적용한다."""
         request = TokenRequest(appkey=appkey, secretkey=secretkey)
         raw = self._api.post("/oauth2/token", asdict(request))
 
         response = self._parse_response(raw)
-        self._api.set_token(response.token)
-        self._expires_at = self._parse_expires_dt(response.expires_dt)
+        self._apply(response, appkey)
         return response
 
+    def _apply(self, response: TokenResponse, appkey: str) -> None:
+        """토큰을 API 클라이언트에 저장하고 만료일시를 기록한다. 자동 갱신이면 다음 갱신을 예약한다."""
+        expires_at = self._parse_expires_dt(response.expires_dt)
+        self._api.set_token(response.token, appkey)
+        self._expires_at = expires_at
+        if self._credentials is not None:
+            self._api.schedule_token_refresh(expires_at - self._refresh_margin)
+
+    def _refresh(self) -> None:
+        """자동 갱신 — 새 토큰을 발급해 적용한다.
+
+        ``token_store``가 있고 다른 프로세스가 이미 갱신해 둔 토큰이 충분히 남아 있으면
+        새로 발급하지 않고 그 토큰을 쓴다. 서버는 새 토큰을 발급하면 이전 토큰을 무효화할
+        수 있으므로, 프로세스마다 따로 발급하지 않도록 한다.
+        """
+        appkey, secretkey = self._credentials  # type: ignore[misc]
+        if self._token_store is None:
+            self._issue(appkey, secretkey)
+            return
+
+        key = self._store_key(appkey)
+        with self._token_store.lock(key):
+            if self._reuse_stored(appkey, refreshing=True) is None:
+                self._token_store.save(key, self._issue(appkey, secretkey))
+
+    def _reuse_stored(self, appkey: str, *, refreshing: bool = False) -> TokenResponse | None:
+        """저장소 잠금 안에서 재사용할 수 있는 토큰을 찾아 적용한다. 없으면 ``None``.
+
+        ``refreshing``이면 현재 토큰과 다르고 만료까지 ``refresh_margin`` 넘게 남은
+        토큰(다른 프로세스가 이미 갱신해 둔 토큰)만 재사용한다.
+        """
+        cached = self._token_store.load(self._store_key(appkey))  # type: ignore[union-attr]
+        if cached is None:
+            return None
+        if refreshing:
+            if cached.token == self._api.token or not self._is_reusable(
+                cached, self._refresh_margin
+            ):
+                return None
+        elif not self._is_reusable(cached):
+            return None
+        self._apply(cached, appkey)
+        return cached
+
+    def _store_key(self, appkey: str) -> str:
+        """토큰 저장소 키. 환경과 앱 키 조합이다."""
+        return f"{self._api.env}:{appkey}"
+
+    @classmethod
+    def _is_reusable(cls, token: TokenResponse, margin: timedelta = _REUSE_MARGIN) -> bool:
+        """저장된 토큰이 만료까지 ``margin`` 넘게 남아 있는지 확인한다."""
+        try:
+            expires_at = cls._parse_expires_dt(token.expires_dt)
+        except KiwoomApiError:
+            return False
+        return datetime.now() + margin < expires_at
+
     def revoke_token(self, appkey: str, secretkey: str) -> None:
         """현재 발급된 접근토큰을 폐기하고 내부 상태를 초기화한다 (au10002).
 
         폐기 후에는 해당 토큰으로 API를 호출할 수 없다.
-        성공 시 ``KiwoomApi``에 저장된 토큰과 만료일시를 초기화한다.
+        성공 시 ``KiwoomApi``에 저장된 토큰과 만료일시를 초기화하고,
+        ``token_store``가 있으면 저장된 토큰도 삭제한다.
 
         Args:
             appkey: 키움증권 앱 키.
@@ -63,8 +176,8 @@ class KiwoomAuth:
             KiwoomApiError: 서버 5xx 오류, 네트워크 타임아웃, 응답 파싱 실패.
         """
         auth_header = self._api.get_auth_header()
-        # get_auth_header()가 토큰 존재 여부를 검증하므로 이 시점에서 _token은 반드시 str
-        token: str = self._api._token  # type: ignore[assignment]  # noqa: SLF001
+        # get_auth_header()가 토큰 존재 여부를 검증하므로 이 시점에서 token은 반드시 str
+        token: str = self._api.token  # type: ignore[assignment]
 
         request = RevokeTokenRequest(appkey=appkey, secretkey=secretkey, token=token)
         raw = self._api.post(
@@ -78,8 +191,12 @@ class KiwoomAuth:
             msg = raw.get("return_msg", "폐기 실패")
             raise KiwoomAuthError(f"접근토큰 폐기 실패 (return_code={return_code}): {msg}")
 
+        self._api.set_token_refresher(None)
+        self._credentials = None
         self._api.set_token("")
         self._expires_at = None
+        if self._token_store is not None:
+            self._token_store.clear(self._store_key(appkey))
 
     def is_token_valid(self) -> bool:
         """현재 토큰이 유효한지 확인한다.
@@ -141,3 +258,107 @@ class KiwoomAuth:
             raise KiwoomApiError(
                 f"만료일시 파싱 실패: {expires_dt!r} — YYYYMMDDHHMMSS 형식이어야 합니다."
             ) from exc
+
+
+class AsyncKiwoomAuth(_AsyncFacade, sync=KiwoomAuth, passthrough=("is_token_valid",)):
+    """``KiwoomAuth``의 비동기 버전.
+
+    ``issue_token()``·``revoke_token()``은 코루틴이며, 토큰 발급 결과는
+    ``AsyncKiwoomApi``에 저장된다. ``is_token_valid()``는 동기 메서드 그대로 제공한다.
+
+    ``auto_refresh=True``면 갱신은 ``issue_token()``을 호출한 이벤트 루프에서 예약된다.
+
+    Args:
+        api: HTTP 클라이언트 인스턴스 (``AsyncKiwoomApi``).
+        token_store: 접근토큰 공유 저장소. ``None``이면 공유하지 않는다.
+        auto_refresh: 만료 전 백그라운드 갱신과 인증 실패 시 재시도를 사용할지 여부.
+        refresh_margin: 만료 몇 전에 갱신할지. 기본값 10분.
+
+    Example:
+        >>> api = AsyncKiwoomApi(env="demo")
+        >>> await AsyncKiwoomAuth(api).issue_token(appkey="...", secretkey="...")
+    """
+
+    _api: AsyncKiwoomApi
+    _sync: KiwoomAuth
+
+    async def issue_token(
+        self, appkey: str, secretkey: str, *, force: bool = False
+    ) -> TokenResponse:
+        """접근토큰을 발급하고 API 클라이언트에 저장한다 (au10001). ``KiwoomAuth.issue_token()`` 참고.
+
+        ``token_store``의 잠금은 이벤트 루프를 막지 않도록 스레드에서 잡고, 발급 요청을
+        ``await``하는 동안 계속 쥐고 있는다. 같은 저장소를 쓰는 다른 프로세스·인스턴스는
+        잠금이 풀린 뒤 저장된 토큰을 재사용하므로 토큰은 한 번만 발급된다.
+
+        Raises:
+            KiwoomAuthError: 앱 키·시크릿 키가 올바르지 않거나 인증 서버 4xx 응답.
+            KiwoomApiError: 서버 5xx 오류, 네트워크 타임아웃, 응답 파싱 실패.
+        """
+        auth = self._sync
+        if auth._auto_refresh:
+            auth._credentials = (appkey, secretkey)
+            self._api.set_token_refresher(self._refresh)
+
+        store = auth._token_store
+        if store is None:
+            return await self._issue(appkey, secretkey)
+
+        key = auth._store_key(appkey)
+        async with _store_lock(store, key):
+            cached = None if force else auth._reuse_stored(appkey)
+            if cached is not None:
+                return cached
+            response = await self._issue(appkey, secretkey)
+            store.save(key, response)
+            return response
+
+    async def _issue(self, appkey: str, secretkey: str) -> TokenResponse:
+        """서버에 접근토큰을 발급 요청하고 결과를 적용한다.
+
+        토큰 갱신은 만료된 토큰으로 요청을 기다리는 TR 호출이 파사드 스레드를 모두
+        차지한 상태에서도 진행돼야 하므로, 파사드 스레드를 거치지 않고 이벤트 루프에서 보낸다.
+        """
+        request = TokenRequest(appkey=appkey, secretkey=secretkey)
+        raw = await self._api.post("/oauth2/token", asdict(request))
+        response = self._sync._parse_response(raw)
+        self._sync._apply(response, appkey)
+        return response
+
+    async def _refresh(self) -> None:
+        """자동 갱신 — 새 토큰을 발급해 적용한다. ``KiwoomAuth._refresh()`` 참고."""
+        auth = self._sync
+        appkey, secretkey = auth._credentials  # type: ignore[misc]
+        store = auth._token_store
+        if store is None:
+            await self._issue(appkey, secretkey)
+            return
+
+        key = auth._store_key(appkey)
+        async with _store_lock(store, key):
+            if auth._reuse_stored(appkey, refreshing=True) is None:
+                store.save(key, await self._issue(appkey, secretkey))
+
+
+@contextlib.asynccontextmanager
+async def _store_lock(store: TokenStore, key: str) -> AsyncIterator[None]:
+    """``store.lock(key)``를 이벤트 루프 밖(스레드)에서 잡고, 본문을 마칠 때 푼다.
+
+    잠금을 기다리는 동안 취소되면 스레드가 뒤늦게 잡은 잠금도 바로 푼다.
+    """
+    lock = store.lock(key)
+    acquiring = asyncio.ensure_future(asyncio.to_thread(lock.__enter__))
+    try:
+        await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+
+        def release(done: asyncio.Future[None]) -> None:
+            if not done.cancelled() and done.exception() is None:
+                lock.__exit__(None, None, None)
+
+        acquiring.add_done_callback(release)
+        raise
+    try:
+        yield
+    finally:
+        lock.__exit__(None, None, None)
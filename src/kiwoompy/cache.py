@@ -0,0 +1,215 @@
+"""응답 캐시 — 하루에 한 번 이상 바뀌지 않는 기준정보 TR 응답을 재사용한다.
+
+종목·업종·회원사 리스트, 종목·ETF·ELW 상세정보처럼 장중에 바뀌지 않는 응답은
+매번 서버에 요청할 필요가 없다. ``KiwoomQuery``에 캐시를 넘기면 ``api-id``별 TTL 안에서
+같은 요청의 응답 본문을 재사용하고, 유량 한도도 소모하지 않는다.
+
+- ``MemoryResponseCache``: 프로세스 안에서만 유지되는 LRU 캐시.
+- ``FileResponseCache``: SQLite 파일에 저장해 재시작·여러 프로세스 간에 공유하는 LRU 캐시.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Protocol
+
+from kiwoompy.codec import json_dumps, json_loads
+from kiwoompy.shared import _prepare_directory
+
+_MEMORY_MAX_ENTRIES = 1024      # 메모리 캐시 기본 최대 항목 수
+_FILE_MAX_ENTRIES = 100_000     # 파일 캐시 기본 최대 항목 수
+_FILE_NAME = "responses.sqlite3"
+_SQLITE_TIMEOUT = 30.0          # 다른 프로세스가 쓰는 동안 기다리는 최대 시간 (초)
+
+
+class ResponseCache(Protocol):
+    """응답 캐시 저장소 인터페이스.
+
+    ``key``는 환경·앱 키 해시·경로·``api-id``·요청 본문으로 만든 문자열이고, 값은 응답
+    JSON 본문이다. 같은 캐시를 여러 계좌(앱 키)가 함께 써도 서로의 응답을 받지 않는다.
+    만료 판단은 저장소가 책임진다.
+    """
+
+    def get(self, key: str) -> dict | None:
+        """만료되지 않은 응답 본문을 반환한다. 없으면 ``None``."""
+        ...
+
+    def set(self, key: str, api_id: str, value: dict, ttl: float) -> None:
+        """응답 본문을 ``ttl``초 동안 저장한다."""
+        ...
+
+    def invalidate(self, api_id: str | None = None) -> None:
+        """``api_id``의 항목을 모두 삭제한다. ``None``이면 전체를 비운다."""
+        ...
+
+
+class MemoryResponseCache:
+    """프로세스 메모리에 두는 LRU 응답 캐시.
+
+    항목 수가 ``max_entries``를 넘으면 가장 오래 사용하지 않은 항목부터 버린다.
+    스레드 안전하다. 조회 결과는 저장된 딕셔너리를 그대로 돌려주므로 수정하지 않아야 한다.
+
+    Args:
+        max_entries: 최대 항목 수. 기본값 ``1024``.
+
+    Example:
+        >>> from kiwoompy import KiwoomQuery, MemoryResponseCache
+        >>> query = KiwoomQuery(api, cache=MemoryResponseCache())
+        >>> query.get_stock_list("kospi")  # 서버 요청
+        >>> query.get_stock_list("kospi")  # 캐시
+    """
+
+    def __init__(self, max_entries: int = _MEMORY_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries는 1 이상이어야 합니다: {max_entries}")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict | None:
+        """만료되지 않은 응답 본문을 반환한다. 없으면 ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def set(self, key: str, api_id: str, value: dict, ttl: float) -> None:
+        """응답 본문을 ``ttl``초 동안 저장한다."""
+        with self._lock:
+            self._entries[key] = (api_id, time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, api_id: str | None = None) -> None:
+        """``api_id``의 항목을 모두 삭제한다. ``None``이면 전체를 비운다."""
+        with self._lock:
+            if api_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k, (a, _, _) in self._entries.items() if a == api_id]:
+                del self._entries[key]
+
+
+class FileResponseCache:
+    """SQLite 파일에 저장하는 LRU 응답 캐시.
+
+    프로세스를 다시 시작해도 유효한 응답을 재사용하고, 같은 디렉터리를 쓰는 여러
+    프로세스가 캐시를 공유한다. 항목 수가 ``max_entries``를 넘으면 가장 오래 사용하지
+    않은 항목부터 지운다. 만료 시각은 벽시계 기준이다.
+
+    계좌 조회 응답도 담길 수 있으므로 캐시 파일은 현재 사용자만 읽고 쓸 수 있다.
+
+    조회·저장은 SQLite 파일 I/O를 하는 동기 호출이다. ``AsyncKiwoomQuery``의 조회 메서드는
+    워커 스레드에서 실행되므로 이벤트 루프를 막지 않는다.
+
+    Args:
+        directory: 캐시 파일을 둘 디렉터리. ``None``이면 사용자 캐시 디렉터리
+            (``FileTokenStore``와 같은 위치).
+        max_entries: 최대 항목 수. 기본값 ``100000``.
+
+    Raises:
+        PermissionError: ``directory``의 소유자가 현재 사용자가 아닌 경우.
+
+    Example:
+        >>> from kiwoompy import FileResponseCache, KiwoomClient
+        >>> client = KiwoomClient(env="real", appkey="...", secretkey="...",
+        ...                       cache=FileResponseCache())
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        max_entries: int = _FILE_MAX_ENTRIES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries는 1 이상이어야 합니다: {max_entries}")
+        self._path = _prepare_directory(directory) / _FILE_NAME
+        # SQLite는 WAL·공유 메모리 파일을 본 파일과 같은 권한으로 만든다
+        os.close(os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(self._path, 0o600)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self._path,
+            timeout=_SQLITE_TIMEOUT,
+            isolation_level=None,  # autocommit — 문장 단위로 원자적이다
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " api_id TEXT NOT NULL,"
+            " expires REAL NOT NULL,"
+            " accessed REAL NOT NULL,"
+            " value TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    @property
+    def path(self) -> Path:
+        """캐시 파일 경로."""
+        return self._path
+
+    def get(self, key: str) -> dict | None:
+        """만료되지 않은 응답 본문을 반환한다. 없거나 손상된 경우 ``None``."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        try:
+            return json_loads(row[0])
+        except ValueError:
+            return None
+
+    def set(self, key: str, api_id: str, value: dict, ttl: float) -> None:
+        """응답 본문을 ``ttl``초 동안 저장하고, 만료·초과 항목을 정리한다."""
+        now = time.time()
+        data = json_dumps(value).decode()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, api_id, now + ttl, now, data),
+            )
+            self._conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def invalidate(self, api_id: str | None = None) -> None:
+        """``api_id``의 항목을 모두 삭제한다. ``None``이면 전체를 비운다."""
+        with self._lock:
+            if api_id is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute("DELETE FROM responses WHERE api_id = ?", (api_id,))
+
+    def close(self) -> None:
+        """캐시 파일을 닫는다."""
+        self._conn.close()
+
+    def __enter__(self) -> FileResponseCache:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
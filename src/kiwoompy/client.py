@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from kiwoompy.api import KiwoomApi
+from kiwoompy.api import HttpConfig, KiwoomApi
 from kiwoompy.auth import KiwoomAuth
-from kiwoompy.models import Env, TokenResponse
+from kiwoompy.cache import ResponseCache
+from kiwoompy.metrics import MetricsHook
+from kiwoompy.models import Env, RequestPriority, TokenResponse
 from kiwoompy.order import KiwoomOrder
 from kiwoompy.query import KiwoomQuery
+from kiwoompy.shared import FileTokenStore, RateLimitStore, TokenStore
 
 
 class KiwoomClient:
@@ -22,6 +25,23 @@ class KiwoomClient:
         secretkey: 키움증권 시크릿 키.
         rps: 초당 최대 요청 수. ``None``이면 환경별 기본값 사용
             (``demo`` 2건/초, ``real`` 20건/초).
+        burst: 최대 연속 호출 수(토큰 버킷 용량). 기본값 ``1``.
+        priorities: ``api-id`` → 요청 우선순위 등급 재정의.
+            기본 등급은 ``KiwoomApi`` 참고.
+        rate_limit_store: 유량 제어 상태 저장소. ``FileRateLimitStore``를 주면
+            같은 계좌를 쓰는 여러 프로세스가 한도를 나눠 쓴다.
+        adaptive: 한도 초과 응답에 따라 유효 RPS를 자동 조절할지 여부. 기본값 ``True``.
+        http: HTTP/2·연결 풀·타임아웃 설정. ``None``이면 기본값.
+        coalesce: 동시에 진행 중인 동일 조회 요청을 하나로 병합할지 여부. 기본값 ``False``.
+        metrics: 요청 계측 훅. ``MetricsRecorder``를 주면 ``api-id``별 지연 백분위를 집계한다.
+        token_store: 접근토큰 공유 저장소. ``FileTokenStore``를 주면 유효한 토큰을
+            프로세스 간에 재사용한다.
+        token_cache: ``True``면 ``token_store``가 없을 때 기본 ``FileTokenStore()``
+            (사용자 캐시 디렉터리)를 써서 재시작 후에도 유효한 토큰을 재사용한다.
+        auto_refresh: 만료 전에 백그라운드에서 토큰을 갱신하고, 토큰 만료로 거절된
+            요청을 갱신 후 한 번 재시도할지 여부. 기본값 ``False``.
+        cache: 기준정보 TR 응답 캐시. ``None``이면 캐시하지 않는다.
+        cache_ttls: ``api-id`` → 캐시 TTL(초) 재정의. 기본 TTL은 ``KiwoomQuery`` 참고.
 
     Examples:
         기본 사용법:
@@ -53,10 +73,34 @@ class KiwoomClient:
         appkey: str = "",
         secretkey: str = "",
         rps: float | None = None,
+        burst: int = 1,
+        priorities: dict[str, RequestPriority] | None = None,
+        rate_limit_store: RateLimitStore | None = None,
+        adaptive: bool = True,
+        http: HttpConfig | None = None,
+        coalesce: bool = False,
+        metrics: MetricsHook | None = None,
+        token_store: TokenStore | None = None,
+        token_cache: bool = False,
+        auto_refresh: bool = False,
+        cache: ResponseCache | None = None,
+        cache_ttls: dict[str, float] | None = None,
     ) -> None:
-        self._api = KiwoomApi(env=env, rps=rps)
-        self._auth = KiwoomAuth(self._api)
-        self._query = KiwoomQuery(self._api)
+        self._api = KiwoomApi(
+            env=env,
+            rps=rps,
+            burst=burst,
+            priorities=priorities,
+            rate_limit_store=rate_limit_store,
+            adaptive=adaptive,
+            http=http,
+            coalesce=coalesce,
+            metrics=metrics,
+        )
+        if token_store is None and token_cache:
+            token_store = FileTokenStore()
+        self._auth = KiwoomAuth(self._api, token_store=token_store, auto_refresh=auto_refresh)
+        self._query = KiwoomQuery(self._api, cache=cache, cache_ttls=cache_ttls)
         self._order = KiwoomOrder(self._api)
         self._auth.issue_token(appkey=appkey, secretkey=secretkey)
 
@@ -108,6 +152,7 @@ class KiwoomClient:
         """접근토큰을 재발급한다.
 
         토큰 만료 전후로 명시적으로 갱신이 필요할 때 호출한다.
+        ``token_store``가 있어도 저장된 토큰을 재사용하지 않고 새로 발급한다.
 
         Args:
             appkey: 키움증권 앱 키.
@@ -116,7 +161,7 @@ class KiwoomClient:
         Returns:
             새로 발급된 ``TokenResponse``.
         """
-        return self._auth.issue_token(appkey=appkey, secretkey=secretkey)
+        return self._auth.issue_token(appkey=appkey, secretkey=secretkey, force=True)
 
     def close(self) -> None:
         """HTTP 클라이언트 세션을 닫는다."""
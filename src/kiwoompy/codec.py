@@ -0,0 +1,159 @@
+"""JSON 코덱 — REST·실시간·조건검색 메시지의 JSON 직렬화 백엔드를 한곳에서 고른다.
+
+``orjson`` 또는 ``msgspec``이 설치되어 있으면 그 순서로 자동 선택하고, 없으면 표준
+라이브러리 ``json``을 쓴다. ``set_json_codec()``으로 백엔드를 고정하거나 직접 만든
+``JsonCodec``을 지정할 수 있다.
+
+- ``orjson``: ``pip install "kiwoompy[orjson]"``
+- ``msgspec``: ``pip install "kiwoompy[msgspec]"``
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+type JsonBackend = Literal["auto", "orjson", "msgspec", "json"]
+"""JSON 백엔드 이름. ``"auto"``는 설치된 백엔드 중 가장 빠른 것을 고른다."""
+
+_AUTO_ORDER = ("orjson", "msgspec")  # 자동 선택 우선순위. 모두 없으면 표준 json
+
+
+@dataclass(frozen=True, slots=True)
+class JsonCodec:
+    """JSON 직렬화 백엔드.
+
+    Attributes:
+        name: 백엔드 이름.
+        loads: JSON ``bytes``/``str``을 파이썬 객체로 바꾼다. 잘못된 JSON이면 ``ValueError``.
+        dumps: 파이썬 객체를 UTF-8 JSON ``bytes``로 바꾼다. 비ASCII 문자를 이스케이프하지 않는다.
+    """
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_codec() -> JsonCodec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(obj: Any) -> bytes:
+        return encoder.encode(obj).encode()
+
+    return JsonCodec("json", json.loads, dumps)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    # orjson.JSONDecodeError는 ValueError의 하위 클래스다
+    return JsonCodec("orjson", orjson.loads, orjson.dumps)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return JsonCodec("msgspec", loads, encoder.encode)
+
+
+_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def _select(backend: JsonBackend) -> JsonCodec:
+    if backend == "auto":
+        for name in _AUTO_ORDER:
+            if importlib.util.find_spec(name) is not None:
+                return _FACTORIES[name]()
+        return _stdlib_codec()
+    factory = _FACTORIES.get(backend)
+    if factory is None:
+        raise ValueError(f"알 수 없는 JSON 백엔드: {backend!r}")
+    try:
+        return factory()
+    except ImportError as exc:
+        raise ImportError(
+            f"{backend} 백엔드를 쓰려면 {backend} 패키지가 필요합니다: "
+            f"pip install \"kiwoompy[{backend}]\""
+        ) from exc
+
+
+_codec: JsonCodec = _select("auto")
+
+
+def get_json_codec() -> JsonCodec:
+    """현재 사용 중인 JSON 코덱을 반환한다."""
+    return _codec
+
+
+def set_json_codec(codec: JsonBackend | JsonCodec = "auto") -> JsonCodec:
+    """REST·실시간·조건검색이 함께 쓰는 JSON 코덱을 바꾼다.
+
+    이미 연결된 실시간·조건검색 세션에도 다음 메시지부터 적용된다.
+
+    Args:
+        codec: 백엔드 이름 또는 직접 만든 ``JsonCodec``. 기본값 ``"auto"``.
+
+    Returns:
+        적용된 ``JsonCodec``.
+
+    Raises:
+        ImportError: 지정한 백엔드 패키지가 설치되지 않은 경우.
+        ValueError: 알 수 없는 백엔드 이름.
+
+    Example:
+        >>> from kiwoompy import set_json_codec
+        >>> set_json_codec("json").name  # 표준 라이브러리로 고정
+        'json'
+    """
+    global _codec
+    _codec = codec if isinstance(codec, JsonCodec) else _select(codec)
+    return _codec
+
+
+def json_loads(data: bytes | str) -> Any:
+    """현재 코덱으로 JSON을 파싱한다. 잘못된 JSON이면 ``ValueError``."""
+    return _codec.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """현재 코덱으로 객체를 UTF-8 JSON ``bytes``로 직렬화한다."""
+    return _codec.dumps(obj)
+
+
+def json_key(obj: Any) -> str:
+    """캐시·요청 병합 키로 쓸 정규화된 JSON 문자열을 만든다.
+
+    딕셔너리 키를 재귀적으로 정렬한 뒤 현재 코덱으로 직렬화하므로, 키 순서만 다른
+    본문은 같은 문자열이 된다. JSON 기본 타입이 아닌 값은 ``str()``로 바꾼다.
+
+    Example:
+        >>> json_key({"b": 1, "a": "가"}) == json_key({"a": "가", "b": 1})
+        True
+    """
+    return _codec.dumps(_normalize(obj)).decode()
+
+
+def _normalize(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {str(key): _normalize(obj[key]) for key in sorted(obj, key=str)}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(value) for value in obj]
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    return str(obj)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from collections.abc import Callable, Coroutine
@@ -11,7 +10,8 @@ from typing import Any
 import websockets
 from websockets.asyncio.client import connect
 
-from kiwoompy.api import KiwoomApi
+from kiwoompy.api import AsyncKiwoomApi, KiwoomApi, TokenBucket
+from kiwoompy.codec import json_dumps, json_loads
 from kiwoompy.exceptions import KiwoomApiError
 from kiwoompy.models import (
     ConditionItem,
@@ -51,28 +51,6 @@ def _check(raw: dict) -> None:
         raise KiwoomApiError(f"조건검색 오류 (return_code={rc}): {msg}")
 
 
-class _AsyncRateLimiter:
-    """asyncio 기반 간단한 유량 제어기.
-
-    초당 ``rps``건을 초과하지 않도록 호출 간격을 제어한다.
-
-    Args:
-        rps: 초당 최대 요청 수.
-    """
-
-    def __init__(self, rps: float) -> None:
-        self._min_interval = 1.0 / rps
-        self._last_called = 0.0
-
-    async def acquire(self) -> None:
-        """다음 요청을 허용할 때까지 필요하면 대기한다."""
-        now = time.monotonic()
-        wait = self._min_interval - (now - self._last_called)
-        if wait > 0:
-            await asyncio.sleep(wait)
-        self._last_called = time.monotonic()
-
-
 class KiwoomCond:
     """키움 REST API 조건검색 WebSocket 클라이언트.
 
@@ -83,7 +61,7 @@ class KiwoomCond:
     **속도 제한**: 5회/초, 동일 조건식 1회/분
 
     Args:
-        api: 접근토큰·환경 정보를 담은 ``KiwoomApi`` 인스턴스.
+        api: 접근토큰·환경 정보를 담은 ``KiwoomApi`` 또는 ``AsyncKiwoomApi`` 인스턴스.
         env: 환경 구분. ``"real"`` (운영) 또는 ``"demo"`` (모의투자).
 
     Example:
@@ -96,10 +74,10 @@ class KiwoomCond:
         >>> print(result.items)
     """
 
-    def __init__(self, api: KiwoomApi, env: str = "demo") -> None:
+    def __init__(self, api: KiwoomApi | AsyncKiwoomApi, env: str = "demo") -> None:
         self._api = api
         self._ws_url = _WS_PATHS[env]
-        self._rate_limiter = _AsyncRateLimiter(_COND_RPS)
+        self._rate_limiter = TokenBucket(_COND_RPS)
         # 조건식 일련번호 → 마지막 요청 시각 (1분 쿨다운)
         self._last_seq_called: dict[str, float] = {}
 
@@ -119,18 +97,16 @@ class KiwoomCond:
         Raises:
             KiwoomApiError: WebSocket 연결·통신 오류 또는 응답 파싱 실패.
         """
-        import json
-
-        await self._rate_limiter.acquire()
+        await self._rate_limiter.acquire_async()
         auth = self._auth_header()
         try:
             async with connect(
                 self._ws_url,
                 additional_headers=auth,
             ) as ws:
-                await ws.send(json.dumps(payload))
+                await ws.send(json_dumps(payload).decode())
                 raw_msg = await ws.recv()
-                return json.loads(raw_msg)  # type: ignore[return-value]
+                return json_loads(raw_msg)  # type: ignore[return-value]
         except websockets.exceptions.WebSocketException as exc:
             raise KiwoomApiError(f"WebSocket 오류: {exc}") from exc
         except Exception as exc:
@@ -262,9 +238,7 @@ class KiwoomCond:
             ...     print(item.values.stock_code, item.values.insert_delete)
             >>> await cond.condition_realtime("4", on_event)
         """
-        import json
-
-        await self._rate_limiter.acquire()
+        await self._rate_limiter.acquire_async()
         payload = {
             "trnm": "CNSRREQ",
             "seq": seq,
@@ -277,9 +251,9 @@ class KiwoomCond:
                 self._ws_url,
                 additional_headers=auth,
             ) as ws:
-                await ws.send(json.dumps(payload))
+                await ws.send(json_dumps(payload).decode())
                 async for raw_msg in ws:
-                    raw: dict = json.loads(raw_msg)
+                    raw: dict = json_loads(raw_msg)
                     trnm = raw.get("trnm", "")
 
                     if trnm == "CNSRREQ":
@@ -32,3 +32,24 @@ class KiwoomAuthError(KiwoomApiError):
         message: 한글 오류 메시지.
         status_code: HTTP 상태 코드 (주로 400·401·403).
     """
+
+
+class KiwoomRateLimitError(KiwoomApiError):
+    """유량 한도 초과 — 서버가 요청 개수 초과(HTTP 429 또는 해당 ``return_code``)로 거절한 경우.
+
+    재시도 대상이며, 서버가 ``Retry-After``를 알려 준 경우 그 시간만큼 기다린 뒤 재시도한다.
+
+    Args:
+        message: 한글 오류 메시지.
+        status_code: HTTP 상태 코드.
+        retry_after: 서버가 요청한 재시도 대기 시간(초). 없으면 ``None``.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        self.retry_after = retry_after
+        super().__init__(message, status_code=status_code)
@@ -0,0 +1,244 @@
+"""요청 계측 — TR 요청별 대기·지연·크기·재시도·오류를 훅으로 보고하고 집계한다.
+
+``KiwoomApi(metrics=...)``에 훅을 넘기면 서버로 전송한 요청마다 ``RequestMetrics``가
+전달된다. ``MetricsRecorder``는 이를 ``api-id``별로 모아 최근 구간의 p50/p95/p99를
+계산하며, ``snapshot()``으로 JSON 직렬화 가능한 딕셔너리를 내보낸다.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+_WINDOW = 1024  # 백분위 계산에 쓰는 최근 표본 수
+_PERCENTILES = (50, 95, 99)
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """요청 한 건의 계측값. 시간 단위는 초, 크기 단위는 바이트.
+
+    재시도한 요청은 시도 전체의 합계를 보고한다.
+
+    Attributes:
+        api_id: TR ID. 토큰 발급처럼 ``api-id``가 없으면 빈 문자열.
+        path: 엔드포인트 경로.
+        queue_wait: 유량 제어기에서 기다린 시간.
+        latency: 요청 전송부터 응답 수신까지 걸린 네트워크 시간.
+        parse_time: 응답 검사·JSON 파싱 시간.
+        request_bytes: 요청 본문 크기.
+        response_bytes: 응답 본문 크기.
+        attempts: 전송 시도 횟수. ``1``이면 재시도 없음.
+        error: 최종 실패 시 예외 클래스 이름. 성공이면 ``None``.
+    """
+
+    api_id: str
+    path: str
+    queue_wait: float
+    latency: float
+    parse_time: float
+    request_bytes: int
+    response_bytes: int
+    attempts: int
+    error: str | None = None
+
+    @property
+    def retries(self) -> int:
+        """재시도 횟수."""
+        return self.attempts - 1
+
+
+type MetricsHook = Callable[[RequestMetrics], None]
+
+
+class _RequestSample:
+    """요청 한 건의 시도별 계측값을 모으는 가변 누산기."""
+
+    __slots__ = (
+        "queue_wait",
+        "latency",
+        "parse_time",
+        "request_bytes",
+        "response_bytes",
+        "attempts",
+        "error",
+    )
+
+    def __init__(self) -> None:
+        self.queue_wait = 0.0
+        self.latency = 0.0
+        self.parse_time = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.attempts = 0
+        self.error: BaseException | None = None
+
+    def to_metrics(self, api_id: str, path: str) -> RequestMetrics:
+        return RequestMetrics(
+            api_id=api_id,
+            path=path,
+            queue_wait=self.queue_wait,
+            latency=self.latency,
+            parse_time=self.parse_time,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            attempts=self.attempts,
+            error=type(self.error).__name__ if self.error is not None else None,
+        )
+
+
+def _nearest_rank(ordered: list[float], p: float) -> float:
+    """정렬된 표본의 ``p`` 백분위 값(nearest-rank). 표본이 없으면 ``0.0``."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LatencyHistogram:
+    """최근 ``window``개 표본으로 백분위를 계산하는 이동 히스토그램. 스레드 안전하다.
+
+    Args:
+        window: 유지할 최근 표본 수. 기본값 ``1024``.
+    """
+
+    def __init__(self, window: int = _WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """표본을 추가한다. 창이 가득 차면 가장 오래된 표본을 버린다."""
+        with self._lock:
+            self._samples.append(value)
+
+    def percentile(self, p: float) -> float:
+        """``p`` 백분위 값(nearest-rank)을 반환한다. 표본이 없으면 ``0.0``.
+
+        Args:
+            p: 0~100 사이 백분위.
+        """
+        with self._lock:
+            ordered = sorted(self._samples)
+        return _nearest_rank(ordered, p)
+
+    def summary(self) -> dict[str, float]:
+        """``{"p50": ..., "p95": ..., "p99": ..., "count": ...}`` 형태의 요약."""
+        with self._lock:
+            ordered = sorted(self._samples)
+        result: dict[str, float] = {"count": len(ordered)}
+        for p in _PERCENTILES:
+            result[f"p{p}"] = _nearest_rank(ordered, p)
+        return result
+
+
+class _ApiIdStats:
+    """``api-id`` 하나의 누적 통계."""
+
+    __slots__ = (
+        "count",
+        "retries",
+        "errors",
+        "request_bytes",
+        "response_bytes",
+        "queue_wait",
+        "latency",
+        "parse_time",
+    )
+
+    def __init__(self, window: int) -> None:
+        self.count = 0
+        self.retries = 0
+        self.errors: Counter[str] = Counter()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.queue_wait = LatencyHistogram(window)
+        self.latency = LatencyHistogram(window)
+        self.parse_time = LatencyHistogram(window)
+
+
+class MetricsRecorder:
+    """``RequestMetrics``를 ``api-id``별로 집계하는 기본 훅.
+
+    호출 가능 객체이므로 그대로 ``KiwoomApi(metrics=recorder)``에 넘긴다.
+    건수·재시도·오류 클래스별 건수·전송 바이트는 누적하고, 대기·지연·파싱 시간은
+    최근 ``window``건으로 백분위를 계산한다.
+
+    Args:
+        window: ``api-id``·지표별로 유지할 최근 표본 수. 기본값 ``1024``.
+
+    Example:
+        >>> from kiwoompy import KiwoomApi, MetricsRecorder
+        >>> recorder = MetricsRecorder()
+        >>> api = KiwoomApi(env="real", metrics=recorder)
+        >>> ...
+        >>> recorder.percentile("ka10004", "latency", 99)
+        0.084
+        >>> json.dumps(recorder.snapshot())
+    """
+
+    def __init__(self, window: int = _WINDOW) -> None:
+        self._window = window
+        self._stats: dict[str, _ApiIdStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        with self._lock:
+            stats = self._stats.get(metrics.api_id)
+            if stats is None:
+                stats = self._stats[metrics.api_id] = _ApiIdStats(self._window)
+            stats.count += 1
+            stats.retries += metrics.retries
+            stats.request_bytes += metrics.request_bytes
+            stats.response_bytes += metrics.response_bytes
+            if metrics.error is not None:
+                stats.errors[metrics.error] += 1
+        stats.queue_wait.add(metrics.queue_wait)
+        stats.latency.add(metrics.latency)
+        stats.parse_time.add(metrics.parse_time)
+
+    def percentile(self, api_id: str, metric: str, p: float) -> float:
+        """``api_id``의 ``metric`` 백분위 값(초)을 반환한다.
+
+        Args:
+            api_id: TR ID.
+            metric: ``"queue_wait"``, ``"latency"``, ``"parse_time"`` 중 하나.
+            p: 0~100 사이 백분위.
+
+        Returns:
+            백분위 값. 해당 TR의 표본이 없으면 ``0.0``.
+        """
+        if metric not in ("queue_wait", "latency", "parse_time"):
+            raise ValueError(f"알 수 없는 지표: {metric!r}")
+        stats = self._stats.get(api_id)
+        if stats is None:
+            return 0.0
+        return getattr(stats, metric).percentile(p)
+
+    def snapshot(self) -> dict[str, dict]:
+        """``api-id``별 누적값과 p50/p95/p99 요약을 JSON 직렬화 가능한 딕셔너리로 반환한다."""
+        with self._lock:
+            items = list(self._stats.items())
+        return {
+            api_id: {
+                "count": stats.count,
+                "retries": stats.retries,
+                "errors": dict(stats.errors),
+                "request_bytes": stats.request_bytes,
+                "response_bytes": stats.response_bytes,
+                "queue_wait": stats.queue_wait.summary(),
+                "latency": stats.latency.summary(),
+                "parse_time": stats.parse_time.summary(),
+            }
+            for api_id, stats in items
+        }
+
+    def reset(self) -> None:
+        """집계를 모두 지운다."""
+        with self._lock:
+            self._stats.clear()
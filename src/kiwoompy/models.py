@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Literal
 
+from kiwoompy.numeric import parse_number
+
 # ---------------------------------------------------------------------------
 # 타입 별칭
 # ---------------------------------------------------------------------------
@@ -12,6 +14,9 @@ from typing import Literal
 type Env = Literal["real", "demo"]
 """운영(`real`) / 모의투자(`demo`) 환경 구분."""
 
+type RequestPriority = Literal["order", "account", "market", "bulk"]
+"""REST 요청 우선순위 등급. 유량 한도 대기 시 ``order`` → ``account`` → ``market`` → ``bulk`` 순으로 전송."""
+
 type AccountNo = str
 """계좌번호. ``"12345678-01"`` 형식 (8자리 계좌번호 + 상품코드).
 입력값 정규화는 :func:`kiwoompy.utils.normalize_account_no` 사용.
@@ -22,7 +27,7 @@ type AccountNo = str
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenRequest:
     """접근토큰 발급 요청 (au10001).
 
@@ -37,7 +42,7 @@ class TokenRequest:
     grant_type: str = "client_credentials"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenResponse:
     """접근토큰 발급 응답 (au10001).
 
@@ -60,7 +65,7 @@ class TokenResponse:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RevokeTokenRequest:
     """접근토큰 폐기 요청 (au10002).
 
@@ -80,7 +85,7 @@ class RevokeTokenRequest:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FxDepositItem:
     """외화예수금 항목 (kt00001 ``stk_entr_prst`` 배열 원소).
 
@@ -107,7 +112,7 @@ class FxDepositItem:
     d4_fx_entr: str             # d+4외화예수금
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DepositDetail:
     """예수금상세현황 응답 (kt00001).
 
@@ -140,7 +145,7 @@ class DepositDetail:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyEstimatedAssetItem:
     """일별추정예탁자산 항목 (kt00002 배열 원소).
 
@@ -165,7 +170,7 @@ class DailyEstimatedAssetItem:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EstimatedAsset:
     """추정자산조회 응답 (kt00003).
 
@@ -181,7 +186,7 @@ class EstimatedAsset:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountEvaluationItem:
     """종목별계좌평가현황 항목 (kt00004 배열 원소).
 
@@ -213,7 +218,7 @@ class AccountEvaluationItem:
     tdy_sellq: str  # 금일매도수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountEvaluation:
     """계좌평가현황 응답 (kt00004).
 
@@ -247,7 +252,7 @@ class AccountEvaluation:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionBalanceItem:
     """종목별체결잔고 항목 (kt00005 배열 원소).
 
@@ -277,7 +282,7 @@ class ExecutionBalanceItem:
     pl_rt: str      # 손익률
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionBalance:
     """체결잔고 응답 (kt00005).
 
@@ -305,7 +310,7 @@ class ExecutionBalance:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderHistoryDetailItem:
     """계좌별주문체결내역상세 항목 (kt00007 배열 원소).
 
@@ -349,7 +354,7 @@ class OrderHistoryDetailItem:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NextDaySettlementItem:
     """계좌별익일결제예정내역 항목 (kt00008 배열 원소).
 
@@ -379,7 +384,7 @@ class NextDaySettlementItem:
     crd_tp: str     # 신용구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NextDaySettlement:
     """계좌별익일결제예정내역 응답 (kt00008).
 
@@ -403,7 +408,7 @@ class NextDaySettlement:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderExecutionStatusItem:
     """계좌별주문체결현황 항목 (kt00009 배열 원소).
 
@@ -441,7 +446,7 @@ class OrderExecutionStatusItem:
     cond_uv: str        # 스톱가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderExecutionStatus:
     """계좌별주문체결현황 응답 (kt00009).
 
@@ -463,7 +468,7 @@ class OrderExecutionStatus:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderableAmount:
     """주문인출가능금액 응답 (kt00010).
 
@@ -500,7 +505,7 @@ class OrderableAmount:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderableQuantity:
     """증거금율별주문가능수량 응답 (kt00011).
 
@@ -536,7 +541,7 @@ class OrderableQuantity:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditOrderableQuantity:
     """신용보증금율별주문가능수량 응답 (kt00012).
 
@@ -568,7 +573,7 @@ class CreditOrderableQuantity:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarginDetail:
     """증거금세부내역 응답 (kt00013).
 
@@ -602,7 +607,7 @@ class MarginDetail:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionHistoryItem:
     """위탁종합거래내역 항목 (kt00015 배열 원소).
 
@@ -638,7 +643,7 @@ class TransactionHistoryItem:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyAccountReturn:
     """일별계좌수익률상세현황 응답 (kt00016).
 
@@ -670,7 +675,7 @@ class DailyAccountReturn:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyAccountStatus:
     """계좌별당일현황 응답 (kt00017).
 
@@ -699,7 +704,7 @@ class DailyAccountStatus:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HoldingItem:
     """계좌평가잔고 종목 항목 (kt00018 배열 원소).
 
@@ -742,7 +747,7 @@ class HoldingItem:
     crd_loan_dt: str    # 대출일
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountBalance:
     """계좌평가잔고내역 응답 (kt00018).
 
@@ -771,7 +776,7 @@ class AccountBalance:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountNumbers:
     """계좌번호조회 응답 (ka00001).
 
@@ -787,7 +792,7 @@ class AccountNumbers:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyBalanceReturnItem:
     """일별잔고수익률 종목 항목 (ka01690 배열 원소).
 
@@ -813,7 +818,7 @@ class DailyBalanceReturnItem:
     evlt_wght: str      # 평가비중
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyBalanceReturn:
     """일별잔고수익률 응답 (ka01690).
 
@@ -840,7 +845,7 @@ class DailyBalanceReturn:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RealizedProfitByDateItem:
     """일자별종목별실현손익 항목 (ka10072 배열 원소).
 
@@ -868,7 +873,7 @@ class RealizedProfitByDateItem:
     crd_tp: str         # 신용구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RealizedProfitByPeriodItem:
     """일자별종목별실현손익 항목 (ka10073 배열 원소).
 
@@ -901,7 +906,7 @@ class RealizedProfitByPeriodItem:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyRealizedProfitItem:
     """일자별실현손익 항목 (ka10074 배열 원소).
 
@@ -920,7 +925,7 @@ class DailyRealizedProfitItem:
     tdy_trde_tax: str   # 당일매매세금
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyRealizedProfit:
     """일자별실현손익 응답 (ka10074).
 
@@ -944,7 +949,7 @@ class DailyRealizedProfit:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnfilledOrderItem:
     """미체결 주문 항목 (ka10075 배열 원소).
 
@@ -985,7 +990,7 @@ class UnfilledOrderItem:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilledOrderItem:
     """체결 주문 항목 (ka10076 배열 원소).
 
@@ -1024,7 +1029,7 @@ class FilledOrderItem:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyRealizedProfitDetailItem:
     """당일실현손익상세 항목 (ka10077 배열 원소).
 
@@ -1047,7 +1052,7 @@ class DailyRealizedProfitDetailItem:
     stk_cd: str         # 종목코드
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyRealizedProfitDetail:
     """당일실현손익상세 응답 (ka10077).
 
@@ -1065,7 +1070,7 @@ class DailyRealizedProfitDetail:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountReturnItem:
     """계좌수익률 항목 (ka10085 배열 원소).
 
@@ -1102,7 +1107,7 @@ class AccountReturnItem:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SplitOrderDetailItem:
     """미체결 분할주문 상세 항목 (ka10088 배열 원소).
 
@@ -1136,7 +1141,7 @@ class SplitOrderDetailItem:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTradeJournalItem:
     """당일매매일지 항목 (ka10170 배열 원소).
 
@@ -1162,7 +1167,7 @@ class DailyTradeJournalItem:
     stk_cd: str         # 종목코드
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTradeJournal:
     """당일매매일지 응답 (ka10170).
 
@@ -1238,7 +1243,7 @@ type OrderExchange = Literal["KRX", "NXT", "SOR"]
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderResponse:
     """주식 매수/매도 주문 응답 (kt10000, kt10001).
 
@@ -1256,7 +1261,7 @@ class OrderResponse:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModifyOrderResponse:
     """주식 정정주문 응답 (kt10002, kt10008).
 
@@ -1278,7 +1283,7 @@ class ModifyOrderResponse:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CancelOrderResponse:
     """주식 취소주문 응답 (kt10003, kt10009).
 
@@ -1510,7 +1515,7 @@ type UnitType = Literal["thousand", "single"]
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderbookLevel:
     """호가 단일 레벨 (매도/매수 각 호가·잔량·직전대비).
 
@@ -1525,7 +1530,7 @@ class OrderbookLevel:
     qty_change: str # 잔량직전대비
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Orderbook:
     """주식호가 응답 (ka10004).
 
@@ -1556,7 +1561,7 @@ class Orderbook:
     ovt_buy_qty_change: str             # 시간외매수잔량대비
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockPeriodItem:
     """주식일주월시분 단일 항목 (ka10005).
 
@@ -1599,7 +1604,7 @@ class StockPeriodItem:
     prm: str            # 프로그램
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockPeriods:
     """주식일주월시분 응답 (ka10005).
 
@@ -1610,7 +1615,7 @@ class StockPeriods:
     items: list[StockPeriodItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockMinutes:
     """주식시분 응답 (ka10006).
 
@@ -1639,7 +1644,7 @@ class StockMinutes:
     cntr_str: str   # 체결강도
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketSummary:
     """시세표성정보 응답 (ka10007). 종목의 현재가·호가·예상체결 등 종합 시세.
 
@@ -1684,7 +1689,7 @@ class MarketSummary:
     tot_sel_req: str        # 총매도잔량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyPriceItem:
     """일별주가 단일 항목 (ka10086).
 
@@ -1719,7 +1724,7 @@ class DailyPriceItem:
     crd_remn_rt: str    # 신용잔고율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyPrices:
     """일별주가 응답 (ka10086).
 
@@ -1730,7 +1735,7 @@ class DailyPrices:
     items: list[DailyPriceItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AfterhoursOrderbook:
     """시간외단일가 호가 응답 (ka10087).
 
@@ -1755,7 +1760,7 @@ class AfterhoursOrderbook:
     buy_bid_tot: str        # 매수호가총잔량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewStockRightsItem:
     """신주인수권 시세 단일 항목 (ka10011).
 
@@ -1782,7 +1787,7 @@ class NewStockRightsItem:
     low_pric: str       # 저가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewStockRightsPrices:
     """신주인수권전체시세 응답 (ka10011).
 
@@ -1793,7 +1798,7 @@ class NewStockRightsPrices:
     items: list[NewStockRightsItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyInstitutionStockItem:
     """일별기관매매종목 단일 항목 (ka10044).
 
@@ -1810,7 +1815,7 @@ class DailyInstitutionStockItem:
     netprps_amt: str    # 순매수금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyInstitutionStocks:
     """일별기관매매종목 응답 (ka10044).
 
@@ -1821,7 +1826,7 @@ class DailyInstitutionStocks:
     items: list[DailyInstitutionStockItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockInstitutionTrendItem:
     """종목별기관매매추이 단일 항목 (ka10045).
 
@@ -1848,7 +1853,7 @@ class StockInstitutionTrendItem:
     limit_exh_rt: str           # 한도소진율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockInstitutionTrend:
     """종목별기관매매추이 응답 (ka10045).
 
@@ -1863,7 +1868,7 @@ class StockInstitutionTrend:
     items: list[StockInstitutionTrendItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionStrengthItem:
     """체결강도추이 단일 항목 (ka10046, ka10047).
 
@@ -1888,7 +1893,7 @@ class ExecutionStrengthItem:
     cntr_str_60: str    # 체결강도 60분/60일
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionStrength:
     """체결강도추이 응답 (ka10046, ka10047).
 
@@ -1899,7 +1904,7 @@ class ExecutionStrength:
     items: list[ExecutionStrengthItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntradayInvestorItem:
     """장중투자자별매매 단일 항목 (ka10063).
 
@@ -1924,7 +1929,7 @@ class IntradayInvestorItem:
     sell_qty: str       # 매도수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntradayInvestorTrading:
     """장중투자자별매매 응답 (ka10063).
 
@@ -1935,7 +1940,7 @@ class IntradayInvestorTrading:
     items: list[IntradayInvestorItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AfterCloseInvestorItem:
     """장마감후투자자별매매 단일 항목 (ka10066).
 
@@ -1960,7 +1965,7 @@ class AfterCloseInvestorItem:
     orgn: str           # 기관계
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AfterCloseInvestorTrading:
     """장마감후투자자별매매 응답 (ka10066).
 
@@ -1971,7 +1976,7 @@ class AfterCloseInvestorTrading:
     items: list[AfterCloseInvestorItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerStockTrendItem:
     """증권사별종목매매동향 단일 항목 (ka10078).
 
@@ -1994,7 +1999,7 @@ class BrokerStockTrendItem:
     sell_qty: str       # 매도수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerStockTrend:
     """증권사별종목매매동향 응답 (ka10078).
 
@@ -2010,7 +2015,7 @@ class BrokerStockTrend:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockInfo:
     """주식기본정보 응답 (ka10001).
 
@@ -2057,7 +2062,7 @@ class StockInfo:
     oyr_lwst: str   # 연중최저
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerEntry:
     """거래원 단일 항목 (ka10002).
 
@@ -2072,7 +2077,7 @@ class BrokerEntry:
     qty: str    # 거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockBrokers:
     """주식거래원 응답 (ka10002).
 
@@ -2091,7 +2096,7 @@ class StockBrokers:
     buy_brokers: list[BrokerEntry]   # 매수거래원 상위 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionInfoItem:
     """체결정보 단일 항목 (ka10003).
 
@@ -2112,7 +2117,7 @@ class ExecutionInfoItem:
     stex_tp: str        # 거래소구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionInfo:
     """체결정보 응답 (ka10003).
 
@@ -2123,7 +2128,7 @@ class ExecutionInfo:
     items: list[ExecutionInfoItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditTradingItem:
     """신용매매동향 단일 항목 (ka10013).
 
@@ -2146,7 +2151,7 @@ class CreditTradingItem:
     remn_rt: str    # 잔고율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditTradingTrend:
     """신용매매동향 응답 (ka10013).
 
@@ -2157,7 +2162,7 @@ class CreditTradingTrend:
     items: list[CreditTradingItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTradingDetailItem:
     """일별거래상세 단일 항목 (ka10015).
 
@@ -2184,7 +2189,7 @@ class DailyTradingDetailItem:
     ind_netprps: str    # 개인순매수
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTradingDetail:
     """일별거래상세 응답 (ka10015).
 
@@ -2195,7 +2200,7 @@ class DailyTradingDetail:
     items: list[DailyTradingDetailItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HighLowStockItem:
     """신고저가 단일 항목 (ka10016).
 
@@ -2218,7 +2223,7 @@ class HighLowStockItem:
     low_pric: str   # 저가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HighLowStocks:
     """신고저가 응답 (ka10016).
 
@@ -2229,7 +2234,7 @@ class HighLowStocks:
     items: list[HighLowStockItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LimitStockItem:
     """상하한가 단일 항목 (ka10017).
 
@@ -2254,7 +2259,7 @@ class LimitStockItem:
     cnt: str        # 횟수
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LimitStocks:
     """상하한가 응답 (ka10017).
 
@@ -2265,7 +2270,7 @@ class LimitStocks:
     items: list[LimitStockItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NearHighLowItem:
     """고저가근접 단일 항목 (ka10018).
 
@@ -2288,7 +2293,7 @@ class NearHighLowItem:
     tdy_low_pric: str   # 당일저가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NearHighLow:
     """고저가근접 응답 (ka10018).
 
@@ -2299,7 +2304,7 @@ class NearHighLow:
     items: list[NearHighLowItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceSurgeItem:
     """가격급등락 단일 항목 (ka10019).
 
@@ -2322,7 +2327,7 @@ class PriceSurgeItem:
     trde_qty: str   # 거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceSurgeStocks:
     """가격급등락 응답 (ka10019).
 
@@ -2333,7 +2338,7 @@ class PriceSurgeStocks:
     items: list[PriceSurgeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VolumeUpdatedItem:
     """거래량갱신 단일 항목 (ka10024).
 
@@ -2354,7 +2359,7 @@ class VolumeUpdatedItem:
     now_trde_qty: str       # 현재거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VolumeUpdatedStocks:
     """거래량갱신 응답 (ka10024).
 
@@ -2365,7 +2370,7 @@ class VolumeUpdatedStocks:
     items: list[VolumeUpdatedItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupplyConcentrationItem:
     """매물대집중 단일 항목 (ka10025).
 
@@ -2390,7 +2395,7 @@ class SupplyConcentrationItem:
     prps_rt: str    # 매물비
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupplyConcentration:
     """매물대집중 응답 (ka10025).
 
@@ -2401,7 +2406,7 @@ class SupplyConcentration:
     items: list[SupplyConcentrationItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HighLowPERItem:
     """고저PER 단일 항목 (ka10026).
 
@@ -2422,7 +2427,7 @@ class HighLowPERItem:
     now_trde_qty: str   # 현재거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HighLowPER:
     """고저PER 응답 (ka10026).
 
@@ -2433,7 +2438,7 @@ class HighLowPER:
     items: list[HighLowPERItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenPriceChangeItem:
     """시가대비등락률 단일 항목 (ka10028).
 
@@ -2456,7 +2461,7 @@ class OpenPriceChangeItem:
     now_trde_qty: str   # 현재거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenPriceChange:
     """시가대비등락률 응답 (ka10028).
 
@@ -2467,7 +2472,7 @@ class OpenPriceChange:
     items: list[OpenPriceChangeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerSupplyItem:
     """거래원매물대분석 단일 항목 (ka10043).
 
@@ -2488,7 +2493,7 @@ class BrokerSupplyItem:
     trde_wght: str      # 거래비중
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerSupplyAnalysis:
     """거래원매물대분석 응답 (ka10043).
 
@@ -2499,7 +2504,7 @@ class BrokerSupplyAnalysis:
     items: list[BrokerSupplyItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerInstantVolumeItem:
     """거래원순간거래량 단일 항목 (ka10052).
 
@@ -2526,7 +2531,7 @@ class BrokerInstantVolumeItem:
     flu_rt: str         # 등락률
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerInstantVolume:
     """거래원순간거래량 응답 (ka10052).
 
@@ -2537,7 +2542,7 @@ class BrokerInstantVolume:
     items: list[BrokerInstantVolumeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VIStockItem:
     """변동성완화장치 발동종목 단일 항목 (ka10054).
 
@@ -2560,7 +2565,7 @@ class VIStockItem:
     stex_tp: str        # 거래소구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VIStocks:
     """변동성완화장치 발동종목 응답 (ka10054).
 
@@ -2571,7 +2576,7 @@ class VIStocks:
     items: list[VIStockItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodayPrevExecutionQtyItem:
     """당일전일체결량 단일 항목 (ka10055).
 
@@ -2592,7 +2597,7 @@ class TodayPrevExecutionQtyItem:
     acc_trde_prica: str     # 누적거래대금
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodayPrevExecutionQty:
     """당일전일체결량 응답 (ka10055).
 
@@ -2603,7 +2608,7 @@ class TodayPrevExecutionQty:
     items: list[TodayPrevExecutionQtyItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvestorDailyStockItem:
     """투자자별일별매매종목 단일 항목 (ka10058).
 
@@ -2624,7 +2629,7 @@ class InvestorDailyStockItem:
     pre_rt: str         # 대비율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvestorDailyStocks:
     """투자자별일별매매종목 응답 (ka10058).
 
@@ -2635,7 +2640,7 @@ class InvestorDailyStocks:
     items: list[InvestorDailyStockItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockInvestorItem:
     """종목별투자자기관별 단일 항목 (ka10059).
 
@@ -2664,7 +2669,7 @@ class StockInvestorItem:
     penfnd_etc: str     # 연기금등
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockInvestorByDay:
     """종목별투자자기관별 응답 (ka10059).
 
@@ -2675,7 +2680,7 @@ class StockInvestorByDay:
     items: list[StockInvestorItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockInvestorTotal:
     """종목별투자자기관별합계 응답 (ka10061).
 
@@ -2702,7 +2707,7 @@ class StockInvestorTotal:
     etc_corp: str       # 기타법인
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodayPrevExecutionItem:
     """당일전일체결 단일 항목 (ka10084).
 
@@ -2723,7 +2728,7 @@ class TodayPrevExecutionItem:
     stex_tp: str        # 거래소구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TodayPrevExecution:
     """당일전일체결 응답 (ka10084).
 
@@ -2734,7 +2739,7 @@ class TodayPrevExecution:
     items: list[TodayPrevExecutionItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WatchlistStockItem:
     """관심종목정보 단일 항목 (ka10095).
 
@@ -2765,7 +2770,7 @@ class WatchlistStockItem:
     lst_pric: str   # 하한가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WatchlistInfo:
     """관심종목정보 응답 (ka10095).
 
@@ -2776,7 +2781,7 @@ class WatchlistInfo:
     items: list[WatchlistStockItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockListItem:
     """종목정보 리스트 단일 항목 (ka10099).
 
@@ -2803,7 +2808,7 @@ class StockListItem:
     nxt_enable: str     # NXT가능여부
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockList:
     """종목정보 리스트 응답 (ka10099).
 
@@ -2814,7 +2819,7 @@ class StockList:
     items: list[StockListItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockDetail:
     """종목정보 조회 응답 (ka10100).
 
@@ -2845,7 +2850,7 @@ class StockDetail:
     nxt_enable: str     # NXT가능여부
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorItem:
     """업종코드 단일 항목 (ka10101).
 
@@ -2862,7 +2867,7 @@ class SectorItem:
     group: str          # 그룹
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorList:
     """업종코드 리스트 응답 (ka10101).
 
@@ -2873,7 +2878,7 @@ class SectorList:
     items: list[SectorItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerItem:
     """회원사 단일 항목 (ka10102).
 
@@ -2888,7 +2893,7 @@ class BrokerItem:
     gb: str     # 구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerList:
     """회원사 리스트 응답 (ka10102).
 
@@ -2992,7 +2997,7 @@ type RkinfoOrgType = Literal[
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BidQtyUpperItem:
     """호가잔량상위 단일 항목 (ka10020)."""
 
@@ -3008,7 +3013,7 @@ class BidQtyUpperItem:
     buy_rt: str         # 매수비율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BidQtyUpper:
     """호가잔량상위 응답 (ka10020).
 
@@ -3019,7 +3024,7 @@ class BidQtyUpper:
     items: list[BidQtyUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BidQtySurgeItem:
     """호가잔량급증 단일 항목 (ka10021)."""
 
@@ -3035,7 +3040,7 @@ class BidQtySurgeItem:
     tot_buy_qty: str    # 총매수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BidQtySurge:
     """호가잔량급증 응답 (ka10021).
 
@@ -3046,7 +3051,7 @@ class BidQtySurge:
     items: list[BidQtySurgeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QtyRatioSurgeItem:
     """잔량율급증 단일 항목 (ka10022)."""
 
@@ -3062,7 +3067,7 @@ class QtyRatioSurgeItem:
     tot_buy_req: str    # 총매수잔량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QtyRatioSurge:
     """잔량율급증 응답 (ka10022).
 
@@ -3073,7 +3078,7 @@ class QtyRatioSurge:
     items: list[QtyRatioSurgeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeQtySurgeItem:
     """거래량급증 단일 항목 (ka10023)."""
 
@@ -3089,7 +3094,7 @@ class TradeQtySurgeItem:
     sdnin_rt: str       # 급증률
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeQtySurge:
     """거래량급증 응답 (ka10023).
 
@@ -3100,7 +3105,7 @@ class TradeQtySurge:
     items: list[TradeQtySurgeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceChangeUpperItem:
     """전일대비등락률상위 단일 항목 (ka10027)."""
 
@@ -3118,7 +3123,7 @@ class PriceChangeUpperItem:
     cnt: str            # 횟수
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceChangeUpper:
     """전일대비등락률상위 응답 (ka10027).
 
@@ -3129,7 +3134,7 @@ class PriceChangeUpper:
     items: list[PriceChangeUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpectedTradeUpperItem:
     """예상체결등락률상위 단일 항목 (ka10029)."""
 
@@ -3147,7 +3152,7 @@ class ExpectedTradeUpperItem:
     buy_req: str        # 매수잔량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpectedTradeUpper:
     """예상체결등락률상위 응답 (ka10029).
 
@@ -3158,7 +3163,7 @@ class ExpectedTradeUpper:
     items: list[ExpectedTradeUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTradeQtyUpperItem:
     """당일거래량상위 단일 항목 (ka10030)."""
 
@@ -3186,7 +3191,7 @@ class DailyTradeQtyUpperItem:
     bf_mkrt_trde_amt: str   # 장전거래금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTradeQtyUpper:
     """당일거래량상위 응답 (ka10030).
 
@@ -3197,7 +3202,7 @@ class DailyTradeQtyUpper:
     items: list[DailyTradeQtyUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrevTradeQtyUpperItem:
     """전일거래량상위 단일 항목 (ka10031)."""
 
@@ -3209,7 +3214,7 @@ class PrevTradeQtyUpperItem:
     trde_qty: str       # 거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrevTradeQtyUpper:
     """전일거래량상위 응답 (ka10031).
 
@@ -3220,7 +3225,7 @@ class PrevTradeQtyUpper:
     items: list[PrevTradeQtyUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeAmtUpperItem:
     """거래대금상위 단일 항목 (ka10032)."""
 
@@ -3239,7 +3244,7 @@ class TradeAmtUpperItem:
     trde_prica: str     # 거래대금
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeAmtUpper:
     """거래대금상위 응답 (ka10032).
 
@@ -3250,7 +3255,7 @@ class TradeAmtUpper:
     items: list[TradeAmtUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditRatioUpperItem:
     """신용비율상위 단일 항목 (ka10033)."""
 
@@ -3267,7 +3272,7 @@ class CreditRatioUpperItem:
     now_trde_qty: str   # 현재거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditRatioUpper:
     """신용비율상위 응답 (ka10033).
 
@@ -3278,7 +3283,7 @@ class CreditRatioUpper:
     items: list[CreditRatioUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignPeriodTradeUpperItem:
     """외인기간별매매상위 단일 항목 (ka10034)."""
 
@@ -3295,7 +3300,7 @@ class ForeignPeriodTradeUpperItem:
     gain_pos_stkcnt: str    # 취득가능주식수
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignPeriodTradeUpper:
     """외인기간별매매상위 응답 (ka10034).
 
@@ -3306,7 +3311,7 @@ class ForeignPeriodTradeUpper:
     items: list[ForeignPeriodTradeUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignConsecTradeUpperItem:
     """외인연속순매매상위 단일 항목 (ka10035)."""
 
@@ -3325,7 +3330,7 @@ class ForeignConsecTradeUpperItem:
     pred_pre_3: str     # 전일대비3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignConsecTradeUpper:
     """외인연속순매매상위 응답 (ka10035).
 
@@ -3336,7 +3341,7 @@ class ForeignConsecTradeUpper:
     items: list[ForeignConsecTradeUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignLimitExhaustUpperItem:
     """외인한도소진율증가상위 단일 항목 (ka10036)."""
 
@@ -3354,7 +3359,7 @@ class ForeignLimitExhaustUpperItem:
     exh_rt_incrs: str       # 소진율증가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignLimitExhaustUpper:
     """외인한도소진율증가상위 응답 (ka10036).
 
@@ -3365,7 +3370,7 @@ class ForeignLimitExhaustUpper:
     items: list[ForeignLimitExhaustUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignBrokerTradeUpperItem:
     """외국계창구매매상위 단일 항목 (ka10037)."""
 
@@ -3384,7 +3389,7 @@ class ForeignBrokerTradeUpperItem:
     trde_prica: str         # 거래대금
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignBrokerTradeUpper:
     """외국계창구매매상위 응답 (ka10037).
 
@@ -3395,7 +3400,7 @@ class ForeignBrokerTradeUpper:
     items: list[ForeignBrokerTradeUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockBrokerRankItem:
     """종목별증권사순위 단일 항목 (ka10038)."""
 
@@ -3406,7 +3411,7 @@ class StockBrokerRankItem:
     acc_netprps_qty: str    # 누적순매수수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockBrokerRank:
     """종목별증권사순위 응답 (ka10038).
 
@@ -3425,7 +3430,7 @@ class StockBrokerRank:
     items: list[StockBrokerRankItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerTradeUpperItem:
     """증권사별매매상위 단일 항목 (ka10039)."""
 
@@ -3443,7 +3448,7 @@ class BrokerTradeUpperItem:
     sell_amt: str           # 매도금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrokerTradeUpper:
     """증권사별매매상위 응답 (ka10039).
 
@@ -3454,7 +3459,7 @@ class BrokerTradeUpper:
     items: list[BrokerTradeUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyMainBrokerEntry:
     """당일주요거래원 매도/매수 이탈 단일 항목 (ka10040)."""
 
@@ -3468,7 +3473,7 @@ class DailyMainBrokerEntry:
     qry_tm: str                 # 조회시간
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyMainBroker:
     """당일주요거래원 응답 (ka10040).
 
@@ -3522,7 +3527,7 @@ class DailyMainBroker:
     items: list[DailyMainBrokerEntry]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetBuyBrokerRankItem:
     """순매수거래원순위 단일 항목 (ka10042)."""
 
@@ -3531,7 +3536,7 @@ class NetBuyBrokerRankItem:
     mmcm_nm: str    # 회원사명
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetBuyBrokerRank:
     """순매수거래원순위 응답 (ka10042).
 
@@ -3542,7 +3547,7 @@ class NetBuyBrokerRank:
     items: list[NetBuyBrokerRankItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTopExitItem:
     """당일상위이탈원 단일 항목 (ka10053)."""
 
@@ -3556,7 +3561,7 @@ class DailyTopExitItem:
     qry_tm: str                 # 조회시간
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTopExit:
     """당일상위이탈원 응답 (ka10053).
 
@@ -3567,7 +3572,7 @@ class DailyTopExit:
     items: list[DailyTopExitItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SameNetTradeRankItem:
     """동일순매매순위 단일 항목 (ka10062)."""
 
@@ -3589,7 +3594,7 @@ class SameNetTradeRankItem:
     nettrde_amt: str            # 순매매금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SameNetTradeRank:
     """동일순매매순위 응답 (ka10062).
 
@@ -3600,7 +3605,7 @@ class SameNetTradeRank:
     items: list[SameNetTradeRankItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvestorTradeUpperItem:
     """장중투자자별매매상위 단일 항목 (ka10065)."""
 
@@ -3611,7 +3616,7 @@ class InvestorTradeUpperItem:
     netslmt: str    # 순매도
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvestorTradeUpper:
     """장중투자자별매매상위 응답 (ka10065).
 
@@ -3622,7 +3627,7 @@ class InvestorTradeUpper:
     items: list[InvestorTradeUpperItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AfterHoursRankItem:
     """시간외단일가등락율순위 단일 항목 (ka10098)."""
 
@@ -3641,7 +3646,7 @@ class AfterHoursRankItem:
     tdy_close_pric_flu_rt: str  # 당일종가등락률
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AfterHoursRank:
     """시간외단일가등락율순위 응답 (ka10098).
 
@@ -3652,7 +3657,7 @@ class AfterHoursRank:
     items: list[AfterHoursRankItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignInstitutionTradeUpperItem:
     """외국인기관매매상위 단일 항목 (ka90009)."""
 
@@ -3674,7 +3679,7 @@ class ForeignInstitutionTradeUpperItem:
     orgn_netprps_qty: str       # 기관순매수수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignInstitutionTradeUpper:
     """외국인기관매매상위 응답 (ka90009).
 
@@ -3754,7 +3759,7 @@ type ChartSectorMarket = Literal["kospi", "kosdaq", "kospi200"]
 # 6단계 — 차트 응답 모델
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockCandleItem:
     """주식 캔들 단일 항목 (틱·분봉 공통)."""
 
@@ -3768,7 +3773,7 @@ class StockCandleItem:
     pred_pre_sig: str   # 전일대비기호 (1:상한가 2:상승 3:보합 4:하한가 5:하락)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockTickChart:
     """주식틱차트조회 응답 (ka10079).
 
@@ -3783,7 +3788,7 @@ class StockTickChart:
     items: list[StockCandleItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockMinChartItem:
     """주식분봉차트 단일 항목 (ka10080)."""
 
@@ -3798,7 +3803,7 @@ class StockMinChartItem:
     acc_trde_qty: str   # 누적거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockMinChart:
     """주식분봉차트조회 응답 (ka10080).
 
@@ -3811,7 +3816,7 @@ class StockMinChart:
     items: list[StockMinChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockDayChartItem:
     """주식일봉차트 단일 항목 (ka10081)."""
 
@@ -3827,7 +3832,7 @@ class StockDayChartItem:
     trde_tern_rt: str   # 거래회전율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockDayChart:
     """주식일봉차트조회 응답 (ka10081).
 
@@ -3840,7 +3845,7 @@ class StockDayChart:
     items: list[StockDayChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockWeekChartItem:
     """주식주봉차트 단일 항목 (ka10082)."""
 
@@ -3856,7 +3861,7 @@ class StockWeekChartItem:
     trde_tern_rt: str   # 거래회전율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockWeekChart:
     """주식주봉차트조회 응답 (ka10082).
 
@@ -3869,7 +3874,7 @@ class StockWeekChart:
     items: list[StockWeekChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockMonthChartItem:
     """주식월봉차트 단일 항목 (ka10083)."""
 
@@ -3885,7 +3890,7 @@ class StockMonthChartItem:
     trde_tern_rt: str   # 거래회전율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockMonthChart:
     """주식월봉차트조회 응답 (ka10083).
 
@@ -3898,7 +3903,7 @@ class StockMonthChart:
     items: list[StockMonthChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockYearChartItem:
     """주식년봉차트 단일 항목 (ka10094)."""
 
@@ -3911,7 +3916,7 @@ class StockYearChartItem:
     low_pric: str       # 저가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockYearChart:
     """주식년봉차트조회 응답 (ka10094).
 
@@ -3924,7 +3929,7 @@ class StockYearChart:
     items: list[StockYearChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvestorChartItem:
     """종목별투자자기관별차트 단일 항목 (ka10060)."""
 
@@ -3947,7 +3952,7 @@ class InvestorChartItem:
     natfor: str         # 내외국인
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvestorChart:
     """종목별투자자기관별차트 응답 (ka10060).
 
@@ -3958,7 +3963,7 @@ class InvestorChart:
     items: list[InvestorChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntraInvestorChartItem:
     """장중투자자별매매차트 단일 항목 (ka10064)."""
 
@@ -3973,7 +3978,7 @@ class IntraInvestorChartItem:
     natn: str           # 국가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntraInvestorChart:
     """장중투자자별매매차트 응답 (ka10064).
 
@@ -3984,7 +3989,7 @@ class IntraInvestorChart:
     items: list[IntraInvestorChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorCandleItem:
     """업종 캔들 단일 항목 (틱·분봉 공통)."""
 
@@ -3998,7 +4003,7 @@ class SectorCandleItem:
     pred_pre_sig: str   # 전일대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorTickChart:
     """업종틱차트조회 응답 (ka20004).
 
@@ -4011,7 +4016,7 @@ class SectorTickChart:
     items: list[SectorCandleItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorMinChartItem:
     """업종분봉차트 단일 항목 (ka20005)."""
 
@@ -4026,7 +4031,7 @@ class SectorMinChartItem:
     pred_pre_sig: str   # 전일대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorMinChart:
     """업종분봉조회 응답 (ka20005).
 
@@ -4039,7 +4044,7 @@ class SectorMinChart:
     items: list[SectorMinChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorDayChartItem:
     """업종 일/주/월/년봉 단일 항목 (ka20006/07/08/19 공통)."""
 
@@ -4052,7 +4057,7 @@ class SectorDayChartItem:
     trde_prica: str     # 거래대금
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorDayChart:
     """업종일봉조회 응답 (ka20006).
 
@@ -4065,7 +4070,7 @@ class SectorDayChart:
     items: list[SectorDayChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorWeekChart:
     """업종주봉조회 응답 (ka20007).
 
@@ -4078,7 +4083,7 @@ class SectorWeekChart:
     items: list[SectorDayChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorMonthChart:
     """업종월봉조회 응답 (ka20008).
 
@@ -4091,7 +4096,7 @@ class SectorMonthChart:
     items: list[SectorDayChartItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorYearChart:
     """업종년봉조회 응답 (ka20019).
 
@@ -4162,7 +4167,7 @@ type SlbMrktType = Literal["kospi", "kosdaq"]
 # 7단계 — 업종 응답 모델
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorProgram:
     """업종프로그램요청 응답 (ka10010)."""
 
@@ -4186,7 +4191,7 @@ class SectorProgram:
     all_dfrt_trst_netprps_amt: str  # 전체차익위탁순매수금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorInvestorNetBuyItem:
     """업종별투자자순매수 단일 항목."""
 
@@ -4212,7 +4217,7 @@ class SectorInvestorNetBuyItem:
     orgn_netprps: str               # 기관계순매수
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorInvestorNetBuy:
     """업종별투자자순매수요청 응답 (ka10051).
 
@@ -4223,7 +4228,7 @@ class SectorInvestorNetBuy:
     items: list[SectorInvestorNetBuyItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorPriceTmItem:
     """업종현재가 시간별 단일 항목."""
 
@@ -4236,7 +4241,7 @@ class SectorPriceTmItem:
     acc_trde_qty_n: str # 누적거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorPrice:
     """업종현재가요청 응답 (ka20001).
 
@@ -4270,7 +4275,7 @@ class SectorPrice:
     items: list[SectorPriceTmItem]  # 시간별 현재가 리스트
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorStockPriceItem:
     """업종별주가 단일 항목."""
 
@@ -4288,7 +4293,7 @@ class SectorStockPriceItem:
     low_pric: str       # 저가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorStockPrices:
     """업종별주가요청 응답 (ka20002).
 
@@ -4299,7 +4304,7 @@ class SectorStockPrices:
     items: list[SectorStockPriceItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AllSectorIndexItem:
     """전업종지수 단일 항목."""
 
@@ -4320,7 +4325,7 @@ class AllSectorIndexItem:
     flo_stk_num: str  # 상장종목수
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AllSectorIndex:
     """전업종지수요청 응답 (ka20003).
 
@@ -4331,7 +4336,7 @@ class AllSectorIndex:
     items: list[AllSectorIndexItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorDailyPriceItem:
     """업종현재가 일별 단일 항목."""
 
@@ -4343,7 +4348,7 @@ class SectorDailyPriceItem:
     acc_trde_qty_n: str # 누적거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectorDailyPrice:
     """업종현재가일별요청 응답 (ka20009).
 
@@ -4381,7 +4386,7 @@ class SectorDailyPrice:
 # 7단계 — 기관/외국인 응답 모델
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignTradeItem:
     """주식외국인 종목별 매매동향 단일 항목."""
 
@@ -4398,7 +4403,7 @@ class ForeignTradeItem:
     limit_exh_rt: str   # 한도소진률
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForeignTrade:
     """주식외국인종목별매매동향 응답 (ka10008).
 
@@ -4409,7 +4414,7 @@ class ForeignTrade:
     items: list[ForeignTradeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstitutionTrade:
     """주식기관요청 응답 (ka10009)."""
 
@@ -4422,7 +4427,7 @@ class InstitutionTrade:
     frgnr_qota_rt: str      # 외국인지분율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstFrgnConsecutiveItem:
     """기관외국인연속매매현황 단일 항목."""
 
@@ -4447,7 +4452,7 @@ class InstFrgnConsecutiveItem:
     tot_cont_netprps_amt: str   # 합계연속순매수금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstFrgnConsecutiveTrade:
     """기관외국인연속매매현황요청 응답 (ka10131).
 
@@ -4462,7 +4467,7 @@ class InstFrgnConsecutiveTrade:
 # 7단계 — 공매도·대차거래 응답 모델
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShortSellItem:
     """공매도추이 단일 항목."""
 
@@ -4479,7 +4484,7 @@ class ShortSellItem:
     shrts_avg_pric: str     # 공매도평균가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShortSellTrend:
     """공매도추이요청 응답 (ka10014).
 
@@ -4490,7 +4495,7 @@ class ShortSellTrend:
     items: list[ShortSellItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockLoanItem:
     """대차거래추이 단일 항목."""
 
@@ -4502,7 +4507,7 @@ class StockLoanItem:
     remn_amt: str           # 잔고금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockLoanTrend:
     """대차거래추이요청 응답 (ka10068).
 
@@ -4513,7 +4518,7 @@ class StockLoanTrend:
     items: list[StockLoanItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockLoanTop10Item:
     """대차거래상위10종목 단일 항목."""
 
@@ -4525,7 +4530,7 @@ class StockLoanTop10Item:
     remn_amt: str           # 잔고금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockLoanTop10:
     """대차거래상위10종목요청 응답 (ka10069).
 
@@ -4545,7 +4550,7 @@ class StockLoanTop10:
     items: list[StockLoanTop10Item]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockLoanByStockItem:
     """대차거래추이(종목별) 단일 항목."""
 
@@ -4557,7 +4562,7 @@ class StockLoanByStockItem:
     remn_amt: str           # 잔고금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockLoanByStock:
     """대차거래추이요청(종목별) 응답 (ka20068).
 
@@ -4568,7 +4573,7 @@ class StockLoanByStock:
     items: list[StockLoanByStockItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockLoanHistoryItem:
     """대차거래내역 단일 항목."""
 
@@ -4580,7 +4585,7 @@ class StockLoanHistoryItem:
     remn_amt: str           # 잔고금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockLoanHistory:
     """대차거래내역요청 응답 (ka90012).
 
@@ -4649,7 +4654,7 @@ type ThemeSearchType = Literal["all", "theme", "stock"]
 # 8단계 — ETF 응답 모델
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfReturnItem:
     """ETF수익율 단일 항목."""
 
@@ -4659,7 +4664,7 @@ class EtfReturnItem:
     orgn_netprps_qty: str   # 기관순매수수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfReturn:
     """ETF수익율요청 응답 (ka40001).
 
@@ -4670,7 +4675,7 @@ class EtfReturn:
     items: list[EtfReturnItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfInfo:
     """ETF종목정보요청 응답 (ka40002).
 
@@ -4689,7 +4694,7 @@ class EtfInfo:
     etntxon_type: str       # ETN과세유형
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfDailyTrendItem:
     """ETF일별추이 단일 항목."""
 
@@ -4709,7 +4714,7 @@ class EtfDailyTrendItem:
     trace_pre_sig: str      # 추적대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfDailyTrend:
     """ETF일별추이요청 응답 (ka40003).
 
@@ -4720,7 +4725,7 @@ class EtfDailyTrend:
     items: list[EtfDailyTrendItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfAllQuoteItem:
     """ETF전체시세 단일 항목."""
 
@@ -4744,7 +4749,7 @@ class EtfAllQuoteItem:
     trace_flu_rt: str       # 추적등락율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfAllQuote:
     """ETF전체시세요청 응답 (ka40004).
 
@@ -4755,7 +4760,7 @@ class EtfAllQuote:
     items: list[EtfAllQuoteItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfTimeTrendItem:
     """ETF시간대별추이 단일 항목 (ka40006)."""
 
@@ -4775,7 +4780,7 @@ class EtfTimeTrendItem:
     trace_idex_pred_pre_sig: str    # 추적지수전일대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfTimeTrend:
     """ETF시간대별추이요청 응답 (ka40006).
 
@@ -4796,7 +4801,7 @@ class EtfTimeTrend:
     items: list[EtfTimeTrendItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfTimeFillItem:
     """ETF시간대별체결 단일 항목 (ka40007)."""
 
@@ -4808,7 +4813,7 @@ class EtfTimeFillItem:
     stex_tp: str    # 거래소구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfTimeFill:
     """ETF시간대별체결요청 응답 (ka40007).
 
@@ -4831,7 +4836,7 @@ class EtfTimeFill:
     items: list[EtfTimeFillItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfDailyFillItem:
     """ETF일자별체결 단일 항목 (ka40008)."""
 
@@ -4844,7 +4849,7 @@ class EtfDailyFillItem:
     orgn_netprps_qty: str   # 기관순매수수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfDailyFill:
     """ETF일자별체결요청 응답 (ka40008).
 
@@ -4865,7 +4870,7 @@ class EtfDailyFill:
     items: list[EtfDailyFillItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfNavItem:
     """ETFNAV 단일 항목 (ka40009)."""
 
@@ -4883,7 +4888,7 @@ class EtfNavItem:
     wonju_pric: str     # 원주가격
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfNav:
     """ETF시간대별체결요청 응답 (ka40009).
 
@@ -4894,7 +4899,7 @@ class EtfNav:
     items: list[EtfNavItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfTimeTrend2Item:
     """ETF시간대별추이 단일 항목 (ka40010)."""
 
@@ -4905,7 +4910,7 @@ class EtfTimeTrend2Item:
     for_netprps: str    # 외인순매수
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EtfTimeTrend2:
     """ETF시간대별추이요청 응답 (ka40010).
 
@@ -4920,7 +4925,7 @@ class EtfTimeTrend2:
 # 8단계 — ELW 응답 모델
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwDailySensItem:
     """ELW일별민감도지표 단일 항목."""
 
@@ -4934,7 +4939,7 @@ class ElwDailySensItem:
     lp: str     # LP
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwDailySens:
     """ELW일별민감도지표요청 응답 (ka10048).
 
@@ -4945,7 +4950,7 @@ class ElwDailySens:
     items: list[ElwDailySensItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwSensItem:
     """ELW민감도지표 단일 항목."""
 
@@ -4961,7 +4966,7 @@ class ElwSensItem:
     lp: str             # LP
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwSens:
     """ELW민감도지표요청 응답 (ka10050).
 
@@ -4972,7 +4977,7 @@ class ElwSens:
     items: list[ElwSensItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwPriceSurgeItem:
     """ELW가격급등락 단일 항목."""
 
@@ -4988,7 +4993,7 @@ class ElwPriceSurgeItem:
     jmp_rt: str                 # 급등율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwPriceSurge:
     """ELW가격급등락요청 응답 (ka30001).
 
@@ -5001,7 +5006,7 @@ class ElwPriceSurge:
     items: list[ElwPriceSurgeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwBrokerNetTradeItem:
     """거래원별ELW순매매상위 단일 항목."""
 
@@ -5015,7 +5020,7 @@ class ElwBrokerNetTradeItem:
     sel_trde_qty: str   # 매도거래량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwBrokerNetTrade:
     """거래원별ELW순매매상위요청 응답 (ka30002).
 
@@ -5026,7 +5031,7 @@ class ElwBrokerNetTrade:
     items: list[ElwBrokerNetTradeItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwLpDailyItem:
     """ELWLP보유일별추이 단일 항목."""
 
@@ -5042,7 +5047,7 @@ class ElwLpDailyItem:
     wght: str       # 비중
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwLpDaily:
     """ELWLP보유일별추이요청 응답 (ka30003).
 
@@ -5053,7 +5058,7 @@ class ElwLpDaily:
     items: list[ElwLpDailyItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwGapItem:
     """ELW괴리율 단일 항목."""
 
@@ -5074,7 +5079,7 @@ class ElwGapItem:
     stk_nm: str         # 종목명
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwGap:
     """ELW괴리율요청 응답 (ka30004).
 
@@ -5085,7 +5090,7 @@ class ElwGap:
     items: list[ElwGapItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwSearchItem:
     """ELW조건검색 단일 항목."""
 
@@ -5130,7 +5135,7 @@ class ElwSearchItem:
     xraymont_cntr_qty_profa_100tp: str     # Xray순간체결량증거금100구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwSearch:
     """ELW조건검색요청 응답 (ka30005).
 
@@ -5141,7 +5146,7 @@ class ElwSearch:
     items: list[ElwSearchItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwFlucRankItem:
     """ELW등락율순위 단일 항목."""
 
@@ -5158,7 +5163,7 @@ class ElwFlucRankItem:
     trde_prica: str # 거래대금
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwFlucRank:
     """ELW등락율순위요청 응답 (ka30009).
 
@@ -5169,7 +5174,7 @@ class ElwFlucRank:
     items: list[ElwFlucRankItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwBalRankItem:
     """ELW잔량순위 단일 항목."""
 
@@ -5187,7 +5192,7 @@ class ElwBalRankItem:
     trde_prica: str     # 거래대금
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwBalRank:
     """ELW잔량순위요청 응답 (ka30010).
 
@@ -5198,7 +5203,7 @@ class ElwBalRank:
     items: list[ElwBalRankItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwAccessRateItem:
     """ELW근접율 단일 항목."""
 
@@ -5212,7 +5217,7 @@ class ElwAccessRateItem:
     alacc_rt: str       # 근접율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwAccessRate:
     """ELW근접율요청 응답 (ka30011).
 
@@ -5223,7 +5228,7 @@ class ElwAccessRate:
     items: list[ElwAccessRateItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElwDetail:
     """ELW종목상세정보요청 응답 (ka30012)."""
 
@@ -5298,7 +5303,7 @@ class ElwDetail:
 # 8단계 — 테마 응답 모델
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeGroupItem:
     """테마그룹별 단일 항목."""
 
@@ -5313,7 +5318,7 @@ class ThemeGroupItem:
     main_stk: str       # 주요종목
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeGroup:
     """테마그룹별요청 응답 (ka90001).
 
@@ -5324,7 +5329,7 @@ class ThemeGroup:
     items: list[ThemeGroupItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeStockItem:
     """테마구성종목 단일 항목."""
 
@@ -5342,7 +5347,7 @@ class ThemeStockItem:
     dt_prft_rt_n: str   # 기간수익률n
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeStocks:
     """테마구성종목요청 응답 (ka90002).
 
@@ -5361,7 +5366,7 @@ class ThemeStocks:
 # 8단계 — 프로그램매매 응답 모델
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramTop50Item:
     """프로그램순매수상위50 단일 항목."""
 
@@ -5378,7 +5383,7 @@ class ProgramTop50Item:
     prm_netprps_amt: str    # 프로그램순매수금액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramTop50:
     """프로그램순매수상위50요청 응답 (ka90003).
 
@@ -5389,7 +5394,7 @@ class ProgramTop50:
     items: list[ProgramTop50Item]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockProgramStatusItem:
     """종목별프로그램매매현황 단일 항목."""
 
@@ -5406,7 +5411,7 @@ class StockProgramStatusItem:
     all_trde_rt: str        # 전체거래비율
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockProgramStatus:
     """종목별프로그램매매현황요청 응답 (ka90004).
 
@@ -5429,7 +5434,7 @@ class StockProgramStatus:
     items: list[StockProgramStatusItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramTrendItem:
     """프로그램매매추이 단일 항목."""
 
@@ -5453,7 +5458,7 @@ class ProgramTrendItem:
     basis: str                      # BASIS
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramTrend:
     """프로그램매매추이요청 응답 (ka90005, ka90010).
 
@@ -5464,7 +5469,7 @@ class ProgramTrend:
     items: list[ProgramTrendItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramArbitrageBalItem:
     """프로그램매매차익잔고추이 단일 항목."""
 
@@ -5477,7 +5482,7 @@ class ProgramArbitrageBalItem:
     sel_dfrt_trde_irds_amt: str     # 매도차익거래증감액
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramArbitrageBal:
     """프로그램매매차익잔고추이요청 응답 (ka90006).
 
@@ -5488,7 +5493,7 @@ class ProgramArbitrageBal:
     items: list[ProgramArbitrageBalItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramAccTrendItem:
     """프로그램매매누적추이 단일 항목."""
 
@@ -5503,7 +5508,7 @@ class ProgramAccTrendItem:
     all_acc: str            # 전체누적
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramAccTrend:
     """프로그램매매누적추이요청 응답 (ka90007).
 
@@ -5514,7 +5519,7 @@ class ProgramAccTrend:
     items: list[ProgramAccTrendItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockTimeProgramItem:
     """종목시간별프로그램매매추이 단일 항목."""
 
@@ -5538,7 +5543,7 @@ class StockTimeProgramItem:
     stex_tp: str                    # 거래소구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockTimeProgram:
     """종목시간별프로그램매매추이요청 응답 (ka90008).
 
@@ -5549,7 +5554,7 @@ class StockTimeProgram:
     items: list[StockTimeProgramItem]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockDailyProgramItem:
     """종목일별프로그램매매추이 단일 항목."""
 
@@ -5573,7 +5578,7 @@ class StockDailyProgramItem:
     stex_tp: str                    # 거래소구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StockDailyProgram:
     """종목일별프로그램매매추이요청 응답 (ka90013).
 
@@ -5606,7 +5611,7 @@ type GoldOrderTradeType = Literal["normal", "normal_ioc", "normal_fok"]
 
 # ── ka50010: 금현물체결추이 ───────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldContractTrendItem:
     """금현물체결추이 단일 항목."""
 
@@ -5625,7 +5630,7 @@ class GoldContractTrendItem:
     cntr_str: str           # 체결강도
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldContractTrend:
     """금현물체결추이요청 응답 (ka50010).
 
@@ -5638,7 +5643,7 @@ class GoldContractTrend:
 
 # ── ka50012: 금현물일별추이 ───────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDailyTrendItem:
     """금현물일별추이 단일 항목."""
 
@@ -5657,7 +5662,7 @@ class GoldDailyTrendItem:
     ind_netprps: str    # 순매매량(개인)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDailyTrend:
     """금현물일별추이요청 응답 (ka50012).
 
@@ -5670,7 +5675,7 @@ class GoldDailyTrend:
 
 # ── ka50087: 금현물예상체결 ───────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldExpectedContractItem:
     """금현물예상체결 단일 항목."""
 
@@ -5684,7 +5689,7 @@ class GoldExpectedContractItem:
     stex_tp: str            # 거래소 구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldExpectedContract:
     """금현물예상체결요청 응답 (ka50087).
 
@@ -5697,7 +5702,7 @@ class GoldExpectedContract:
 
 # ── ka50100: 금현물 시세정보 ─────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldMarketInfo:
     """금현물 시세정보 응답 (ka50100)."""
 
@@ -5716,7 +5721,7 @@ class GoldMarketInfo:
 
 # ── ka50101: 금현물 호가 ──────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldBidItem:
     """금현물 호가 단일 항목."""
 
@@ -5737,7 +5742,7 @@ class GoldBidItem:
     stex_tp: str            # 거래소구분
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldBid:
     """금현물 호가 응답 (ka50101).
 
@@ -5750,7 +5755,7 @@ class GoldBid:
 
 # ── ka52301: 금현물투자자현황 ────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldInvestorStatusItem:
     """금현물투자자현황 단일 항목."""
 
@@ -5774,7 +5779,7 @@ class GoldInvestorStatusItem:
     acc_netprps_qty: str            # 누적 순매수 수량(천)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldInvestorStatus:
     """금현물투자자현황 응답 (ka52301).
 
@@ -5787,7 +5792,7 @@ class GoldInvestorStatus:
 
 # ── ka50079: 금현물틱차트 ────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldTickChartItem:
     """금현물틱차트 단일 항목."""
 
@@ -5802,7 +5807,7 @@ class GoldTickChartItem:
     pred_pre_sig: str   # 전일대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldTickChart:
     """금현물틱차트조회요청 응답 (ka50079).
 
@@ -5815,7 +5820,7 @@ class GoldTickChart:
 
 # ── ka50080: 금현물분봉차트 ─────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldMinuteChartItem:
     """금현물분봉차트 단일 항목."""
 
@@ -5831,7 +5836,7 @@ class GoldMinuteChartItem:
     pred_pre_sig: str   # 전일대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldMinuteChart:
     """금현물분봉차트조회요청 응답 (ka50080).
 
@@ -5844,7 +5849,7 @@ class GoldMinuteChart:
 
 # ── ka50081: 금현물일봉차트 ─────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDailyChartItem:
     """금현물일봉차트 단일 항목."""
 
@@ -5858,7 +5863,7 @@ class GoldDailyChartItem:
     pred_pre_sig: str   # 전일대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDailyChart:
     """금현물일봉차트조회요청 응답 (ka50081).
 
@@ -5871,7 +5876,7 @@ class GoldDailyChart:
 
 # ── ka50082: 금현물주봉차트 ─────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldWeeklyChartItem:
     """금현물주봉차트 단일 항목."""
 
@@ -5884,7 +5889,7 @@ class GoldWeeklyChartItem:
     dt: str             # 일자 (YYYYMMDDHHmmss)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldWeeklyChart:
     """금현물주봉차트조회요청 응답 (ka50082).
 
@@ -5897,7 +5902,7 @@ class GoldWeeklyChart:
 
 # ── ka50083: 금현물월봉차트 ─────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldMonthlyChartItem:
     """금현물월봉차트 단일 항목."""
 
@@ -5910,7 +5915,7 @@ class GoldMonthlyChartItem:
     dt: str             # 일자 (YYYYMMDDHHmmss)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldMonthlyChart:
     """금현물월봉차트조회요청 응답 (ka50083).
 
@@ -5923,7 +5928,7 @@ class GoldMonthlyChart:
 
 # ── ka50091: 금현물당일틱차트 ───────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDailyTickChartItem:
     """금현물당일틱차트 단일 항목."""
 
@@ -5938,7 +5943,7 @@ class GoldDailyTickChartItem:
     pred_pre_sig: str   # 전일대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDailyTickChart:
     """금현물당일틱차트조회요청 응답 (ka50091).
 
@@ -5951,7 +5956,7 @@ class GoldDailyTickChart:
 
 # ── ka50092: 금현물당일분봉차트 ─────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDailyMinuteChartItem:
     """금현물당일분봉차트 단일 항목."""
 
@@ -5968,7 +5973,7 @@ class GoldDailyMinuteChartItem:
     pred_pre_sig: str   # 전일대비기호
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDailyMinuteChart:
     """금현물당일분봉차트조회요청 응답 (ka50092).
 
@@ -5981,7 +5986,7 @@ class GoldDailyMinuteChart:
 
 # ── kt50000/kt50001: 금현물 매수/매도주문 응답 ───────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldOrderResponse:
     """금현물 매수/매도주문 응답 (kt50000, kt50001).
 
@@ -5994,7 +5999,7 @@ class GoldOrderResponse:
 
 # ── kt50002: 금현물 정정주문 응답 ────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldModifyOrderResponse:
     """금현물 정정주문 응답 (kt50002).
 
@@ -6011,7 +6016,7 @@ class GoldModifyOrderResponse:
 
 # ── kt50003: 금현물 취소주문 응답 ────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldCancelOrderResponse:
     """금현물 취소주문 응답 (kt50003).
 
@@ -6028,7 +6033,7 @@ class GoldCancelOrderResponse:
 
 # ── kt50020: 금현물 잔고확인 ─────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldBalanceItem:
     """금현물계좌평가현황 단일 항목."""
 
@@ -6050,7 +6055,7 @@ class GoldBalanceItem:
     able_qty: str       # 가능수량
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldBalance:
     """금현물 잔고확인 응답 (kt50020).
 
@@ -6079,7 +6084,7 @@ class GoldBalance:
 
 # ── kt50021: 금현물 예수금 ───────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldDeposit:
     """금현물 예수금 응답 (kt50021)."""
 
@@ -6101,7 +6106,7 @@ class GoldDeposit:
 
 # ── kt50030: 금현물 주문체결전체조회 ────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldOrderStatusItem:
     """금현물 주문체결전체조회 단일 항목."""
 
@@ -6129,7 +6134,7 @@ class GoldOrderStatusItem:
     cond_uv: str            # 스톱가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldOrderStatus:
     """금현물 주문체결전체조회 응답 (kt50030).
 
@@ -6142,7 +6147,7 @@ class GoldOrderStatus:
 
 # ── kt50031: 금현물 주문체결조회 ────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldOrderDetailItem:
     """금현물 주문체결조회 단일 항목."""
 
@@ -6170,7 +6175,7 @@ class GoldOrderDetailItem:
     cond_uv: str        # 스톱가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldOrderDetail:
     """금현물 주문체결조회 응답 (kt50031).
 
@@ -6183,7 +6188,7 @@ class GoldOrderDetail:
 
 # ── kt50032: 금현물 거래내역조회 ────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldTradeHistoryItem:
     """금현물 거래내역조회 단일 항목."""
 
@@ -6213,7 +6218,7 @@ class GoldTradeHistoryItem:
     prcsr: str              # 처리자
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldTradeHistory:
     """금현물 거래내역조회 응답 (kt50032).
 
@@ -6228,7 +6233,7 @@ class GoldTradeHistory:
 
 # ── kt50075: 금현물 미체결조회 ───────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldUnfilledItem:
     """금현물 미체결조회 단일 항목."""
 
@@ -6256,7 +6261,7 @@ class GoldUnfilledItem:
     cond_uv: str            # 스톱가
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoldUnfilled:
     """금현물 미체결조회 응답 (kt50075).
 
@@ -6273,7 +6278,7 @@ class GoldUnfilled:
 
 # ── ka10171: 조건검색 목록조회 ──────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionItem:
     """조건검색식 단일 항목.
 
@@ -6286,7 +6291,7 @@ class ConditionItem:
     name: str   # 조건검색식 이름
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionList:
     """조건검색 목록조회 응답 (ka10171).
 
@@ -6299,7 +6304,7 @@ class ConditionList:
 
 # ── ka10172: 조건검색 요청 일반 ─────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionSearchItem:
     """조건검색 결과 단일 종목 항목.
 
@@ -6328,7 +6333,7 @@ class ConditionSearchItem:
     low_price: str      # 저가 (18)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionSearchResult:
     """조건검색 요청 일반 응답 (ka10172).
 
@@ -6347,7 +6352,7 @@ class ConditionSearchResult:
 
 # ── ka10173: 조건검색 요청 실시간 ───────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionRealtimeValues:
     """조건검색 실시간 단일 이벤트 값.
 
@@ -6366,7 +6371,7 @@ class ConditionRealtimeValues:
     sell_buy: str       # 매도/수 구분 (907)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionRealtimeItem:
     """조건검색 실시간 단일 이벤트.
 
@@ -6385,7 +6390,7 @@ class ConditionRealtimeItem:
 
 # ── ka10174: 조건검색 실시간 해제 ───────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConditionStopResult:
     """조건검색 실시간 해제 응답 (ka10174).
 
@@ -6417,7 +6422,7 @@ type CreditMarketType = Literal["%", "1", "0"]
 
 # ── kt20016: 신용융자 가능종목요청 ───────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditLoanStockItem:
     """신용융자 가능종목 단일 항목.
 
@@ -6440,7 +6445,7 @@ class CreditLoanStockItem:
     crd_limit_over_txt: str # 신용한도초과 텍스트
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditLoanStocks:
     """신용융자 가능종목요청 응답 (kt20016).
 
@@ -6455,7 +6460,7 @@ class CreditLoanStocks:
 
 # ── kt20017: 신용융자 가능문의 ───────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditLoanAvailability:
     """신용융자 가능문의 응답 (kt20017).
 
@@ -6501,11 +6506,13 @@ type RealtimeType = Literal[
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RealtimeEvent:
     """실시간 WebSocket 수신 이벤트.
 
     서버에서 ``trnm="REAL"`` 메시지가 수신될 때 data 배열의 각 항목을 이 dataclass로 파싱한다.
+    ``values``는 수신 메시지의 딕셔너리를 복사하지 않고 그대로 담으므로 수정하지 않는다.
+    숫자 값은 ``number()``·``price()``로 읽을 때 처음 한 번만 변환해 이벤트에 저장한다.
 
     Args:
         type: 실시간 항목 TR명. (예: ``"0B"``, ``"00"``)
@@ -6518,9 +6525,36 @@ class RealtimeEvent:
         '+60700'
         >>> event.values.get("20", "")   # 체결시간
         '165208'
+        >>> event.price("10"), event.number("11")   # 현재가, 전일대비
+        (60700, -300)
     """
 
     type: str               # 실시간 항목 TR명 (예: "0B")
     name: str               # 실시간 항목명 (예: "주식체결")
     item: str               # 종목코드 (없으면 "")
     values: dict[str, str]  # 필드번호 → 값 (예: {"10": "+60700", ...})
+    _numbers: dict[str, int | float | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )  # 변환한 숫자 값 캐시. 첫 number() 호출 때 만든다
+
+    def number(self, fid: str) -> int | float | None:
+        """필드 값을 부호를 유지한 숫자로 반환한다. 없거나 빈 값이면 ``None``.
+
+        정수가 아니면 ``float``. 변환 결과는 이벤트에 저장되어 다시 파싱하지 않는다.
+
+        Raises:
+            ValueError: 숫자로 읽을 수 없는 값.
+        """
+        numbers = self._numbers
+        if numbers is None:
+            numbers = {}
+            object.__setattr__(self, "_numbers", numbers)
+        elif fid in numbers:
+            return numbers[fid]
+        value = numbers[fid] = parse_number(self.values.get(fid, ""))
+        return value
+
+    def price(self, fid: str) -> int | float | None:
+        """가격 필드 값을 숫자로 반환한다. 부호(전일 대비 방향)를 뗀 절댓값이다."""
+        value = self.number(fid)
+        return abs(value) if value is not None else None
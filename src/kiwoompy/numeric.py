@@ -0,0 +1,292 @@
+"""숫자 변환 — 부호·0 채움·쉼표가 붙은 키움 응답 문자열을 int/float/Decimal로 바꾼다.
+
+응답 모델의 필드는 모두 서버가 보낸 문자열 그대로다 (``cur_prc="+60700"``,
+``flu_rt="-1.23"``, ``trde_qty="000000012345"``). 이 모듈은 모델 필드마다 숫자 종류를
+적어 둔 표(``kiwoompy._field_kinds``)로 변환 방법을 정하고, 목록 전체를 열 단위로
+한 번에 변환한다. 표에서 ``None``인 필드(코드·이름·일자·부호 등)는 문자열 그대로 둔다.
+
+- ``"price"``: 가격·단가·호가. 부호는 전일 대비 방향 표시이므로 절댓값을 쓴다.
+- ``"int"``: 수량·금액·대비. 부호를 유지한다.
+- ``"float"``: 비율·등락률·비중·체결강도. 부호를 유지한다.
+
+정수 종류라도 소수점이 있는 값(업종지수, 외화금액 등)은 ``float``로 바꾼다.
+빈 문자열은 ``None``이 된다.
+
+``to_arrays()``는 같은 규칙으로 NumPy 배열을 만든다 (``pip install "kiwoompy[numpy]"``).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+from collections.abc import Callable, Mapping, Sequence
+from decimal import Decimal
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal
+
+from kiwoompy._field_kinds import _FIELD_KINDS, _MODEL_FIELD_KINDS, _RESPONSE_KEYS
+
+if TYPE_CHECKING:
+    import numpy as np
+
+type NumericKind = Literal["price", "int", "float"]
+"""숫자 필드 종류. 모듈 설명 참고."""
+
+# 날짜·시각 필드의 마지막 토큰. 값 길이로 datetime64 단위를 정한다 (8자리 일자, 14자리 일시)
+_DATETIME_SUFFIXES = frozenset({"dt", "tm"})
+
+
+def _kind_of(name: str) -> NumericKind | None:
+    """필드 이름 또는 응답 키의 숫자 종류. 표에 없는 이름은 텍스트로 본다."""
+    return _FIELD_KINDS.get(_RESPONSE_KEYS.get(name, name))
+
+
+def parse_number(text: str) -> int | float | None:
+    """키움 숫자 문자열 하나를 부호를 유지한 ``int``로 바꾼다.
+
+    부호·0 채움·쉼표·앞뒤 공백을 처리하고, 소수점이 있으면 ``float``를 반환한다.
+    ``"int"`` 종류 필드와 실시간 시세 값(``RealtimeEvent.number()``)이 이 규칙을 쓴다.
+
+    Raises:
+        ValueError: 숫자로 읽을 수 없는 값.
+
+    Example:
+        >>> parse_number("-000012,345")
+        -12345
+        >>> parse_number("")  # 빈 값
+    """
+    try:
+        return int(text)  # "+60700", "-0012", "000123" 모두 처리한다
+    except ValueError:
+        text = text.replace(",", "").strip()
+        if not text:
+            return None
+        try:
+            return int(text)
+        except ValueError:
+            return float(text)
+
+
+def _parse_price(text: str) -> int | float | None:
+    value = parse_number(text)
+    return abs(value) if value is not None else None
+
+
+def _parse_float(text: str) -> float | None:
+    try:
+        return float(text)
+    except ValueError:
+        text = text.replace(",", "").strip()
+        return float(text) if text else None
+
+
+def _parse_decimal(text: str) -> Decimal | None:
+    text = text.replace(",", "").strip()
+    return Decimal(text) if text else None
+
+
+_PARSERS: dict[NumericKind, Callable[[str], Any]] = {
+    "price": _parse_price,
+    "int": parse_number,
+    "float": _parse_float,
+}
+
+
+def _parser(kind: NumericKind, decimal: bool) -> Callable[[str], Any]:
+    if decimal and kind == "float":
+        return _parse_decimal
+    return _PARSERS[kind]
+
+
+@functools.cache
+def numeric_fields(model: type) -> Mapping[str, NumericKind]:
+    """응답 모델의 숫자 필드와 종류를 반환한다. 문자열 필드만 대상이다.
+
+    Args:
+        model: ``kiwoompy.models``의 응답 dataclass.
+
+    Example:
+        >>> numeric_fields(StockDayChartItem)["cur_prc"]
+        'price'
+    """
+    kinds: dict[str, NumericKind] = {}
+    for f in dataclasses.fields(model):
+        if f.type not in ("str", str):
+            continue
+        kind = _MODEL_FIELD_KINDS.get((model.__name__, f.name), _FIELD_KINDS.get(f.name))
+        if kind is not None:
+            kinds[f.name] = kind
+    return MappingProxyType(kinds)
+
+
+def to_columns(
+    items: Sequence[Any],
+    *,
+    fields: Sequence[str] | None = None,
+    decimal: bool = False,
+    parse: bool = True,
+) -> dict[str, list[Any]]:
+    """항목 목록을 열(필드) 단위로 변환한다. 숫자 필드는 목록 전체를 한 번에 파싱한다.
+
+    응답 모델 목록과, 원시 응답 모드에서 받은 항목 dict 목록을 모두 받는다.
+    dict 목록은 첫 항목의 키를 열로 쓰고, 키 이름으로 숫자 종류를 정한다.
+
+    Args:
+        items: 같은 종류의 응답 항목 목록 (예: ``StockDayChart.items``).
+        fields: 반환할 열. ``None``이면 모든 필드.
+        decimal: ``True``면 ``"float"`` 종류를 ``Decimal``로 바꾼다.
+        parse: ``False``면 숫자 필드도 문자열 그대로 열만 모은다.
+
+    Returns:
+        필드 이름 → 값 목록. 숫자가 아닌 필드는 원래 값 그대로다.
+
+    Raises:
+        ValueError: 숫자 필드에 숫자로 읽을 수 없는 값이 있는 경우.
+
+    Example:
+        >>> chart = query.get_stock_day_chart("005930", "20250101")
+        >>> cols = to_columns(chart.items, fields=["dt", "cur_prc", "trde_qty"])
+        >>> cols["cur_prc"][:3]
+        [60700, 61200, 60900]
+    """
+    if not items:
+        return {name: [] for name in fields or ()}
+    first = items[0]
+    if isinstance(first, Mapping):
+        names = list(fields) if fields is not None else list(first)
+        kinds = {name: kind for name in names if (kind := _kind_of(name)) is not None}
+        getter: Callable[[str], Callable[[Any], Any]] = itemgetter
+    else:
+        names = list(fields) if fields is not None else [f.name for f in dataclasses.fields(first)]
+        kinds = dict(numeric_fields(type(first)))
+        getter = attrgetter
+
+    columns: dict[str, list[Any]] = {}
+    for name in names:
+        values = map(getter(name), items)
+        kind = kinds.get(name) if parse else None
+        columns[name] = list(map(_parser(kind, decimal), values)) if kind else list(values)
+    return columns
+
+
+def to_numeric(obj: Any, *, decimal: bool = False) -> dict[str, Any]:
+    """응답 모델 하나를 숫자 필드가 변환된 dict로 바꾼다.
+
+    ``items``처럼 모델 목록을 담은 필드는 각 항목을 dict로 바꾼 목록이 된다.
+    큰 목록은 ``to_columns()``가 더 빠르다.
+
+    Args:
+        obj: 응답 dataclass 인스턴스.
+        decimal: ``True``면 ``"float"`` 종류를 ``Decimal``로 바꾼다.
+
+    Example:
+        >>> to_numeric(query.get_stock_info("005930"))["flu_rt"]
+        -1.23
+    """
+    kinds = numeric_fields(type(obj))
+    result: dict[str, Any] = {}
+    for f in dataclasses.fields(obj):
+        value = getattr(obj, f.name)
+        kind = kinds.get(f.name)
+        if kind is not None:
+            value = _parser(kind, decimal)(value)
+        elif isinstance(value, list):
+            value = [to_numeric(v, decimal=decimal) if dataclasses.is_dataclass(v) else v for v in value]
+        elif dataclasses.is_dataclass(value):
+            value = to_numeric(value, decimal=decimal)
+        result[f.name] = value
+    return result
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            'to_arrays()를 쓰려면 numpy 패키지가 필요합니다: pip install "kiwoompy[numpy]"'
+        ) from exc
+    return numpy
+
+
+def _item_list(data: Any) -> Sequence[Any]:
+    """항목 목록, ``items`` 필드가 있는 응답 모델, 원시 응답 본문에서 항목 목록을 꺼낸다."""
+    if isinstance(data, Mapping):
+        lists = [v for v in data.values() if isinstance(v, list)]
+        if len(lists) != 1:
+            raise ValueError("원시 응답 본문에 항목 목록이 하나가 아닙니다. 목록을 직접 넘기세요.")
+        return lists[0]
+    if dataclasses.is_dataclass(data) and not isinstance(data, type):
+        return data.items
+    return data
+
+
+def _datetime_array(numpy: Any, values: list[str]) -> np.ndarray | None:
+    """``YYYYMMDD`` → ``datetime64[D]``, ``YYYYMMDDHHMMSS`` → ``datetime64[s]``. 그 외는 ``None``."""
+    width = next((len(v) for v in values if v), 0)
+    if width == 8:
+        iso = [f"{v[:4]}-{v[4:6]}-{v[6:]}" if v else "NaT" for v in values]
+        return numpy.array(iso, dtype="datetime64[D]")
+    if width == 14:
+        iso = [
+            f"{v[:4]}-{v[4:6]}-{v[6:8]}T{v[8:10]}:{v[10:12]}:{v[12:]}" if v else "NaT"
+            for v in values
+        ]
+        return numpy.array(iso, dtype="datetime64[s]")
+    return None
+
+
+def _numeric_array(numpy: Any, kind: NumericKind, values: list[str]) -> np.ndarray:
+    """숫자 열을 배열로 바꾼다. 정수 종류는 ``int64``, 그 외·빈 값·소수가 섞이면 ``float64``."""
+    dtype = numpy.float64 if kind == "float" else numpy.int64
+    try:
+        # 부호·0 채움 문자열은 NumPy가 C 수준에서 바로 파싱한다
+        array = numpy.array(values, dtype=numpy.str_).astype(dtype)
+    except ValueError:
+        parse = _PARSERS[kind]
+        array = numpy.array(
+            [numpy.nan if (v := parse(text)) is None else v for text in values],
+            dtype=numpy.float64,
+        )
+    return numpy.abs(array) if kind == "price" else array
+
+
+def to_arrays(data: Any, *, fields: Sequence[str] | None = None) -> dict[str, np.ndarray]:
+    """차트 등 목록형 응답을 열(필드) 단위 NumPy 배열로 변환한다.
+
+    가격·수량·금액은 ``int64``, 비율은 ``float64``, 일자(``dt``)·일시(``cntr_tm``)는
+    ``datetime64``가 된다. 빈 값이 섞인 정수 열은 ``NaN``을 담기 위해 ``float64``로,
+    빈 일시는 ``NaT``가 된다. 그 밖의 필드는 문자열 배열이다.
+
+    원시 응답 모드(``query.as_raw()``)의 응답 본문을 넘기면 항목 dataclass를 만들지 않고
+    응답 dict에서 바로 배열을 만든다.
+
+    Args:
+        data: 항목 목록, ``items`` 필드가 있는 응답 모델, 또는 항목 목록이 하나 있는 원시 응답 본문.
+        fields: 반환할 열. ``None``이면 모든 필드.
+
+    Returns:
+        필드 이름 → 1차원 배열.
+
+    Raises:
+        ImportError: numpy가 설치되지 않은 경우.
+        ValueError: 원시 응답 본문에서 항목 목록을 하나로 정할 수 없는 경우.
+
+    Example:
+        >>> raw = query.as_raw().chart.get_stock_day_chart("005930", "20250101")
+        >>> arrays = to_arrays(raw, fields=["dt", "cur_prc", "trde_qty"])
+        >>> arrays["cur_prc"].dtype, arrays["dt"].dtype
+        (dtype('int64'), dtype('<M8[D]'))
+    """
+    numpy = _import_numpy()
+    columns = to_columns(_item_list(data), fields=fields, parse=False)
+    arrays: dict[str, np.ndarray] = {}
+    for name, values in columns.items():
+        array = None
+        tokens = [t for t in name.split("_") if not t.isdigit()]
+        if tokens and tokens[-1] in _DATETIME_SUFFIXES:
+            array = _datetime_array(numpy, values)
+        elif (kind := _kind_of(name)) is not None:
+            array = _numeric_array(numpy, kind, values)
+        arrays[name] = array if array is not None else numpy.array(values, dtype=numpy.str_)
+    return arrays
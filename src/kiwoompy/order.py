@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from kiwoompy.api import KiwoomApi
+from kiwoompy.api import KiwoomApi, _AsyncFacade
 from kiwoompy.exceptions import KiwoomApiError
 from kiwoompy.models import (
     CancelOrderResponse,
@@ -1004,3 +1004,17 @@ class KiwoomOrder:
             for it in raw.get("acnt_ord_oso_prst", [])
         ]
         return GoldUnfilled(items=items)
+
+
+class AsyncKiwoomOrder(_AsyncFacade, sync=KiwoomOrder):
+    """``KiwoomOrder``의 비동기 버전.
+
+    ``KiwoomOrder``의 모든 주문·금현물 메서드를 같은 이름·인자의 코루틴으로 제공한다.
+
+    Args:
+        api: 인증 토큰이 설정된 ``AsyncKiwoomApi`` 인스턴스.
+
+    Example:
+        >>> order = AsyncKiwoomOrder(api)
+        >>> result = await order.buy("005930", "1", trade_type="market")
+    """
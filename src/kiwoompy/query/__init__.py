@@ -0,0 +1,415 @@
+"""조회 모듈 — 계좌·잔고·손익·주문체결·시세·종목정보·순위정보·차트·업종·기관/외국인·공매도·대차거래·ETF·ELW·테마·프로그램매매 조회.
+
+TR은 엔드포인트별 도메인 모듈(``account``, ``chart``, ``etf``, ``elw`` …)에 나뉘어 있고,
+``KiwoomQuery``는 도메인 하위 클라이언트를 처음 접근할 때 불러온다.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, overload
+
+from kiwoompy.api import _AsyncFacade
+from kiwoompy.query._base import (
+    BalanceQueryType,
+    CashCreditType,
+    DelistedQueryType,
+    DepositQueryType,
+    DomesticExchange,
+    ExchangeType,
+    ExecutionQueryType,
+    FilledQueryType,
+    GoodsType,
+    MarketType,
+    OrderHistoryQueryType,
+    QueryType,
+    SellType,
+    SingleStockType,
+    StockBondType,
+    TradeSide,
+    UnfilledTradeType,
+    _QueryBase,
+)
+
+if TYPE_CHECKING:
+    from kiwoompy.api import AsyncKiwoomApi
+    from kiwoompy.query.account import AccountQuery
+    from kiwoompy.query.market import MarketQuery
+    from kiwoompy.query.stock_info import StockInfoQuery
+    from kiwoompy.query.ranking import RankingQuery
+    from kiwoompy.query.chart import ChartQuery
+    from kiwoompy.query.sector import SectorQuery
+    from kiwoompy.query.investor import InvestorQuery
+    from kiwoompy.query.short_sell import ShortSellQuery
+    from kiwoompy.query.stock_loan import StockLoanQuery
+    from kiwoompy.query.etf import EtfQuery
+    from kiwoompy.query.elw import ElwQuery
+    from kiwoompy.query.theme import ThemeQuery
+    from kiwoompy.query.program import ProgramQuery
+    from kiwoompy.query.gold import GoldQuery
+
+    class _FlatQuery(
+        AccountQuery,
+        MarketQuery,
+        StockInfoQuery,
+        RankingQuery,
+        ChartQuery,
+        SectorQuery,
+        InvestorQuery,
+        ShortSellQuery,
+        StockLoanQuery,
+        EtfQuery,
+        ElwQuery,
+        ThemeQuery,
+        ProgramQuery,
+        GoldQuery,
+    ):
+        """정적 타입 검사용 — 모든 도메인 메서드를 ``KiwoomQuery``에 평면으로 노출한다."""
+
+else:
+    _FlatQuery = _QueryBase
+
+__all__ = [
+    "KiwoomQuery",
+    "AsyncKiwoomQuery",
+    "QueryType",
+    "DomesticExchange",
+    "ExchangeType",
+    "SellType",
+    "TradeSide",
+    "UnfilledTradeType",
+    "DepositQueryType",
+    "DelistedQueryType",
+    "OrderHistoryQueryType",
+    "StockBondType",
+    "MarketType",
+    "ExecutionQueryType",
+    "GoodsType",
+    "BalanceQueryType",
+    "FilledQueryType",
+    "SingleStockType",
+    "CashCreditType",
+]
+
+# 도메인 → 공개 메서드. 평면 호출(``query.get_...``)을 도메인 하위 클라이언트로 넘길 때 쓴다.
+_DOMAIN_METHODS: dict[str, tuple[str, ...]] = {
+    "account": (
+        "get_deposit", "get_daily_estimated_asset", "get_estimated_asset",
+        "get_account_evaluation", "get_execution_balance", "get_order_history_detail",
+        "iter_order_history_detail", "get_next_day_settlement", "get_order_execution_status",
+        "get_orderable_amount", "get_orderable_quantity", "get_credit_orderable_quantity",
+        "get_margin_detail", "get_transaction_history", "iter_transaction_history",
+        "get_daily_account_return", "get_daily_status", "get_account_balance",
+        "get_account_numbers", "get_daily_balance_return", "get_realized_profit_by_date",
+        "get_realized_profit_by_period", "get_daily_realized_profit", "get_unfilled_orders",
+        "iter_unfilled_orders", "get_filled_orders", "iter_filled_orders",
+        "get_daily_realized_profit_detail", "get_account_return", "get_split_order_detail",
+        "get_daily_trade_journal",
+    ),
+    "market": (
+        "get_orderbook", "get_stock_periods", "get_stock_minutes", "get_market_summary",
+        "get_daily_prices", "get_afterhours_orderbook", "get_newstock_rights_prices",
+        "get_daily_institution_stocks", "get_stock_institution_trend",
+        "get_execution_strength_by_time", "get_execution_strength_by_day",
+        "get_intraday_investor_trading", "get_afterclose_investor_trading",
+        "get_broker_stock_trend",
+    ),
+    "stock_info": (
+        "get_stock_info", "get_stock_brokers", "get_execution_info", "get_credit_trading_trend",
+        "get_daily_trading_detail", "get_high_low_stocks", "get_limit_stocks", "get_near_high_low",
+        "get_price_surge_stocks", "get_volume_updated_stocks", "get_supply_concentration",
+        "get_high_low_per", "get_open_price_change", "get_broker_supply_analysis",
+        "get_broker_instant_volume", "get_vi_triggered_stocks", "get_today_prev_execution_qty",
+        "get_investor_daily_stocks", "get_stock_investor_by_day", "get_stock_investor_total",
+        "get_today_prev_execution", "get_watchlist_info", "get_stock_list", "get_stock_detail",
+        "get_sector_list", "get_broker_list", "credit_loan_stocks", "credit_loan_availability",
+    ),
+    "ranking": (
+        "get_bid_qty_upper", "get_bid_qty_surge", "get_qty_ratio_surge", "get_trade_qty_surge",
+        "get_price_change_upper", "get_expected_trade_upper", "get_daily_trade_qty_upper",
+        "get_prev_trade_qty_upper", "get_trade_amt_upper", "get_credit_ratio_upper",
+        "get_foreign_period_trade_upper", "get_foreign_consec_trade_upper",
+        "get_foreign_limit_exhaust_upper", "get_foreign_broker_trade_upper",
+        "get_stock_broker_rank", "get_broker_trade_upper", "get_daily_main_broker",
+        "get_net_buy_broker_rank", "get_daily_top_exit", "get_same_net_trade_rank",
+        "get_investor_trade_upper", "get_after_hours_rank", "get_foreign_institution_trade_upper",
+    ),
+    "chart": (
+        "get_stock_tick_chart", "iter_stock_tick_chart", "get_stock_min_chart",
+        "iter_stock_min_chart", "get_stock_day_chart", "iter_stock_day_chart",
+        "get_stock_week_chart", "iter_stock_week_chart", "get_stock_month_chart",
+        "iter_stock_month_chart", "get_stock_year_chart", "iter_stock_year_chart",
+        "get_investor_chart", "get_intra_investor_chart", "get_sector_tick_chart",
+        "iter_sector_tick_chart", "get_sector_min_chart", "iter_sector_min_chart",
+        "get_sector_day_chart", "iter_sector_day_chart", "get_sector_week_chart",
+        "iter_sector_week_chart", "get_sector_month_chart", "iter_sector_month_chart",
+        "get_sector_year_chart", "iter_sector_year_chart",
+    ),
+    "sector": (
+        "get_sector_program", "get_sector_investor_net_buy", "get_sector_price",
+        "get_sector_stock_prices", "get_all_sector_index", "get_sector_daily_price",
+    ),
+    "investor": (
+        "get_foreign_trade_trend", "get_institution_trade", "get_inst_frgn_consecutive_trade",
+    ),
+    "short_sell": (
+        "get_short_sell_trend",
+    ),
+    "stock_loan": (
+        "get_stock_loan_trend", "get_stock_loan_top10", "get_stock_loan_trend_by_stock",
+        "get_stock_loan_history",
+    ),
+    "etf": (
+        "get_etf_return", "get_etf_info", "get_etf_daily_trend", "get_etf_all_quote",
+        "get_etf_time_trend", "get_etf_time_fill", "get_etf_daily_fill", "get_etf_nav",
+        "get_etf_time_trend2",
+    ),
+    "elw": (
+        "get_elw_daily_sens", "get_elw_sens", "get_elw_price_surge", "get_elw_broker_net_trade",
+        "get_elw_lp_daily", "get_elw_gap", "get_elw_search", "get_elw_fluc_rank",
+        "get_elw_bal_rank", "get_elw_access_rate", "get_elw_detail",
+    ),
+    "theme": (
+        "get_theme_group", "get_theme_stocks",
+    ),
+    "program": (
+        "get_program_top50", "get_stock_program_status", "get_program_trend_by_time",
+        "get_program_arbitrage_bal", "get_program_acc_trend", "get_stock_time_program",
+        "get_program_trend_by_day", "get_stock_daily_program",
+    ),
+    "gold": (
+        "gold_contract_trend", "gold_daily_trend", "gold_expected_contract", "gold_market_info",
+        "gold_bid", "gold_investor_status", "gold_tick_chart", "gold_minute_chart",
+        "gold_daily_chart", "gold_weekly_chart", "gold_monthly_chart", "gold_daily_tick_chart",
+        "gold_daily_minute_chart",
+    ),
+}
+
+_FLAT_METHODS: dict[str, str] = {
+    name: domain for domain, names in _DOMAIN_METHODS.items() for name in names
+}
+
+
+class _LazyDomain[T: _QueryBase]:
+    """``KiwoomQuery``의 도메인 하위 클라이언트 디스크립터.
+
+    처음 접근할 때 속성 이름과 같은 도메인 모듈을 import해 클라이언트를 만들고
+    인스턴스 ``__dict__``에 넣으므로, 이후 접근은 일반 속성 조회가 된다.
+
+    Args:
+        class_name: 도메인 모듈의 클라이언트 클래스 이름.
+    """
+
+    def __init__(self, class_name: str) -> None:
+        self._class_name = class_name
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def load(self) -> type[T]:
+        """도메인 모듈을 import해 클라이언트 클래스를 반환한다."""
+        module = importlib.import_module(f"{__name__}.{self._name}")
+        return getattr(module, self._class_name)
+
+    @overload
+    def __get__(self, obj: None, owner: type) -> _LazyDomain[T]: ...
+    @overload
+    def __get__(self, obj: KiwoomQuery, owner: type) -> T: ...
+    def __get__(self, obj: KiwoomQuery | None, owner: type) -> T | _LazyDomain[T]:
+        if obj is None:
+            return self
+        client = self.load()(
+            obj._api, obj._cache, obj._cache_ttls, raw=obj._raw, fields=obj._fields
+        )
+        obj.__dict__[self._name] = client
+        return client
+
+
+class KiwoomQuery(_FlatQuery):
+    """키움 REST API 조회 클라이언트.
+
+    계좌·잔고·손익·주문체결 등 조회성 TR을 담당한다.
+    모든 메서드는 ``KiwoomApi``를 통해 HTTP 요청을 전송하며,
+    응답을 dataclass로 파싱하여 반환한다.
+
+    연속조회를 지원하는 TR 중 일부는 ``iter_`` 메서드를 함께 제공한다.
+    ``get_`` 메서드는 첫 페이지만 반환하고, ``iter_`` 메서드는 ``cont-yn``/``next-key``를
+    따라 마지막 페이지까지 항목을 하나씩 내놓는다.
+
+    ``cache``를 주면 종목·업종·회원사 리스트, 종목·ETF·ELW 상세정보처럼 하루 한 번
+    이하로 바뀌는 기준정보 TR의 응답을 TTL(기본 6시간) 동안 재사용한다. ``cache_ttls``로
+    ``api-id``별 TTL을 덮어쓰거나 다른 TR을 추가할 수 있고, TTL이 ``0``이면 캐시하지 않는다.
+    오류 응답과 연속조회 페이지는 캐시하지 않는다.
+
+    TR은 엔드포인트별 도메인 하위 클라이언트로 나뉜다. ``account``·``market``·``stock_info``·
+    ``ranking``·``chart``·``sector``·``investor``·``short_sell``·``stock_loan``·``etf``·``elw``·
+    ``theme``·``program``·``gold`` 속성에 처음 접근할 때 해당 도메인 모듈을 import해
+    클라이언트를 만들고, 이후에는 같은 인스턴스를 재사용한다. ``query.get_stock_info(...)``처럼
+    도메인을 생략한 기존 호출도 그대로 동작하며 해당 도메인만 불러온다.
+
+    ``raw=True`` 또는 ``fields``를 주면 원시 응답 모드가 된다. ``get_`` 메서드는 모델 객체를
+    만들지 않고 ``return_code``를 검사한 응답 본문 dict(``fields``가 있으면 그 최상위 키만
+    남긴 dict)를 반환하고, ``iter_`` 메서드는 항목 대신 페이지 응답 본문을 내놓는다.
+    캐시에서 온 본문은 캐시와 같은 객체이므로 수정하지 않아야 한다. 호출 단위로 쓰려면
+    ``as_raw()``로 같은 API·캐시를 공유하는 원시 응답 모드 클라이언트를 만든다.
+
+    Args:
+        api: 인증 토큰이 설정된 ``KiwoomApi`` 인스턴스.
+        cache: 응답 캐시 저장소. ``None``이면 캐시하지 않는다.
+        cache_ttls: ``api-id`` → TTL(초) 재정의. 기본 TTL에 덮어쓴다.
+        raw: ``True``면 원시 응답 모드.
+        fields: 원시 응답 모드에서 남길 응답 최상위 키. 지정하면 ``raw=True``로 동작한다.
+
+    Example:
+        >>> from kiwoompy import FileResponseCache, KiwoomQuery
+        >>> query = KiwoomQuery(api, cache=FileResponseCache())
+        >>> stocks = query.get_stock_list("kospi")  # 재시작 후에도 6시간 동안 캐시
+        >>> query.invalidate_cache("ka10099")
+        >>> chart = query.chart.get_stock_day_chart("005930")  # 차트 모듈만 import
+        >>> query.as_raw(["stk_nm", "cur_prc"]).get_stock_info("005930")
+        {'stk_nm': '삼성전자', 'cur_prc': '+70000'}
+    """
+
+    account: _LazyDomain[AccountQuery] = _LazyDomain("AccountQuery")
+    market: _LazyDomain[MarketQuery] = _LazyDomain("MarketQuery")
+    stock_info: _LazyDomain[StockInfoQuery] = _LazyDomain("StockInfoQuery")
+    ranking: _LazyDomain[RankingQuery] = _LazyDomain("RankingQuery")
+    chart: _LazyDomain[ChartQuery] = _LazyDomain("ChartQuery")
+    sector: _LazyDomain[SectorQuery] = _LazyDomain("SectorQuery")
+    investor: _LazyDomain[InvestorQuery] = _LazyDomain("InvestorQuery")
+    short_sell: _LazyDomain[ShortSellQuery] = _LazyDomain("ShortSellQuery")
+    stock_loan: _LazyDomain[StockLoanQuery] = _LazyDomain("StockLoanQuery")
+    etf: _LazyDomain[EtfQuery] = _LazyDomain("EtfQuery")
+    elw: _LazyDomain[ElwQuery] = _LazyDomain("ElwQuery")
+    theme: _LazyDomain[ThemeQuery] = _LazyDomain("ThemeQuery")
+    program: _LazyDomain[ProgramQuery] = _LazyDomain("ProgramQuery")
+    gold: _LazyDomain[GoldQuery] = _LazyDomain("GoldQuery")
+
+    def __getattr__(self, name: str) -> Any:
+        domain = _FLAT_METHODS.get(name)
+        if domain is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        method = getattr(getattr(self, domain), name)
+        self.__dict__[name] = method
+        return method
+
+    def __dir__(self) -> list[str]:
+        return sorted({*super().__dir__(), *_FLAT_METHODS})
+
+    def as_raw(self, fields: Iterable[str] | None = None) -> KiwoomQuery:
+        """같은 API·캐시를 쓰는 원시 응답 모드 클라이언트를 반환한다.
+
+        Args:
+            fields: 남길 응답 최상위 키. ``None``이면 응답 본문 전체를 반환한다.
+
+        Returns:
+            ``get_`` 메서드가 응답 본문 dict를 반환하는 ``KiwoomQuery``.
+        """
+        return type(self)(self._api, self._cache, self._cache_ttls, raw=True, fields=fields)
+
+    def invalidate_cache(self, api_id: str | None = None) -> None:
+        """응답 캐시를 비운다. 모든 도메인 하위 클라이언트가 같은 캐시를 쓴다.
+
+        Args:
+            api_id: 비울 TR의 ``api-id``. ``None``이면 캐시 전체를 비운다.
+        """
+        if self._cache is not None:
+            self._cache.invalidate(api_id)
+
+
+class _AsyncLazyDomain:
+    """``AsyncKiwoomQuery``의 도메인 하위 클라이언트 디스크립터.
+
+    처음 접근할 때 동기 도메인 클래스를 불러와 비동기 파사드 클래스를 만들고,
+    파사드 클래스는 모든 ``AsyncKiwoomQuery`` 인스턴스가 공유한다.
+
+    Args:
+        domain: 대응하는 ``KiwoomQuery``의 도메인 디스크립터.
+    """
+
+    def __init__(self, domain: _LazyDomain[Any]) -> None:
+        self._domain = domain
+        self._facade: type[_AsyncFacade] | None = None
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj: AsyncKiwoomQuery | None, owner: type) -> Any:
+        if obj is None:
+            return self
+        if self._facade is None:
+            sync = self._domain.load()
+            self._facade = type(
+                f"Async{sync.__name__}",
+                (_AsyncFacade,),
+                {"__module__": sync.__module__, "__doc__": f"``{sync.__name__}``의 비동기 버전."},
+                sync=sync,
+            )
+        sync = obj._sync
+        client = self._facade(
+            obj._api, sync._cache, sync._cache_ttls, raw=sync._raw, fields=sync._fields
+        )
+        obj.__dict__[self._name] = client
+        return client
+
+
+class AsyncKiwoomQuery(_AsyncFacade, sync=KiwoomQuery, passthrough=("invalidate_cache",)):
+    """``KiwoomQuery``의 비동기 버전.
+
+    ``KiwoomQuery``의 모든 공개 조회 메서드를 같은 이름·인자의 코루틴으로 제공한다.
+    요청은 ``AsyncKiwoomApi``를 통해 전송되므로 하나의 이벤트 루프에서
+    여러 조회를 동시에 진행할 수 있다. 도메인 하위 클라이언트(``query.chart`` 등)도
+    같은 방식으로 처음 접근할 때 불러온다.
+
+    Args:
+        api: 인증 토큰이 설정된 ``AsyncKiwoomApi`` 인스턴스.
+        cache: 응답 캐시 저장소. ``KiwoomQuery`` 참고.
+        cache_ttls: ``api-id`` → TTL(초) 재정의.
+        raw: ``True``면 원시 응답 모드. ``KiwoomQuery`` 참고.
+        fields: 원시 응답 모드에서 남길 응답 최상위 키.
+
+    Example:
+        >>> query = AsyncKiwoomQuery(api)
+        >>> balance, book = await asyncio.gather(
+        ...     query.get_account_balance(),
+        ...     query.get_orderbook("005930"),
+        ... )
+        >>> etf = await query.etf.get_etf_info("069500")
+    """
+
+    _api: AsyncKiwoomApi
+    _sync: KiwoomQuery
+
+    account = _AsyncLazyDomain(KiwoomQuery.account)
+    market = _AsyncLazyDomain(KiwoomQuery.market)
+    stock_info = _AsyncLazyDomain(KiwoomQuery.stock_info)
+    ranking = _AsyncLazyDomain(KiwoomQuery.ranking)
+    chart = _AsyncLazyDomain(KiwoomQuery.chart)
+    sector = _AsyncLazyDomain(KiwoomQuery.sector)
+    investor = _AsyncLazyDomain(KiwoomQuery.investor)
+    short_sell = _AsyncLazyDomain(KiwoomQuery.short_sell)
+    stock_loan = _AsyncLazyDomain(KiwoomQuery.stock_loan)
+    etf = _AsyncLazyDomain(KiwoomQuery.etf)
+    elw = _AsyncLazyDomain(KiwoomQuery.elw)
+    theme = _AsyncLazyDomain(KiwoomQuery.theme)
+    program = _AsyncLazyDomain(KiwoomQuery.program)
+    gold = _AsyncLazyDomain(KiwoomQuery.gold)
+
+    def __getattr__(self, name: str) -> Any:
+        domain = _FLAT_METHODS.get(name)
+        if domain is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        method = getattr(getattr(self, domain), name)
+        self.__dict__[name] = method
+        return method
+
+    def __dir__(self) -> list[str]:
+        return sorted({*super().__dir__(), *_FLAT_METHODS})
+
+    def as_raw(self, fields: Iterable[str] | None = None) -> AsyncKiwoomQuery:
+        """같은 API·캐시를 쓰는 원시 응답 모드 클라이언트를 반환한다. ``KiwoomQuery.as_raw()`` 참고."""
+        sync = self._sync
+        return type(self)(self._api, sync._cache, sync._cache_ttls, raw=True, fields=fields)
@@ -0,0 +1,670 @@
+"""조회 클라이언트 공통 기반 — 요청 헤더·응답 캐시·연속조회와 TR 인자 타입·매핑 테이블."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Callable, Iterable
+from typing import Any, Literal
+
+from kiwoompy.api import KiwoomApi, PageIterator
+from kiwoompy.cache import ResponseCache
+from kiwoompy.codec import json_key
+from kiwoompy.exceptions import KiwoomApiError
+from kiwoompy.shared import _file_name
+
+type QueryType = Literal["1", "2", "3"]
+"""예수금 조회구분. ``"2"``: 일반조회, ``"3"``: 추정조회."""
+
+type DomesticExchange = Literal["KRX", "NXT", "%", "SOR"]
+"""국내거래소구분.
+- ``"KRX"``: 한국거래소
+- ``"NXT"``: 넥스트트레이드
+- ``"%"``: 전체
+- ``"SOR"``: 최선주문집행
+"""
+
+type ExchangeType = Literal["all", "krx", "nxt"]
+"""거래소구분.
+
+- ``"all"``: 통합 — API ``"0"``
+- ``"krx"``: 한국거래소 — API ``"1"``
+- ``"nxt"``: 넥스트트레이드 — API ``"2"``
+"""
+
+_EXCHANGE_CODE: dict[str, str] = {
+    "all": "0",
+    "krx": "1",
+    "nxt": "2",
+}
+
+type SellType = Literal["all", "sell", "buy"]
+"""매도수구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"sell"``: 매도 — API ``"1"``
+- ``"buy"``: 매수 — API ``"2"``
+"""
+
+type TradeSide = Literal["sell", "buy"]
+"""매매구분 (전체 없음).
+
+- ``"sell"``: 매도 — API ``"1"``
+- ``"buy"``: 매수 — API ``"2"``
+"""
+
+type UnfilledTradeType = Literal["all", "sell", "buy"]
+"""미체결 매매구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"sell"``: 매도 — API ``"1"``
+- ``"buy"``: 매수 — API ``"2"``
+"""
+
+_SELL_TYPE_CODE: dict[str, str] = {
+    "all":  "0",
+    "sell": "1",
+    "buy":  "2",
+}
+
+# ---------------------------------------------------------------------------
+# 3단계 타입 정의
+# ---------------------------------------------------------------------------
+
+type DepositQueryType = Literal["normal", "estimated"]
+"""예수금 조회구분.
+
+- ``"normal"``: 일반조회 — API ``"2"``
+- ``"estimated"``: 추정조회 — API ``"3"``
+"""
+
+type DelistedQueryType = Literal["all", "exclude_delisted"]
+"""상장폐지 조회구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"exclude_delisted"``: 상장폐지종목제외 — API ``"1"``
+"""
+
+type OrderHistoryQueryType = Literal["asc", "desc", "unfilled", "filled_only"]
+"""주문체결내역상세 조회구분.
+
+- ``"asc"``: 주문순 — API ``"1"``
+- ``"desc"``: 역순 — API ``"2"``
+- ``"unfilled"``: 미체결 — API ``"3"``
+- ``"filled_only"``: 체결내역만 — API ``"4"``
+"""
+
+type StockBondType = Literal["all", "stock", "bond"]
+"""주식채권구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"stock"``: 주식 — API ``"1"``
+- ``"bond"``: 채권 — API ``"2"``
+"""
+
+type MarketType = Literal["all", "kospi", "kosdaq", "otcbb", "ecn"]
+"""시장구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"kospi"``: 코스피 — API ``"1"``
+- ``"kosdaq"``: 코스닥 — API ``"2"``
+- ``"otcbb"``: OTCBB — API ``"3"``
+- ``"ecn"``: ECN — API ``"4"``
+"""
+
+type ExecutionQueryType = Literal["all", "filled"]
+"""주문체결현황 조회구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"filled"``: 체결 — API ``"1"``
+"""
+
+type GoodsType = Literal["all", "domestic_stock", "fund", "overseas_stock", "financial"]
+"""위탁종합거래내역 상품구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"domestic_stock"``: 국내주식 — API ``"1"``
+- ``"fund"``: 수익증권 — API ``"2"``
+- ``"overseas_stock"``: 해외주식 — API ``"3"``
+- ``"financial"``: 금융상품 — API ``"4"``
+"""
+
+type BalanceQueryType = Literal["combined", "individual"]
+"""계좌평가잔고 조회구분.
+
+- ``"combined"``: 합산 — API ``"1"``
+- ``"individual"``: 개별 — API ``"2"``
+"""
+
+type FilledQueryType = Literal["all", "by_stock"]
+"""체결조회 조회구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"by_stock"``: 종목 — API ``"1"``
+"""
+
+type SingleStockType = Literal["today_buy_sell", "today_sell_all"]
+"""당일매매일지 단주구분.
+
+- ``"today_buy_sell"``: 당일매수에 대한 당일매도 — API ``"1"``
+- ``"today_sell_all"``: 당일매도 전체 — API ``"2"``
+"""
+
+type CashCreditType = Literal["all", "cash", "credit"]
+"""당일매매일지 현금신용구분.
+
+- ``"all"``: 전체 — API ``"0"``
+- ``"cash"``: 현금매매만 — API ``"1"``
+- ``"credit"``: 신용매매만 — API ``"2"``
+"""
+
+_DEPOSIT_QUERY_CODE: dict[str, str] = {
+    "normal":    "2",
+    "estimated": "3",
+}
+_DELISTED_QUERY_CODE: dict[str, str] = {
+    "all":              "0",
+    "exclude_delisted": "1",
+}
+_ORDER_HISTORY_QUERY_CODE: dict[str, str] = {
+    "asc":         "1",
+    "desc":        "2",
+    "unfilled":    "3",
+    "filled_only": "4",
+}
+_STOCK_BOND_CODE: dict[str, str] = {
+    "all":   "0",
+    "stock": "1",
+    "bond":  "2",
+}
+_MARKET_TYPE_CODE: dict[str, str] = {
+    "all":    "0",
+    "kospi":  "1",
+    "kosdaq": "2",
+    "otcbb":  "3",
+    "ecn":    "4",
+}
+_EXECUTION_QUERY_CODE: dict[str, str] = {
+    "all":    "0",
+    "filled": "1",
+}
+_GOODS_TYPE_CODE: dict[str, str] = {
+    "all":            "0",
+    "domestic_stock": "1",
+    "fund":           "2",
+    "overseas_stock": "3",
+    "financial":      "4",
+}
+_BALANCE_QUERY_CODE: dict[str, str] = {
+    "combined":   "1",
+    "individual": "2",
+}
+_FILLED_QUERY_CODE: dict[str, str] = {
+    "all":      "0",
+    "by_stock": "1",
+}
+_SINGLE_STOCK_CODE: dict[str, str] = {
+    "today_buy_sell": "1",
+    "today_sell_all": "2",
+}
+_CASH_CREDIT_CODE: dict[str, str] = {
+    "all":    "0",
+    "cash":   "1",
+    "credit": "2",
+}
+
+# ---------------------------------------------------------------------------
+# 4단계 매핑 테이블
+# ---------------------------------------------------------------------------
+
+_DISPLAY_TYPE_CODE: dict[str, str] = {
+    "qty":    "0",
+    "amount": "1",
+}
+_NEW_STOCK_RIGHTS_CODE: dict[str, str] = {
+    "all":          "00",
+    "rights_cert":  "05",
+    "rights_deed":  "07",
+}
+_INSTITUTION_TRADE_CODE: dict[str, str] = {
+    "sell": "1",
+    "buy":  "2",
+}
+_ESTIMATED_PRICE_CODE: dict[str, str] = {
+    "buy":  "1",
+    "sell": "2",
+}
+_CREDIT_QUERY_CODE: dict[str, str] = {
+    "loan":  "1",
+    "short": "2",
+}
+_HIGH_LOW_SELECT_CODE: dict[str, str] = {
+    "high": "1",
+    "low":  "2",
+}
+_PER_TYPE_CODE: dict[str, str] = {
+    "low_pbr":  "1",
+    "high_pbr": "2",
+    "low_per":  "3",
+    "high_per": "4",
+    "low_roe":  "5",
+    "high_roe": "6",
+}
+_TODAY_PREV_CODE: dict[str, str] = {
+    "today": "1",
+    "prev":  "2",
+}
+_TICK_MIN_CODE: dict[str, str] = {
+    "tick":   "0",
+    "minute": "1",
+}
+_STK_MARKET_CODE: dict[str, str] = {
+    "kospi":       "0",
+    "kosdaq":      "10",
+    "kotc":        "30",
+    "konex":       "50",
+    "etn":         "60",
+    "loss_etn":    "70",
+    "gold":        "80",
+    "vol_etn":     "90",
+    "infra":       "2",
+    "elw":         "3",
+    "mutual_fund": "4",
+    "rights":      "5",
+    "reit":        "6",
+    "rights_deed": "7",
+    "etf":         "8",
+    "high_yield":  "9",
+}
+_SECTOR_MARKET_CODE: dict[str, str] = {
+    "kospi":    "0",
+    "kosdaq":   "1",
+    "kospi200": "2",
+    "kospi100": "4",
+    "krx100":   "7",
+}
+_MRKCOND_EXCHANGE_CODE: dict[str, str] = {
+    "krx": "1",
+    "nxt": "2",
+    "all": "3",
+}
+_MRKT_TYPE3_CODE: dict[str, str] = {
+    "all":    "000",
+    "kospi":  "001",
+    "kosdaq": "101",
+}
+_MRKT_TYPE3_EXT_CODE: dict[str, str] = {
+    "all":      "000",
+    "kospi":    "001",
+    "kosdaq":   "101",
+    "kospi200": "201",
+}
+_INTRA_AMT_QTY_CODE: dict[str, str] = {
+    "amount_qty": "1",
+}
+_AFTER_AMT_QTY_CODE: dict[str, str] = {
+    "amount": "1",
+    "qty":    "2",
+}
+_AFTER_TRADE_TYPE_CODE: dict[str, str] = {
+    "net_buy": "0",
+    "buy":     "1",
+    "sell":    "2",
+}
+_INVESTOR_CODE: dict[str, str] = {
+    "foreign":    "6",
+    "institution": "7",
+    "trust":       "1",
+    "insurance":   "0",
+    "bank":        "2",
+    "pension":     "3",
+    "gov":         "4",
+    "other_corp":  "5",
+}
+_INVESTOR2_CODE: dict[str, str] = {
+    "individual":   "8000",
+    "foreign":      "9000",
+    "financial_inv": "1000",
+    "trust":        "3000",
+    "private_fund": "3100",
+    "other_fin":    "5000",
+    "bank":         "4000",
+    "insurance":    "2000",
+    "pension":      "6000",
+    "gov":          "7000",
+    "other_corp":   "7100",
+    "institution":  "9999",
+}
+_AMT_QTY_CODE: dict[str, str] = {
+    "amount": "1",
+    "qty":    "2",
+}
+_INVESTOR_TRADE_CODE: dict[str, str] = {
+    "net_buy": "0",
+    "buy":     "1",
+    "sell":    "2",
+}
+_UNIT_CODE: dict[str, str] = {
+    "thousand": "1000",
+    "single":   "1",
+}
+
+# ---------------------------------------------------------------------------
+# 5단계 매핑 테이블 — 순위정보
+# ---------------------------------------------------------------------------
+
+_RKINFO_MARKET_CODE: dict[str, str] = {
+    "all":    "000",
+    "kospi":  "001",
+    "kosdaq": "101",
+}
+_RKINFO_STEX_CODE: dict[str, str] = {
+    "krx": "1",
+    "nxt": "2",
+    "all": "3",
+}
+_RKINFO_BID_SORT_CODE: dict[str, str] = {
+    "net_buy_qty":  "1",
+    "net_sell_qty": "2",
+    "buy_ratio":    "3",
+    "sell_ratio":   "4",
+}
+_RKINFO_SURGE_SORT2_CODE: dict[str, str] = {
+    "surge_qty":   "1",
+    "surge_ratio": "2",
+}
+_RKINFO_PRICE_CHANGE_SORT_CODE: dict[str, str] = {
+    "rise_ratio": "1",
+    "rise_gap":   "2",
+    "fall_ratio": "3",
+    "fall_gap":   "4",
+    "flat":       "5",
+}
+_RKINFO_BASE_DATE_CODE: dict[str, str] = {
+    "today": "0",
+    "prev":  "1",
+}
+_RKINFO_SORT_CND_CODE: dict[str, str] = {
+    "qty":    "1",
+    "amount": "2",
+}
+_RKINFO_BID_TRADE_CODE: dict[str, str] = {
+    "buy":  "1",
+    "sell": "2",
+}
+_RKINFO_ORG_TYPE_CODE: dict[str, str] = {
+    "foreign":      "9000",
+    "foreign_corp": "9100",
+    "financial_inv":"1000",
+    "trust":        "3000",
+    "other_finance":"5000",
+    "bank":         "4000",
+    "insurance":    "2000",
+    "pension":      "6000",
+    "gov":          "7000",
+    "other_corp":   "7100",
+    "institution":  "9999",
+}
+
+# ---------------------------------------------------------------------------
+# 6단계 매핑 테이블 — 차트
+# ---------------------------------------------------------------------------
+_CHART_ADJ_CODE: dict[str, str] = {
+    "adjusted": "1",
+    "raw":      "0",
+}
+_CHART_AMT_QTY_CODE: dict[str, str] = {
+    "amount": "1",
+    "qty":    "2",
+}
+_CHART_TRADE_CODE: dict[str, str] = {
+    "net_buy": "0",
+    "buy":     "1",
+    "sell":    "2",
+}
+_CHART_UNIT_CODE: dict[str, str] = {
+    "thousand": "1000",
+    "single":   "1",
+}
+_CHART_SECTOR_MARKET_CODE: dict[str, str] = {
+    "kospi":    "0",
+    "kosdaq":   "1",
+    "kospi200": "2",
+}
+
+# ---------------------------------------------------------------------------
+# 7단계 매핑 테이블 — 업종·기관/외국인·공매도·대차거래
+# ---------------------------------------------------------------------------
+_SECT_MRKT_CODE: dict[str, str] = {
+    "kospi":    "0",
+    "kosdaq":   "1",
+    "kospi200": "2",
+}
+_SECT_AMT_QTY_CODE: dict[str, str] = {
+    "amount": "0",
+    "qty":    "1",
+}
+_SECT_EXCHANGE_CODE: dict[str, str] = {
+    "krx": "1",
+    "nxt": "2",
+    "all": "3",
+}
+_FRGN_STK_SECT_CODE: dict[str, str] = {
+    "stock":  "0",
+    "sector": "1",
+}
+_FRGN_DURATION_CODE: dict[str, str] = {
+    "1":      "1",
+    "3":      "3",
+    "5":      "5",
+    "10":     "10",
+    "20":     "20",
+    "120":    "120",
+    "custom": "0",
+}
+_SLB_MRKT_CODE: dict[str, str] = {
+    "kospi":  "001",
+    "kosdaq": "101",
+}
+
+# ---------------------------------------------------------------------------
+# 8단계 매핑 테이블 — ETF·ELW·테마·프로그램매매
+# ---------------------------------------------------------------------------
+_ETF_DURATION_CODE: dict[str, str] = {
+    "1w": "0",
+    "1m": "1",
+    "6m": "2",
+    "1y": "3",
+}
+_ELW_FLUC_CODE: dict[str, str] = {
+    "surge":   "1",
+    "plunge":  "2",
+}
+_ELW_RIGHT_CODE: dict[str, str] = {
+    "all":        "000",
+    "call":       "001",
+    "put":        "002",
+    "dc":         "003",
+    "dp":         "004",
+    "ex":         "005",
+    "early_call": "006",
+    "early_put":  "007",
+}
+_ELW_SORT_CODE: dict[str, str] = {
+    "rise_rate": "1",
+    "rise_gap":  "2",
+    "fall_rate": "3",
+    "fall_gap":  "4",
+    "volume":    "5",
+    "amount":    "6",
+    "expire":    "7",
+}
+_THEME_SEARCH_CODE: dict[str, str] = {
+    "all":   "0",
+    "theme": "1",
+    "stock": "2",
+}
+
+# ---------------------------------------------------------------------------
+# 응답 캐시 TTL — 캐시를 쓸 때 기본으로 캐시하는 기준정보 TR
+# ---------------------------------------------------------------------------
+_REFERENCE_TTL = 6 * 60 * 60  # 초 — 하루 한 번 이하로 바뀌는 기준정보
+
+_CACHE_TTLS: dict[str, float] = {
+    "ka10099": _REFERENCE_TTL,  # 종목정보 리스트
+    "ka10100": _REFERENCE_TTL,  # 종목정보 조회
+    "ka10101": _REFERENCE_TTL,  # 업종코드 리스트
+    "ka10102": _REFERENCE_TTL,  # 회원사 리스트
+    "ka40002": _REFERENCE_TTL,  # ETF종목정보
+    "ka30012": _REFERENCE_TTL,  # ELW종목상세정보
+}
+
+
+def _check(raw: dict) -> dict:
+    """응답 body의 return_code를 확인하고 오류 시 KiwoomApiError를 raise한다.
+
+    Args:
+        raw: API 응답 dict.
+
+    Returns:
+        원본 ``raw`` dict (체이닝 편의).
+
+    Raises:
+        KiwoomApiError: ``return_code``가 0이 아닌 경우.
+    """
+    return_code = raw.get("return_code")
+    if return_code is not None and return_code != 0:
+        msg = raw.get("return_msg", "조회 실패")
+        raise KiwoomApiError(f"조회 실패 (return_code={return_code}): {msg}")
+    return raw
+
+
+class _RawResponse(BaseException):
+    """원시 응답 모드에서 모델을 만들지 않고 응답 본문을 메서드 밖으로 전달한다.
+
+    TR 메서드 내부의 ``except Exception``에 잡히지 않도록 ``BaseException``을 상속한다.
+    """
+
+    def __init__(self, body: dict) -> None:
+        super().__init__()
+        self.body = body
+
+
+def _raw_aware[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    """``_post``가 ``_RawResponse``로 돌려보낸 응답 본문을 반환하도록 공개 메서드를 감싼다."""
+
+    @functools.wraps(func)
+    def method(*args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            return func(*args, **kwargs)
+        except _RawResponse as exc:
+            return exc.body  # type: ignore[return-value]
+
+    return method
+
+
+class _QueryBase:
+    """도메인별 조회 클라이언트의 기반 클래스.
+
+    엔드포인트 경로, 공통 헤더, 응답 캐시 조회, 연속조회 반복자 생성을 제공한다.
+
+    원시 응답 모드(``raw=True`` 또는 ``fields`` 지정)에서는 ``_post``가 ``return_code``를
+    검사한 응답 본문을 ``_RawResponse``로 던지고, 서브클래스의 공개 메서드가 이를 받아
+    그대로 반환한다. 응답 파싱 코드는 실행되지 않으므로 모델 객체를 만들지 않는다.
+    """
+
+    _ACNT_PATH    = "/api/dostk/acnt"
+    _MRKCOND_PATH = "/api/dostk/mrkcond"
+    _STKINFO_PATH = "/api/dostk/stkinfo"
+    _RKINFO_PATH  = "/api/dostk/rkinfo"
+    _CHART_PATH    = "/api/dostk/chart"
+    _SECT_PATH     = "/api/dostk/sect"
+    _FRGNISTT_PATH = "/api/dostk/frgnistt"
+    _SHSA_PATH     = "/api/dostk/shsa"
+    _SLB_PATH      = "/api/dostk/slb"
+    _ETF_PATH      = "/api/dostk/etf"
+    _ELW_PATH      = "/api/dostk/elw"
+    _THME_PATH     = "/api/dostk/thme"
+
+    def __init__(
+        self,
+        api: KiwoomApi,
+        cache: ResponseCache | None = None,
+        cache_ttls: dict[str, float] | None = None,
+        *,
+        raw: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> None:
+        self._api = api
+        self._cache = cache
+        self._cache_ttls: dict[str, float] = {**_CACHE_TTLS, **(cache_ttls or {})}
+        self._fields = tuple(fields) if fields is not None else None
+        self._raw = raw or self._fields is not None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, func in list(vars(cls).items()):
+            if not name.startswith(("_", "iter_")) and inspect.isfunction(func):
+                setattr(cls, name, _raw_aware(func))
+
+    def _headers(self, api_id: str) -> dict[str, str]:
+        """공통 요청 헤더를 반환한다."""
+        return {**self._api.get_auth_header(), "api-id": api_id}
+
+    def _project(self, raw: dict) -> dict:
+        """``fields``가 있으면 응답 본문에서 해당 최상위 키만 남긴다. 없는 키는 생략한다."""
+        if self._fields is None:
+            return raw
+        return {key: raw[key] for key in self._fields if key in raw}
+
+    def _post(self, path: str, body: dict, headers: dict[str, str]) -> dict:
+        """TR 요청을 보낸다. 원시 응답 모드면 검사한 응답 본문을 ``_RawResponse``로 던진다."""
+        raw = self._fetch(path, body, headers)
+        if self._raw:
+            raise _RawResponse(self._project(_check(raw)))
+        return raw
+
+    def _fetch(self, path: str, body: dict, headers: dict[str, str]) -> dict:
+        """TR 요청을 보낸다. 캐시 대상 TR이면 유효한 캐시 응답을 먼저 찾는다."""
+        api_id = headers["api-id"]
+        ttl = self._cache_ttls.get(api_id, 0) if self._cache is not None else 0
+        if ttl <= 0:
+            return self._api.post(path, body, headers=headers)
+
+        # 계좌 조회 응답을 다른 앱 키(계좌)와 나누되, 파일 캐시에 앱 키가 그대로 남지 않게 해시한다
+        account = _file_name(self._api.appkey or "")
+        key = "|".join((self._api.env, account, path, api_id, json_key(body)))
+        raw = self._cache.get(key)
+        if raw is None:
+            raw = self._api.post(path, body, headers=headers)
+            if raw.get("return_code") in (None, 0):
+                self._cache.set(key, api_id, raw, ttl)
+        return raw
+
+    def _paginate[T](
+        self,
+        path: str,
+        api_id: str,
+        body: dict,
+        parse: Callable[[dict], list[T]],
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[T]:
+        """연속조회 TR의 페이지 반복자를 만든다. 각 페이지는 ``_check`` 후 ``parse``로 변환한다.
+
+        원시 응답 모드면 항목 대신 페이지 응답 본문을 하나씩 내놓는다.
+        """
+        if self._raw:
+            def parse_page(raw: dict) -> list[Any]:
+                return [self._project(_check(raw))]
+        else:
+            def parse_page(raw: dict) -> list[Any]:
+                return parse(_check(raw))
+        return PageIterator(
+            self._api,
+            path,
+            body,
+            lambda: self._headers(api_id),
+            parse_page,
+            max_pages=max_pages,
+        )
@@ -0,0 +1,97 @@
+"""TR 응답 스키마 — ``api-id``별 경로·목록 키·항목 모델·필드 매핑과 컴파일된 디코더.
+
+목록형 TR의 항목은 대부분 응답 키를 그대로 문자열 필드로 옮긴 dataclass다.
+이런 TR은 메서드마다 ``item.get("field", "")``를 나열하는 대신 ``TrSchema`` 한 줄로
+선언하고, 스키마가 만들 때 한 번 컴파일한 디코더로 응답 페이지를 변환한다.
+새 TR을 추가할 때도 응답 모델과 스키마 항목만 더하면 된다.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from operator import itemgetter
+from types import MappingProxyType
+
+_SCHEMAS: dict[str, TrSchema] = {}  # api-id → 스키마. 도메인 모듈을 import할 때 채워진다.
+
+
+def _compile[T](model: type[T], keys: tuple[str, ...]) -> Callable[[list[dict]], list[T]]:
+    """응답 항목 목록을 ``model`` 목록으로 바꾸는 디코더를 만든다.
+
+    모든 키가 있는 항목은 ``itemgetter`` 한 번으로 값을 꺼내 위치 인자로 생성하고,
+    키가 빠진 항목이 있는 페이지만 ``dict.get(key, "")``로 하나씩 채운다.
+    """
+    if len(keys) == 1:
+        key = keys[0]
+
+        def getter(item: dict) -> tuple:
+            return (item[key],)
+    else:
+        getter = itemgetter(*keys)
+
+    def decode(items: list[dict]) -> list[T]:
+        try:
+            return [model(*getter(item)) for item in items]
+        except KeyError:
+            return [model(*[item.get(k, "") for k in keys]) for item in items]
+
+    return decode
+
+
+@dataclass(frozen=True)
+class TrSchema[T]:
+    """목록형 TR 응답의 선언적 스키마.
+
+    항목 모델의 필드는 모두 문자열이고, 응답에 키가 없으면 ``""``로 채운다.
+
+    Attributes:
+        api_id: TR ID.
+        path: 엔드포인트 경로.
+        list_key: 응답 본문에서 항목 목록이 담긴 키.
+        model: 항목 dataclass.
+        renames: 모델 필드 → 응답 키. 이름이 다른 필드만 적는다.
+    """
+
+    api_id: str
+    path: str
+    list_key: str
+    model: type[T]
+    renames: Mapping[str, str] = field(default_factory=dict)
+    keys: tuple[str, ...] = field(init=False, repr=False)
+    _decode: Callable[[list[dict]], list[T]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        names = [f.name for f in dataclasses.fields(self.model) if f.init]
+        unknown = set(self.renames) - set(names)
+        if unknown:
+            raise ValueError(f"{self.api_id}: {self.model.__name__}에 없는 필드: {sorted(unknown)}")
+        keys = tuple(self.renames.get(name, name) for name in names)
+        object.__setattr__(self, "renames", MappingProxyType(dict(self.renames)))
+        object.__setattr__(self, "keys", keys)
+        object.__setattr__(self, "_decode", _compile(self.model, keys))
+
+    def decode(self, raw: dict) -> list[T]:
+        """응답 본문(또는 연속조회 한 페이지)에서 항목 목록을 만든다."""
+        return self._decode(raw.get(self.list_key, []))
+
+
+def register(*schemas: TrSchema) -> dict[str, TrSchema]:
+    """스키마를 레지스트리에 등록하고 ``api-id`` → 스키마 딕셔너리를 반환한다.
+
+    Raises:
+        ValueError: ``schemas`` 안에 같은 ``api-id``가 두 번 있는 경우.
+    """
+    table: dict[str, TrSchema] = {}
+    for schema in schemas:
+        if schema.api_id in table:
+            raise ValueError(f"중복된 TR 스키마: {schema.api_id}")
+        table[schema.api_id] = schema
+    _SCHEMAS.update(table)
+    return table
+
+
+def get_schema(api_id: str) -> TrSchema | None:
+    """등록된 TR 스키마를 반환한다. 해당 도메인 모듈을 아직 import하지 않았으면 ``None``."""
+    return _SCHEMAS.get(api_id)
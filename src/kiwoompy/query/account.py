@@ -0,0 +1,1376 @@
+"""계좌 조회 — 예수금·잔고·손익·주문체결 내역 (``acnt``)."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from kiwoompy.api import PageIterator
+from kiwoompy.models import (
+    AccountBalance,
+    AccountEvaluation,
+    AccountEvaluationItem,
+    AccountNumbers,
+    AccountReturnItem,
+    CreditOrderableQuantity,
+    DailyAccountReturn,
+    DailyAccountStatus,
+    DailyBalanceReturn,
+    DailyBalanceReturnItem,
+    DailyRealizedProfit,
+    DailyRealizedProfitDetail,
+    DailyRealizedProfitDetailItem,
+    DailyRealizedProfitItem,
+    DailyTradeJournal,
+    DailyTradeJournalItem,
+    DepositDetail,
+    DailyEstimatedAssetItem,
+    EstimatedAsset,
+    ExecutionBalance,
+    ExecutionBalanceItem,
+    FilledOrderItem,
+    FxDepositItem,
+    HoldingItem,
+    MarginDetail,
+    NextDaySettlement,
+    NextDaySettlementItem,
+    OrderableAmount,
+    OrderableQuantity,
+    OrderExecutionStatus,
+    OrderExecutionStatusItem,
+    OrderHistoryDetailItem,
+    RealizedProfitByDateItem,
+    RealizedProfitByPeriodItem,
+    SplitOrderDetailItem,
+    TransactionHistoryItem,
+    UnfilledOrderItem,
+)
+from kiwoompy.query._base import (
+    _BALANCE_QUERY_CODE,
+    _CASH_CREDIT_CODE,
+    _DELISTED_QUERY_CODE,
+    _DEPOSIT_QUERY_CODE,
+    _EXCHANGE_CODE,
+    _EXECUTION_QUERY_CODE,
+    _FILLED_QUERY_CODE,
+    _GOODS_TYPE_CODE,
+    _MARKET_TYPE_CODE,
+    _ORDER_HISTORY_QUERY_CODE,
+    _SELL_TYPE_CODE,
+    _SINGLE_STOCK_CODE,
+    _STOCK_BOND_CODE,
+    BalanceQueryType,
+    CashCreditType,
+    DelistedQueryType,
+    DepositQueryType,
+    DomesticExchange,
+    ExchangeType,
+    ExecutionQueryType,
+    FilledQueryType,
+    GoodsType,
+    MarketType,
+    OrderHistoryQueryType,
+    SellType,
+    SingleStockType,
+    StockBondType,
+    TradeSide,
+    UnfilledTradeType,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("kt00001", _QueryBase._ACNT_PATH, "stk_entr_prst", FxDepositItem),
+    TrSchema(
+        "kt00002",
+        _QueryBase._ACNT_PATH,
+        "daly_prsm_dpst_aset_amt_prst",
+        DailyEstimatedAssetItem,
+    ),
+    TrSchema("kt00004", _QueryBase._ACNT_PATH, "stk_acnt_evlt_prst", AccountEvaluationItem),
+    TrSchema("kt00005", _QueryBase._ACNT_PATH, "stk_cntr_remn", ExecutionBalanceItem),
+    TrSchema("kt00007", _QueryBase._ACNT_PATH, "acnt_ord_cntr_prps_dtl", OrderHistoryDetailItem),
+    TrSchema(
+        "kt00008",
+        _QueryBase._ACNT_PATH,
+        "acnt_nxdy_setl_frcs_prps_array",
+        NextDaySettlementItem,
+    ),
+    TrSchema(
+        "kt00009",
+        _QueryBase._ACNT_PATH,
+        "acnt_ord_cntr_prst_array",
+        OrderExecutionStatusItem,
+    ),
+    TrSchema("kt00015", _QueryBase._ACNT_PATH, "trst_ovrl_trde_prps_array", TransactionHistoryItem),
+    TrSchema("kt00018", _QueryBase._ACNT_PATH, "acnt_evlt_remn_indv_tot", HoldingItem),
+    TrSchema("ka01690", _QueryBase._ACNT_PATH, "day_bal_rt", DailyBalanceReturnItem),
+    TrSchema("ka10072", _QueryBase._ACNT_PATH, "dt_stk_div_rlzt_pl", RealizedProfitByDateItem),
+    TrSchema("ka10073", _QueryBase._ACNT_PATH, "dt_stk_rlzt_pl", RealizedProfitByPeriodItem),
+    TrSchema("ka10074", _QueryBase._ACNT_PATH, "dt_rlzt_pl", DailyRealizedProfitItem),
+    TrSchema("ka10075", _QueryBase._ACNT_PATH, "oso", UnfilledOrderItem),
+    TrSchema("ka10076", _QueryBase._ACNT_PATH, "cntr", FilledOrderItem),
+    TrSchema("ka10077", _QueryBase._ACNT_PATH, "tdy_rlzt_pl_dtl", DailyRealizedProfitDetailItem),
+    TrSchema("ka10085", _QueryBase._ACNT_PATH, "acnt_prft_rt", AccountReturnItem),
+    TrSchema("ka10088", _QueryBase._ACNT_PATH, "osop", SplitOrderDetailItem),
+    TrSchema("ka10170", _QueryBase._ACNT_PATH, "tdy_trde_diary", DailyTradeJournalItem),
+)
+
+
+class AccountQuery(_QueryBase):
+    """계좌·잔고·손익·주문체결 조회 클라이언트.
+
+    ``KiwoomQuery.account``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # kt00001 — 예수금상세현황요청
+    # -----------------------------------------------------------------------
+
+    def get_deposit(self, query_type: DepositQueryType = "normal") -> DepositDetail:
+        """예수금상세현황을 조회한다 (kt00001).
+
+        Args:
+            query_type: 조회구분. ``"normal"``: 일반조회, ``"estimated"``: 추정조회.
+
+        Returns:
+            예수금상세현황 ``DepositDetail``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"qry_tp": _DEPOSIT_QUERY_CODE[query_type]},
+            headers=self._headers("kt00001"),
+        ))
+        fx_list = _SCHEMAS["kt00001"].decode(raw)
+        return DepositDetail(
+            entr=raw.get("entr", ""),
+            profa_ch=raw.get("profa_ch", ""),
+            pymn_alow_amt=raw.get("pymn_alow_amt", ""),
+            ord_alow_amt=raw.get("ord_alow_amt", ""),
+            d1_entra=raw.get("d1_entra", ""),
+            d1_pymn_alow_amt=raw.get("d1_pymn_alow_amt", ""),
+            d2_entra=raw.get("d2_entra", ""),
+            d2_pymn_alow_amt=raw.get("d2_pymn_alow_amt", ""),
+            repl_amt=raw.get("repl_amt", ""),
+            ch_uncla=raw.get("ch_uncla", ""),
+            nrpy_loan=raw.get("nrpy_loan", ""),
+            crd_grnt_rt=raw.get("crd_grnt_rt", ""),
+            fx_deposits=fx_list,
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00002 — 일별추정예탁자산현황요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_estimated_asset(
+        self,
+        start_dt: str,
+        end_dt: str,
+    ) -> list[DailyEstimatedAssetItem]:
+        """일별추정예탁자산현황을 조회한다 (kt00002).
+
+        Args:
+            start_dt: 시작조회기간 (``YYYYMMDD`` 형식).
+            end_dt: 종료조회기간 (``YYYYMMDD`` 형식).
+
+        Returns:
+            일별추정예탁자산 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"start_dt": start_dt, "end_dt": end_dt},
+            headers=self._headers("kt00002"),
+        ))
+        return _SCHEMAS["kt00002"].decode(raw)
+
+    # -----------------------------------------------------------------------
+    # kt00003 — 추정자산조회요청
+    # -----------------------------------------------------------------------
+
+    def get_estimated_asset(
+        self,
+        query_type: DelistedQueryType = "all",
+    ) -> EstimatedAsset:
+        """추정자산을 조회한다 (kt00003).
+
+        Args:
+            query_type: 상장폐지조회구분. ``"all"``: 전체, ``"exclude_delisted"``: 상장폐지종목제외.
+
+        Returns:
+            추정자산 ``EstimatedAsset``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"qry_tp": _DELISTED_QUERY_CODE[query_type]},
+            headers=self._headers("kt00003"),
+        ))
+        return EstimatedAsset(prsm_dpst_aset_amt=raw.get("prsm_dpst_aset_amt", ""))
+
+    # -----------------------------------------------------------------------
+    # kt00004 — 계좌평가현황요청
+    # -----------------------------------------------------------------------
+
+    def get_account_evaluation(
+        self,
+        query_type: DelistedQueryType = "all",
+        exchange: Literal["KRX", "NXT"] = "KRX",
+    ) -> AccountEvaluation:
+        """계좌평가현황을 조회한다 (kt00004).
+
+        Args:
+            query_type: 상장폐지조회구분. ``"all"``: 전체, ``"exclude_delisted"``: 상장폐지종목제외.
+            exchange: 국내거래소구분. ``"KRX"`` 또는 ``"NXT"``.
+
+        Returns:
+            계좌평가현황 ``AccountEvaluation`` (종목별 목록 포함).
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"qry_tp": _DELISTED_QUERY_CODE[query_type], "dmst_stex_tp": exchange},
+            headers=self._headers("kt00004"),
+        ))
+        holdings = _SCHEMAS["kt00004"].decode(raw)
+        return AccountEvaluation(
+            acnt_nm=raw.get("acnt_nm", ""),
+            brch_nm=raw.get("brch_nm", ""),
+            entr=raw.get("entr", ""),
+            d2_entra=raw.get("d2_entra", ""),
+            tot_est_amt=raw.get("tot_est_amt", ""),
+            aset_evlt_amt=raw.get("aset_evlt_amt", ""),
+            tot_pur_amt=raw.get("tot_pur_amt", ""),
+            prsm_dpst_aset_amt=raw.get("prsm_dpst_aset_amt", ""),
+            tdy_lspft=raw.get("tdy_lspft", ""),
+            tdy_lspft_rt=raw.get("tdy_lspft_rt", ""),
+            lspft_ratio=raw.get("lspft_ratio", ""),
+            lspft_rt=raw.get("lspft_rt", ""),
+            holdings=holdings,
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00005 — 체결잔고요청
+    # -----------------------------------------------------------------------
+
+    def get_execution_balance(
+        self,
+        exchange: Literal["KRX", "NXT"] = "KRX",
+    ) -> ExecutionBalance:
+        """체결잔고를 조회한다 (kt00005).
+
+        Args:
+            exchange: 국내거래소구분. ``"KRX"`` 또는 ``"NXT"``.
+
+        Returns:
+            체결잔고 ``ExecutionBalance`` (종목별 목록 포함).
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"dmst_stex_tp": exchange},
+            headers=self._headers("kt00005"),
+        ))
+        holdings = _SCHEMAS["kt00005"].decode(raw)
+        return ExecutionBalance(
+            entr=raw.get("entr", ""),
+            entr_d1=raw.get("entr_d1", ""),
+            entr_d2=raw.get("entr_d2", ""),
+            pymn_alow_amt=raw.get("pymn_alow_amt", ""),
+            ord_alowa=raw.get("ord_alowa", ""),
+            evlt_amt_tot=raw.get("evlt_amt_tot", ""),
+            tot_pl_tot=raw.get("tot_pl_tot", ""),
+            tot_pl_rt=raw.get("tot_pl_rt", ""),
+            holdings=holdings,
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00007 — 계좌별주문체결내역상세요청
+    # -----------------------------------------------------------------------
+
+    def get_order_history_detail(
+        self,
+        query_type: OrderHistoryQueryType,
+        stock_bond_type: StockBondType,
+        sell_type: SellType,
+        exchange: DomesticExchange = "%",
+        order_date: str = "",
+        stock_code: str = "",
+        from_order_no: str = "",
+    ) -> list[OrderHistoryDetailItem]:
+        """계좌별주문체결내역상세를 조회한다 (kt00007).
+
+        Args:
+            query_type: 조회구분.
+                ``"asc"``: 주문순, ``"desc"``: 역순, ``"unfilled"``: 미체결, ``"filled_only"``: 체결내역만.
+            stock_bond_type: 주식채권구분. ``"all"``: 전체, ``"stock"``: 주식, ``"bond"``: 채권.
+            sell_type: 매도수구분. ``"all"``: 전체, ``"sell"``: 매도, ``"buy"``: 매수.
+            exchange: 국내거래소구분. 기본값 ``"%"`` (전체).
+            order_date: 주문일자 (``YYYYMMDD`` 형식). 공백이면 당일.
+            stock_code: 종목코드. 공백이면 전체 종목.
+            from_order_no: 시작주문번호. 공백이면 전체 주문.
+
+        Returns:
+            주문체결내역 상세 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {
+                "ord_dt": order_date,
+                "qry_tp": _ORDER_HISTORY_QUERY_CODE[query_type],
+                "stk_bond_tp": _STOCK_BOND_CODE[stock_bond_type],
+                "sell_tp": _SELL_TYPE_CODE[sell_type],
+                "stk_cd": stock_code,
+                "fr_ord_no": from_order_no,
+                "dmst_stex_tp": exchange,
+            },
+            headers=self._headers("kt00007"),
+        ))
+        return _SCHEMAS["kt00007"].decode(raw)
+
+    def iter_order_history_detail(
+        self,
+        query_type: OrderHistoryQueryType,
+        stock_bond_type: StockBondType,
+        sell_type: SellType,
+        exchange: DomesticExchange = "%",
+        order_date: str = "",
+        stock_code: str = "",
+        from_order_no: str = "",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[OrderHistoryDetailItem]:
+        """계좌별주문체결내역상세를 연속조회로 끝까지 순회한다 (kt00007).
+
+        ``get_order_history_detail()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            query_type: 조회구분.
+                ``"asc"``: 주문순, ``"desc"``: 역순, ``"unfilled"``: 미체결, ``"filled_only"``: 체결내역만.
+            stock_bond_type: 주식채권구분. ``"all"``: 전체, ``"stock"``: 주식, ``"bond"``: 채권.
+            sell_type: 매도수구분. ``"all"``: 전체, ``"sell"``: 매도, ``"buy"``: 매수.
+            exchange: 국내거래소구분. 기본값 ``"%"`` (전체).
+            order_date: 주문일자 (``YYYYMMDD`` 형식). 공백이면 당일.
+            stock_code: 종목코드. 공백이면 전체 종목.
+            from_order_no: 시작주문번호. 공백이면 전체 주문.
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``OrderHistoryDetailItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._ACNT_PATH,
+            "kt00007",
+            {
+                "ord_dt": order_date,
+                "qry_tp": _ORDER_HISTORY_QUERY_CODE[query_type],
+                "stk_bond_tp": _STOCK_BOND_CODE[stock_bond_type],
+                "sell_tp": _SELL_TYPE_CODE[sell_type],
+                "stk_cd": stock_code,
+                "fr_ord_no": from_order_no,
+                "dmst_stex_tp": exchange,
+            },
+            _SCHEMAS["kt00007"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00008 — 계좌별익일결제예정내역요청
+    # -----------------------------------------------------------------------
+
+    def get_next_day_settlement(
+        self,
+        from_settlement_no: str = "",
+    ) -> NextDaySettlement:
+        """계좌별익일결제예정내역을 조회한다 (kt00008).
+
+        Args:
+            from_settlement_no: 시작결제번호. 공백이면 전체.
+
+        Returns:
+            익일결제예정내역 ``NextDaySettlement``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"strt_dcd_seq": from_settlement_no},
+            headers=self._headers("kt00008"),
+        ))
+        items = _SCHEMAS["kt00008"].decode(raw)
+        return NextDaySettlement(
+            trde_dt=raw.get("trde_dt", ""),
+            setl_dt=raw.get("setl_dt", ""),
+            sell_amt_sum=raw.get("sell_amt_sum", ""),
+            buy_amt_sum=raw.get("buy_amt_sum", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00009 — 계좌별주문체결현황요청
+    # -----------------------------------------------------------------------
+
+    def get_order_execution_status(
+        self,
+        stock_bond_type: StockBondType,
+        market_type: MarketType,
+        sell_type: SellType,
+        query_type: ExecutionQueryType,
+        exchange: DomesticExchange = "KRX",
+        order_date: str = "",
+        stock_code: str = "",
+        from_order_no: str = "",
+    ) -> OrderExecutionStatus:
+        """계좌별주문체결현황을 조회한다 (kt00009).
+
+        Args:
+            stock_bond_type: 주식채권구분. ``"all"``: 전체, ``"stock"``: 주식, ``"bond"``: 채권.
+            market_type: 시장구분.
+                ``"all"``: 전체, ``"kospi"``: 코스피, ``"kosdaq"``: 코스닥, ``"otcbb"``: OTCBB, ``"ecn"``: ECN.
+            sell_type: 매도수구분. ``"all"``: 전체, ``"sell"``: 매도, ``"buy"``: 매수.
+            query_type: 조회구분. ``"all"``: 전체, ``"filled"``: 체결.
+            exchange: 국내거래소구분. 기본값 ``"KRX"``.
+            order_date: 주문일자 (``YYYYMMDD`` 형식). 공백이면 당일.
+            stock_code: 종목코드. 공백이면 전체.
+            from_order_no: 시작주문번호. 공백이면 전체.
+
+        Returns:
+            주문체결현황 ``OrderExecutionStatus``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {
+                "ord_dt": order_date,
+                "stk_bond_tp": _STOCK_BOND_CODE[stock_bond_type],
+                "mrkt_tp": _MARKET_TYPE_CODE[market_type],
+                "sell_tp": _SELL_TYPE_CODE[sell_type],
+                "qry_tp": _EXECUTION_QUERY_CODE[query_type],
+                "stk_cd": stock_code,
+                "fr_ord_no": from_order_no,
+                "dmst_stex_tp": exchange,
+            },
+            headers=self._headers("kt00009"),
+        ))
+        items = _SCHEMAS["kt00009"].decode(raw)
+        return OrderExecutionStatus(
+            sell_grntl_engg_amt=raw.get("sell_grntl_engg_amt", ""),
+            buy_engg_amt=raw.get("buy_engg_amt", ""),
+            engg_amt=raw.get("engg_amt", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00010 — 주문인출가능금액요청
+    # -----------------------------------------------------------------------
+
+    def get_orderable_amount(
+        self,
+        stock_code: str,
+        trade_type: TradeSide,
+        price: str,
+        io_amount: str = "",
+        trade_qty: str = "",
+        expected_buy_price: str = "",
+    ) -> OrderableAmount:
+        """주문인출가능금액을 조회한다 (kt00010).
+
+        Args:
+            stock_code: 종목번호.
+            trade_type: 매매구분. ``"sell"``: 매도, ``"buy"``: 매수.
+            price: 매수가격 (단위: 원).
+            io_amount: 입출금액. 공백 허용.
+            trade_qty: 매매수량. 공백 허용.
+            expected_buy_price: 예상매수단가. 공백 허용.
+
+        Returns:
+            주문인출가능금액 ``OrderableAmount``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {
+                "io_amt": io_amount,
+                "stk_cd": stock_code,
+                "trde_tp": _SELL_TYPE_CODE[trade_type],
+                "trde_qty": trade_qty,
+                "uv": price,
+                "exp_buy_unp": expected_buy_price,
+            },
+            headers=self._headers("kt00010"),
+        ))
+        return OrderableAmount(
+            profa_20ord_alow_amt=raw.get("profa_20ord_alow_amt", ""),
+            profa_20ord_alowq=raw.get("profa_20ord_alowq", ""),
+            profa_30ord_alow_amt=raw.get("profa_30ord_alow_amt", ""),
+            profa_30ord_alowq=raw.get("profa_30ord_alowq", ""),
+            profa_40ord_alow_amt=raw.get("profa_40ord_alow_amt", ""),
+            profa_40ord_alowq=raw.get("profa_40ord_alowq", ""),
+            profa_50ord_alow_amt=raw.get("profa_50ord_alow_amt", ""),
+            profa_50ord_alowq=raw.get("profa_50ord_alowq", ""),
+            profa_60ord_alow_amt=raw.get("profa_60ord_alow_amt", ""),
+            profa_60ord_alowq=raw.get("profa_60ord_alowq", ""),
+            profa_100ord_alow_amt=raw.get("profa_100ord_alow_amt", ""),
+            profa_100ord_alowq=raw.get("profa_100ord_alowq", ""),
+            entr=raw.get("entr", ""),
+            repl_amt=raw.get("repl_amt", ""),
+            ord_alowa=raw.get("ord_alowa", ""),
+            wthd_alowa=raw.get("wthd_alowa", ""),
+            nxdy_wthd_alowa=raw.get("nxdy_wthd_alowa", ""),
+            d2entra=raw.get("d2entra", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00011 — 증거금율별주문가능수량조회요청
+    # -----------------------------------------------------------------------
+
+    def get_orderable_quantity(
+        self,
+        stock_code: str,
+        price: str = "",
+    ) -> OrderableQuantity:
+        """증거금율별주문가능수량을 조회한다 (kt00011).
+
+        Args:
+            stock_code: 종목번호.
+            price: 매수가격. 공백 허용.
+
+        Returns:
+            증거금율별주문가능수량 ``OrderableQuantity``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"stk_cd": stock_code, "uv": price},
+            headers=self._headers("kt00011"),
+        ))
+        return OrderableQuantity(
+            stk_profa_rt=raw.get("stk_profa_rt", ""),
+            profa_rt=raw.get("profa_rt", ""),
+            aplc_rt=raw.get("aplc_rt", ""),
+            profa_20ord_alow_amt=raw.get("profa_20ord_alow_amt", ""),
+            profa_20ord_alowq=raw.get("profa_20ord_alowq", ""),
+            profa_30ord_alow_amt=raw.get("profa_30ord_alow_amt", ""),
+            profa_30ord_alowq=raw.get("profa_30ord_alowq", ""),
+            profa_40ord_alow_amt=raw.get("profa_40ord_alow_amt", ""),
+            profa_40ord_alowq=raw.get("profa_40ord_alowq", ""),
+            profa_50ord_alow_amt=raw.get("profa_50ord_alow_amt", ""),
+            profa_50ord_alowq=raw.get("profa_50ord_alowq", ""),
+            profa_60ord_alow_amt=raw.get("profa_60ord_alow_amt", ""),
+            profa_60ord_alowq=raw.get("profa_60ord_alowq", ""),
+            profa_100ord_alow_amt=raw.get("profa_100ord_alow_amt", ""),
+            profa_100ord_alowq=raw.get("profa_100ord_alowq", ""),
+            entr=raw.get("entr", ""),
+            repl_amt=raw.get("repl_amt", ""),
+            ord_alowa=raw.get("ord_alowa", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00012 — 신용보증금율별주문가능수량조회요청
+    # -----------------------------------------------------------------------
+
+    def get_credit_orderable_quantity(
+        self,
+        stock_code: str,
+        price: str = "",
+    ) -> CreditOrderableQuantity:
+        """신용보증금율별주문가능수량을 조회한다 (kt00012).
+
+        Args:
+            stock_code: 종목번호.
+            price: 매수가격. 공백 허용.
+
+        Returns:
+            신용보증금율별주문가능수량 ``CreditOrderableQuantity``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"stk_cd": stock_code, "uv": price},
+            headers=self._headers("kt00012"),
+        ))
+        return CreditOrderableQuantity(
+            stk_assr_rt=raw.get("stk_assr_rt", ""),
+            stk_assr_rt_nm=raw.get("stk_assr_rt_nm", ""),
+            assr_30ord_alow_amt=raw.get("assr_30ord_alow_amt", ""),
+            assr_30ord_alowq=raw.get("assr_30ord_alowq", ""),
+            assr_40ord_alow_amt=raw.get("assr_40ord_alow_amt", ""),
+            assr_40ord_alowq=raw.get("assr_40ord_alowq", ""),
+            assr_50ord_alow_amt=raw.get("assr_50ord_alow_amt", ""),
+            assr_50ord_alowq=raw.get("assr_50ord_alowq", ""),
+            assr_60ord_alow_amt=raw.get("assr_60ord_alow_amt", ""),
+            assr_60ord_alowq=raw.get("assr_60ord_alowq", ""),
+            entr=raw.get("entr", ""),
+            repl_amt=raw.get("repl_amt", ""),
+            ord_alowa=raw.get("ord_alowa", ""),
+            out_alowa=raw.get("out_alowa", ""),
+            min_amt=raw.get("min_amt", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00013 — 증거금세부내역조회요청
+    # -----------------------------------------------------------------------
+
+    def get_margin_detail(self) -> MarginDetail:
+        """증거금세부내역을 조회한다 (kt00013).
+
+        Returns:
+            증거금세부내역 ``MarginDetail``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {},
+            headers=self._headers("kt00013"),
+        ))
+        return MarginDetail(
+            tdy_reu_alowa=raw.get("tdy_reu_alowa", ""),
+            tdy_reu_alowa_fin=raw.get("tdy_reu_alowa_fin", ""),
+            pred_reu_alowa=raw.get("pred_reu_alowa", ""),
+            pred_reu_alowa_fin=raw.get("pred_reu_alowa_fin", ""),
+            use_pos_ch=raw.get("use_pos_ch", ""),
+            use_pos_ch_fin=raw.get("use_pos_ch_fin", ""),
+            use_pos_repl=raw.get("use_pos_repl", ""),
+            use_pos_repl_fin=raw.get("use_pos_repl_fin", ""),
+            uncla=raw.get("uncla", ""),
+            ord_alow_20=raw.get("20ord_alow_amt", ""),
+            ord_alow_30=raw.get("30ord_alow_amt", ""),
+            ord_alow_40=raw.get("40ord_alow_amt", ""),
+            ord_alow_50=raw.get("50ord_alow_amt", ""),
+            ord_alow_60=raw.get("60ord_alow_amt", ""),
+            ord_alow_100=raw.get("100ord_alow_amt", ""),
+            d2vexct_entr=raw.get("d2vexct_entr", ""),
+            d2ch_ord_alow_amt=raw.get("d2ch_ord_alow_amt", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00015 — 위탁종합거래내역요청
+    # -----------------------------------------------------------------------
+
+    def get_transaction_history(
+        self,
+        start_dt: str,
+        end_dt: str,
+        trade_type: str,
+        goods_type: GoodsType,
+        exchange: DomesticExchange = "%",
+        stock_code: str = "",
+        currency_code: str = "",
+        foreign_exchange_code: str = "",
+    ) -> list[TransactionHistoryItem]:
+        """위탁종합거래내역을 조회한다 (kt00015).
+
+        Args:
+            start_dt: 시작일자 (``YYYYMMDD`` 형식).
+            end_dt: 종료일자 (``YYYYMMDD`` 형식).
+            trade_type: 구분.
+                ``"0"``: 전체, ``"1"``: 입출금, ``"2"``: 입출고, ``"3"``: 매매,
+                ``"4"``: 매수, ``"5"``: 매도, ``"6"``: 입금, ``"7"``: 출금.
+            goods_type: 상품구분.
+                ``"all"``: 전체, ``"domestic_stock"``: 국내주식, ``"fund"``: 수익증권,
+                ``"overseas_stock"``: 해외주식, ``"financial"``: 금융상품.
+            exchange: 국내거래소구분. 기본값 ``"%"`` (전체).
+            stock_code: 종목코드. 공백 허용.
+            currency_code: 통화코드. 공백 허용.
+            foreign_exchange_code: 해외거래소코드. 공백 허용.
+
+        Returns:
+            위탁종합거래내역 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {
+                "strt_dt": start_dt,
+                "end_dt": end_dt,
+                "tp": trade_type,
+                "stk_cd": stock_code,
+                "crnc_cd": currency_code,
+                "gds_tp": _GOODS_TYPE_CODE[goods_type],
+                "frgn_stex_code": foreign_exchange_code,
+                "dmst_stex_tp": exchange,
+            },
+            headers=self._headers("kt00015"),
+        ))
+        return _SCHEMAS["kt00015"].decode(raw)
+
+    def iter_transaction_history(
+        self,
+        start_dt: str,
+        end_dt: str,
+        trade_type: str,
+        goods_type: GoodsType,
+        exchange: DomesticExchange = "%",
+        stock_code: str = "",
+        currency_code: str = "",
+        foreign_exchange_code: str = "",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[TransactionHistoryItem]:
+        """위탁종합거래내역을 연속조회로 끝까지 순회한다 (kt00015).
+
+        ``get_transaction_history()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            start_dt: 시작일자 (``YYYYMMDD`` 형식).
+            end_dt: 종료일자 (``YYYYMMDD`` 형식).
+            trade_type: 구분.
+                ``"0"``: 전체, ``"1"``: 입출금, ``"2"``: 입출고, ``"3"``: 매매,
+                ``"4"``: 매수, ``"5"``: 매도, ``"6"``: 입금, ``"7"``: 출금.
+            goods_type: 상품구분.
+                ``"all"``: 전체, ``"domestic_stock"``: 국내주식, ``"fund"``: 수익증권,
+                ``"overseas_stock"``: 해외주식, ``"financial"``: 금융상품.
+            exchange: 국내거래소구분. 기본값 ``"%"`` (전체).
+            stock_code: 종목코드. 공백 허용.
+            currency_code: 통화코드. 공백 허용.
+            foreign_exchange_code: 해외거래소코드. 공백 허용.
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``TransactionHistoryItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._ACNT_PATH,
+            "kt00015",
+            {
+                "strt_dt": start_dt,
+                "end_dt": end_dt,
+                "tp": trade_type,
+                "stk_cd": stock_code,
+                "crnc_cd": currency_code,
+                "gds_tp": _GOODS_TYPE_CODE[goods_type],
+                "frgn_stex_code": foreign_exchange_code,
+                "dmst_stex_tp": exchange,
+            },
+            _SCHEMAS["kt00015"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00016 — 일별계좌수익률상세현황요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_account_return(
+        self,
+        from_dt: str,
+        to_dt: str,
+    ) -> DailyAccountReturn:
+        """일별계좌수익률상세현황을 조회한다 (kt00016).
+
+        Args:
+            from_dt: 평가시작일 (``YYYYMMDD`` 형식).
+            to_dt: 평가종료일 (``YYYYMMDD`` 형식).
+
+        Returns:
+            일별계좌수익률상세현황 ``DailyAccountReturn``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"fr_dt": from_dt, "to_dt": to_dt},
+            headers=self._headers("kt00016"),
+        ))
+        return DailyAccountReturn(
+            mang_empno=raw.get("mang_empno", ""),
+            mngr_nm=raw.get("mngr_nm", ""),
+            dept_nm=raw.get("dept_nm", ""),
+            entr_fr=raw.get("entr_fr", ""),
+            entr_to=raw.get("entr_to", ""),
+            scrt_evlt_amt_fr=raw.get("scrt_evlt_amt_fr", ""),
+            scrt_evlt_amt_to=raw.get("scrt_evlt_amt_to", ""),
+            tot_amt_fr=raw.get("tot_amt_fr", ""),
+            tot_amt_to=raw.get("tot_amt_to", ""),
+            evltv_prft=raw.get("evltv_prft", ""),
+            prft_rt=raw.get("prft_rt", ""),
+            tern_rt=raw.get("tern_rt", ""),
+            termin_tot_trns=raw.get("termin_tot_trns", ""),
+            termin_tot_pymn=raw.get("termin_tot_pymn", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00017 — 계좌별당일현황요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_status(self) -> DailyAccountStatus:
+        """계좌별당일현황을 조회한다 (kt00017).
+
+        Returns:
+            계좌별당일현황 ``DailyAccountStatus``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {},
+            headers=self._headers("kt00017"),
+        ))
+        return DailyAccountStatus(
+            d2_entra=raw.get("d2_entra", ""),
+            gnrl_stk_evlt_amt_d2=raw.get("gnrl_stk_evlt_amt_d2", ""),
+            crd_loan_d2=raw.get("crd_loan_d2", ""),
+            ina_amt=raw.get("ina_amt", ""),
+            outa=raw.get("outa", ""),
+            sell_amt=raw.get("sell_amt", ""),
+            buy_amt=raw.get("buy_amt", ""),
+            cmsn=raw.get("cmsn", ""),
+            tax=raw.get("tax", ""),
+            dvida_amt=raw.get("dvida_amt", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # kt00018 — 계좌평가잔고내역요청 (핵심)
+    # -----------------------------------------------------------------------
+
+    def get_account_balance(
+        self,
+        query_type: BalanceQueryType = "combined",
+        exchange: Literal["KRX", "NXT"] = "KRX",
+    ) -> AccountBalance:
+        """계좌평가잔고내역을 조회한다 (kt00018).
+
+        보유 종목별 매입금액·평가금액·평가손익·수익률을 포함한
+        계좌 전체 잔고 현황을 반환한다.
+
+        Args:
+            query_type: 조회구분. ``"combined"``: 합산, ``"individual"``: 개별.
+            exchange: 국내거래소구분. ``"KRX"`` 또는 ``"NXT"``.
+
+        Returns:
+            계좌평가잔고내역 ``AccountBalance`` (종목별 목록 포함).
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"qry_tp": _BALANCE_QUERY_CODE[query_type], "dmst_stex_tp": exchange},
+            headers=self._headers("kt00018"),
+        ))
+        holdings = _SCHEMAS["kt00018"].decode(raw)
+        return AccountBalance(
+            tot_pur_amt=raw.get("tot_pur_amt", ""),
+            tot_evlt_amt=raw.get("tot_evlt_amt", ""),
+            tot_evlt_pl=raw.get("tot_evlt_pl", ""),
+            tot_prft_rt=raw.get("tot_prft_rt", ""),
+            prsm_dpst_aset_amt=raw.get("prsm_dpst_aset_amt", ""),
+            tot_loan_amt=raw.get("tot_loan_amt", ""),
+            tot_crd_loan_amt=raw.get("tot_crd_loan_amt", ""),
+            tot_crd_ls_amt=raw.get("tot_crd_ls_amt", ""),
+            holdings=holdings,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka00001 — 계좌번호조회
+    # -----------------------------------------------------------------------
+
+    def get_account_numbers(self) -> AccountNumbers:
+        """현재 토큰에 연결된 계좌번호 목록을 조회한다 (ka00001).
+
+        Returns:
+            계좌번호 목록 ``AccountNumbers``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {},
+            headers=self._headers("ka00001"),
+        ))
+        acct_raw = raw.get("acctNo", "")
+        if isinstance(acct_raw, list):
+            numbers = [str(a) for a in acct_raw]
+        elif acct_raw:
+            numbers = [str(acct_raw)]
+        else:
+            numbers = []
+        return AccountNumbers(account_numbers=numbers)
+
+    # -----------------------------------------------------------------------
+    # ka01690 — 일별잔고수익률
+    # -----------------------------------------------------------------------
+
+    def get_daily_balance_return(self, query_date: str) -> DailyBalanceReturn:
+        """일별잔고수익률을 조회한다 (ka01690).
+
+        모의투자를 지원하지 않는 TR이다.
+
+        Args:
+            query_date: 조회일자 (``YYYYMMDD`` 형식).
+
+        Returns:
+            일별잔고수익률 ``DailyBalanceReturn``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"qry_dt": query_date},
+            headers=self._headers("ka01690"),
+        ))
+        items = _SCHEMAS["ka01690"].decode(raw)
+        return DailyBalanceReturn(
+            dt=raw.get("dt", ""),
+            tot_buy_amt=raw.get("tot_buy_amt", ""),
+            tot_evlt_amt=raw.get("tot_evlt_amt", ""),
+            tot_evltv_prft=raw.get("tot_evltv_prft", ""),
+            tot_prft_rt=raw.get("tot_prft_rt", ""),
+            dbst_bal=raw.get("dbst_bal", ""),
+            day_stk_asst=raw.get("day_stk_asst", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10072 — 일자별종목별실현손익요청_일자
+    # -----------------------------------------------------------------------
+
+    def get_realized_profit_by_date(
+        self,
+        start_dt: str,
+        stock_code: str = "",
+    ) -> list[RealizedProfitByDateItem]:
+        """일자별종목별실현손익(일자 기준)을 조회한다 (ka10072).
+
+        Args:
+            start_dt: 시작일자 (``YYYYMMDD`` 형식).
+            stock_code: 종목코드. 공백이면 전체 종목.
+
+        Returns:
+            일자별종목별실현손익 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"stk_cd": stock_code, "strt_dt": start_dt},
+            headers=self._headers("ka10072"),
+        ))
+        return _SCHEMAS["ka10072"].decode(raw)
+
+    # -----------------------------------------------------------------------
+    # ka10073 — 일자별종목별실현손익요청_기간
+    # -----------------------------------------------------------------------
+
+    def get_realized_profit_by_period(
+        self,
+        start_dt: str,
+        end_dt: str,
+        stock_code: str = "",
+    ) -> list[RealizedProfitByPeriodItem]:
+        """일자별종목별실현손익(기간 기준)을 조회한다 (ka10073).
+
+        Args:
+            start_dt: 시작일자 (``YYYYMMDD`` 형식).
+            end_dt: 종료일자 (``YYYYMMDD`` 형식).
+            stock_code: 종목코드. 공백이면 전체 종목.
+
+        Returns:
+            일자별종목별실현손익 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"stk_cd": stock_code, "strt_dt": start_dt, "end_dt": end_dt},
+            headers=self._headers("ka10073"),
+        ))
+        return _SCHEMAS["ka10073"].decode(raw)
+
+    # -----------------------------------------------------------------------
+    # ka10074 — 일자별실현손익요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_realized_profit(
+        self,
+        start_dt: str,
+        end_dt: str,
+    ) -> DailyRealizedProfit:
+        """일자별실현손익을 조회한다 (ka10074).
+
+        실현손익이 발생한 일자에 대해서만 데이터가 채워진다.
+
+        Args:
+            start_dt: 시작일자 (``YYYYMMDD`` 형식).
+            end_dt: 종료일자 (``YYYYMMDD`` 형식).
+
+        Returns:
+            일자별실현손익 ``DailyRealizedProfit``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"strt_dt": start_dt, "end_dt": end_dt},
+            headers=self._headers("ka10074"),
+        ))
+        items = _SCHEMAS["ka10074"].decode(raw)
+        return DailyRealizedProfit(
+            tot_buy_amt=raw.get("tot_buy_amt", ""),
+            tot_sell_amt=raw.get("tot_sell_amt", ""),
+            rlzt_pl=raw.get("rlzt_pl", ""),
+            trde_cmsn=raw.get("trde_cmsn", ""),
+            trde_tax=raw.get("trde_tax", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10075 — 미체결요청
+    # -----------------------------------------------------------------------
+
+    def get_unfilled_orders(
+        self,
+        all_stock_type: Literal["0", "1"],
+        trade_type: UnfilledTradeType,
+        exchange: ExchangeType = "all",
+        stock_code: str = "",
+    ) -> list[UnfilledOrderItem]:
+        """미체결 주문 목록을 조회한다 (ka10075).
+
+        Args:
+            all_stock_type: 전체종목구분. ``"0"``: 전체, ``"1"``: 종목.
+            trade_type: 매매구분. ``"all"``: 전체, ``"sell"``: 매도, ``"buy"``: 매수.
+            exchange: 거래소구분. ``"all"``: 통합, ``"krx"``: KRX, ``"nxt"``: NXT.
+            stock_code: 종목코드. ``all_stock_type="1"`` 일 때 필수.
+
+        Returns:
+            미체결 주문 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {
+                "all_stk_tp": all_stock_type,
+                "trde_tp": _SELL_TYPE_CODE[trade_type],
+                "stk_cd": stock_code,
+                "stex_tp": _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10075"),
+        ))
+        return _SCHEMAS["ka10075"].decode(raw)
+
+    def iter_unfilled_orders(
+        self,
+        all_stock_type: Literal["0", "1"],
+        trade_type: UnfilledTradeType,
+        exchange: ExchangeType = "all",
+        stock_code: str = "",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[UnfilledOrderItem]:
+        """미체결 주문 목록을 연속조회로 끝까지 순회한다 (ka10075).
+
+        ``get_unfilled_orders()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            all_stock_type: 전체종목구분. ``"0"``: 전체, ``"1"``: 종목.
+            trade_type: 매매구분. ``"all"``: 전체, ``"sell"``: 매도, ``"buy"``: 매수.
+            exchange: 거래소구분. ``"all"``: 통합, ``"krx"``: KRX, ``"nxt"``: NXT.
+            stock_code: 종목코드. ``all_stock_type="1"`` 일 때 필수.
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``UnfilledOrderItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._ACNT_PATH,
+            "ka10075",
+            {
+                "all_stk_tp": all_stock_type,
+                "trde_tp": _SELL_TYPE_CODE[trade_type],
+                "stk_cd": stock_code,
+                "stex_tp": _EXCHANGE_CODE[exchange],
+            },
+            _SCHEMAS["ka10075"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10076 — 체결요청
+    # -----------------------------------------------------------------------
+
+    def get_filled_orders(
+        self,
+        query_type: FilledQueryType,
+        sell_type: SellType,
+        exchange: ExchangeType = "all",
+        stock_code: str = "",
+        order_no: str = "",
+    ) -> list[FilledOrderItem]:
+        """체결 주문 목록을 조회한다 (ka10076).
+
+        Args:
+            query_type: 조회구분. ``"all"``: 전체, ``"by_stock"``: 종목.
+            sell_type: 매도수구분. ``"all"``: 전체, ``"sell"``: 매도, ``"buy"``: 매수.
+            exchange: 거래소구분. ``"all"``: 통합, ``"krx"``: KRX, ``"nxt"``: NXT.
+            stock_code: 종목코드. 공백 허용.
+            order_no: 주문번호. 입력한 주문번호보다 과거에 체결된 내역을 조회한다.
+
+        Returns:
+            체결 주문 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {
+                "stk_cd": stock_code,
+                "qry_tp": _FILLED_QUERY_CODE[query_type],
+                "sell_tp": _SELL_TYPE_CODE[sell_type],
+                "ord_no": order_no,
+                "stex_tp": _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10076"),
+        ))
+        return _SCHEMAS["ka10076"].decode(raw)
+
+    def iter_filled_orders(
+        self,
+        query_type: FilledQueryType,
+        sell_type: SellType,
+        exchange: ExchangeType = "all",
+        stock_code: str = "",
+        order_no: str = "",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[FilledOrderItem]:
+        """체결 주문 목록을 연속조회로 끝까지 순회한다 (ka10076).
+
+        ``get_filled_orders()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            query_type: 조회구분. ``"all"``: 전체, ``"by_stock"``: 종목.
+            sell_type: 매도수구분. ``"all"``: 전체, ``"sell"``: 매도, ``"buy"``: 매수.
+            exchange: 거래소구분. ``"all"``: 통합, ``"krx"``: KRX, ``"nxt"``: NXT.
+            stock_code: 종목코드. 공백 허용.
+            order_no: 주문번호. 입력한 주문번호보다 과거에 체결된 내역을 조회한다.
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``FilledOrderItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._ACNT_PATH,
+            "ka10076",
+            {
+                "stk_cd": stock_code,
+                "qry_tp": _FILLED_QUERY_CODE[query_type],
+                "sell_tp": _SELL_TYPE_CODE[sell_type],
+                "ord_no": order_no,
+                "stex_tp": _EXCHANGE_CODE[exchange],
+            },
+            _SCHEMAS["ka10076"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10077 — 당일실현손익상세요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_realized_profit_detail(
+        self,
+        stock_code: str,
+    ) -> DailyRealizedProfitDetail:
+        """당일실현손익상세를 조회한다 (ka10077).
+
+        Args:
+            stock_code: 종목코드.
+
+        Returns:
+            당일실현손익상세 ``DailyRealizedProfitDetail``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10077"),
+        ))
+        items = _SCHEMAS["ka10077"].decode(raw)
+        return DailyRealizedProfitDetail(
+            tdy_rlzt_pl=raw.get("tdy_rlzt_pl", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10085 — 계좌수익률요청
+    # -----------------------------------------------------------------------
+
+    def get_account_return(
+        self,
+        exchange: ExchangeType = "all",
+    ) -> list[AccountReturnItem]:
+        """계좌수익률을 조회한다 (ka10085).
+
+        Args:
+            exchange: 거래소구분. ``"all"``: 통합, ``"krx"``: KRX, ``"nxt"``: NXT.
+
+        Returns:
+            계좌수익률 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"stex_tp": _EXCHANGE_CODE[exchange]},
+            headers=self._headers("ka10085"),
+        ))
+        return _SCHEMAS["ka10085"].decode(raw)
+
+    # -----------------------------------------------------------------------
+    # ka10088 — 미체결 분할주문 상세
+    # -----------------------------------------------------------------------
+
+    def get_split_order_detail(
+        self,
+        order_no: str,
+    ) -> list[SplitOrderDetailItem]:
+        """미체결 분할주문 상세를 조회한다 (ka10088).
+
+        Args:
+            order_no: 주문번호.
+
+        Returns:
+            미체결 분할주문 상세 목록.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {"ord_no": order_no},
+            headers=self._headers("ka10088"),
+        ))
+        return _SCHEMAS["ka10088"].decode(raw)
+
+    # -----------------------------------------------------------------------
+    # ka10170 — 당일매매일지요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_trade_journal(
+        self,
+        single_stock_type: SingleStockType,
+        cash_credit_type: CashCreditType,
+        base_date: str = "",
+    ) -> DailyTradeJournal:
+        """당일매매일지를 조회한다 (ka10170).
+
+        Args:
+            single_stock_type: 단주구분.
+                ``"today_buy_sell"``: 당일매수에 대한 당일매도, ``"today_sell_all"``: 당일매도 전체.
+            cash_credit_type: 현금신용구분.
+                ``"all"``: 전체, ``"cash"``: 현금매매만, ``"credit"``: 신용매매만.
+            base_date: 기준일자 (``YYYYMMDD`` 형식).
+                공백이면 금일 데이터. 최근 2개월까지 제공.
+
+        Returns:
+            당일매매일지 ``DailyTradeJournal``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._ACNT_PATH,
+            {
+                "base_dt": base_date,
+                "ottks_tp": _SINGLE_STOCK_CODE[single_stock_type],
+                "ch_crd_tp": _CASH_CREDIT_CODE[cash_credit_type],
+            },
+            headers=self._headers("ka10170"),
+        ))
+        items = _SCHEMAS["ka10170"].decode(raw)
+        return DailyTradeJournal(
+            tot_sell_amt=raw.get("tot_sell_amt", ""),
+            tot_buy_amt=raw.get("tot_buy_amt", ""),
+            tot_cmsn_tax=raw.get("tot_cmsn_tax", ""),
+            tot_exct_amt=raw.get("tot_exct_amt", ""),
+            tot_pl_amt=raw.get("tot_pl_amt", ""),
+            tot_prft_rt=raw.get("tot_prft_rt", ""),
+            items=items,
+        )
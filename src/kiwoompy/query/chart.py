@@ -0,0 +1,992 @@
+"""차트 조회 — 주식·업종 틱/분/일/주/월/년봉과 투자자별 차트 (``chart``)."""
+
+from __future__ import annotations
+
+from kiwoompy.api import PageIterator
+from kiwoompy.models import (
+    ChartAdjustedPrice,
+    ChartAmtQtyType,
+    ChartMinScope,
+    ChartSectorMarket,
+    ChartTickScope,
+    ChartTradeType,
+    ChartUnitType,
+    InvestorChart,
+    InvestorChartItem,
+    IntraInvestorChart,
+    IntraInvestorChartItem,
+    SectorCandleItem,
+    SectorDayChart,
+    SectorDayChartItem,
+    SectorMinChart,
+    SectorMinChartItem,
+    SectorMonthChart,
+    SectorTickChart,
+    SectorWeekChart,
+    SectorYearChart,
+    StockCandleItem,
+    StockDayChart,
+    StockDayChartItem,
+    StockMinChart,
+    StockMinChartItem,
+    StockMonthChart,
+    StockMonthChartItem,
+    StockTickChart,
+    StockWeekChart,
+    StockWeekChartItem,
+    StockYearChart,
+    StockYearChartItem,
+)
+from kiwoompy.query._base import (
+    _CHART_ADJ_CODE,
+    _CHART_AMT_QTY_CODE,
+    _CHART_SECTOR_MARKET_CODE,
+    _CHART_TRADE_CODE,
+    _CHART_UNIT_CODE,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10079", _QueryBase._CHART_PATH, "stk_tic_chart_qry", StockCandleItem),
+    TrSchema("ka10080", _QueryBase._CHART_PATH, "stk_min_pole_chart_qry", StockMinChartItem),
+    TrSchema("ka10081", _QueryBase._CHART_PATH, "stk_dt_pole_chart_qry", StockDayChartItem),
+    TrSchema("ka10082", _QueryBase._CHART_PATH, "stk_stk_pole_chart_qry", StockWeekChartItem),
+    TrSchema("ka10083", _QueryBase._CHART_PATH, "stk_mth_pole_chart_qry", StockMonthChartItem),
+    TrSchema("ka10094", _QueryBase._CHART_PATH, "stk_yr_pole_chart_qry", StockYearChartItem),
+    TrSchema("ka10060", _QueryBase._CHART_PATH, "stk_invsr_orgn_chart", InvestorChartItem),
+    TrSchema("ka10064", _QueryBase._CHART_PATH, "opmr_invsr_trde_chart", IntraInvestorChartItem),
+    TrSchema("ka20004", _QueryBase._CHART_PATH, "inds_tic_chart_qry", SectorCandleItem),
+    TrSchema("ka20006", _QueryBase._CHART_PATH, "inds_dt_pole_qry", SectorDayChartItem),
+    TrSchema("ka20007", _QueryBase._CHART_PATH, "inds_stk_pole_qry", SectorDayChartItem),
+    TrSchema("ka20008", _QueryBase._CHART_PATH, "inds_mth_pole_qry", SectorDayChartItem),
+    TrSchema("ka20019", _QueryBase._CHART_PATH, "inds_yr_pole_qry", SectorDayChartItem),
+)
+
+
+class ChartQuery(_QueryBase):
+    """주식·업종 차트 조회 클라이언트.
+
+    ``KiwoomQuery.chart``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10079 — 주식틱차트조회요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_tick_chart(
+        self,
+        stock_code: str,
+        tick_scope: "ChartTickScope",
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+    ) -> StockTickChart:
+        """주식 틱 차트 데이터를 조회한다 (ka10079).
+
+        Args:
+            stock_code: 거래소별 종목코드 (예: ``"005930"``, ``"005930_NX"``).
+            tick_scope: 틱 범위 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"30"``).
+            adjusted: 수정주가 반영 여부 (``"adjusted"`` 반영 / ``"raw"`` 미반영).
+
+        Returns:
+            :class:`~kiwoompy.models.StockTickChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "stk_cd":        stock_code,
+                "tic_scope":     tick_scope,
+                "upd_stkpc_tp":  _CHART_ADJ_CODE[adjusted],
+            },
+            headers=self._headers("ka10079"),
+        ))
+        items = _SCHEMAS["ka10079"].decode(raw)
+        return StockTickChart(
+            stk_cd=raw.get("stk_cd", ""),
+            last_tic_cnt=raw.get("last_tic_cnt", ""),
+            items=items,
+        )
+
+    def iter_stock_tick_chart(
+        self,
+        stock_code: str,
+        tick_scope: "ChartTickScope",
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[StockCandleItem]:
+        """주식 틱 차트 데이터를 연속조회로 끝까지 순회한다 (ka10079).
+
+        ``get_stock_tick_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            stock_code: 거래소별 종목코드 (예: ``"005930"``, ``"005930_NX"``).
+            tick_scope: 틱 범위 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"30"``).
+            adjusted: 수정주가 반영 여부 (``"adjusted"`` 반영 / ``"raw"`` 미반영).
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``StockCandleItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka10079",
+            {
+                "stk_cd":        stock_code,
+                "tic_scope":     tick_scope,
+                "upd_stkpc_tp":  _CHART_ADJ_CODE[adjusted],
+            },
+            _SCHEMAS["ka10079"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10080 — 주식분봉차트조회요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_min_chart(
+        self,
+        stock_code: str,
+        min_scope: "ChartMinScope",
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+        base_date: str = "",
+    ) -> StockMinChart:
+        """주식 분봉 차트 데이터를 조회한다 (ka10080).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            min_scope: 분봉 범위 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"15"`` / ``"30"`` / ``"45"`` / ``"60"``).
+            adjusted: 수정주가 반영 여부.
+            base_date: 기준일자 (``"YYYYMMDD"``, 생략 시 최신).
+
+        Returns:
+            :class:`~kiwoompy.models.StockMinChart` 인스턴스.
+        """
+        body: dict = {
+            "stk_cd":       stock_code,
+            "tic_scope":    min_scope,
+            "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+        }
+        if base_date:
+            body["base_dt"] = base_date
+        raw = _check(self._post(
+            self._CHART_PATH,
+            body,
+            headers=self._headers("ka10080"),
+        ))
+        items = _SCHEMAS["ka10080"].decode(raw)
+        return StockMinChart(stk_cd=raw.get("stk_cd", ""), items=items)
+
+    def iter_stock_min_chart(
+        self,
+        stock_code: str,
+        min_scope: "ChartMinScope",
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+        base_date: str = "",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[StockMinChartItem]:
+        """주식 분봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka10080).
+
+        ``get_stock_min_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            min_scope: 분봉 범위 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"15"`` / ``"30"`` / ``"45"`` / ``"60"``).
+            adjusted: 수정주가 반영 여부.
+            base_date: 기준일자 (``"YYYYMMDD"``, 생략 시 최신).
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``StockMinChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        body: dict = {
+            "stk_cd":       stock_code,
+            "tic_scope":    min_scope,
+            "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+        }
+        if base_date:
+            body["base_dt"] = base_date
+        return self._paginate(
+            self._CHART_PATH,
+            "ka10080",
+            body,
+            _SCHEMAS["ka10080"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10081 — 주식일봉차트조회요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_day_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+    ) -> StockDayChart:
+        """주식 일봉 차트 데이터를 조회한다 (ka10081).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjusted: 수정주가 반영 여부.
+
+        Returns:
+            :class:`~kiwoompy.models.StockDayChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "stk_cd":       stock_code,
+                "base_dt":      base_date,
+                "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+            },
+            headers=self._headers("ka10081"),
+        ))
+        items = _SCHEMAS["ka10081"].decode(raw)
+        return StockDayChart(stk_cd=raw.get("stk_cd", ""), items=items)
+
+    def iter_stock_day_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[StockDayChartItem]:
+        """주식 일봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka10081).
+
+        ``get_stock_day_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjusted: 수정주가 반영 여부.
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``StockDayChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka10081",
+            {
+                "stk_cd":       stock_code,
+                "base_dt":      base_date,
+                "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+            },
+            _SCHEMAS["ka10081"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10082 — 주식주봉차트조회요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_week_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+    ) -> StockWeekChart:
+        """주식 주봉 차트 데이터를 조회한다 (ka10082).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjusted: 수정주가 반영 여부.
+
+        Returns:
+            :class:`~kiwoompy.models.StockWeekChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "stk_cd":       stock_code,
+                "base_dt":      base_date,
+                "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+            },
+            headers=self._headers("ka10082"),
+        ))
+        items = _SCHEMAS["ka10082"].decode(raw)
+        return StockWeekChart(stk_cd=raw.get("stk_cd", ""), items=items)
+
+    def iter_stock_week_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[StockWeekChartItem]:
+        """주식 주봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka10082).
+
+        ``get_stock_week_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjusted: 수정주가 반영 여부.
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``StockWeekChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka10082",
+            {
+                "stk_cd":       stock_code,
+                "base_dt":      base_date,
+                "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+            },
+            _SCHEMAS["ka10082"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10083 — 주식월봉차트조회요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_month_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+    ) -> StockMonthChart:
+        """주식 월봉 차트 데이터를 조회한다 (ka10083).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjusted: 수정주가 반영 여부.
+
+        Returns:
+            :class:`~kiwoompy.models.StockMonthChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "stk_cd":       stock_code,
+                "base_dt":      base_date,
+                "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+            },
+            headers=self._headers("ka10083"),
+        ))
+        items = _SCHEMAS["ka10083"].decode(raw)
+        return StockMonthChart(stk_cd=raw.get("stk_cd", ""), items=items)
+
+    def iter_stock_month_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[StockMonthChartItem]:
+        """주식 월봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka10083).
+
+        ``get_stock_month_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjusted: 수정주가 반영 여부.
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``StockMonthChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka10083",
+            {
+                "stk_cd":       stock_code,
+                "base_dt":      base_date,
+                "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+            },
+            _SCHEMAS["ka10083"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10094 — 주식년봉차트조회요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_year_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+    ) -> StockYearChart:
+        """주식 년봉 차트 데이터를 조회한다 (ka10094).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjusted: 수정주가 반영 여부.
+
+        Returns:
+            :class:`~kiwoompy.models.StockYearChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "stk_cd":       stock_code,
+                "base_dt":      base_date,
+                "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+            },
+            headers=self._headers("ka10094"),
+        ))
+        items = _SCHEMAS["ka10094"].decode(raw)
+        return StockYearChart(stk_cd=raw.get("stk_cd", ""), items=items)
+
+    def iter_stock_year_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: "ChartAdjustedPrice" = "adjusted",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[StockYearChartItem]:
+        """주식 년봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka10094).
+
+        ``get_stock_year_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjusted: 수정주가 반영 여부.
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``StockYearChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka10094",
+            {
+                "stk_cd":       stock_code,
+                "base_dt":      base_date,
+                "upd_stkpc_tp": _CHART_ADJ_CODE[adjusted],
+            },
+            _SCHEMAS["ka10094"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10060 — 종목별투자자기관별차트요청
+    # -----------------------------------------------------------------------
+
+    def get_investor_chart(
+        self,
+        date: str,
+        stock_code: str,
+        amt_qty_type: "ChartAmtQtyType",
+        trade_type: "ChartTradeType",
+        unit_type: "ChartUnitType",
+    ) -> InvestorChart:
+        """종목별 투자자기관별 차트 데이터를 조회한다 (ka10060).
+
+        Args:
+            date: 조회일자 (``"YYYYMMDD"``).
+            stock_code: 거래소별 종목코드.
+            amt_qty_type: 금액수량구분 (``"amount"`` 금액 / ``"qty"`` 수량).
+            trade_type: 매매구분 (``"net_buy"`` 순매수 / ``"buy"`` 매수 / ``"sell"`` 매도).
+            unit_type: 단위구분 (``"thousand"`` 천주 / ``"single"`` 단주).
+
+        Returns:
+            :class:`~kiwoompy.models.InvestorChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "dt":         date,
+                "stk_cd":     stock_code,
+                "amt_qty_tp": _CHART_AMT_QTY_CODE[amt_qty_type],
+                "trde_tp":    _CHART_TRADE_CODE[trade_type],
+                "unit_tp":    _CHART_UNIT_CODE[unit_type],
+            },
+            headers=self._headers("ka10060"),
+        ))
+        items = _SCHEMAS["ka10060"].decode(raw)
+        return InvestorChart(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10064 — 장중투자자별매매차트요청
+    # -----------------------------------------------------------------------
+
+    def get_intra_investor_chart(
+        self,
+        market: "ChartSectorMarket",
+        stock_code: str,
+        amt_qty_type: "ChartAmtQtyType",
+        trade_type: "ChartTradeType",
+    ) -> IntraInvestorChart:
+        """장중 투자자별 매매 차트 데이터를 조회한다 (ka10064).
+
+        Args:
+            market: 시장구분 (``"kospi"`` / ``"kosdaq"`` / ``"kospi200"``).
+            stock_code: 거래소별 종목코드.
+            amt_qty_type: 금액수량구분 (``"amount"`` 금액 / ``"qty"`` 수량).
+            trade_type: 매매구분 (``"net_buy"`` 순매수 / ``"buy"`` 매수 / ``"sell"`` 매도).
+
+        Returns:
+            :class:`~kiwoompy.models.IntraInvestorChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "mrkt_tp":    _CHART_SECTOR_MARKET_CODE[market],
+                "amt_qty_tp": _CHART_AMT_QTY_CODE[amt_qty_type],
+                "trde_tp":    _CHART_TRADE_CODE[trade_type],
+                "stk_cd":     stock_code,
+            },
+            headers=self._headers("ka10064"),
+        ))
+        items = _SCHEMAS["ka10064"].decode(raw)
+        return IntraInvestorChart(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka20004 — 업종틱차트조회요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_tick_chart(
+        self,
+        sector_code: str,
+        tick_scope: "ChartTickScope",
+    ) -> SectorTickChart:
+        """업종 틱 차트 데이터를 조회한다 (ka20004).
+
+        Args:
+            sector_code: 업종코드 (예: ``"001"`` 종합KOSPI, ``"101"`` 종합KOSDAQ).
+            tick_scope: 틱 범위 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"30"``).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorTickChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "inds_cd":   sector_code,
+                "tic_scope": tick_scope,
+            },
+            headers=self._headers("ka20004"),
+        ))
+        items = _SCHEMAS["ka20004"].decode(raw)
+        return SectorTickChart(inds_cd=raw.get("inds_cd", ""), items=items)
+
+    def iter_sector_tick_chart(
+        self,
+        sector_code: str,
+        tick_scope: "ChartTickScope",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[SectorCandleItem]:
+        """업종 틱 차트 데이터를 연속조회로 끝까지 순회한다 (ka20004).
+
+        ``get_sector_tick_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            sector_code: 업종코드 (예: ``"001"`` 종합KOSPI, ``"101"`` 종합KOSDAQ).
+            tick_scope: 틱 범위 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"30"``).
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``SectorCandleItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka20004",
+            {
+                "inds_cd":   sector_code,
+                "tic_scope": tick_scope,
+            },
+            _SCHEMAS["ka20004"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka20005 — 업종분봉조회요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_min_chart(
+        self,
+        sector_code: str,
+        min_scope: "ChartMinScope",
+        base_date: str = "",
+    ) -> SectorMinChart:
+        """업종 분봉 차트 데이터를 조회한다 (ka20005).
+
+        Args:
+            sector_code: 업종코드.
+            min_scope: 분봉 범위 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"15"`` / ``"30"`` / ``"45"`` / ``"60"``).
+            base_date: 기준일자 (``"YYYYMMDD"``, 생략 시 최신).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorMinChart` 인스턴스.
+        """
+        body: dict = {
+            "inds_cd":   sector_code,
+            "tic_scope": min_scope,
+        }
+        if base_date:
+            body["base_dt"] = base_date
+        raw = _check(self._post(
+            self._CHART_PATH,
+            body,
+            headers=self._headers("ka20005"),
+        ))
+        items = self._sector_min_chart_items(raw)
+        return SectorMinChart(inds_cd=raw.get("inds_cd", ""), items=items)
+
+    def iter_sector_min_chart(
+        self,
+        sector_code: str,
+        min_scope: "ChartMinScope",
+        base_date: str = "",
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[SectorMinChartItem]:
+        """업종 분봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka20005).
+
+        ``get_sector_min_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            sector_code: 업종코드.
+            min_scope: 분봉 범위 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"15"`` / ``"30"`` / ``"45"`` / ``"60"``).
+            base_date: 기준일자 (``"YYYYMMDD"``, 생략 시 최신).
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``SectorMinChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        body: dict = {
+            "inds_cd":   sector_code,
+            "tic_scope": min_scope,
+        }
+        if base_date:
+            body["base_dt"] = base_date
+        return self._paginate(
+            self._CHART_PATH,
+            "ka20005",
+            body,
+            self._sector_min_chart_items,
+            max_pages=max_pages,
+        )
+
+    @staticmethod
+    def _sector_min_chart_items(raw: dict) -> list[SectorMinChartItem]:
+        """ka20005 응답 페이지에서 ``SectorMinChartItem`` 목록을 만든다."""
+        return [
+            SectorMinChartItem(
+                cur_prc=item.get("cur_prc", ""),
+                trde_qty=item.get("trde_qty", ""),
+                cntr_tm=item.get("cntr_tm", item.get("dt", "")),
+                open_pric=item.get("open_pric", ""),
+                high_pric=item.get("high_pric", ""),
+                low_pric=item.get("low_pric", ""),
+                acc_trde_qty=item.get("acc_trde_qty", ""),
+                pred_pre=item.get("pred_pre", ""),
+                pred_pre_sig=item.get("pred_pre_sig", ""),
+            )
+            for item in raw.get("inds_min_pole_qry", [])
+        ]
+
+    # -----------------------------------------------------------------------
+    # ka20006 — 업종일봉조회요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_day_chart(
+        self,
+        sector_code: str,
+        base_date: str,
+    ) -> SectorDayChart:
+        """업종 일봉 차트 데이터를 조회한다 (ka20006).
+
+        Args:
+            sector_code: 업종코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorDayChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "inds_cd": sector_code,
+                "base_dt": base_date,
+            },
+            headers=self._headers("ka20006"),
+        ))
+        items = _SCHEMAS["ka20006"].decode(raw)
+        return SectorDayChart(inds_cd=raw.get("inds_cd", ""), items=items)
+
+    def iter_sector_day_chart(
+        self,
+        sector_code: str,
+        base_date: str,
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[SectorDayChartItem]:
+        """업종 일봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka20006).
+
+        ``get_sector_day_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            sector_code: 업종코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``SectorDayChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka20006",
+            {
+                "inds_cd": sector_code,
+                "base_dt": base_date,
+            },
+            _SCHEMAS["ka20006"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka20007 — 업종주봉조회요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_week_chart(
+        self,
+        sector_code: str,
+        base_date: str,
+    ) -> SectorWeekChart:
+        """업종 주봉 차트 데이터를 조회한다 (ka20007).
+
+        Args:
+            sector_code: 업종코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorWeekChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "inds_cd": sector_code,
+                "base_dt": base_date,
+            },
+            headers=self._headers("ka20007"),
+        ))
+        items = _SCHEMAS["ka20007"].decode(raw)
+        return SectorWeekChart(inds_cd=raw.get("inds_cd", ""), items=items)
+
+    def iter_sector_week_chart(
+        self,
+        sector_code: str,
+        base_date: str,
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[SectorDayChartItem]:
+        """업종 주봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka20007).
+
+        ``get_sector_week_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            sector_code: 업종코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``SectorDayChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka20007",
+            {
+                "inds_cd": sector_code,
+                "base_dt": base_date,
+            },
+            _SCHEMAS["ka20007"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka20008 — 업종월봉조회요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_month_chart(
+        self,
+        sector_code: str,
+        base_date: str,
+    ) -> SectorMonthChart:
+        """업종 월봉 차트 데이터를 조회한다 (ka20008).
+
+        Args:
+            sector_code: 업종코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorMonthChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "inds_cd": sector_code,
+                "base_dt": base_date,
+            },
+            headers=self._headers("ka20008"),
+        ))
+        items = _SCHEMAS["ka20008"].decode(raw)
+        return SectorMonthChart(inds_cd=raw.get("inds_cd", ""), items=items)
+
+    def iter_sector_month_chart(
+        self,
+        sector_code: str,
+        base_date: str,
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[SectorDayChartItem]:
+        """업종 월봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka20008).
+
+        ``get_sector_month_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            sector_code: 업종코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``SectorDayChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka20008",
+            {
+                "inds_cd": sector_code,
+                "base_dt": base_date,
+            },
+            _SCHEMAS["ka20008"].decode,
+            max_pages=max_pages,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka20019 — 업종년봉조회요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_year_chart(
+        self,
+        sector_code: str,
+        base_date: str,
+    ) -> SectorYearChart:
+        """업종 년봉 차트 데이터를 조회한다 (ka20019).
+
+        Args:
+            sector_code: 업종코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorYearChart` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {
+                "inds_cd": sector_code,
+                "base_dt": base_date,
+            },
+            headers=self._headers("ka20019"),
+        ))
+        items = _SCHEMAS["ka20019"].decode(raw)
+        return SectorYearChart(inds_cd=raw.get("inds_cd", ""), items=items)
+
+    def iter_sector_year_chart(
+        self,
+        sector_code: str,
+        base_date: str,
+        *,
+        max_pages: int | None = None,
+    ) -> PageIterator[SectorDayChartItem]:
+        """업종 년봉 차트 데이터를 연속조회로 끝까지 순회한다 (ka20019).
+
+        ``get_sector_year_chart()``와 인자가 같으며, 응답 헤더의 ``cont-yn``/``next-key``를 따라
+        다음 페이지를 요청하면서 항목을 하나씩 내놓는다.
+
+        Args:
+            sector_code: 업종코드.
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            max_pages: 최대 요청 페이지 수. ``None``이면 마지막 페이지까지.
+
+        Returns:
+            ``SectorDayChartItem``을 내놓는 ``PageIterator``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        return self._paginate(
+            self._CHART_PATH,
+            "ka20019",
+            {
+                "inds_cd": sector_code,
+                "base_dt": base_date,
+            },
+            _SCHEMAS["ka20019"].decode,
+            max_pages=max_pages,
+        )
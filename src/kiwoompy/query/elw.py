@@ -0,0 +1,464 @@
+"""ELW 조회 — 민감도·가격급등락·거래원·LP·종목정보 (``elw``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    ElwAccessRate,
+    ElwAccessRateItem,
+    ElwBalRank,
+    ElwBalRankItem,
+    ElwBrokerNetTrade,
+    ElwBrokerNetTradeItem,
+    ElwDailySens,
+    ElwDailySensItem,
+    ElwDetail,
+    ElwFlucRank,
+    ElwFlucRankItem,
+    ElwFlucType,
+    ElwGap,
+    ElwGapItem,
+    ElwLpDaily,
+    ElwLpDailyItem,
+    ElwPriceSurge,
+    ElwPriceSurgeItem,
+    ElwRightType,
+    ElwSearch,
+    ElwSearchItem,
+    ElwSens,
+    ElwSensItem,
+    ElwSortType,
+)
+from kiwoompy.query._base import (
+    _ELW_FLUC_CODE,
+    _ELW_RIGHT_CODE,
+    _ELW_SORT_CODE,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10048", _QueryBase._ELW_PATH, "elwdaly_snst_ix", ElwDailySensItem),
+    TrSchema("ka10050", _QueryBase._ELW_PATH, "elwsnst_ix_array", ElwSensItem),
+    TrSchema("ka30001", _QueryBase._ELW_PATH, "elwpric_jmpflu", ElwPriceSurgeItem),
+    TrSchema("ka30002", _QueryBase._ELW_PATH, "trde_ori_elwnettrde_upper", ElwBrokerNetTradeItem),
+    TrSchema("ka30003", _QueryBase._ELW_PATH, "elwlpposs_daly_trnsn", ElwLpDailyItem),
+    TrSchema("ka30004", _QueryBase._ELW_PATH, "elwdispty_rt", ElwGapItem),
+    TrSchema("ka30005", _QueryBase._ELW_PATH, "elwcnd_qry", ElwSearchItem),
+    TrSchema("ka30009", _QueryBase._ELW_PATH, "elwflu_rt_rank", ElwFlucRankItem),
+    TrSchema("ka30010", _QueryBase._ELW_PATH, "elwreq_rank", ElwBalRankItem),
+    TrSchema("ka30011", _QueryBase._ELW_PATH, "elwalacc_rt", ElwAccessRateItem),
+)
+
+
+class ElwQuery(_QueryBase):
+    """ELW 조회 클라이언트.
+
+    ``KiwoomQuery.elw``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10048 — ELW일별민감도지표요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_daily_sens(self, stock_code: str) -> ElwDailySens:
+        """ELW 일별 민감도 지표를 조회한다 (ka10048).
+
+        Args:
+            stock_code: ELW 종목코드 (예: ``"57JBHH"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwDailySens` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10048"),
+        ))
+        items = _SCHEMAS["ka10048"].decode(raw)
+        return ElwDailySens(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10050 — ELW민감도지표요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_sens(self, stock_code: str) -> ElwSens:
+        """ELW 민감도 지표를 조회한다 (ka10050).
+
+        Args:
+            stock_code: ELW 종목코드 (예: ``"57JBHH"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwSens` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10050"),
+        ))
+        items = _SCHEMAS["ka10050"].decode(raw)
+        return ElwSens(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka30001 — ELW가격급등락요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_price_surge(
+        self,
+        fluc_type: "ElwFlucType",
+        time_type: str,
+        time: str,
+        volume_type: str,
+        issuer_code: str,
+        base_asset_code: str,
+        right_type: "ElwRightType",
+        lp_code: str,
+        exclude_ended: str,
+    ) -> ElwPriceSurge:
+        """ELW 가격급등락 종목을 조회한다 (ka30001).
+
+        Args:
+            fluc_type: 등락구분 (``"surge"`` / ``"plunge"``).
+            time_type: 시간구분 (``"1"``분전 / ``"2"``일전).
+            time: 시간 (분 또는 일, 예: ``"5"``).
+            volume_type: 거래량구분 (``"0"``전체 / ``"10"``만주이상 등).
+            issuer_code: 발행사코드 12자리 (전체: ``"000000000000"``).
+            base_asset_code: 기초자산코드 12자리 (전체: ``"000000000000"``).
+            right_type: 권리구분 (``"all"`` / ``"call"`` / ``"put"`` 등).
+            lp_code: LP코드 12자리 (전체: ``"000000000000"``).
+            exclude_ended: 거래종료ELW제외 (``"0"``포함 / ``"1"``제외).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwPriceSurge` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {
+                "flu_tp":           _ELW_FLUC_CODE[fluc_type],
+                "tm_tp":            time_type,
+                "tm":               time,
+                "trde_qty_tp":      volume_type,
+                "isscomp_cd":       issuer_code,
+                "bsis_aset_cd":     base_asset_code,
+                "rght_tp":          _ELW_RIGHT_CODE[right_type],
+                "lpcd":             lp_code,
+                "trde_end_elwskip": exclude_ended,
+            },
+            headers=self._headers("ka30001"),
+        ))
+        items = _SCHEMAS["ka30001"].decode(raw)
+        return ElwPriceSurge(
+            base_pric_tm=raw.get("base_pric_tm", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka30002 — 거래원별ELW순매매상위요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_broker_net_trade(
+        self,
+        issuer_code: str,
+        volume_type: str,
+        trade_type: str,
+        duration: str,
+        exclude_ended: str,
+    ) -> ElwBrokerNetTrade:
+        """거래원별 ELW 순매매 상위 종목을 조회한다 (ka30002).
+
+        Args:
+            issuer_code: 발행사코드 3자리 (예: ``"003"``한국투자증권).
+            volume_type: 거래량구분 (``"0"``전체 / ``"5"``5천주 / ``"10"``만주 등).
+            trade_type: 매매구분 (``"1"``순매수 / ``"2"``순매도).
+            duration: 기간 (``"1"``전일 / ``"5"``5일 / ``"10"``10일 / ``"40"``40일 / ``"60"``60일).
+            exclude_ended: 거래종료ELW제외 (``"0"``포함 / ``"1"``제외).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwBrokerNetTrade` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {
+                "isscomp_cd":       issuer_code,
+                "trde_qty_tp":      volume_type,
+                "trde_tp":          trade_type,
+                "dt":               duration,
+                "trde_end_elwskip": exclude_ended,
+            },
+            headers=self._headers("ka30002"),
+        ))
+        items = _SCHEMAS["ka30002"].decode(raw)
+        return ElwBrokerNetTrade(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka30003 — ELWLP보유일별추이요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_lp_daily(self, base_asset_code: str, base_date: str) -> ElwLpDaily:
+        """ELW LP 보유 일별 추이를 조회한다 (ka30003).
+
+        Args:
+            base_asset_code: 기초자산코드 (예: ``"57KJ99"``).
+            base_date: 기준일자 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwLpDaily` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {
+                "bsis_aset_cd": base_asset_code,
+                "base_dt":      base_date,
+            },
+            headers=self._headers("ka30003"),
+        ))
+        items = _SCHEMAS["ka30003"].decode(raw)
+        return ElwLpDaily(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka30004 — ELW괴리율요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_gap(
+        self,
+        issuer_code: str,
+        base_asset_code: str,
+        right_type: "ElwRightType",
+        lp_code: str,
+        exclude_ended: str,
+    ) -> ElwGap:
+        """ELW 괴리율을 조회한다 (ka30004).
+
+        Args:
+            issuer_code: 발행사코드 12자리 (전체: ``"000000000000"``).
+            base_asset_code: 기초자산코드 12자리 (전체: ``"000000000000"``).
+            right_type: 권리구분 (``"all"`` / ``"call"`` / ``"put"`` 등).
+            lp_code: LP코드 12자리 (전체: ``"000000000000"``).
+            exclude_ended: 거래종료ELW제외 (``"1"``제외 / ``"0"``포함).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwGap` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {
+                "isscomp_cd":       issuer_code,
+                "bsis_aset_cd":     base_asset_code,
+                "rght_tp":          _ELW_RIGHT_CODE[right_type],
+                "lpcd":             lp_code,
+                "trde_end_elwskip": exclude_ended,
+            },
+            headers=self._headers("ka30004"),
+        ))
+        items = _SCHEMAS["ka30004"].decode(raw)
+        return ElwGap(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka30005 — ELW조건검색요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_search(
+        self,
+        issuer_code: str,
+        base_asset_code: str,
+        right_type: "ElwRightType",
+        lp_code: str,
+        sort_type: "ElwSortType",
+    ) -> ElwSearch:
+        """ELW 조건검색을 수행한다 (ka30005).
+
+        Args:
+            issuer_code: 발행사코드 12자리 (전체: ``"000000000000"``).
+            base_asset_code: 기초자산코드 12자리 (전체: ``"000000000000"``).
+            right_type: 권리구분 (``"all"`` / ``"call"`` / ``"put"`` 등).
+            lp_code: LP코드 12자리 (전체: ``"000000000000"``).
+            sort_type: 정렬구분 (``"rise_rate"`` / ``"volume"`` 등).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwSearch` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {
+                "isscomp_cd":   issuer_code,
+                "bsis_aset_cd": base_asset_code,
+                "rght_tp":      _ELW_RIGHT_CODE[right_type][0],  # 단자리
+                "lpcd":         lp_code,
+                "sort_tp":      _ELW_SORT_CODE[sort_type],
+            },
+            headers=self._headers("ka30005"),
+        ))
+        items = _SCHEMAS["ka30005"].decode(raw)
+        return ElwSearch(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka30009 — ELW등락율순위요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_fluc_rank(
+        self,
+        sort_type: "ElwSortType",
+        right_type: "ElwRightType",
+        exclude_ended: str,
+    ) -> ElwFlucRank:
+        """ELW 등락율 순위를 조회한다 (ka30009).
+
+        Args:
+            sort_type: 정렬구분 (``"rise_rate"`` / ``"rise_gap"`` / ``"fall_rate"`` / ``"fall_gap"``).
+            right_type: 권리구분 (``"all"`` / ``"call"`` / ``"put"`` 등).
+            exclude_ended: 거래종료제외 (``"1"``제외 / ``"0"``포함).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwFlucRank` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {
+                "sort_tp":       _ELW_SORT_CODE[sort_type],
+                "rght_tp":       _ELW_RIGHT_CODE[right_type],
+                "trde_end_skip": exclude_ended,
+            },
+            headers=self._headers("ka30009"),
+        ))
+        items = _SCHEMAS["ka30009"].decode(raw)
+        return ElwFlucRank(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka30010 — ELW잔량순위요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_bal_rank(
+        self,
+        sort_type: str,
+        right_type: "ElwRightType",
+        exclude_ended: str,
+    ) -> ElwBalRank:
+        """ELW 잔량 순위를 조회한다 (ka30010).
+
+        Args:
+            sort_type: 정렬구분 (``"1"``순매수잔량상위 / ``"2"``순매도잔량상위).
+            right_type: 권리구분 (``"all"`` / ``"call"`` / ``"put"`` 등).
+            exclude_ended: 거래종료제외 (``"1"``제외 / ``"0"``포함).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwBalRank` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {
+                "sort_tp":       sort_type,
+                "rght_tp":       _ELW_RIGHT_CODE[right_type],
+                "trde_end_skip": exclude_ended,
+            },
+            headers=self._headers("ka30010"),
+        ))
+        items = _SCHEMAS["ka30010"].decode(raw)
+        return ElwBalRank(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka30011 — ELW근접율요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_access_rate(self, stock_code: str) -> ElwAccessRate:
+        """ELW 근접율을 조회한다 (ka30011).
+
+        Args:
+            stock_code: ELW 종목코드 (예: ``"57JBHH"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwAccessRate` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka30011"),
+        ))
+        items = _SCHEMAS["ka30011"].decode(raw)
+        return ElwAccessRate(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka30012 — ELW종목상세정보요청
+    # -----------------------------------------------------------------------
+
+    def get_elw_detail(self, stock_code: str) -> ElwDetail:
+        """ELW 종목 상세 정보를 조회한다 (ka30012).
+
+        Args:
+            stock_code: ELW 종목코드 (예: ``"57JBHH"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ElwDetail` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ELW_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka30012"),
+        ))
+        return ElwDetail(
+            aset_cd=raw.get("aset_cd", ""),
+            cur_prc=raw.get("cur_prc", ""),
+            pred_pre_sig=raw.get("pred_pre_sig", ""),
+            pred_pre=raw.get("pred_pre", ""),
+            flu_rt=raw.get("flu_rt", ""),
+            lpmmcm_nm=raw.get("lpmmcm_nm", ""),
+            lpmmcm_nm_1=raw.get("lpmmcm_nm_1", ""),
+            lpmmcm_nm_2=raw.get("lpmmcm_nm_2", ""),
+            elwrght_cntn=raw.get("elwrght_cntn", ""),
+            elwexpr_evlt_pric=raw.get("elwexpr_evlt_pric", ""),
+            elwtheory_pric=raw.get("elwtheory_pric", ""),
+            dispty_rt=raw.get("dispty_rt", ""),
+            elwinnr_vltl=raw.get("elwinnr_vltl", ""),
+            exp_rght_pric=raw.get("exp_rght_pric", ""),
+            elwpl_qutr_rt=raw.get("elwpl_qutr_rt", ""),
+            elwexec_pric=raw.get("elwexec_pric", ""),
+            elwcnvt_rt=raw.get("elwcnvt_rt", ""),
+            elwcmpn_rt=raw.get("elwcmpn_rt", ""),
+            elwpric_rising_part_rt=raw.get("elwpric_rising_part_rt", ""),
+            elwrght_type=raw.get("elwrght_type", ""),
+            elwsrvive_dys=raw.get("elwsrvive_dys", ""),
+            stkcnt=raw.get("stkcnt", ""),
+            elwlpord_pos=raw.get("elwlpord_pos", ""),
+            lpposs_rt=raw.get("lpposs_rt", ""),
+            lprmnd_qty=raw.get("lprmnd_qty", ""),
+            elwspread=raw.get("elwspread", ""),
+            elwprty=raw.get("elwprty", ""),
+            elwgear=raw.get("elwgear", ""),
+            elwflo_dt=raw.get("elwflo_dt", ""),
+            elwfin_trde_dt=raw.get("elwfin_trde_dt", ""),
+            expr_dt=raw.get("expr_dt", ""),
+            exec_dt=raw.get("exec_dt", ""),
+            lpsuply_end_dt=raw.get("lpsuply_end_dt", ""),
+            elwpay_dt=raw.get("elwpay_dt", ""),
+            elwinvt_ix_comput=raw.get("elwinvt_ix_comput", ""),
+            elwpay_agnt=raw.get("elwpay_agnt", ""),
+            elwappr_way=raw.get("elwappr_way", ""),
+            elwrght_exec_way=raw.get("elwrght_exec_way", ""),
+            elwpblicte_orgn=raw.get("elwpblicte_orgn", ""),
+            dcsn_pay_amt=raw.get("dcsn_pay_amt", ""),
+            kobarr=raw.get("kobarr", ""),
+            iv=raw.get("iv", ""),
+            clsprd_end_elwocr=raw.get("clsprd_end_elwocr", ""),
+            bsis_aset_1=raw.get("bsis_aset_1", ""),
+            bsis_aset_comp_rt_1=raw.get("bsis_aset_comp_rt_1", ""),
+            bsis_aset_2=raw.get("bsis_aset_2", ""),
+            bsis_aset_comp_rt_2=raw.get("bsis_aset_comp_rt_2", ""),
+            bsis_aset_3=raw.get("bsis_aset_3", ""),
+            bsis_aset_comp_rt_3=raw.get("bsis_aset_comp_rt_3", ""),
+            bsis_aset_4=raw.get("bsis_aset_4", ""),
+            bsis_aset_comp_rt_4=raw.get("bsis_aset_comp_rt_4", ""),
+            bsis_aset_5=raw.get("bsis_aset_5", ""),
+            bsis_aset_comp_rt_5=raw.get("bsis_aset_comp_rt_5", ""),
+            fr_dt=raw.get("fr_dt", ""),
+            to_dt=raw.get("to_dt", ""),
+            fr_tm=raw.get("fr_tm", ""),
+            evlt_end_tm=raw.get("evlt_end_tm", ""),
+            evlt_pric=raw.get("evlt_pric", ""),
+            evlt_fnsh_yn=raw.get("evlt_fnsh_yn", ""),
+            all_hgst_pric=raw.get("all_hgst_pric", ""),
+            all_lwst_pric=raw.get("all_lwst_pric", ""),
+            imaf_hgst_pric=raw.get("imaf_hgst_pric", ""),
+            imaf_lwst_pric=raw.get("imaf_lwst_pric", ""),
+            sndhalf_mrkt_hgst_pric=raw.get("sndhalf_mrkt_hgst_pric", ""),
+            sndhalf_mrkt_lwst_pric=raw.get("sndhalf_mrkt_lwst_pric", ""),
+        )
@@ -0,0 +1,299 @@
+"""ETF 조회 — 수익율·종목정보·시세·일별/시간대별 추이 (``etf``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    EtfAllQuote,
+    EtfAllQuoteItem,
+    EtfDailyFill,
+    EtfDailyFillItem,
+    EtfDailyTrend,
+    EtfDailyTrendItem,
+    EtfDuration,
+    EtfInfo,
+    EtfNav,
+    EtfNavItem,
+    EtfReturn,
+    EtfReturnItem,
+    EtfTimeFill,
+    EtfTimeFillItem,
+    EtfTimeTrend,
+    EtfTimeTrendItem,
+    EtfTimeTrend2,
+    EtfTimeTrend2Item,
+)
+from kiwoompy.query._base import (
+    _ETF_DURATION_CODE,
+    _EXCHANGE_CODE,
+    ExchangeType,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka40001", _QueryBase._ETF_PATH, "etfprft_rt_lst", EtfReturnItem),
+    TrSchema("ka40003", _QueryBase._ETF_PATH, "etfdaly_trnsn", EtfDailyTrendItem),
+    TrSchema("ka40004", _QueryBase._ETF_PATH, "etfall_mrpr", EtfAllQuoteItem),
+    TrSchema("ka40006", _QueryBase._ETF_PATH, "etftisl_trnsn", EtfTimeTrendItem),
+    TrSchema("ka40007", _QueryBase._ETF_PATH, "etftisl_cntr_array", EtfTimeFillItem),
+    TrSchema("ka40008", _QueryBase._ETF_PATH, "etfnetprps_qty_array", EtfDailyFillItem),
+    TrSchema("ka40009", _QueryBase._ETF_PATH, "etfnavarray", EtfNavItem),
+    TrSchema("ka40010", _QueryBase._ETF_PATH, "etftisl_trnsn", EtfTimeTrend2Item),
+)
+
+
+class EtfQuery(_QueryBase):
+    """ETF 조회 클라이언트.
+
+    ``KiwoomQuery.etf``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka40001 — ETF수익율요청
+    # -----------------------------------------------------------------------
+
+    def get_etf_return(
+        self,
+        stock_code: str,
+        index_code: str,
+        duration: "EtfDuration",
+    ) -> EtfReturn:
+        """ETF 수익율을 조회한다 (ka40001).
+
+        Args:
+            stock_code: ETF 종목코드 (예: ``"069500"``).
+            index_code: ETF 대상지수코드 (예: ``"207"``).
+            duration: 기간 (``"1w"`` / ``"1m"`` / ``"6m"`` / ``"1y"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfReturn` 인스턴스.
+        """
+        from kiwoompy.models import EtfDuration  # noqa: F401
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {
+                "stk_cd":          stock_code,
+                "etfobjt_idex_cd": index_code,
+                "dt":              _ETF_DURATION_CODE[duration],
+            },
+            headers=self._headers("ka40001"),
+        ))
+        items = _SCHEMAS["ka40001"].decode(raw)
+        return EtfReturn(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka40002 — ETF종목정보요청
+    # -----------------------------------------------------------------------
+
+    def get_etf_info(self, stock_code: str) -> EtfInfo:
+        """ETF 종목 기본정보를 조회한다 (ka40002).
+
+        Args:
+            stock_code: ETF 종목코드 (예: ``"069500"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfInfo` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka40002"),
+        ))
+        return EtfInfo(
+            stk_nm=raw.get("stk_nm", ""),
+            etfobjt_idex_nm=raw.get("etfobjt_idex_nm", ""),
+            wonju_pric=raw.get("wonju_pric", ""),
+            etftxon_type=raw.get("etftxon_type", ""),
+            etntxon_type=raw.get("etntxon_type", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka40003 — ETF일별추이요청
+    # -----------------------------------------------------------------------
+
+    def get_etf_daily_trend(self, stock_code: str) -> EtfDailyTrend:
+        """ETF 일별 추이를 조회한다 (ka40003).
+
+        Args:
+            stock_code: ETF 종목코드 (예: ``"069500"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfDailyTrend` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka40003"),
+        ))
+        items = _SCHEMAS["ka40003"].decode(raw)
+        return EtfDailyTrend(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka40004 — ETF전체시세요청
+    # -----------------------------------------------------------------------
+
+    def get_etf_all_quote(
+        self,
+        tax_type: str,
+        nav_compare: str,
+        asset_manager: str,
+        tax_yn: str,
+        tracking_index: str,
+        exchange: "ExchangeType",
+    ) -> EtfAllQuote:
+        """ETF 전체 시세를 조회한다 (ka40004).
+
+        Args:
+            tax_type: 과세유형 (``"0"``전체 / ``"1"``비과세 / ``"2"``보유기간과세 / ``"3"``회사형 / ``"4"``외국 / ``"5"``비과세해외).
+            nav_compare: NAV대비 (``"0"``전체 / ``"1"``NAV>전일종가 / ``"2"``NAV<전일종가).
+            asset_manager: 운용사코드 (``"0000"``전체 / ``"3020"``KODEX 등).
+            tax_yn: 과세여부 (``"0"``전체 / ``"1"``과세 / ``"2"``비과세).
+            tracking_index: 추적지수 (``"0"``전체).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfAllQuote` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {
+                "txon_type":  tax_type,
+                "navpre":     nav_compare,
+                "mngmcomp":   asset_manager,
+                "txon_yn":    tax_yn,
+                "trace_idex": tracking_index,
+                "stex_tp":    _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka40004"),
+        ))
+        items = _SCHEMAS["ka40004"].decode(raw)
+        return EtfAllQuote(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka40006 — ETF시간대별추이요청
+    # -----------------------------------------------------------------------
+
+    def get_etf_time_trend(self, stock_code: str) -> EtfTimeTrend:
+        """ETF 시간대별 추이를 조회한다 (ka40006).
+
+        Args:
+            stock_code: ETF 종목코드 (예: ``"069500"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfTimeTrend` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka40006"),
+        ))
+        items = _SCHEMAS["ka40006"].decode(raw)
+        return EtfTimeTrend(
+            stk_nm=raw.get("stk_nm", ""),
+            etfobjt_idex_nm=raw.get("etfobjt_idex_nm", ""),
+            wonju_pric=raw.get("wonju_pric", ""),
+            etftxon_type=raw.get("etftxon_type", ""),
+            etntxon_type=raw.get("etntxon_type", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka40007 — ETF시간대별체결요청
+    # -----------------------------------------------------------------------
+
+    def get_etf_time_fill(self, stock_code: str) -> EtfTimeFill:
+        """ETF 시간대별 체결을 조회한다 (ka40007).
+
+        Args:
+            stock_code: ETF 종목코드 (예: ``"069500"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfTimeFill` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka40007"),
+        ))
+        items = _SCHEMAS["ka40007"].decode(raw)
+        return EtfTimeFill(
+            stk_cls=raw.get("stk_cls", ""),
+            stk_nm=raw.get("stk_nm", ""),
+            etfobjt_idex_nm=raw.get("etfobjt_idex_nm", ""),
+            etfobjt_idex_cd=raw.get("etfobjt_idex_cd", ""),
+            objt_idex_pre_rt=raw.get("objt_idex_pre_rt", ""),
+            wonju_pric=raw.get("wonju_pric", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka40008 — ETF일자별체결요청
+    # -----------------------------------------------------------------------
+
+    def get_etf_daily_fill(self, stock_code: str) -> EtfDailyFill:
+        """ETF 일자별 체결을 조회한다 (ka40008).
+
+        Args:
+            stock_code: ETF 종목코드 (예: ``"069500"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfDailyFill` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka40008"),
+        ))
+        items = _SCHEMAS["ka40008"].decode(raw)
+        return EtfDailyFill(
+            cntr_tm=raw.get("cntr_tm", ""),
+            cur_prc=raw.get("cur_prc", ""),
+            pre_sig=raw.get("pre_sig", ""),
+            pred_pre=raw.get("pred_pre", ""),
+            trde_qty=raw.get("trde_qty", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka40009 — ETF시간대별체결요청 (NAV)
+    # -----------------------------------------------------------------------
+
+    def get_etf_nav(self, stock_code: str) -> EtfNav:
+        """ETF NAV 데이터를 조회한다 (ka40009).
+
+        Args:
+            stock_code: ETF 종목코드 (예: ``"069500"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfNav` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka40009"),
+        ))
+        items = _SCHEMAS["ka40009"].decode(raw)
+        return EtfNav(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka40010 — ETF시간대별추이요청 (외인순매수)
+    # -----------------------------------------------------------------------
+
+    def get_etf_time_trend2(self, stock_code: str) -> EtfTimeTrend2:
+        """ETF 시간대별 추이(외인순매수 포함)를 조회한다 (ka40010).
+
+        Args:
+            stock_code: ETF 종목코드 (예: ``"069500"``).
+
+        Returns:
+            :class:`~kiwoompy.models.EtfTimeTrend2` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._ETF_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka40010"),
+        ))
+        items = _SCHEMAS["ka40010"].decode(raw)
+        return EtfTimeTrend2(items=items)
@@ -0,0 +1,406 @@
+"""금현물 조회 — 체결·일별·호가·차트·투자자 (``ka50xxx``/``ka52xxx``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    GoldBid,
+    GoldBidItem,
+    GoldContractTrend,
+    GoldContractTrendItem,
+    GoldDailyChart,
+    GoldDailyChartItem,
+    GoldDailyMinuteChart,
+    GoldDailyMinuteChartItem,
+    GoldDailyTickChart,
+    GoldDailyTickChartItem,
+    GoldDailyTrend,
+    GoldDailyTrendItem,
+    GoldExpectedContract,
+    GoldExpectedContractItem,
+    GoldInvestorStatus,
+    GoldInvestorStatusItem,
+    GoldMarketInfo,
+    GoldMinuteChart,
+    GoldMinuteChartItem,
+    GoldMonthlyChart,
+    GoldMonthlyChartItem,
+    GoldStockCode,
+    GoldTickChart,
+    GoldTickChartItem,
+    GoldWeeklyChart,
+    GoldWeeklyChartItem,
+)
+from kiwoompy.query._base import _QueryBase, _check
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka50010", _QueryBase._MRKCOND_PATH, "gold_cntr", GoldContractTrendItem),
+    TrSchema("ka50012", _QueryBase._MRKCOND_PATH, "gold_daly_trnsn", GoldDailyTrendItem),
+    TrSchema("ka50087", _QueryBase._MRKCOND_PATH, "gold_expt_exec", GoldExpectedContractItem),
+    TrSchema("ka50101", _QueryBase._MRKCOND_PATH, "gold_bid", GoldBidItem),
+    TrSchema("ka52301", _QueryBase._FRGNISTT_PATH, "inve_trad_stat", GoldInvestorStatusItem),
+    TrSchema("ka50079", _QueryBase._CHART_PATH, "gds_tic_chart_qry", GoldTickChartItem),
+    TrSchema("ka50080", _QueryBase._CHART_PATH, "gds_min_chart_qry", GoldMinuteChartItem),
+    TrSchema("ka50081", _QueryBase._CHART_PATH, "gds_day_chart_qry", GoldDailyChartItem),
+    TrSchema("ka50082", _QueryBase._CHART_PATH, "gds_week_chart_qry", GoldWeeklyChartItem),
+    TrSchema("ka50083", _QueryBase._CHART_PATH, "gds_month_chart_qry", GoldMonthlyChartItem),
+    TrSchema("ka50091", _QueryBase._CHART_PATH, "gds_tic_chart_qry", GoldDailyTickChartItem),
+    TrSchema("ka50092", _QueryBase._CHART_PATH, "gds_min_chart_qry", GoldDailyMinuteChartItem),
+)
+
+
+class GoldQuery(_QueryBase):
+    """금현물 조회 클라이언트.
+
+    ``KiwoomQuery.gold``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    def gold_contract_trend(self, stock_code: GoldStockCode) -> GoldContractTrend:
+        """금현물체결추이를 조회한다 (ka50010).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+
+        Returns:
+            :class:`~kiwoompy.models.GoldContractTrend` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka50010"),
+        ))
+        items = _SCHEMAS["ka50010"].decode(raw)
+        return GoldContractTrend(items=items)
+
+    def gold_daily_trend(
+        self,
+        stock_code: GoldStockCode,
+        base_date: str,
+    ) -> GoldDailyTrend:
+        """금현물일별추이를 조회한다 (ka50012).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            base_date: 기준일자 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.GoldDailyTrend` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code, "base_dt": base_date},
+            headers=self._headers("ka50012"),
+        ))
+        items = _SCHEMAS["ka50012"].decode(raw)
+        return GoldDailyTrend(items=items)
+
+    def gold_expected_contract(self, stock_code: GoldStockCode) -> GoldExpectedContract:
+        """금현물예상체결을 조회한다 (ka50087).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+
+        Returns:
+            :class:`~kiwoompy.models.GoldExpectedContract` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka50087"),
+        ))
+        items = _SCHEMAS["ka50087"].decode(raw)
+        return GoldExpectedContract(items=items)
+
+    def gold_market_info(self, stock_code: GoldStockCode) -> GoldMarketInfo:
+        """금현물 시세정보를 조회한다 (ka50100).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+
+        Returns:
+            :class:`~kiwoompy.models.GoldMarketInfo` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka50100"),
+        ))
+        return GoldMarketInfo(
+            pred_pre_sig=raw.get("pred_pre_sig", ""),
+            pred_pre=raw.get("pred_pre", ""),
+            flu_rt=raw.get("flu_rt", ""),
+            trde_qty=raw.get("trde_qty", ""),
+            open_pric=raw.get("open_pric", ""),
+            high_pric=raw.get("high_pric", ""),
+            low_pric=raw.get("low_pric", ""),
+            pred_rt=raw.get("pred_rt", ""),
+            upl_pric=raw.get("upl_pric", ""),
+            lst_pric=raw.get("lst_pric", ""),
+            pred_close_pric=raw.get("pred_close_pric", ""),
+        )
+
+    def gold_bid(
+        self,
+        stock_code: GoldStockCode,
+        tick_scope: str,
+    ) -> GoldBid:
+        """금현물 호가를 조회한다 (ka50101).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            tick_scope: 틱범위. ``"1"``:1틱, ``"3"``:3틱, ``"5"``:5틱, ``"10"``:10틱, ``"30"``:30틱.
+
+        Returns:
+            :class:`~kiwoompy.models.GoldBid` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code, "tic_scope": tick_scope},
+            headers=self._headers("ka50101"),
+        ))
+        items = _SCHEMAS["ka50101"].decode(raw)
+        return GoldBid(items=items)
+
+    def gold_investor_status(self) -> GoldInvestorStatus:
+        """금현물투자자현황을 조회한다 (ka52301).
+
+        Returns:
+            :class:`~kiwoompy.models.GoldInvestorStatus` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._FRGNISTT_PATH,
+            {},
+            headers=self._headers("ka52301"),
+        ))
+        items = _SCHEMAS["ka52301"].decode(raw)
+        return GoldInvestorStatus(items=items)
+
+    def gold_tick_chart(
+        self,
+        stock_code: GoldStockCode,
+        tick_scope: str,
+        adjust_price: str = "1",
+    ) -> GoldTickChart:
+        """금현물틱차트를 조회한다 (ka50079).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            tick_scope: 틱범위. ``"1"``:1틱, ``"3"``:3틱, ``"5"``:5틱, ``"10"``:10틱, ``"30"``:30틱.
+            adjust_price: 수정주가구분. ``"0"`` 또는 ``"1"``. 기본값 ``"1"``.
+
+        Returns:
+            :class:`~kiwoompy.models.GoldTickChart` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {"stk_cd": stock_code, "tic_scope": tick_scope, "upd_stkpc_tp": adjust_price},
+            headers=self._headers("ka50079"),
+        ))
+        items = _SCHEMAS["ka50079"].decode(raw)
+        return GoldTickChart(items=items)
+
+    def gold_minute_chart(
+        self,
+        stock_code: GoldStockCode,
+        tick_scope: str,
+        adjust_price: str = "1",
+    ) -> GoldMinuteChart:
+        """금현물분봉차트를 조회한다 (ka50080).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            tick_scope: 틱범위(분). ``"1"``:1분, ``"3"``:3분, ``"5"``:5분, ``"10"``:10분,
+                ``"15"``:15분, ``"30"``:30분, ``"45"``:45분, ``"60"``:60분.
+            adjust_price: 수정주가구분. ``"0"`` 또는 ``"1"``. 기본값 ``"1"``.
+
+        Returns:
+            :class:`~kiwoompy.models.GoldMinuteChart` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {"stk_cd": stock_code, "tic_scope": tick_scope, "upd_stkpc_tp": adjust_price},
+            headers=self._headers("ka50080"),
+        ))
+        items = _SCHEMAS["ka50080"].decode(raw)
+        return GoldMinuteChart(items=items)
+
+    def gold_daily_chart(
+        self,
+        stock_code: GoldStockCode,
+        base_date: str,
+        adjust_price: str = "1",
+    ) -> GoldDailyChart:
+        """금현물일봉차트를 조회한다 (ka50081).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjust_price: 수정주가구분. ``"0"`` 또는 ``"1"``. 기본값 ``"1"``.
+
+        Returns:
+            :class:`~kiwoompy.models.GoldDailyChart` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {"stk_cd": stock_code, "base_dt": base_date, "upd_stkpc_tp": adjust_price},
+            headers=self._headers("ka50081"),
+        ))
+        items = _SCHEMAS["ka50081"].decode(raw)
+        return GoldDailyChart(items=items)
+
+    def gold_weekly_chart(
+        self,
+        stock_code: GoldStockCode,
+        base_date: str,
+        adjust_price: str = "1",
+    ) -> GoldWeeklyChart:
+        """금현물주봉차트를 조회한다 (ka50082).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjust_price: 수정주가구분. ``"0"`` 또는 ``"1"``. 기본값 ``"1"``.
+
+        Returns:
+            :class:`~kiwoompy.models.GoldWeeklyChart` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {"stk_cd": stock_code, "base_dt": base_date, "upd_stkpc_tp": adjust_price},
+            headers=self._headers("ka50082"),
+        ))
+        items = _SCHEMAS["ka50082"].decode(raw)
+        return GoldWeeklyChart(items=items)
+
+    def gold_monthly_chart(
+        self,
+        stock_code: GoldStockCode,
+        base_date: str,
+        adjust_price: str = "1",
+    ) -> GoldMonthlyChart:
+        """금현물월봉차트를 조회한다 (ka50083).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            base_date: 기준일자 (``"YYYYMMDD"``).
+            adjust_price: 수정주가구분. ``"0"`` 또는 ``"1"``. 기본값 ``"1"``.
+
+        Returns:
+            :class:`~kiwoompy.models.GoldMonthlyChart` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {"stk_cd": stock_code, "base_dt": base_date, "upd_stkpc_tp": adjust_price},
+            headers=self._headers("ka50083"),
+        ))
+        items = _SCHEMAS["ka50083"].decode(raw)
+        return GoldMonthlyChart(items=items)
+
+    def gold_daily_tick_chart(
+        self,
+        stock_code: GoldStockCode,
+        tick_scope: str,
+    ) -> GoldDailyTickChart:
+        """금현물당일틱차트를 조회한다 (ka50091).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            tick_scope: 틱범위. ``"1"``:1틱, ``"3"``:3틱, ``"5"``:5틱, ``"10"``:10틱, ``"30"``:30틱.
+
+        Returns:
+            :class:`~kiwoompy.models.GoldDailyTickChart` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {"stk_cd": stock_code, "tic_scope": tick_scope},
+            headers=self._headers("ka50091"),
+        ))
+        items = _SCHEMAS["ka50091"].decode(raw)
+        return GoldDailyTickChart(items=items)
+
+    def gold_daily_minute_chart(
+        self,
+        stock_code: GoldStockCode,
+        tick_scope: str,
+    ) -> GoldDailyMinuteChart:
+        """금현물당일분봉차트를 조회한다 (ka50092).
+
+        Args:
+            stock_code: 금현물 종목코드.
+                ``"M04020000"`` (금 99.99_1kg) 또는 ``"M04020100"`` (미니금 99.99_100g).
+            tick_scope: 틱범위(분). ``"1"``:1분, ``"3"``:3분, ``"5"``:5분, ``"10"``:10분, ``"30"``:30분.
+
+        Returns:
+            :class:`~kiwoompy.models.GoldDailyMinuteChart` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._CHART_PATH,
+            {"stk_cd": stock_code, "tic_scope": tick_scope},
+            headers=self._headers("ka50092"),
+        ))
+        items = _SCHEMAS["ka50092"].decode(raw)
+        return GoldDailyMinuteChart(items=items)
@@ -0,0 +1,138 @@
+"""기관/외국인 조회 — 외국인 매매동향·기관 매매·연속매매 (``frgnistt``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    ForeignTrade,
+    ForeignTradeItem,
+    FrgnDuration,
+    FrgnStockSectType,
+    InstFrgnConsecutiveItem,
+    InstFrgnConsecutiveTrade,
+    InstitutionTrade,
+    SectAmtQtyType,
+    SectExchangeType,
+)
+from kiwoompy.query._base import (
+    _FRGN_DURATION_CODE,
+    _FRGN_STK_SECT_CODE,
+    _SECT_AMT_QTY_CODE,
+    _SECT_EXCHANGE_CODE,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10008", _QueryBase._FRGNISTT_PATH, "stk_frgnr", ForeignTradeItem),
+    TrSchema(
+        "ka10131",
+        _QueryBase._FRGNISTT_PATH,
+        "orgn_frgnr_cont_trde_prst",
+        InstFrgnConsecutiveItem,
+    ),
+)
+
+
+class InvestorQuery(_QueryBase):
+    """기관/외국인 매매 조회 클라이언트.
+
+    ``KiwoomQuery.investor``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10008 — 주식외국인종목별매매동향
+    # -----------------------------------------------------------------------
+
+    def get_foreign_trade_trend(self, stock_code: str) -> ForeignTrade:
+        """종목별 외국인 매매동향을 조회한다 (ka10008).
+
+        Args:
+            stock_code: 거래소별 종목코드 (예: ``"005930"``, ``"039490_NX"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ForeignTrade` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._FRGNISTT_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10008"),
+        ))
+        items = _SCHEMAS["ka10008"].decode(raw)
+        return ForeignTrade(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10009 — 주식기관요청
+    # -----------------------------------------------------------------------
+
+    def get_institution_trade(self, stock_code: str) -> InstitutionTrade:
+        """종목별 기관 매매 현황을 조회한다 (ka10009).
+
+        Args:
+            stock_code: 거래소별 종목코드 (예: ``"005930"``, ``"039490_NX"``).
+
+        Returns:
+            :class:`~kiwoompy.models.InstitutionTrade` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._FRGNISTT_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10009"),
+        ))
+        return InstitutionTrade(
+            date=raw.get("date", ""),
+            close_pric=raw.get("close_pric", ""),
+            pre=raw.get("pre", ""),
+            orgn_dt_acc=raw.get("orgn_dt_acc", ""),
+            orgn_daly_nettrde=raw.get("orgn_daly_nettrde", ""),
+            frgnr_daly_nettrde=raw.get("frgnr_daly_nettrde", ""),
+            frgnr_qota_rt=raw.get("frgnr_qota_rt", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10131 — 기관외국인연속매매현황요청
+    # -----------------------------------------------------------------------
+
+    def get_inst_frgn_consecutive_trade(
+        self,
+        duration: "FrgnDuration",
+        market: str,
+        stock_or_sector: "FrgnStockSectType",
+        amt_qty: "SectAmtQtyType",
+        exchange: "SectExchangeType" = "krx",
+        start_date: str = "",
+        end_date: str = "",
+    ) -> InstFrgnConsecutiveTrade:
+        """기관·외국인 연속 매매 현황을 조회한다 (ka10131).
+
+        Args:
+            duration: 기간 (``"1"`` / ``"3"`` / ``"5"`` / ``"10"`` / ``"20"``
+                / ``"120"`` / ``"custom"``). ``"custom"`` 선택 시
+                ``start_date`` / ``end_date`` 필수.
+            market: 장구분 코드 (``"001"``: 코스피, ``"101"``: 코스닥).
+            stock_or_sector: 종목업종구분 (``"stock"`` / ``"sector"``).
+            amt_qty: 금액수량구분 (``"amount"`` / ``"qty"``).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``). 기본 ``"krx"``.
+            start_date: 시작일자 (``"YYYYMMDD"``). ``duration="custom"`` 일 때 사용.
+            end_date: 종료일자 (``"YYYYMMDD"``). ``duration="custom"`` 일 때 사용.
+
+        Returns:
+            :class:`~kiwoompy.models.InstFrgnConsecutiveTrade` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._FRGNISTT_PATH,
+            {
+                "dt":          _FRGN_DURATION_CODE[duration],
+                "strt_dt":     start_date,
+                "end_dt":      end_date,
+                "mrkt_tp":     market,
+                "netslmt_tp":  "2",
+                "stk_inds_tp": _FRGN_STK_SECT_CODE[stock_or_sector],
+                "amt_qty_tp":  _SECT_AMT_QTY_CODE[amt_qty],
+                "stex_tp":     _SECT_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10131"),
+        ))
+        items = _SCHEMAS["ka10131"].decode(raw)
+        return InstFrgnConsecutiveTrade(items=items)
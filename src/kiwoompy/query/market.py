@@ -0,0 +1,622 @@
+"""시세 조회 — 호가·체결·일별주가·시간외 시세 (``mrkcond``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    AfterAmtQtyType,
+    AfterCloseInvestorItem,
+    AfterCloseInvestorTrading,
+    AfterTradeType,
+    AfterhoursOrderbook,
+    BrokerStockTrend,
+    BrokerStockTrendItem,
+    DailyInstitutionStockItem,
+    DailyInstitutionStocks,
+    DailyPriceItem,
+    DailyPrices,
+    DisplayType,
+    EstimatedPriceType,
+    ExecutionStrength,
+    ExecutionStrengthItem,
+    InstitutionTradeType,
+    IntradayInvestorItem,
+    IntradayInvestorTrading,
+    InvestorType,
+    MarketSummary,
+    MrkcondExchangeType,
+    MrktType3,
+    NewStockRightsItem,
+    NewStockRightsPrices,
+    NewStockRightsType,
+    OrderbookLevel,
+    Orderbook,
+    StockInstitutionTrend,
+    StockInstitutionTrendItem,
+    StockMinutes,
+    StockPeriodItem,
+    StockPeriods,
+)
+from kiwoompy.query._base import (
+    _AFTER_AMT_QTY_CODE,
+    _AFTER_TRADE_TYPE_CODE,
+    _DISPLAY_TYPE_CODE,
+    _ESTIMATED_PRICE_CODE,
+    _INSTITUTION_TRADE_CODE,
+    _INVESTOR_CODE,
+    _MRKCOND_EXCHANGE_CODE,
+    _MRKT_TYPE3_CODE,
+    _NEW_STOCK_RIGHTS_CODE,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10005", _QueryBase._MRKCOND_PATH, "stk_ddwkmm", StockPeriodItem),
+    TrSchema("ka10086", _QueryBase._MRKCOND_PATH, "daly_stkpc", DailyPriceItem),
+    TrSchema("ka10011", _QueryBase._MRKCOND_PATH, "newstk_recvrht_mrpr", NewStockRightsItem),
+    TrSchema("ka10044", _QueryBase._MRKCOND_PATH, "daly_orgn_trde_stk", DailyInstitutionStockItem),
+    TrSchema("ka10045", _QueryBase._MRKCOND_PATH, "stk_orgn_trde_trnsn", StockInstitutionTrendItem),
+    TrSchema(
+        "ka10046",
+        _QueryBase._MRKCOND_PATH,
+        "cntr_str_tm",
+        ExecutionStrengthItem,
+        renames={
+            "time_or_dt": "cntr_tm",
+            "cntr_str_5": "cntr_str_5min",
+            "cntr_str_20": "cntr_str_20min",
+            "cntr_str_60": "cntr_str_60min",
+        },
+    ),
+    TrSchema(
+        "ka10047",
+        _QueryBase._MRKCOND_PATH,
+        "cntr_str_daly",
+        ExecutionStrengthItem,
+        renames={
+            "time_or_dt": "dt",
+            "cntr_str_5": "cntr_str_5min",
+            "cntr_str_20": "cntr_str_20min",
+            "cntr_str_60": "cntr_str_60min",
+        },
+    ),
+    TrSchema("ka10063", _QueryBase._MRKCOND_PATH, "opmr_invsr_trde", IntradayInvestorItem),
+    TrSchema("ka10066", _QueryBase._MRKCOND_PATH, "opaf_invsr_trde", AfterCloseInvestorItem),
+    TrSchema("ka10078", _QueryBase._MRKCOND_PATH, "sec_stk_trde_trend", BrokerStockTrendItem),
+)
+
+
+class MarketQuery(_QueryBase):
+    """국내주식 시세 조회 클라이언트.
+
+    ``KiwoomQuery.market``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10004 — 주식호가요청
+    # -----------------------------------------------------------------------
+
+    def get_orderbook(self, stock_code: str) -> Orderbook:
+        """주식 10차 호가 및 잔량을 조회한다 (ka10004).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+                KRX: ``"005930"``, NXT: ``"005930_NX"``, SOR: ``"005930_AL"``.
+
+        Returns:
+            호가 정보 ``Orderbook``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10004"),
+        ))
+
+        def _sell_level(n: int) -> OrderbookLevel:
+            if n == 1:
+                return OrderbookLevel(
+                    price=raw.get("sel_fpr_bid", ""),
+                    qty=raw.get("sel_fpr_req", ""),
+                    qty_change=raw.get("sel_1th_pre_req_pre", ""),
+                )
+            return OrderbookLevel(
+                price=raw.get(f"sel_{n}th_pre_bid", ""),
+                qty=raw.get(f"sel_{n}th_pre_req", ""),
+                qty_change=raw.get(f"sel_{n}th_pre_req_pre", ""),
+            )
+
+        def _buy_level(n: int) -> OrderbookLevel:
+            if n == 1:
+                return OrderbookLevel(
+                    price=raw.get("buy_fpr_bid", ""),
+                    qty=raw.get("buy_fpr_req", ""),
+                    qty_change=raw.get("buy_1th_pre_req_pre", ""),
+                )
+            return OrderbookLevel(
+                price=raw.get(f"buy_{n}th_pre_bid", ""),
+                qty=raw.get(f"buy_{n}th_pre_req", ""),
+                qty_change=raw.get(f"buy_{n}th_pre_req_pre", ""),
+            )
+
+        return Orderbook(
+            base_time=raw.get("bid_req_base_tm", ""),
+            sell_levels=[_sell_level(i) for i in range(1, 11)],
+            buy_levels=[_buy_level(i) for i in range(1, 11)],
+            tot_sell_qty=raw.get("tot_sel_req", ""),
+            tot_buy_qty=raw.get("tot_buy_req", ""),
+            tot_sell_qty_change=raw.get("tot_sel_req_jub_pre", ""),
+            tot_buy_qty_change=raw.get("tot_buy_req_jub_pre", ""),
+            ovt_sell_qty=raw.get("ovt_sel_req", ""),
+            ovt_buy_qty=raw.get("ovt_buy_req", ""),
+            ovt_sell_qty_change=raw.get("ovt_sel_req_pre", ""),
+            ovt_buy_qty_change=raw.get("ovt_buy_req_pre", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10005 — 주식일주월시분요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_periods(self, stock_code: str) -> StockPeriods:
+        """주식의 일·주·월·시·분 OHLCV 데이터를 조회한다 (ka10005).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+
+        Returns:
+            기간별 OHLCV 리스트 ``StockPeriods``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10005"),
+        ))
+        items = _SCHEMAS["ka10005"].decode(raw)
+        return StockPeriods(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10006 — 주식시분요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_minutes(self, stock_code: str) -> StockMinutes:
+        """주식 시·분 시세를 조회한다 (ka10006).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+
+        Returns:
+            시분 시세 ``StockMinutes``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10006"),
+        ))
+        return StockMinutes(
+            date=raw.get("date", ""),
+            open_pric=raw.get("open_pric", ""),
+            high_pric=raw.get("high_pric", ""),
+            low_pric=raw.get("low_pric", ""),
+            close_pric=raw.get("close_pric", ""),
+            pre=raw.get("pre", ""),
+            flu_rt=raw.get("flu_rt", ""),
+            trde_qty=raw.get("trde_qty", ""),
+            trde_prica=raw.get("trde_prica", ""),
+            cntr_str=raw.get("cntr_str", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10007 — 시세표성정보요청
+    # -----------------------------------------------------------------------
+
+    def get_market_summary(self, stock_code: str) -> MarketSummary:
+        """종목의 종합 시세표(현재가·호가·예상체결 등)를 조회한다 (ka10007).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+
+        Returns:
+            시세표성정보 ``MarketSummary``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10007"),
+        ))
+        return MarketSummary(
+            stk_nm=raw.get("stk_nm", ""),
+            stk_cd=raw.get("stk_cd", ""),
+            date=raw.get("date", ""),
+            tm=raw.get("tm", ""),
+            cur_prc=raw.get("cur_prc", ""),
+            flu_rt=raw.get("flu_rt", ""),
+            open_pric=raw.get("open_pric", ""),
+            high_pric=raw.get("high_pric", ""),
+            low_pric=raw.get("low_pric", ""),
+            trde_qty=raw.get("trde_qty", ""),
+            trde_prica=raw.get("trde_prica", ""),
+            pred_close_pric=raw.get("pred_close_pric", ""),
+            upl_pric=raw.get("upl_pric", ""),
+            lst_pric=raw.get("lst_pric", ""),
+            exp_cntr_pric=raw.get("exp_cntr_pric", ""),
+            exp_cntr_qty=raw.get("exp_cntr_qty", ""),
+            tot_buy_req=raw.get("tot_buy_req", ""),
+            tot_sel_req=raw.get("tot_sel_req", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10086 — 일별주가요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_prices(
+        self,
+        stock_code: str,
+        query_date: str,
+        display_type: "DisplayType" = "qty",
+    ) -> DailyPrices:
+        """일별 주가 및 투자자별 순매수 데이터를 조회한다 (ka10086).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            query_date: 조회일자 (``YYYYMMDD`` 형식).
+            display_type: 표시구분. ``"qty"``: 수량, ``"amount"``: 금액(백만원).
+
+        Returns:
+            일별주가 리스트 ``DailyPrices``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "stk_cd": stock_code,
+                "qry_dt": query_date,
+                "indc_tp": _DISPLAY_TYPE_CODE[display_type],
+            },
+            headers=self._headers("ka10086"),
+        ))
+        items = _SCHEMAS["ka10086"].decode(raw)
+        return DailyPrices(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10087 — 시간외단일가요청
+    # -----------------------------------------------------------------------
+
+    def get_afterhours_orderbook(self, stock_code: str) -> AfterhoursOrderbook:
+        """시간외단일가 호가 및 현재가를 조회한다 (ka10087).
+
+        Args:
+            stock_code: 종목코드 (6자리).
+
+        Returns:
+            시간외단일가 호가 ``AfterhoursOrderbook``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10087"),
+        ))
+        return AfterhoursOrderbook(
+            base_time=raw.get("bid_req_base_tm", ""),
+            ovt_cur_prc=raw.get("ovt_sigpric_cur_prc", ""),
+            ovt_flu_rt=raw.get("ovt_sigpric_flu_rt", ""),
+            ovt_acc_trde_qty=raw.get("ovt_sigpric_acc_trde_qty", ""),
+            ovt_sell_tot=raw.get("ovt_sigpric_sel_bid_tot_req", ""),
+            ovt_buy_tot=raw.get("ovt_sigpric_buy_bid_tot_req", ""),
+            sel_bid_tot=raw.get("sel_bid_tot_req", ""),
+            buy_bid_tot=raw.get("buy_bid_tot_req", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10011 — 신주인수권전체시세요청
+    # -----------------------------------------------------------------------
+
+    def get_newstock_rights_prices(
+        self,
+        rights_type: "NewStockRightsType" = "all",
+    ) -> NewStockRightsPrices:
+        """신주인수권 전체 시세를 조회한다 (ka10011).
+
+        Args:
+            rights_type: 신주인수권구분.
+                ``"all"``: 전체, ``"rights_cert"``: 신주인수권증권, ``"rights_deed"``: 신주인수권증서.
+
+        Returns:
+            신주인수권 시세 리스트 ``NewStockRightsPrices``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"newstk_recvrht_tp": _NEW_STOCK_RIGHTS_CODE[rights_type]},
+            headers=self._headers("ka10011"),
+        ))
+        items = _SCHEMAS["ka10011"].decode(raw)
+        return NewStockRightsPrices(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10044 — 일별기관매매종목요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_institution_stocks(
+        self,
+        start_date: str,
+        end_date: str,
+        trade_type: "InstitutionTradeType",
+        market_type: "MrktType3",
+        exchange: "MrkcondExchangeType" = "all",
+    ) -> DailyInstitutionStocks:
+        """기관 순매도·순매수 상위 종목을 조회한다 (ka10044).
+
+        Args:
+            start_date: 시작일자 (``YYYYMMDD`` 형식).
+            end_date: 종료일자 (``YYYYMMDD`` 형식).
+            trade_type: 매매구분. ``"sell"``: 순매도, ``"buy"``: 순매수.
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            일별기관매매종목 리스트 ``DailyInstitutionStocks``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "strt_dt": start_date,
+                "end_dt": end_date,
+                "trde_tp": _INSTITUTION_TRADE_CODE[trade_type],
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10044"),
+        ))
+        items = _SCHEMAS["ka10044"].decode(raw)
+        return DailyInstitutionStocks(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10045 — 종목별기관매매추이요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_institution_trend(
+        self,
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+        org_price_type: "EstimatedPriceType" = "buy",
+        for_price_type: "EstimatedPriceType" = "buy",
+    ) -> StockInstitutionTrend:
+        """종목별 기관·외인 매매 추이를 조회한다 (ka10045).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            start_date: 시작일자 (``YYYYMMDD`` 형식).
+            end_date: 종료일자 (``YYYYMMDD`` 형식).
+            org_price_type: 기관추정단가구분. ``"buy"``: 매수단가, ``"sell"``: 매도단가.
+            for_price_type: 외인추정단가구분. ``"buy"``: 매수단가, ``"sell"``: 매도단가.
+
+        Returns:
+            종목별기관매매추이 ``StockInstitutionTrend``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "stk_cd": stock_code,
+                "strt_dt": start_date,
+                "end_dt": end_date,
+                "orgn_prsm_unp_tp": _ESTIMATED_PRICE_CODE[org_price_type],
+                "for_prsm_unp_tp": _ESTIMATED_PRICE_CODE[for_price_type],
+            },
+            headers=self._headers("ka10045"),
+        ))
+        items = _SCHEMAS["ka10045"].decode(raw)
+        return StockInstitutionTrend(
+            orgn_prsm_avg_pric=raw.get("orgn_prsm_avg_pric", ""),
+            for_prsm_avg_pric=raw.get("for_prsm_avg_pric", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10046 — 체결강도추이시간별요청
+    # -----------------------------------------------------------------------
+
+    def get_execution_strength_by_time(self, stock_code: str) -> ExecutionStrength:
+        """체결강도 추이(시간별)를 조회한다 (ka10046).
+
+        Args:
+            stock_code: 거래소별 종목코드 (6자리).
+
+        Returns:
+            체결강도 시계열 ``ExecutionStrength``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10046"),
+        ))
+        items = _SCHEMAS["ka10046"].decode(raw)
+        return ExecutionStrength(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10047 — 체결강도추이일별요청
+    # -----------------------------------------------------------------------
+
+    def get_execution_strength_by_day(self, stock_code: str) -> ExecutionStrength:
+        """체결강도 추이(일별)를 조회한다 (ka10047).
+
+        Args:
+            stock_code: 거래소별 종목코드 (6자리).
+
+        Returns:
+            체결강도 일별 시계열 ``ExecutionStrength``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10047"),
+        ))
+        items = _SCHEMAS["ka10047"].decode(raw)
+        return ExecutionStrength(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10063 — 장중투자자별매매요청
+    # -----------------------------------------------------------------------
+
+    def get_intraday_investor_trading(
+        self,
+        market_type: "MrktType3",
+        investor: "InvestorType",
+        exchange: "MrkcondExchangeType" = "all",
+        foreign_all: str = "0",
+        simultaneous_net_buy: str = "0",
+    ) -> IntradayInvestorTrading:
+        """장중 투자자별 매매 상위 종목을 조회한다 (ka10063).
+
+        Args:
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            investor: 투자자별.
+                ``"foreign"``: 외국인, ``"institution"``: 기관계, ``"trust"``: 투신,
+                ``"insurance"``: 보험, ``"bank"``: 은행, ``"pension"``: 연기금,
+                ``"gov"``: 국가, ``"other_corp"``: 기타법인.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            foreign_all: 외국계전체. ``"1"``: 체크, ``"0"``: 미체크.
+            simultaneous_net_buy: 동시순매수구분. ``"1"``: 체크, ``"0"``: 미체크.
+
+        Returns:
+            장중투자자별매매 리스트 ``IntradayInvestorTrading``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "amt_qty_tp": "1",
+                "invsr": _INVESTOR_CODE[investor],
+                "frgn_all": foreign_all,
+                "smtm_netprps_tp": simultaneous_net_buy,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10063"),
+        ))
+        items = _SCHEMAS["ka10063"].decode(raw)
+        return IntradayInvestorTrading(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10066 — 장마감후투자자별매매요청
+    # -----------------------------------------------------------------------
+
+    def get_afterclose_investor_trading(
+        self,
+        market_type: "MrktType3",
+        trade_type: "AfterTradeType",
+        amount_qty_type: "AfterAmtQtyType" = "amount",
+        exchange: "MrkcondExchangeType" = "all",
+    ) -> AfterCloseInvestorTrading:
+        """장마감 후 투자자별 매매 상위 종목을 조회한다 (ka10066).
+
+        Args:
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            trade_type: 매매구분. ``"net_buy"``: 순매수, ``"buy"``: 매수, ``"sell"``: 매도.
+            amount_qty_type: 금액수량구분. ``"amount"``: 금액, ``"qty"``: 수량.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            장마감후투자자별매매 리스트 ``AfterCloseInvestorTrading``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "amt_qty_tp": _AFTER_AMT_QTY_CODE[amount_qty_type],
+                "trde_tp": _AFTER_TRADE_TYPE_CODE[trade_type],
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10066"),
+        ))
+        items = _SCHEMAS["ka10066"].decode(raw)
+        return AfterCloseInvestorTrading(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10078 — 증권사별종목매매동향요청
+    # -----------------------------------------------------------------------
+
+    def get_broker_stock_trend(
+        self,
+        broker_code: str,
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+    ) -> BrokerStockTrend:
+        """특정 증권사의 종목별 매매동향을 조회한다 (ka10078).
+
+        Args:
+            broker_code: 회원사코드 (3자리). ``get_broker_list()``로 조회 가능.
+            stock_code: 거래소별 종목코드.
+            start_date: 시작일자 (``YYYYMMDD`` 형식).
+            end_date: 종료일자 (``YYYYMMDD`` 형식).
+
+        Returns:
+            증권사별종목매매동향 리스트 ``BrokerStockTrend``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "mmcm_cd": broker_code,
+                "stk_cd": stock_code,
+                "strt_dt": start_date,
+                "end_dt": end_date,
+            },
+            headers=self._headers("ka10078"),
+        ))
+        items = _SCHEMAS["ka10078"].decode(raw)
+        return BrokerStockTrend(items=items)
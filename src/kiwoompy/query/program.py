@@ -0,0 +1,330 @@
+"""프로그램매매 조회 — 프로그램 순매수 상위·추이·종목별 현황 (``mrkcond``/``stkinfo``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    ProgramAccTrend,
+    ProgramAccTrendItem,
+    ProgramArbitrageBal,
+    ProgramArbitrageBalItem,
+    ProgramTop50,
+    ProgramTop50Item,
+    ProgramTrend,
+    ProgramTrendItem,
+    StockDailyProgram,
+    StockDailyProgramItem,
+    StockProgramStatus,
+    StockProgramStatusItem,
+    StockTimeProgram,
+    StockTimeProgramItem,
+)
+from kiwoompy.query._base import (
+    _EXCHANGE_CODE,
+    ExchangeType,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka90003", _QueryBase._STKINFO_PATH, "prm_netprps_upper_50", ProgramTop50Item),
+    TrSchema("ka90004", _QueryBase._STKINFO_PATH, "stk_prm_trde_prst", StockProgramStatusItem),
+    TrSchema("ka90005", _QueryBase._MRKCOND_PATH, "prm_trde_trnsn", ProgramTrendItem),
+    TrSchema(
+        "ka90006",
+        _QueryBase._MRKCOND_PATH,
+        "prm_trde_dfrt_remn_trnsn",
+        ProgramArbitrageBalItem,
+    ),
+    TrSchema("ka90007", _QueryBase._MRKCOND_PATH, "prm_trde_acc_trnsn", ProgramAccTrendItem),
+    TrSchema("ka90008", _QueryBase._MRKCOND_PATH, "stk_tm_prm_trde_trnsn", StockTimeProgramItem),
+    TrSchema("ka90010", _QueryBase._MRKCOND_PATH, "prm_trde_trnsn", ProgramTrendItem),
+    TrSchema("ka90013", _QueryBase._MRKCOND_PATH, "stk_daly_prm_trde_trnsn", StockDailyProgramItem),
+)
+
+
+class ProgramQuery(_QueryBase):
+    """프로그램매매 조회 클라이언트.
+
+    ``KiwoomQuery.program``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka90003 — 프로그램순매수상위50요청
+    # -----------------------------------------------------------------------
+
+    def get_program_top50(
+        self,
+        trade_upper_type: str,
+        amt_qty_type: str,
+        market_type: str,
+        exchange: "ExchangeType",
+    ) -> ProgramTop50:
+        """프로그램 순매수 상위 50 종목을 조회한다 (ka90003).
+
+        Args:
+            trade_upper_type: 매매상위구분 (``"1"``순매도상위 / ``"2"``순매수상위).
+            amt_qty_type: 금액수량구분 (``"1"``금액 / ``"2"``수량).
+            market_type: 시장구분 (``"P00101"``코스피 / ``"P10102"``코스닥).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ProgramTop50` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "trde_upper_tp": trade_upper_type,
+                "amt_qty_tp":    amt_qty_type,
+                "mrkt_tp":       market_type,
+                "stex_tp":       _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka90003"),
+        ))
+        items = _SCHEMAS["ka90003"].decode(raw)
+        return ProgramTop50(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90004 — 종목별프로그램매매현황요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_program_status(
+        self,
+        date: str,
+        market_type: str,
+        exchange: "ExchangeType",
+    ) -> StockProgramStatus:
+        """종목별 프로그램 매매 현황을 조회한다 (ka90004).
+
+        Args:
+            date: 일자 (``"YYYYMMDD"``).
+            market_type: 시장구분 (``"P00101"``코스피 / ``"P10102"``코스닥).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+
+        Returns:
+            :class:`~kiwoompy.models.StockProgramStatus` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "dt":      date,
+                "mrkt_tp": market_type,
+                "stex_tp": _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka90004"),
+        ))
+        items = _SCHEMAS["ka90004"].decode(raw)
+        return StockProgramStatus(
+            tot_1=raw.get("tot_1", ""),
+            tot_2=raw.get("tot_2", ""),
+            tot_3=raw.get("tot_3", ""),
+            tot_4=raw.get("tot_4", ""),
+            tot_5=raw.get("tot_5", ""),
+            tot_6=raw.get("tot_6", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka90005 — 프로그램매매추이요청 시간대별
+    # -----------------------------------------------------------------------
+
+    def get_program_trend_by_time(
+        self,
+        date: str,
+        amt_qty_type: str,
+        market_type: str,
+        min_tic_type: str,
+        exchange: "ExchangeType",
+    ) -> ProgramTrend:
+        """프로그램 매매 추이(시간대별)를 조회한다 (ka90005).
+
+        Args:
+            date: 날짜 (``"YYYYMMDD"``).
+            amt_qty_type: 금액수량구분 (``"1"``금액(백만원) / ``"2"``수량(천주)).
+            market_type: 시장구분 (``"P00101"``코스피KRX 등).
+            min_tic_type: 분틱구분 (``"0"``틱 / ``"1"``분).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ProgramTrend` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "date":       date,
+                "amt_qty_tp": amt_qty_type,
+                "mrkt_tp":    market_type,
+                "min_tic_tp": min_tic_type,
+                "stex_tp":    _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka90005"),
+        ))
+        items = _SCHEMAS["ka90005"].decode(raw)
+        return ProgramTrend(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90006 — 프로그램매매차익잔고추이요청
+    # -----------------------------------------------------------------------
+
+    def get_program_arbitrage_bal(
+        self,
+        date: str,
+        exchange: "ExchangeType",
+    ) -> ProgramArbitrageBal:
+        """프로그램 매매 차익 잔고 추이를 조회한다 (ka90006).
+
+        Args:
+            date: 날짜 (``"YYYYMMDD"``).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ProgramArbitrageBal` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "date":    date,
+                "stex_tp": _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka90006"),
+        ))
+        items = _SCHEMAS["ka90006"].decode(raw)
+        return ProgramArbitrageBal(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90007 — 프로그램매매누적추이요청
+    # -----------------------------------------------------------------------
+
+    def get_program_acc_trend(
+        self,
+        date: str,
+        amt_qty_type: str,
+        market_type: str,
+        exchange: "ExchangeType",
+    ) -> ProgramAccTrend:
+        """프로그램 매매 누적 추이를 조회한다 (ka90007).
+
+        Args:
+            date: 날짜 (``"YYYYMMDD"``).
+            amt_qty_type: 금액수량구분 (``"1"``금액 / ``"2"``수량).
+            market_type: 시장구분 (``"0"``코스피 / ``"1"``코스닥).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ProgramAccTrend` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "date":       date,
+                "amt_qty_tp": amt_qty_type,
+                "mrkt_tp":    market_type,
+                "stex_tp":    _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka90007"),
+        ))
+        items = _SCHEMAS["ka90007"].decode(raw)
+        return ProgramAccTrend(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90008 — 종목시간별프로그램매매추이요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_time_program(
+        self,
+        amt_qty_type: str,
+        stock_code: str,
+        date: str,
+    ) -> StockTimeProgram:
+        """종목 시간별 프로그램 매매 추이를 조회한다 (ka90008).
+
+        Args:
+            amt_qty_type: 금액수량구분 (``"1"``금액 / ``"2"``수량).
+            stock_code: 종목코드 (예: ``"005930"``).
+            date: 날짜 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.StockTimeProgram` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "amt_qty_tp": amt_qty_type,
+                "stk_cd":     stock_code,
+                "date":       date,
+            },
+            headers=self._headers("ka90008"),
+        ))
+        items = _SCHEMAS["ka90008"].decode(raw)
+        return StockTimeProgram(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90010 — 프로그램매매추이요청 일자별
+    # -----------------------------------------------------------------------
+
+    def get_program_trend_by_day(
+        self,
+        date: str,
+        amt_qty_type: str,
+        market_type: str,
+        min_tic_type: str,
+        exchange: "ExchangeType",
+    ) -> ProgramTrend:
+        """프로그램 매매 추이(일자별)를 조회한다 (ka90010).
+
+        Args:
+            date: 날짜 (``"YYYYMMDD"``).
+            amt_qty_type: 금액수량구분 (``"1"``금액(백만원) / ``"2"``수량(천주)).
+            market_type: 시장구분 (``"P00101"``코스피KRX 등).
+            min_tic_type: 분틱구분 (``"0"``틱 / ``"1"``분).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+
+        Returns:
+            :class:`~kiwoompy.models.ProgramTrend` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "date":       date,
+                "amt_qty_tp": amt_qty_type,
+                "mrkt_tp":    market_type,
+                "min_tic_tp": min_tic_type,
+                "stex_tp":    _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka90010"),
+        ))
+        items = _SCHEMAS["ka90010"].decode(raw)
+        return ProgramTrend(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90013 — 종목일별프로그램매매추이요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_daily_program(
+        self,
+        stock_code: str,
+        amt_qty_type: str = "",
+        date: str = "",
+    ) -> StockDailyProgram:
+        """종목 일별 프로그램 매매 추이를 조회한다 (ka90013).
+
+        Args:
+            stock_code: 종목코드 (예: ``"005930"``).
+            amt_qty_type: 금액수량구분 (``"1"``금액 / ``"2"``수량, 기본값: ``""``).
+            date: 날짜 (``"YYYYMMDD"``, 기본값: ``""``).
+
+        Returns:
+            :class:`~kiwoompy.models.StockDailyProgram` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._MRKCOND_PATH,
+            {
+                "amt_qty_tp": amt_qty_type,
+                "stk_cd":     stock_code,
+                "date":       date,
+            },
+            headers=self._headers("ka90013"),
+        ))
+        items = _SCHEMAS["ka90013"].decode(raw)
+        return StockDailyProgram(items=items)
@@ -0,0 +1,1173 @@
+"""순위정보 조회 — 호가잔량·등락률·거래량·외국인/기관 상위 (``rkinfo``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    AfterHoursRank,
+    AfterHoursRankItem,
+    BidQtySurge,
+    BidQtySurgeItem,
+    BidQtyUpper,
+    BidQtyUpperItem,
+    BrokerTradeUpper,
+    BrokerTradeUpperItem,
+    CreditRatioUpper,
+    CreditRatioUpperItem,
+    DailyMainBroker,
+    DailyMainBrokerEntry,
+    DailyTopExit,
+    DailyTopExitItem,
+    DailyTradeQtyUpper,
+    DailyTradeQtyUpperItem,
+    ExpectedTradeUpper,
+    ExpectedTradeUpperItem,
+    ForeignBrokerTradeUpper,
+    ForeignBrokerTradeUpperItem,
+    ForeignConsecTradeUpper,
+    ForeignConsecTradeUpperItem,
+    ForeignInstitutionTradeUpper,
+    ForeignInstitutionTradeUpperItem,
+    ForeignLimitExhaustUpper,
+    ForeignLimitExhaustUpperItem,
+    ForeignPeriodTradeUpper,
+    ForeignPeriodTradeUpperItem,
+    InvestorTradeUpper,
+    InvestorTradeUpperItem,
+    NetBuyBrokerRank,
+    NetBuyBrokerRankItem,
+    PriceChangeUpper,
+    PriceChangeUpperItem,
+    PrevTradeQtyUpper,
+    PrevTradeQtyUpperItem,
+    QtyRatioSurge,
+    QtyRatioSurgeItem,
+    RkinfoBaseDateType,
+    RkinfoBidSortType,
+    RkinfoBidTradeType,
+    RkinfoMarketType,
+    RkinfoOrgType,
+    RkinfoPriceChangeSortType,
+    RkinfoSortCndType,
+    RkinfoStexType,
+    RkinfoSurgeSort2Type,
+    SameNetTradeRank,
+    SameNetTradeRankItem,
+    StockBrokerRank,
+    StockBrokerRankItem,
+    TradeAmtUpper,
+    TradeAmtUpperItem,
+    TradeQtySurge,
+    TradeQtySurgeItem,
+)
+from kiwoompy.query._base import (
+    _RKINFO_BASE_DATE_CODE,
+    _RKINFO_BID_SORT_CODE,
+    _RKINFO_BID_TRADE_CODE,
+    _RKINFO_MARKET_CODE,
+    _RKINFO_ORG_TYPE_CODE,
+    _RKINFO_PRICE_CHANGE_SORT_CODE,
+    _RKINFO_SORT_CND_CODE,
+    _RKINFO_STEX_CODE,
+    _RKINFO_SURGE_SORT2_CODE,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10020", _QueryBase._RKINFO_PATH, "bid_req_upper", BidQtyUpperItem),
+    TrSchema(
+        "ka10021",
+        _QueryBase._RKINFO_PATH,
+        "bid_req_sdnin",
+        BidQtySurgeItem,
+        renames={"base_rt": "int"},
+    ),
+    TrSchema(
+        "ka10022",
+        _QueryBase._RKINFO_PATH,
+        "req_rt_sdnin",
+        QtyRatioSurgeItem,
+        renames={"base_rt": "int"},
+    ),
+    TrSchema("ka10023", _QueryBase._RKINFO_PATH, "trde_qty_sdnin", TradeQtySurgeItem),
+    TrSchema("ka10027", _QueryBase._RKINFO_PATH, "pred_pre_flu_rt_upper", PriceChangeUpperItem),
+    TrSchema("ka10029", _QueryBase._RKINFO_PATH, "exp_cntr_flu_rt_upper", ExpectedTradeUpperItem),
+    TrSchema("ka10030", _QueryBase._RKINFO_PATH, "tdy_trde_qty_upper", DailyTradeQtyUpperItem),
+    TrSchema("ka10031", _QueryBase._RKINFO_PATH, "pred_trde_qty_upper", PrevTradeQtyUpperItem),
+    TrSchema("ka10032", _QueryBase._RKINFO_PATH, "trde_prica_upper", TradeAmtUpperItem),
+    TrSchema("ka10033", _QueryBase._RKINFO_PATH, "crd_rt_upper", CreditRatioUpperItem),
+    TrSchema("ka10034", _QueryBase._RKINFO_PATH, "for_dt_trde_upper", ForeignPeriodTradeUpperItem),
+    TrSchema(
+        "ka10035",
+        _QueryBase._RKINFO_PATH,
+        "for_cont_nettrde_upper",
+        ForeignConsecTradeUpperItem,
+    ),
+    TrSchema(
+        "ka10036",
+        _QueryBase._RKINFO_PATH,
+        "for_limit_exh_rt_incrs_upper",
+        ForeignLimitExhaustUpperItem,
+    ),
+    TrSchema(
+        "ka10037",
+        _QueryBase._RKINFO_PATH,
+        "frgn_wicket_trde_upper",
+        ForeignBrokerTradeUpperItem,
+    ),
+    TrSchema("ka10038", _QueryBase._RKINFO_PATH, "stk_sec_rank", StockBrokerRankItem),
+    TrSchema("ka10039", _QueryBase._RKINFO_PATH, "sec_trde_upper", BrokerTradeUpperItem),
+    TrSchema("ka10040", _QueryBase._RKINFO_PATH, "tdy_main_trde_ori", DailyMainBrokerEntry),
+    TrSchema("ka10042", _QueryBase._RKINFO_PATH, "netprps_trde_ori_rank", NetBuyBrokerRankItem),
+    TrSchema("ka10053", _QueryBase._RKINFO_PATH, "tdy_upper_scesn_ori", DailyTopExitItem),
+    TrSchema("ka10062", _QueryBase._RKINFO_PATH, "eql_nettrde_rank", SameNetTradeRankItem),
+    TrSchema("ka10065", _QueryBase._RKINFO_PATH, "opmr_invsr_trde_upper", InvestorTradeUpperItem),
+    TrSchema("ka10098", _QueryBase._RKINFO_PATH, "ovt_sigpric_flu_rt_rank", AfterHoursRankItem),
+    TrSchema(
+        "ka90009",
+        _QueryBase._RKINFO_PATH,
+        "frgnr_orgn_trde_upper",
+        ForeignInstitutionTradeUpperItem,
+    ),
+)
+
+
+class RankingQuery(_QueryBase):
+    """순위정보 조회 클라이언트.
+
+    ``KiwoomQuery.ranking``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10020 — 호가잔량상위요청
+    # -----------------------------------------------------------------------
+
+    def get_bid_qty_upper(
+        self,
+        market: "RkinfoMarketType",
+        sort_type: "RkinfoBidSortType",
+        trade_qty_type: str,
+        stock_cond: str,
+        credit_cond: str,
+        exchange: "RkinfoStexType",
+    ) -> BidQtyUpper:
+        """호가잔량 상위 종목을 조회한다 (ka10020).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            sort_type: 정렬구분.
+                ``"net_buy_qty"``: 순매수잔량순, ``"net_sell_qty"``: 순매도잔량순,
+                ``"buy_ratio"``: 매수비율순, ``"sell_ratio"``: 매도비율순.
+            trade_qty_type: 거래량구분.
+                ``"0000"``: 0주이상, ``"0010"``: 만주이상, ``"0050"``: 5만주이상, ``"00100"``: 10만주이상.
+            stock_cond: 종목조건.
+                ``"0"``: 전체, ``"1"``: 관리종목제외, ``"5"``~``"9"``: 증거금 조건.
+            credit_cond: 신용조건.
+                ``"0"``: 전체, ``"9"``: 신용융자전체, 기타 군별 코드.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            호가잔량상위 ``BidQtyUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":    _RKINFO_MARKET_CODE[market],
+                "sort_tp":    _RKINFO_BID_SORT_CODE[sort_type],
+                "trde_qty_tp": trade_qty_type,
+                "stk_cnd":    stock_cond,
+                "crd_cnd":    credit_cond,
+                "stex_tp":    _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10020"),
+        ))
+        items = _SCHEMAS["ka10020"].decode(raw)
+        return BidQtyUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10021 — 호가잔량급증요청
+    # -----------------------------------------------------------------------
+
+    def get_bid_qty_surge(
+        self,
+        market: "RkinfoMarketType",
+        trade_type: "RkinfoBidTradeType",
+        sort_type: "RkinfoSurgeSort2Type",
+        time_min: str,
+        trade_qty_type: str,
+        stock_cond: str,
+        exchange: "RkinfoStexType",
+    ) -> BidQtySurge:
+        """호가잔량 급증 종목을 조회한다 (ka10021).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            trade_type: 매매구분. ``"buy"``: 매수잔량, ``"sell"``: 매도잔량.
+            sort_type: 정렬구분. ``"surge_qty"``: 급증량, ``"surge_ratio"``: 급증률.
+            time_min: 시간구분 (분 입력, 예: ``"30"``).
+            trade_qty_type: 거래량구분.
+                ``"1"``: 천주이상, ``"5"``: 5천주이상, ``"10"``: 만주이상, ``"50"``: 5만주이상.
+            stock_cond: 종목조건 (``"0"``~``"9"``).
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            호가잔량급증 ``BidQtySurge``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":    _RKINFO_MARKET_CODE[market],
+                "trde_tp":    _RKINFO_BID_TRADE_CODE[trade_type],
+                "sort_tp":    _RKINFO_SURGE_SORT2_CODE[sort_type],
+                "tm_tp":      time_min,
+                "trde_qty_tp": trade_qty_type,
+                "stk_cnd":    stock_cond,
+                "stex_tp":    _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10021"),
+        ))
+        items = _SCHEMAS["ka10021"].decode(raw)
+        return BidQtySurge(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10022 — 잔량율급증요청
+    # -----------------------------------------------------------------------
+
+    def get_qty_ratio_surge(
+        self,
+        market: "RkinfoMarketType",
+        ratio_type: str,
+        time_min: str,
+        trade_qty_type: str,
+        stock_cond: str,
+        exchange: "RkinfoStexType",
+    ) -> QtyRatioSurge:
+        """잔량율 급증 종목을 조회한다 (ka10022).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            ratio_type: 비율구분. ``"1"``: 매수/매도비율, ``"2"``: 매도/매수비율.
+            time_min: 시간구분 (분 입력, 예: ``"1"``).
+            trade_qty_type: 거래량구분.
+                ``"5"``: 5천주이상, ``"10"``: 만주이상, ``"50"``: 5만주이상.
+            stock_cond: 종목조건 (``"0"``~``"9"``).
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            잔량율급증 ``QtyRatioSurge``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":    _RKINFO_MARKET_CODE[market],
+                "rt_tp":      ratio_type,
+                "tm_tp":      time_min,
+                "trde_qty_tp": trade_qty_type,
+                "stk_cnd":    stock_cond,
+                "stex_tp":    _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10022"),
+        ))
+        items = _SCHEMAS["ka10022"].decode(raw)
+        return QtyRatioSurge(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10023 — 거래량급증요청
+    # -----------------------------------------------------------------------
+
+    def get_trade_qty_surge(
+        self,
+        market: "RkinfoMarketType",
+        sort_type: str,
+        time_type: str,
+        trade_qty_type: str,
+        stock_cond: str,
+        price_type: str,
+        exchange: "RkinfoStexType",
+        time: str = "",
+    ) -> TradeQtySurge:
+        """거래량 급증 종목을 조회한다 (ka10023).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            sort_type: 정렬구분.
+                ``"1"``: 급증량, ``"2"``: 급증률, ``"3"``: 급감량, ``"4"``: 급감률.
+            time_type: 시간구분. ``"1"``: 분, ``"2"``: 전일.
+            trade_qty_type: 거래량구분 (``"5"``~``"1000"``).
+            stock_cond: 종목조건 (``"0"``~``"20"``).
+            price_type: 가격구분 (``"0"``~``"9"``).
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            time: 분 입력 (``time_type="1"``일 때만 유효, 기본 ``""``).
+
+        Returns:
+            거래량급증 ``TradeQtySurge``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":    _RKINFO_MARKET_CODE[market],
+                "sort_tp":    sort_type,
+                "tm_tp":      time_type,
+                "trde_qty_tp": trade_qty_type,
+                "tm":         time,
+                "stk_cnd":    stock_cond,
+                "pric_tp":    price_type,
+                "stex_tp":    _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10023"),
+        ))
+        items = _SCHEMAS["ka10023"].decode(raw)
+        return TradeQtySurge(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10027 — 전일대비등락률상위요청
+    # -----------------------------------------------------------------------
+
+    def get_price_change_upper(
+        self,
+        market: "RkinfoMarketType",
+        sort_type: "RkinfoPriceChangeSortType",
+        trade_qty_cond: str,
+        stock_cond: str,
+        credit_cond: str,
+        updown_incls: str,
+        price_cond: str,
+        trade_amt_cond: str,
+        exchange: "RkinfoStexType",
+    ) -> PriceChangeUpper:
+        """전일대비 등락률 상위 종목을 조회한다 (ka10027).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            sort_type: 정렬구분.
+                ``"rise_ratio"``: 상승률, ``"rise_gap"``: 상승폭,
+                ``"fall_ratio"``: 하락률, ``"fall_gap"``: 하락폭, ``"flat"``: 보합.
+            trade_qty_cond: 거래량조건 (``"0000"``, ``"0010"``, …).
+            stock_cond: 종목조건 (``"0"``~``"16"``).
+            credit_cond: 신용조건 (``"0"``, ``"9"`` 등).
+            updown_incls: 상하한포함. ``"0"``: 미포함, ``"1"``: 포함.
+            price_cond: 가격조건 (``"0"``~``"10"``).
+            trade_amt_cond: 거래대금조건 (``"0"``, ``"3"``~``"5000"``).
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            전일대비등락률상위 ``PriceChangeUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":        _RKINFO_MARKET_CODE[market],
+                "sort_tp":        _RKINFO_PRICE_CHANGE_SORT_CODE[sort_type],
+                "trde_qty_cnd":   trade_qty_cond,
+                "stk_cnd":        stock_cond,
+                "crd_cnd":        credit_cond,
+                "updown_incls":   updown_incls,
+                "pric_cnd":       price_cond,
+                "trde_prica_cnd": trade_amt_cond,
+                "stex_tp":        _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10027"),
+        ))
+        items = _SCHEMAS["ka10027"].decode(raw)
+        return PriceChangeUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10029 — 예상체결등락률상위요청
+    # -----------------------------------------------------------------------
+
+    def get_expected_trade_upper(
+        self,
+        market: "RkinfoMarketType",
+        sort_type: str,
+        trade_qty_cond: str,
+        stock_cond: str,
+        credit_cond: str,
+        price_cond: str,
+        exchange: "RkinfoStexType",
+    ) -> ExpectedTradeUpper:
+        """예상체결 등락률 상위 종목을 조회한다 (ka10029).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            sort_type: 정렬구분.
+                ``"1"``: 상승률, ``"2"``: 상승폭, ``"3"``: 보합, ``"4"``: 하락률,
+                ``"5"``: 하락폭, ``"6"``: 체결량, ``"7"``: 상한, ``"8"``: 하한.
+            trade_qty_cond: 거래량조건 (``"0"``, ``"1"``, ``"3"``, ``"5"``, ``"10"``, ``"50"``, ``"100"``).
+            stock_cond: 종목조건 (``"0"``~``"16"``).
+            credit_cond: 신용조건 (``"0"``, ``"9"`` 등).
+            price_cond: 가격조건 (``"0"``~``"10"``).
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            예상체결등락률상위 ``ExpectedTradeUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":      _RKINFO_MARKET_CODE[market],
+                "sort_tp":      sort_type,
+                "trde_qty_cnd": trade_qty_cond,
+                "stk_cnd":      stock_cond,
+                "crd_cnd":      credit_cond,
+                "pric_cnd":     price_cond,
+                "stex_tp":      _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10029"),
+        ))
+        items = _SCHEMAS["ka10029"].decode(raw)
+        return ExpectedTradeUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10030 — 당일거래량상위요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_trade_qty_upper(
+        self,
+        market: "RkinfoMarketType",
+        sort_type: str,
+        stock_cond: str,
+        credit_type: str,
+        trade_qty_type: str,
+        price_type: str,
+        trade_amt_type: str,
+        market_open_type: str,
+        exchange: "RkinfoStexType",
+    ) -> DailyTradeQtyUpper:
+        """당일거래량 상위 종목을 조회한다 (ka10030).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            sort_type: 정렬구분. ``"1"``: 거래량, ``"2"``: 거래회전율, ``"3"``: 거래대금.
+            stock_cond: 관리종목포함 (``"0"``~``"16"``).
+            credit_type: 신용구분 (``"0"``, ``"9"`` 등).
+            trade_qty_type: 거래량구분 (``"0"``, ``"5"``, ``"10"`` 등).
+            price_type: 가격구분 (``"0"``~``"9"``).
+            trade_amt_type: 거래대금구분 (``"0"``, ``"1"`` 등).
+            market_open_type: 장운영구분. ``"0"``: 전체, ``"1"``: 장중, ``"2"``: 장전시간외, ``"3"``: 장후시간외.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            당일거래량상위 ``DailyTradeQtyUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":       _RKINFO_MARKET_CODE[market],
+                "sort_tp":       sort_type,
+                "mang_stk_incls": stock_cond,
+                "crd_tp":        credit_type,
+                "trde_qty_tp":   trade_qty_type,
+                "pric_tp":       price_type,
+                "trde_prica_tp": trade_amt_type,
+                "mrkt_open_tp":  market_open_type,
+                "stex_tp":       _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10030"),
+        ))
+        items = _SCHEMAS["ka10030"].decode(raw)
+        return DailyTradeQtyUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10031 — 전일거래량상위요청
+    # -----------------------------------------------------------------------
+
+    def get_prev_trade_qty_upper(
+        self,
+        market: "RkinfoMarketType",
+        query_type: str,
+        rank_start: str,
+        rank_end: str,
+        exchange: "RkinfoStexType",
+    ) -> PrevTradeQtyUpper:
+        """전일거래량 상위 종목을 조회한다 (ka10031).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            query_type: 조회구분. ``"1"``: 전일거래량 상위100, ``"2"``: 전일거래대금 상위100.
+            rank_start: 순위시작 (``"0"``~``"100"`` 값 중 조회 시작 순위).
+            rank_end: 순위끝 (``"0"``~``"100"`` 값 중 조회 끝 순위).
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            전일거래량상위 ``PrevTradeQtyUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":   _RKINFO_MARKET_CODE[market],
+                "qry_tp":    query_type,
+                "rank_strt": rank_start,
+                "rank_end":  rank_end,
+                "stex_tp":   _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10031"),
+        ))
+        items = _SCHEMAS["ka10031"].decode(raw)
+        return PrevTradeQtyUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10032 — 거래대금상위요청
+    # -----------------------------------------------------------------------
+
+    def get_trade_amt_upper(
+        self,
+        market: "RkinfoMarketType",
+        include_managed: str,
+        exchange: "RkinfoStexType",
+    ) -> TradeAmtUpper:
+        """거래대금 상위 종목을 조회한다 (ka10032).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            include_managed: 관리종목포함. ``"0"``: 미포함, ``"1"``: 포함.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            거래대금상위 ``TradeAmtUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":       _RKINFO_MARKET_CODE[market],
+                "mang_stk_incls": include_managed,
+                "stex_tp":       _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10032"),
+        ))
+        items = _SCHEMAS["ka10032"].decode(raw)
+        return TradeAmtUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10033 — 신용비율상위요청
+    # -----------------------------------------------------------------------
+
+    def get_credit_ratio_upper(
+        self,
+        market: "RkinfoMarketType",
+        trade_qty_type: str,
+        stock_cond: str,
+        updown_incls: str,
+        credit_cond: str,
+        exchange: "RkinfoStexType",
+    ) -> CreditRatioUpper:
+        """신용비율 상위 종목을 조회한다 (ka10033).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            trade_qty_type: 거래량구분 (``"0"``, ``"10"`` 등).
+            stock_cond: 종목조건 (``"0"``~``"9"``).
+            updown_incls: 상하한포함. ``"0"``: 미포함, ``"1"``: 포함.
+            credit_cond: 신용조건 (``"0"``, ``"9"`` 등).
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            신용비율상위 ``CreditRatioUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":     _RKINFO_MARKET_CODE[market],
+                "trde_qty_tp": trade_qty_type,
+                "stk_cnd":     stock_cond,
+                "updown_incls": updown_incls,
+                "crd_cnd":     credit_cond,
+                "stex_tp":     _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10033"),
+        ))
+        items = _SCHEMAS["ka10033"].decode(raw)
+        return CreditRatioUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10034 — 외인기간별매매상위요청
+    # -----------------------------------------------------------------------
+
+    def get_foreign_period_trade_upper(
+        self,
+        market: "RkinfoMarketType",
+        trade_type: str,
+        period: str,
+        exchange: "RkinfoStexType",
+    ) -> ForeignPeriodTradeUpper:
+        """외국인 기간별 매매 상위 종목을 조회한다 (ka10034).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            trade_type: 매매구분. ``"1"``: 순매도, ``"2"``: 순매수, ``"3"``: 순매매.
+            period: 기간. ``"0"``: 당일, ``"1"``: 전일, ``"5"``: 5일, ``"10"``: 10일, ``"20"``: 20일, ``"60"``: 60일.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            외인기간별매매상위 ``ForeignPeriodTradeUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp": _RKINFO_MARKET_CODE[market],
+                "trde_tp": trade_type,
+                "dt":      period,
+                "stex_tp": _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10034"),
+        ))
+        items = _SCHEMAS["ka10034"].decode(raw)
+        return ForeignPeriodTradeUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10035 — 외인연속순매매상위요청
+    # -----------------------------------------------------------------------
+
+    def get_foreign_consec_trade_upper(
+        self,
+        market: "RkinfoMarketType",
+        trade_type: str,
+        base_date: "RkinfoBaseDateType",
+        exchange: "RkinfoStexType",
+    ) -> ForeignConsecTradeUpper:
+        """외국인 연속 순매매 상위 종목을 조회한다 (ka10035).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            trade_type: 매매구분. ``"1"``: 연속순매도, ``"2"``: 연속순매수.
+            base_date: 기준일구분. ``"today"``: 당일기준, ``"prev"``: 전일기준.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            외인연속순매매상위 ``ForeignConsecTradeUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":    _RKINFO_MARKET_CODE[market],
+                "trde_tp":    trade_type,
+                "base_dt_tp": _RKINFO_BASE_DATE_CODE[base_date],
+                "stex_tp":    _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10035"),
+        ))
+        items = _SCHEMAS["ka10035"].decode(raw)
+        return ForeignConsecTradeUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10036 — 외인한도소진율증가상위
+    # -----------------------------------------------------------------------
+
+    def get_foreign_limit_exhaust_upper(
+        self,
+        market: "RkinfoMarketType",
+        period: str,
+        exchange: "RkinfoStexType",
+    ) -> ForeignLimitExhaustUpper:
+        """외국인 한도소진율 증가 상위 종목을 조회한다 (ka10036).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            period: 기간. ``"0"``: 당일, ``"1"``: 전일, ``"5"``: 5일, ``"10"``: 10일, ``"20"``: 20일, ``"60"``: 60일.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            외인한도소진율증가상위 ``ForeignLimitExhaustUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp": _RKINFO_MARKET_CODE[market],
+                "dt":      period,
+                "stex_tp": _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10036"),
+        ))
+        items = _SCHEMAS["ka10036"].decode(raw)
+        return ForeignLimitExhaustUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10037 — 외국계창구매매상위요청
+    # -----------------------------------------------------------------------
+
+    def get_foreign_broker_trade_upper(
+        self,
+        market: "RkinfoMarketType",
+        period: str,
+        trade_type: str,
+        sort_type: str,
+        exchange: "RkinfoStexType",
+    ) -> ForeignBrokerTradeUpper:
+        """외국계 창구 매매 상위 종목을 조회한다 (ka10037).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            period: 기간. ``"0"``: 당일, ``"1"``: 전일, ``"5"``: 5일, ``"10"``: 10일, ``"20"``: 20일, ``"60"``: 60일.
+            trade_type: 매매구분. ``"1"``: 순매수, ``"2"``: 순매도, ``"3"``: 매수, ``"4"``: 매도.
+            sort_type: 정렬구분. ``"1"``: 금액, ``"2"``: 수량.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            외국계창구매매상위 ``ForeignBrokerTradeUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp": _RKINFO_MARKET_CODE[market],
+                "dt":      period,
+                "trde_tp": trade_type,
+                "sort_tp": sort_type,
+                "stex_tp": _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10037"),
+        ))
+        items = _SCHEMAS["ka10037"].decode(raw)
+        return ForeignBrokerTradeUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10038 — 종목별증권사순위요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_broker_rank(
+        self,
+        stock_code: str,
+        query_type: str,
+        period: str = "",
+        start_date: str = "",
+        end_date: str = "",
+    ) -> StockBrokerRank:
+        """종목별 증권사 순위를 조회한다 (ka10038).
+
+        Args:
+            stock_code: 종목코드 (예: ``"005930"``).
+            query_type: 조회구분. ``"1"``: 순매도순위정렬, ``"2"``: 순매수순위정렬.
+            period: 기간. ``"1"``: 전일, ``"4"``: 5일, ``"9"``: 10일, ``"19"``: 20일 등 (기본 ``""``).
+            start_date: 시작일자 ``YYYYMMDD`` (기본 ``""``).
+            end_date: 종료일자 ``YYYYMMDD`` (기본 ``""``).
+
+        Returns:
+            종목별증권사순위 ``StockBrokerRank``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "stk_cd":  stock_code,
+                "strt_dt": start_date,
+                "end_dt":  end_date,
+                "qry_tp":  query_type,
+                "dt":      period,
+            },
+            headers=self._headers("ka10038"),
+        ))
+        items = _SCHEMAS["ka10038"].decode(raw)
+        return StockBrokerRank(
+            rank_1=raw.get("rank_1", ""),
+            rank_2=raw.get("rank_2", ""),
+            rank_3=raw.get("rank_3", ""),
+            prid_trde_qty=raw.get("prid_trde_qty", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10039 — 증권사별매매상위요청
+    # -----------------------------------------------------------------------
+
+    def get_broker_trade_upper(
+        self,
+        broker_code: str,
+        trade_qty_type: str,
+        trade_type: str,
+        period: str,
+        exchange: "RkinfoStexType",
+    ) -> BrokerTradeUpper:
+        """증권사별 매매 상위 종목을 조회한다 (ka10039).
+
+        Args:
+            broker_code: 회원사코드 (ka10102로 조회, 예: ``"001"``).
+            trade_qty_type: 거래량구분 (``"0"``, ``"5"``, ``"10"`` 등).
+            trade_type: 매매구분. ``"1"``: 순매수, ``"2"``: 순매도.
+            period: 기간. ``"1"``: 전일, ``"5"``: 5일, ``"10"``: 10일, ``"60"``: 60일.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            증권사별매매상위 ``BrokerTradeUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mmcm_cd":     broker_code,
+                "trde_qty_tp": trade_qty_type,
+                "trde_tp":     trade_type,
+                "dt":          period,
+                "stex_tp":     _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10039"),
+        ))
+        items = _SCHEMAS["ka10039"].decode(raw)
+        return BrokerTradeUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10040 — 당일주요거래원요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_main_broker(self, stock_code: str) -> DailyMainBroker:
+        """종목의 당일 주요 거래원(매도/매수 상위 5개)을 조회한다 (ka10040).
+
+        Args:
+            stock_code: 종목코드 (예: ``"005930"``).
+
+        Returns:
+            당일주요거래원 ``DailyMainBroker``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10040"),
+        ))
+        exit_items = _SCHEMAS["ka10040"].decode(raw)
+        return DailyMainBroker(
+            sel_trde_ori_1=raw.get("sel_trde_ori_1", ""),
+            sel_trde_ori_qty_1=raw.get("sel_trde_ori_qty_1", ""),
+            sel_trde_ori_irds_1=raw.get("sel_trde_ori_irds_1", ""),
+            buy_trde_ori_1=raw.get("buy_trde_ori_1", ""),
+            buy_trde_ori_qty_1=raw.get("buy_trde_ori_qty_1", ""),
+            buy_trde_ori_irds_1=raw.get("buy_trde_ori_irds_1", ""),
+            sel_trde_ori_2=raw.get("sel_trde_ori_2", ""),
+            sel_trde_ori_qty_2=raw.get("sel_trde_ori_qty_2", ""),
+            sel_trde_ori_irds_2=raw.get("sel_trde_ori_irds_2", ""),
+            buy_trde_ori_2=raw.get("buy_trde_ori_2", ""),
+            buy_trde_ori_qty_2=raw.get("buy_trde_ori_qty_2", ""),
+            buy_trde_ori_irds_2=raw.get("buy_trde_ori_irds_2", ""),
+            sel_trde_ori_3=raw.get("sel_trde_ori_3", ""),
+            sel_trde_ori_qty_3=raw.get("sel_trde_ori_qty_3", ""),
+            sel_trde_ori_irds_3=raw.get("sel_trde_ori_irds_3", ""),
+            buy_trde_ori_3=raw.get("buy_trde_ori_3", ""),
+            buy_trde_ori_qty_3=raw.get("buy_trde_ori_qty_3", ""),
+            buy_trde_ori_irds_3=raw.get("buy_trde_ori_irds_3", ""),
+            sel_trde_ori_4=raw.get("sel_trde_ori_4", ""),
+            sel_trde_ori_qty_4=raw.get("sel_trde_ori_qty_4", ""),
+            sel_trde_ori_irds_4=raw.get("sel_trde_ori_irds_4", ""),
+            buy_trde_ori_4=raw.get("buy_trde_ori_4", ""),
+            buy_trde_ori_qty_4=raw.get("buy_trde_ori_qty_4", ""),
+            buy_trde_ori_irds_4=raw.get("buy_trde_ori_irds_4", ""),
+            sel_trde_ori_5=raw.get("sel_trde_ori_5", ""),
+            sel_trde_ori_qty_5=raw.get("sel_trde_ori_qty_5", ""),
+            sel_trde_ori_irds_5=raw.get("sel_trde_ori_irds_5", ""),
+            buy_trde_ori_5=raw.get("buy_trde_ori_5", ""),
+            buy_trde_ori_qty_5=raw.get("buy_trde_ori_qty_5", ""),
+            buy_trde_ori_irds_5=raw.get("buy_trde_ori_irds_5", ""),
+            frgn_sel_prsm_sum=raw.get("frgn_sel_prsm_sum", ""),
+            frgn_sel_prsm_sum_chang=raw.get("frgn_sel_prsm_sum_chang", ""),
+            frgn_buy_prsm_sum=raw.get("frgn_buy_prsm_sum", ""),
+            frgn_buy_prsm_sum_chang=raw.get("frgn_buy_prsm_sum_chang", ""),
+            items=exit_items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10042 — 순매수거래원순위요청
+    # -----------------------------------------------------------------------
+
+    def get_net_buy_broker_rank(
+        self,
+        stock_code: str,
+        query_date_type: str,
+        sort_base: str,
+        period: str = "",
+        start_date: str = "",
+        end_date: str = "",
+    ) -> NetBuyBrokerRank:
+        """종목의 순매수 거래원 순위를 조회한다 (ka10042).
+
+        Args:
+            stock_code: 종목코드 (예: ``"005930"``).
+            query_date_type: 조회기간구분.
+                ``"0"``: 기간으로 조회, ``"1"``: 시작일자·종료일자로 조회.
+            sort_base: 정렬기준. ``"1"``: 종가순, ``"2"``: 날짜순.
+            period: 기간. ``"5"``: 5일, ``"10"``: 10일, ``"20"``: 20일 등 (기본 ``""``).
+            start_date: 시작일자 ``YYYYMMDD`` (기본 ``""``).
+            end_date: 종료일자 ``YYYYMMDD`` (기본 ``""``).
+
+        Returns:
+            순매수거래원순위 ``NetBuyBrokerRank``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "stk_cd":    stock_code,
+                "strt_dt":   start_date,
+                "end_dt":    end_date,
+                "qry_dt_tp": query_date_type,
+                "pot_tp":    "0",
+                "dt":        period,
+                "sort_base": sort_base,
+            },
+            headers=self._headers("ka10042"),
+        ))
+        items = _SCHEMAS["ka10042"].decode(raw)
+        return NetBuyBrokerRank(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10053 — 당일상위이탈원요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_top_exit(self, stock_code: str) -> DailyTopExit:
+        """종목의 당일 상위 이탈원 리스트를 조회한다 (ka10053).
+
+        Args:
+            stock_code: 종목코드 (예: ``"005930"``).
+
+        Returns:
+            당일상위이탈원 ``DailyTopExit``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10053"),
+        ))
+        items = _SCHEMAS["ka10053"].decode(raw)
+        return DailyTopExit(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10062 — 동일순매매순위요청
+    # -----------------------------------------------------------------------
+
+    def get_same_net_trade_rank(
+        self,
+        start_date: str,
+        market: "RkinfoMarketType",
+        trade_type: str,
+        sort_cnd: "RkinfoSortCndType",
+        unit_type: str,
+        exchange: "RkinfoStexType",
+        end_date: str = "",
+    ) -> SameNetTradeRank:
+        """기관·외국인 동일 순매매 순위를 조회한다 (ka10062).
+
+        Args:
+            start_date: 시작일자 ``YYYYMMDD``.
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            trade_type: 매매구분. ``"1"``: 순매수, ``"2"``: 순매도.
+            sort_cnd: 정렬조건. ``"qty"``: 수량, ``"amount"``: 금액.
+            unit_type: 단위구분. ``"1"``: 단주, ``"1000"``: 천주.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            end_date: 종료일자 ``YYYYMMDD`` (기본 ``""``).
+
+        Returns:
+            동일순매매순위 ``SameNetTradeRank``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "strt_dt":  start_date,
+                "end_dt":   end_date,
+                "mrkt_tp":  _RKINFO_MARKET_CODE[market],
+                "trde_tp":  trade_type,
+                "sort_cnd": _RKINFO_SORT_CND_CODE[sort_cnd],
+                "unit_tp":  unit_type,
+                "stex_tp":  _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka10062"),
+        ))
+        items = _SCHEMAS["ka10062"].decode(raw)
+        return SameNetTradeRank(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10065 — 장중투자자별매매상위요청
+    # -----------------------------------------------------------------------
+
+    def get_investor_trade_upper(
+        self,
+        trade_type: str,
+        market: "RkinfoMarketType",
+        org_type: "RkinfoOrgType",
+    ) -> InvestorTradeUpper:
+        """장중 투자자별 매매 상위 종목을 조회한다 (ka10065).
+
+        Args:
+            trade_type: 매매구분. ``"1"``: 순매수, ``"2"``: 순매도.
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            org_type: 기관구분.
+                ``"foreign"``: 외국인, ``"institution"``: 기관계 등.
+
+        Returns:
+            장중투자자별매매상위 ``InvestorTradeUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "trde_tp": trade_type,
+                "mrkt_tp": _RKINFO_MARKET_CODE[market],
+                "orgn_tp": _RKINFO_ORG_TYPE_CODE[org_type],
+            },
+            headers=self._headers("ka10065"),
+        ))
+        items = _SCHEMAS["ka10065"].decode(raw)
+        return InvestorTradeUpper(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10098 — 시간외단일가등락율순위요청
+    # -----------------------------------------------------------------------
+
+    def get_after_hours_rank(
+        self,
+        market: "RkinfoMarketType",
+        sort_base: str,
+        stock_cond: str,
+        trade_qty_cond: str,
+        credit_cond: str,
+        trade_amt: str,
+    ) -> AfterHoursRank:
+        """시간외 단일가 등락율 순위를 조회한다 (ka10098).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            sort_base: 정렬기준.
+                ``"1"``: 상승률, ``"2"``: 상승폭, ``"3"``: 하락률, ``"4"``: 하락폭, ``"5"``: 보합.
+            stock_cond: 종목조건 (``"0"``~``"17"``).
+            trade_qty_cond: 거래량조건 (``"0"``, ``"10"``, ``"50"`` 등).
+            credit_cond: 신용조건 (``"0"``, ``"9"`` 등).
+            trade_amt: 거래대금 (``"0"``, ``"5"``, ``"10"`` 등).
+
+        Returns:
+            시간외단일가등락율순위 ``AfterHoursRank``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":      _RKINFO_MARKET_CODE[market],
+                "sort_base":    sort_base,
+                "stk_cnd":      stock_cond,
+                "trde_qty_cnd": trade_qty_cond,
+                "crd_cnd":      credit_cond,
+                "trde_prica":   trade_amt,
+            },
+            headers=self._headers("ka10098"),
+        ))
+        items = _SCHEMAS["ka10098"].decode(raw)
+        return AfterHoursRank(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90009 — 외국인기관매매상위요청
+    # -----------------------------------------------------------------------
+
+    def get_foreign_institution_trade_upper(
+        self,
+        market: "RkinfoMarketType",
+        amt_qty_type: str,
+        query_date_type: str,
+        exchange: "RkinfoStexType",
+        date: str = "",
+    ) -> ForeignInstitutionTradeUpper:
+        """외국인·기관 매매 상위 종목을 조회한다 (ka90009).
+
+        Args:
+            market: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            amt_qty_type: 금액수량구분. ``"1"``: 금액(천만), ``"2"``: 수량(천).
+            query_date_type: 조회일자구분. ``"0"``: 조회일자 미포함, ``"1"``: 조회일자 포함.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            date: 날짜 ``YYYYMMDD`` (기본 ``""``).
+
+        Returns:
+            외국인기관매매상위 ``ForeignInstitutionTradeUpper``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._RKINFO_PATH,
+            {
+                "mrkt_tp":    _RKINFO_MARKET_CODE[market],
+                "amt_qty_tp": amt_qty_type,
+                "qry_dt_tp":  query_date_type,
+                "date":       date,
+                "stex_tp":    _RKINFO_STEX_CODE[exchange],
+            },
+            headers=self._headers("ka90009"),
+        ))
+        items = _SCHEMAS["ka90009"].decode(raw)
+        return ForeignInstitutionTradeUpper(items=items)
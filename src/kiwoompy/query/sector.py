@@ -0,0 +1,277 @@
+"""업종 조회 — 업종 현재가·일별·투자자 순매수·프로그램 (``sect``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    AllSectorIndex,
+    AllSectorIndexItem,
+    SectAmtQtyType,
+    SectExchangeType,
+    SectMrktType,
+    SectorDailyPrice,
+    SectorDailyPriceItem,
+    SectorInvestorNetBuy,
+    SectorInvestorNetBuyItem,
+    SectorPrice,
+    SectorPriceTmItem,
+    SectorProgram,
+    SectorStockPriceItem,
+    SectorStockPrices,
+)
+from kiwoompy.query._base import (
+    _SECT_AMT_QTY_CODE,
+    _SECT_EXCHANGE_CODE,
+    _SECT_MRKT_CODE,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10051", _QueryBase._SECT_PATH, "inds_netprps", SectorInvestorNetBuyItem),
+    TrSchema("ka20001", _QueryBase._SECT_PATH, "inds_cur_prc_tm", SectorPriceTmItem),
+    TrSchema("ka20002", _QueryBase._SECT_PATH, "inds_stkpc", SectorStockPriceItem),
+    TrSchema("ka20003", _QueryBase._SECT_PATH, "all_inds_idex", AllSectorIndexItem),
+    TrSchema("ka20009", _QueryBase._SECT_PATH, "inds_cur_prc_daly_rept", SectorDailyPriceItem),
+)
+
+
+class SectorQuery(_QueryBase):
+    """업종 조회 클라이언트.
+
+    ``KiwoomQuery.sector``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10010 — 업종프로그램요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_program(self, stock_code: str) -> SectorProgram:
+        """업종 프로그램 매매 정보를 조회한다 (ka10010).
+
+        Args:
+            stock_code: 거래소별 종목코드 (예: ``"005930"``, ``"039490_NX"``).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorProgram` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SECT_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10010"),
+        ))
+        return SectorProgram(
+            dfrt_trst_sell_qty=raw.get("dfrt_trst_sell_qty", ""),
+            dfrt_trst_sell_amt=raw.get("dfrt_trst_sell_amt", ""),
+            dfrt_trst_buy_qty=raw.get("dfrt_trst_buy_qty", ""),
+            dfrt_trst_buy_amt=raw.get("dfrt_trst_buy_amt", ""),
+            dfrt_trst_netprps_qty=raw.get("dfrt_trst_netprps_qty", ""),
+            dfrt_trst_netprps_amt=raw.get("dfrt_trst_netprps_amt", ""),
+            ndiffpro_trst_sell_qty=raw.get("ndiffpro_trst_sell_qty", ""),
+            ndiffpro_trst_sell_amt=raw.get("ndiffpro_trst_sell_amt", ""),
+            ndiffpro_trst_buy_qty=raw.get("ndiffpro_trst_buy_qty", ""),
+            ndiffpro_trst_buy_amt=raw.get("ndiffpro_trst_buy_amt", ""),
+            ndiffpro_trst_netprps_qty=raw.get("ndiffpro_trst_netprps_qty", ""),
+            ndiffpro_trst_netprps_amt=raw.get("ndiffpro_trst_netprps_amt", ""),
+            all_dfrt_trst_sell_qty=raw.get("all_dfrt_trst_sell_qty", ""),
+            all_dfrt_trst_sell_amt=raw.get("all_dfrt_trst_sell_amt", ""),
+            all_dfrt_trst_buy_qty=raw.get("all_dfrt_trst_buy_qty", ""),
+            all_dfrt_trst_buy_amt=raw.get("all_dfrt_trst_buy_amt", ""),
+            all_dfrt_trst_netprps_qty=raw.get("all_dfrt_trst_netprps_qty", ""),
+            all_dfrt_trst_netprps_amt=raw.get("all_dfrt_trst_netprps_amt", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10051 — 업종별투자자순매수요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_investor_net_buy(
+        self,
+        market: "SectMrktType",
+        amt_qty: "SectAmtQtyType",
+        base_date: str = "",
+        exchange: "SectExchangeType" = "all",
+    ) -> SectorInvestorNetBuy:
+        """업종별 투자자 순매수 현황을 조회한다 (ka10051).
+
+        Args:
+            market: 시장구분 (``"kospi"`` / ``"kosdaq"`` / ``"kospi200"``).
+            amt_qty: 금액수량구분 (``"amount"`` / ``"qty"``).
+            base_date: 기준일자 (``"YYYYMMDD"``). 생략 시 당일.
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``). 기본 ``"all"``.
+
+        Returns:
+            :class:`~kiwoompy.models.SectorInvestorNetBuy` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SECT_PATH,
+            {
+                "mrkt_tp":   _SECT_MRKT_CODE[market],
+                "amt_qty_tp": _SECT_AMT_QTY_CODE[amt_qty],
+                "base_dt":   base_date,
+                "stex_tp":   _SECT_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10051"),
+        ))
+        items = _SCHEMAS["ka10051"].decode(raw)
+        return SectorInvestorNetBuy(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka20001 — 업종현재가요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_price(
+        self,
+        market: "SectMrktType",
+        sector_code: str,
+    ) -> SectorPrice:
+        """업종 현재가 정보를 조회한다 (ka20001).
+
+        Args:
+            market: 시장구분 (``"kospi"`` / ``"kosdaq"`` / ``"kospi200"``).
+            sector_code: 업종코드 (예: ``"001"``).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorPrice` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SECT_PATH,
+            {
+                "mrkt_tp": _SECT_MRKT_CODE[market],
+                "inds_cd": sector_code,
+            },
+            headers=self._headers("ka20001"),
+        ))
+        items = _SCHEMAS["ka20001"].decode(raw)
+        return SectorPrice(
+            cur_prc=raw.get("cur_prc", ""),
+            pred_pre_sig=raw.get("pred_pre_sig", ""),
+            pred_pre=raw.get("pred_pre", ""),
+            flu_rt=raw.get("flu_rt", ""),
+            trde_qty=raw.get("trde_qty", ""),
+            trde_prica=raw.get("trde_prica", ""),
+            trde_frmatn_stk_num=raw.get("trde_frmatn_stk_num", ""),
+            trde_frmatn_rt=raw.get("trde_frmatn_rt", ""),
+            open_pric=raw.get("open_pric", ""),
+            high_pric=raw.get("high_pric", ""),
+            low_pric=raw.get("low_pric", ""),
+            upl=raw.get("upl", ""),
+            rising=raw.get("rising", ""),
+            stdns=raw.get("stdns", ""),
+            fall=raw.get("fall", ""),
+            lst=raw.get("lst", ""),
+            wk52_hgst_pric=raw.get("52wk_hgst_pric", ""),
+            wk52_hgst_pric_dt=raw.get("52wk_hgst_pric_dt", ""),
+            wk52_hgst_pric_pre_rt=raw.get("52wk_hgst_pric_pre_rt", ""),
+            wk52_lwst_pric=raw.get("52wk_lwst_pric", ""),
+            wk52_lwst_pric_dt=raw.get("52wk_lwst_pric_dt", ""),
+            wk52_lwst_pric_pre_rt=raw.get("52wk_lwst_pric_pre_rt", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka20002 — 업종별주가요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_stock_prices(
+        self,
+        market: "SectMrktType",
+        sector_code: str,
+        exchange: "SectExchangeType" = "krx",
+    ) -> SectorStockPrices:
+        """업종 내 구성 종목별 주가를 조회한다 (ka20002).
+
+        Args:
+            market: 시장구분 (``"kospi"`` / ``"kosdaq"`` / ``"kospi200"``).
+            sector_code: 업종코드 (예: ``"001"``).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``). 기본 ``"krx"``.
+
+        Returns:
+            :class:`~kiwoompy.models.SectorStockPrices` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SECT_PATH,
+            {
+                "mrkt_tp": _SECT_MRKT_CODE[market],
+                "inds_cd": sector_code,
+                "stex_tp": _SECT_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka20002"),
+        ))
+        items = _SCHEMAS["ka20002"].decode(raw)
+        return SectorStockPrices(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka20003 — 전업종지수요청
+    # -----------------------------------------------------------------------
+
+    def get_all_sector_index(self, sector_code: str) -> AllSectorIndex:
+        """전 업종 지수를 조회한다 (ka20003).
+
+        Args:
+            sector_code: 업종코드 (``"001"``: 코스피 종합, ``"101"``: 코스닥 종합).
+
+        Returns:
+            :class:`~kiwoompy.models.AllSectorIndex` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SECT_PATH,
+            {"inds_cd": sector_code},
+            headers=self._headers("ka20003"),
+        ))
+        items = _SCHEMAS["ka20003"].decode(raw)
+        return AllSectorIndex(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka20009 — 업종현재가일별요청
+    # -----------------------------------------------------------------------
+
+    def get_sector_daily_price(
+        self,
+        market: "SectMrktType",
+        sector_code: str,
+    ) -> SectorDailyPrice:
+        """업종 현재가 일별 데이터를 조회한다 (ka20009).
+
+        Args:
+            market: 시장구분 (``"kospi"`` / ``"kosdaq"`` / ``"kospi200"``).
+            sector_code: 업종코드 (예: ``"001"``).
+
+        Returns:
+            :class:`~kiwoompy.models.SectorDailyPrice` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SECT_PATH,
+            {
+                "mrkt_tp": _SECT_MRKT_CODE[market],
+                "inds_cd": sector_code,
+            },
+            headers=self._headers("ka20009"),
+        ))
+        items = _SCHEMAS["ka20009"].decode(raw)
+        return SectorDailyPrice(
+            cur_prc=raw.get("cur_prc", ""),
+            pred_pre_sig=raw.get("pred_pre_sig", ""),
+            pred_pre=raw.get("pred_pre", ""),
+            flu_rt=raw.get("flu_rt", ""),
+            trde_qty=raw.get("trde_qty", ""),
+            trde_prica=raw.get("trde_prica", ""),
+            trde_frmatn_stk_num=raw.get("trde_frmatn_stk_num", ""),
+            trde_frmatn_rt=raw.get("trde_frmatn_rt", ""),
+            open_pric=raw.get("open_pric", ""),
+            high_pric=raw.get("high_pric", ""),
+            low_pric=raw.get("low_pric", ""),
+            upl=raw.get("upl", ""),
+            rising=raw.get("rising", ""),
+            stdns=raw.get("stdns", ""),
+            fall=raw.get("fall", ""),
+            lst=raw.get("lst", ""),
+            wk52_hgst_pric=raw.get("52wk_hgst_pric", ""),
+            wk52_hgst_pric_dt=raw.get("52wk_hgst_pric_dt", ""),
+            wk52_hgst_pric_pre_rt=raw.get("52wk_hgst_pric_pre_rt", ""),
+            wk52_lwst_pric=raw.get("52wk_lwst_pric", ""),
+            wk52_lwst_pric_dt=raw.get("52wk_lwst_pric_dt", ""),
+            wk52_lwst_pric_pre_rt=raw.get("52wk_lwst_pric_pre_rt", ""),
+            items=items,
+        )
@@ -0,0 +1,57 @@
+"""공매도 조회 — 공매도 추이 (``shsa``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    ShortSellItem,
+    ShortSellTrend,
+)
+from kiwoompy.query._base import _QueryBase, _check
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10014", _QueryBase._SHSA_PATH, "shrts_trnsn", ShortSellItem),
+)
+
+
+class ShortSellQuery(_QueryBase):
+    """공매도 조회 클라이언트.
+
+    ``KiwoomQuery.short_sell``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10014 — 공매도추이요청
+    # -----------------------------------------------------------------------
+
+    def get_short_sell_trend(
+        self,
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+        time_type: str = "1",
+    ) -> ShortSellTrend:
+        """종목별 공매도 추이를 조회한다 (ka10014).
+
+        Args:
+            stock_code: 거래소별 종목코드 (예: ``"005930"``).
+            start_date: 시작일자 (``"YYYYMMDD"``).
+            end_date: 종료일자 (``"YYYYMMDD"``).
+            time_type: 시간구분 (``"0"``: 시작일, ``"1"``: 기간). 기본 ``"1"``.
+
+        Returns:
+            :class:`~kiwoompy.models.ShortSellTrend` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SHSA_PATH,
+            {
+                "stk_cd":  stock_code,
+                "tm_tp":   time_type,
+                "strt_dt": start_date,
+                "end_dt":  end_date,
+            },
+            headers=self._headers("ka10014"),
+        ))
+        items = _SCHEMAS["ka10014"].decode(raw)
+        return ShortSellTrend(items=items)
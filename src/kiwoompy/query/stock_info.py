@@ -0,0 +1,1295 @@
+"""종목정보 조회 — 종목 기본정보·리스트·거래원·신용주문 가능 종목 (``stkinfo``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    AmtQtyType,
+    BrokerInstantVolume,
+    BrokerInstantVolumeItem,
+    BrokerItem,
+    BrokerList,
+    BrokerSupplyAnalysis,
+    BrokerSupplyItem,
+    CreditQueryType,
+    CreditTradingItem,
+    CreditTradingTrend,
+    DailyTradingDetail,
+    DailyTradingDetailItem,
+    ExecutionInfo,
+    ExecutionInfoItem,
+    HighLowPER,
+    HighLowPERItem,
+    HighLowSelectType,
+    HighLowStockItem,
+    HighLowStocks,
+    InstitutionTradeType,
+    InvestorDailyStockItem,
+    InvestorDailyStocks,
+    InvestorTradeType,
+    InvestorType2,
+    LimitStockItem,
+    LimitStocks,
+    MrkcondExchangeType,
+    MrktType3,
+    MrktType3Ext,
+    NearHighLow,
+    NearHighLowItem,
+    OpenPriceChange,
+    OpenPriceChangeItem,
+    PERType,
+    PriceSurgeItem,
+    PriceSurgeStocks,
+    SectorItem,
+    SectorList,
+    SectorMarketType,
+    StkMarketType,
+    StockBrokers,
+    StockDetail,
+    StockInfo,
+    StockInvestorByDay,
+    StockInvestorItem,
+    StockInvestorTotal,
+    StockList,
+    StockListItem,
+    SupplyConcentration,
+    SupplyConcentrationItem,
+    TickMinType,
+    TodayPrevExecution,
+    TodayPrevExecutionItem,
+    TodayPrevExecutionQty,
+    TodayPrevExecutionQtyItem,
+    TodayPrevType,
+    UnitType,
+    VIStockItem,
+    VIStocks,
+    VolumeUpdatedItem,
+    VolumeUpdatedStocks,
+    WatchlistInfo,
+    WatchlistStockItem,
+    BrokerEntry,
+    CreditLoanAvailability,
+    CreditLoanStockItem,
+    CreditLoanStocks,
+    CreditMarketType,
+    CreditStockGradeType,
+)
+from kiwoompy.query._base import (
+    _AMT_QTY_CODE,
+    _CREDIT_QUERY_CODE,
+    _HIGH_LOW_SELECT_CODE,
+    _INSTITUTION_TRADE_CODE,
+    _INVESTOR2_CODE,
+    _INVESTOR_TRADE_CODE,
+    _MRKCOND_EXCHANGE_CODE,
+    _MRKT_TYPE3_CODE,
+    _MRKT_TYPE3_EXT_CODE,
+    _PER_TYPE_CODE,
+    _SECTOR_MARKET_CODE,
+    _STK_MARKET_CODE,
+    _TICK_MIN_CODE,
+    _TODAY_PREV_CODE,
+    _UNIT_CODE,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10003", _QueryBase._STKINFO_PATH, "cntr_infr", ExecutionInfoItem),
+    TrSchema("ka10013", _QueryBase._STKINFO_PATH, "crd_trde_trend", CreditTradingItem),
+    TrSchema("ka10015", _QueryBase._STKINFO_PATH, "daly_trde_dtl", DailyTradingDetailItem),
+    TrSchema("ka10016", _QueryBase._STKINFO_PATH, "ntl_pric", HighLowStockItem),
+    TrSchema("ka10017", _QueryBase._STKINFO_PATH, "updown_pric", LimitStockItem),
+    TrSchema("ka10018", _QueryBase._STKINFO_PATH, "high_low_pric_alacc", NearHighLowItem),
+    TrSchema("ka10019", _QueryBase._STKINFO_PATH, "pric_jmpflu", PriceSurgeItem),
+    TrSchema("ka10024", _QueryBase._STKINFO_PATH, "trde_qty_updt", VolumeUpdatedItem),
+    TrSchema("ka10025", _QueryBase._STKINFO_PATH, "prps_cnctr", SupplyConcentrationItem),
+    TrSchema("ka10026", _QueryBase._STKINFO_PATH, "high_low_per", HighLowPERItem),
+    TrSchema("ka10028", _QueryBase._STKINFO_PATH, "open_pric_pre_flu_rt", OpenPriceChangeItem),
+    TrSchema("ka10043", _QueryBase._STKINFO_PATH, "trde_ori_prps_anly", BrokerSupplyItem),
+    TrSchema(
+        "ka10052",
+        _QueryBase._STKINFO_PATH,
+        "trde_ori_mont_trde_qty",
+        BrokerInstantVolumeItem,
+    ),
+    TrSchema("ka10054", _QueryBase._STKINFO_PATH, "motn_stk", VIStockItem),
+    TrSchema("ka10055", _QueryBase._STKINFO_PATH, "tdy_pred_cntr_qty", TodayPrevExecutionQtyItem),
+    TrSchema("ka10058", _QueryBase._STKINFO_PATH, "invsr_daly_trde_stk", InvestorDailyStockItem),
+    TrSchema("ka10059", _QueryBase._STKINFO_PATH, "stk_invsr_orgn", StockInvestorItem),
+    TrSchema("ka10084", _QueryBase._STKINFO_PATH, "tdy_pred_cntr", TodayPrevExecutionItem),
+    TrSchema("ka10095", _QueryBase._STKINFO_PATH, "atn_stk_infr", WatchlistStockItem),
+    TrSchema(
+        "ka10099",
+        _QueryBase._STKINFO_PATH,
+        "list",
+        StockListItem,
+        renames={
+            "list_count": "listCount",
+            "reg_day": "regDay",
+            "last_price": "lastPrice",
+            "market_name": "marketName",
+            "up_name": "upName",
+            "nxt_enable": "nxtEnable",
+        },
+    ),
+    TrSchema(
+        "ka10101",
+        _QueryBase._STKINFO_PATH,
+        "list",
+        SectorItem,
+        renames={"market_code": "marketCode"},
+    ),
+    TrSchema("ka10102", _QueryBase._STKINFO_PATH, "list", BrokerItem),
+    TrSchema("kt20016", _QueryBase._STKINFO_PATH, "crd_loan_pos_stk", CreditLoanStockItem),
+)
+
+
+class StockInfoQuery(_QueryBase):
+    """국내주식 종목정보 조회 클라이언트.
+
+    ``KiwoomQuery.stock_info``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10001 — 주식기본정보요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_info(self, stock_code: str) -> StockInfo:
+        """주식 기본정보(현재가·재무지표·시가총액 등)를 조회한다 (ka10001).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+
+        Returns:
+            주식기본정보 ``StockInfo``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10001"),
+        ))
+        return StockInfo(
+            stk_cd=raw.get("stk_cd", ""),
+            stk_nm=raw.get("stk_nm", ""),
+            cur_prc=raw.get("cur_prc", ""),
+            flu_rt=raw.get("flu_rt", ""),
+            trde_qty=raw.get("trde_qty", ""),
+            open_pric=raw.get("open_pric", ""),
+            high_pric=raw.get("high_pric", ""),
+            low_pric=raw.get("low_pric", ""),
+            upl_pric=raw.get("upl_pric", ""),
+            lst_pric=raw.get("lst_pric", ""),
+            mac=raw.get("mac", ""),
+            per=raw.get("per", ""),
+            pbr=raw.get("pbr", ""),
+            eps=raw.get("eps", ""),
+            roe=raw.get("roe", ""),
+            flo_stk=raw.get("flo_stk", ""),
+            cap=raw.get("cap", ""),
+            oyr_hgst=raw.get("oyr_hgst", ""),
+            oyr_lwst=raw.get("oyr_lwst", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10002 — 주식거래원요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_brokers(self, stock_code: str) -> StockBrokers:
+        """주식 매도·매수 상위 5개 거래원을 조회한다 (ka10002).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+
+        Returns:
+            매도·매수 거래원 정보 ``StockBrokers``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10002"),
+        ))
+        sell_brokers = [
+            BrokerEntry(
+                name=raw.get(f"sel_trde_ori_nm_{i}", ""),
+                code=raw.get(f"sel_trde_ori_{i}", ""),
+                qty=raw.get(f"sel_trde_qty_{i}", ""),
+            )
+            for i in range(1, 6)
+        ]
+        buy_brokers = [
+            BrokerEntry(
+                name=raw.get(f"buy_trde_ori_nm_{i}", ""),
+                code=raw.get(f"buy_trde_ori_{i}", ""),
+                qty=raw.get(f"buy_trde_qty_{i}", ""),
+            )
+            for i in range(1, 6)
+        ]
+        return StockBrokers(
+            stk_cd=raw.get("stk_cd", ""),
+            stk_nm=raw.get("stk_nm", ""),
+            cur_prc=raw.get("cur_prc", ""),
+            sell_brokers=sell_brokers,
+            buy_brokers=buy_brokers,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10003 — 체결정보요청
+    # -----------------------------------------------------------------------
+
+    def get_execution_info(self, stock_code: str) -> ExecutionInfo:
+        """주식 체결 내역을 조회한다 (ka10003).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+
+        Returns:
+            체결정보 리스트 ``ExecutionInfo``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10003"),
+        ))
+        items = _SCHEMAS["ka10003"].decode(raw)
+        return ExecutionInfo(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10013 — 신용매매동향요청
+    # -----------------------------------------------------------------------
+
+    def get_credit_trading_trend(
+        self,
+        stock_code: str,
+        date: str,
+        query_type: "CreditQueryType" = "loan",
+    ) -> CreditTradingTrend:
+        """신용 매매동향(융자·대주 잔고 추이)을 조회한다 (ka10013).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            date: 조회일자 (``YYYYMMDD`` 형식).
+            query_type: 조회구분. ``"loan"``: 융자, ``"short"``: 대주.
+
+        Returns:
+            신용매매동향 리스트 ``CreditTradingTrend``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "stk_cd": stock_code,
+                "dt": date,
+                "qry_tp": _CREDIT_QUERY_CODE[query_type],
+            },
+            headers=self._headers("ka10013"),
+        ))
+        items = _SCHEMAS["ka10013"].decode(raw)
+        return CreditTradingTrend(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10015 — 일별거래상세요청
+    # -----------------------------------------------------------------------
+
+    def get_daily_trading_detail(
+        self,
+        stock_code: str,
+        start_date: str,
+    ) -> DailyTradingDetail:
+        """일별 거래상세(거래량·거래대금·투자자별 순매수 등)를 조회한다 (ka10015).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            start_date: 시작일자 (``YYYYMMDD`` 형식).
+
+        Returns:
+            일별거래상세 리스트 ``DailyTradingDetail``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "stk_cd": stock_code,
+                "strt_dt": start_date,
+            },
+            headers=self._headers("ka10015"),
+        ))
+        items = _SCHEMAS["ka10015"].decode(raw)
+        return DailyTradingDetail(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10016 — 신고저가요청
+    # -----------------------------------------------------------------------
+
+    def get_high_low_stocks(
+        self,
+        high_low_type: "HighLowSelectType",
+        market_type: "MrktType3" = "all",
+        exchange: "MrkcondExchangeType" = "all",
+        period: str = "5",
+        stock_condition: str = "0",
+        volume_type: str = "00000",
+        credit_condition: str = "0",
+        include_limit: str = "0",
+        high_low_close_type: str = "1",
+    ) -> HighLowStocks:
+        """신고가·신저가 종목을 조회한다 (ka10016).
+
+        Args:
+            high_low_type: 신고저구분. ``"high"``: 신고가, ``"low"``: 신저가.
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            period: 기간 (일). 5·10·20·60·250 중 선택.
+            stock_condition: 종목조건. ``"0"``: 전체조회 등.
+            volume_type: 거래량구분. ``"00000"``: 전체조회 등.
+            credit_condition: 신용조건. ``"0"``: 전체조회 등.
+            include_limit: 상하한포함. ``"0"``: 미포함, ``"1"``: 포함.
+            high_low_close_type: 고저종구분. ``"1"``: 고저기준, ``"2"``: 종가기준.
+
+        Returns:
+            신고저가 종목 리스트 ``HighLowStocks``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "ntl_tp": _HIGH_LOW_SELECT_CODE[high_low_type],
+                "high_low_close_tp": high_low_close_type,
+                "stk_cnd": stock_condition,
+                "trde_qty_tp": volume_type,
+                "crd_cnd": credit_condition,
+                "updown_incls": include_limit,
+                "dt": period,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10016"),
+        ))
+        items = _SCHEMAS["ka10016"].decode(raw)
+        return HighLowStocks(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10017 — 상하한가요청
+    # -----------------------------------------------------------------------
+
+    def get_limit_stocks(
+        self,
+        up_down_type: str,
+        market_type: "MrktType3" = "all",
+        exchange: "MrkcondExchangeType" = "all",
+        sort_type: str = "1",
+        stock_condition: str = "0",
+        volume_type: str = "00000",
+        credit_condition: str = "0",
+        price_condition: str = "0",
+    ) -> LimitStocks:
+        """상한가·하한가 종목을 조회한다 (ka10017).
+
+        Args:
+            up_down_type: 상하한구분.
+                ``"1"``: 상한, ``"2"``: 상승, ``"3"``: 보합, ``"4"``: 하한, ``"5"``: 하락,
+                ``"6"``: 전일상한, ``"7"``: 전일하한.
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            sort_type: 정렬구분. ``"1"``: 종목코드순, ``"2"``: 연속횟수순, ``"3"``: 등락률순.
+            stock_condition: 종목조건. ``"0"``: 전체조회 등.
+            volume_type: 거래량구분. ``"00000"``: 전체조회 등.
+            credit_condition: 신용조건. ``"0"``: 전체조회 등.
+            price_condition: 매매금구분. ``"0"``: 전체조회 등.
+
+        Returns:
+            상하한가 종목 리스트 ``LimitStocks``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "updown_tp": up_down_type,
+                "sort_tp": sort_type,
+                "stk_cnd": stock_condition,
+                "trde_qty_tp": volume_type,
+                "crd_cnd": credit_condition,
+                "trde_gold_tp": price_condition,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10017"),
+        ))
+        items = _SCHEMAS["ka10017"].decode(raw)
+        return LimitStocks(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10018 — 고저가근접요청
+    # -----------------------------------------------------------------------
+
+    def get_near_high_low(
+        self,
+        high_low_type: "HighLowSelectType",
+        approach_rate: str,
+        market_type: "MrktType3" = "all",
+        exchange: "MrkcondExchangeType" = "all",
+        volume_type: str = "00000",
+        stock_condition: str = "0",
+        credit_condition: str = "0",
+    ) -> NearHighLow:
+        """고가·저가 근접 종목을 조회한다 (ka10018).
+
+        Args:
+            high_low_type: 고저구분. ``"high"``: 고가, ``"low"``: 저가.
+            approach_rate: 근접율. ``"05"``: 0.5%, ``"10"``: 1.0%, ``"15"``: 1.5% 등.
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            volume_type: 거래량구분. ``"00000"``: 전체조회 등.
+            stock_condition: 종목조건. ``"0"``: 전체조회 등.
+            credit_condition: 신용조건. ``"0"``: 전체조회 등.
+
+        Returns:
+            고저가근접 종목 리스트 ``NearHighLow``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "high_low_tp": _HIGH_LOW_SELECT_CODE[high_low_type],
+                "alacc_rt": approach_rate,
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "trde_qty_tp": volume_type,
+                "stk_cnd": stock_condition,
+                "crd_cnd": credit_condition,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10018"),
+        ))
+        items = _SCHEMAS["ka10018"].decode(raw)
+        return NearHighLow(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10019 — 가격급등락요청
+    # -----------------------------------------------------------------------
+
+    def get_price_surge_stocks(
+        self,
+        surge_type: str,
+        time_type: str,
+        time_value: str,
+        market_type: "MrktType3Ext" = "all",
+        exchange: "MrkcondExchangeType" = "all",
+        volume_type: str = "00000",
+        stock_condition: str = "0",
+        credit_condition: str = "0",
+        price_condition: str = "0",
+        include_limit: str = "1",
+    ) -> PriceSurgeStocks:
+        """가격 급등·급락 종목을 조회한다 (ka10019).
+
+        Args:
+            surge_type: 등락구분. ``"1"``: 급등, ``"2"``: 급락.
+            time_type: 시간구분. ``"1"``: 분전, ``"2"``: 일전.
+            time_value: 시간(분 또는 일). 예) ``"60"`` → 60분 전 대비.
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``, ``"kospi200"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            volume_type: 거래량구분. ``"00000"``: 전체조회 등.
+            stock_condition: 종목조건. ``"0"``: 전체조회 등.
+            credit_condition: 신용조건. ``"0"``: 전체조회 등.
+            price_condition: 가격조건. ``"0"``: 전체조회 등.
+            include_limit: 상하한포함. ``"0"``: 미포함, ``"1"``: 포함.
+
+        Returns:
+            가격급등락 종목 리스트 ``PriceSurgeStocks``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "mrkt_tp": _MRKT_TYPE3_EXT_CODE[market_type],
+                "flu_tp": surge_type,
+                "tm_tp": time_type,
+                "tm": time_value,
+                "trde_qty_tp": volume_type,
+                "stk_cnd": stock_condition,
+                "crd_cnd": credit_condition,
+                "pric_cnd": price_condition,
+                "updown_incls": include_limit,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10019"),
+        ))
+        items = _SCHEMAS["ka10019"].decode(raw)
+        return PriceSurgeStocks(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10024 — 거래량갱신요청
+    # -----------------------------------------------------------------------
+
+    def get_volume_updated_stocks(
+        self,
+        market_type: "MrktType3" = "all",
+        cycle_type: str = "5",
+        volume_type: str = "5",
+        exchange: "MrkcondExchangeType" = "all",
+    ) -> VolumeUpdatedStocks:
+        """기간 대비 거래량이 갱신된 종목을 조회한다 (ka10024).
+
+        Args:
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            cycle_type: 주기구분. ``"5"``: 5일, ``"10"``: 10일, ``"20"``: 20일 등.
+            volume_type: 거래량구분.
+                ``"5"``: 5천주이상, ``"10"``: 만주이상, ``"50"``: 5만주이상 등.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            거래량갱신 종목 리스트 ``VolumeUpdatedStocks``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "cycle_tp": cycle_type,
+                "trde_qty_tp": volume_type,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10024"),
+        ))
+        items = _SCHEMAS["ka10024"].decode(raw)
+        return VolumeUpdatedStocks(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10025 — 매물대집중요청
+    # -----------------------------------------------------------------------
+
+    def get_supply_concentration(
+        self,
+        concentration_rate: str,
+        supply_count: str,
+        cycle_type: str = "50",
+        market_type: "MrktType3" = "all",
+        exchange: "MrkcondExchangeType" = "all",
+        current_price_entry: str = "0",
+    ) -> SupplyConcentration:
+        """매물대가 집중된 종목을 조회한다 (ka10025).
+
+        Args:
+            concentration_rate: 매물집중비율 (0~100).
+            supply_count: 매물대수 (숫자 입력).
+            cycle_type: 주기구분.
+                ``"50"``: 50일, ``"100"``: 100일, ``"150"``: 150일, ``"200"``: 200일, ``"250"``: 250일, ``"300"``: 300일.
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            current_price_entry: 현재가진입. ``"0"``: 미포함, ``"1"``: 포함.
+
+        Returns:
+            매물대집중 종목 리스트 ``SupplyConcentration``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "prps_cnctr_rt": concentration_rate,
+                "cur_prc_entry": current_price_entry,
+                "prpscnt": supply_count,
+                "cycle_tp": cycle_type,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10025"),
+        ))
+        items = _SCHEMAS["ka10025"].decode(raw)
+        return SupplyConcentration(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10026 — 고저PER요청
+    # -----------------------------------------------------------------------
+
+    def get_high_low_per(
+        self,
+        per_type: "PERType",
+        exchange: "MrkcondExchangeType" = "all",
+    ) -> HighLowPER:
+        """고PER·저PER·PBR·ROE 상위 종목을 조회한다 (ka10026).
+
+        Args:
+            per_type: PER구분.
+                ``"low_pbr"``: 저PBR, ``"high_pbr"``: 고PBR,
+                ``"low_per"``: 저PER, ``"high_per"``: 고PER,
+                ``"low_roe"``: 저ROE, ``"high_roe"``: 고ROE.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            고저PER 종목 리스트 ``HighLowPER``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "pertp": _PER_TYPE_CODE[per_type],
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10026"),
+        ))
+        items = _SCHEMAS["ka10026"].decode(raw)
+        return HighLowPER(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10028 — 시가대비등락률요청
+    # -----------------------------------------------------------------------
+
+    def get_open_price_change(
+        self,
+        sort_type: str = "1",
+        change_condition: str = "1",
+        market_type: "MrktType3" = "all",
+        exchange: "MrkcondExchangeType" = "all",
+        volume_condition: str = "0000",
+        include_limit: str = "1",
+        stock_condition: str = "0",
+        credit_condition: str = "0",
+        amount_condition: str = "0",
+    ) -> OpenPriceChange:
+        """시가 대비 등락률 상·하위 종목을 조회한다 (ka10028).
+
+        Args:
+            sort_type: 정렬구분. ``"1"``: 시가, ``"2"``: 고가, ``"3"``: 저가, ``"4"``: 기준가.
+            change_condition: 등락조건. ``"1"``: 상위, ``"2"``: 하위.
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            volume_condition: 거래량조건. ``"0000"``: 전체조회 등.
+            include_limit: 상하한포함. ``"0"``: 불포함, ``"1"``: 포함.
+            stock_condition: 종목조건. ``"0"``: 전체조회 등.
+            credit_condition: 신용조건. ``"0"``: 전체조회 등.
+            amount_condition: 거래대금조건. ``"0"``: 전체조회 등.
+
+        Returns:
+            시가대비등락률 종목 리스트 ``OpenPriceChange``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "sort_tp": sort_type,
+                "trde_qty_cnd": volume_condition,
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "updown_incls": include_limit,
+                "stk_cnd": stock_condition,
+                "crd_cnd": credit_condition,
+                "trde_prica_cnd": amount_condition,
+                "flu_cnd": change_condition,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10028"),
+        ))
+        items = _SCHEMAS["ka10028"].decode(raw)
+        return OpenPriceChange(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10043 — 거래원매물대분석요청
+    # -----------------------------------------------------------------------
+
+    def get_broker_supply_analysis(
+        self,
+        stock_code: str,
+        broker_code: str,
+        start_date: str,
+        end_date: str,
+        period: str = "5",
+        sort_base: str = "1",
+        query_date_type: str = "0",
+        time_point_type: str = "0",
+        exchange: "MrkcondExchangeType" = "all",
+    ) -> BrokerSupplyAnalysis:
+        """특정 거래원의 종목 매물대 분석 데이터를 조회한다 (ka10043).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            broker_code: 회원사코드 (3자리). ``get_broker_list()``로 조회 가능.
+            start_date: 시작일자 (``YYYYMMDD`` 형식).
+            end_date: 종료일자 (``YYYYMMDD`` 형식).
+            period: 기간. ``"5"``: 5일, ``"10"``: 10일, ``"20"``: 20일, ``"40"``: 40일, ``"60"``: 60일, ``"120"``: 120일.
+            sort_base: 정렬기준. ``"1"``: 종가순, ``"2"``: 날짜순.
+            query_date_type: 조회기간구분. ``"0"``: 기간으로 조회, ``"1"``: 시작·종료일로 조회.
+            time_point_type: 시점구분. ``"0"``: 당일, ``"1"``: 전일.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            거래원매물대분석 리스트 ``BrokerSupplyAnalysis``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "stk_cd": stock_code,
+                "strt_dt": start_date,
+                "end_dt": end_date,
+                "qry_dt_tp": query_date_type,
+                "pot_tp": time_point_type,
+                "dt": period,
+                "sort_base": sort_base,
+                "mmcm_cd": broker_code,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10043"),
+        ))
+        items = _SCHEMAS["ka10043"].decode(raw)
+        return BrokerSupplyAnalysis(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10052 — 거래원순간거래량요청
+    # -----------------------------------------------------------------------
+
+    def get_broker_instant_volume(
+        self,
+        broker_code: str,
+        market_type: str = "0",
+        stock_code: str = "",
+        volume_type: str = "0",
+        price_type: str = "0",
+        exchange: "MrkcondExchangeType" = "all",
+    ) -> BrokerInstantVolume:
+        """특정 거래원의 순간거래량을 조회한다 (ka10052).
+
+        Args:
+            broker_code: 회원사코드 (3자리). ``get_broker_list()``로 조회 가능.
+            market_type: 시장구분. ``"0"``: 전체, ``"1"``: 코스피, ``"2"``: 코스닥, ``"3"``: 종목.
+            stock_code: 종목코드. 시장구분이 ``"3"``(종목)일 때 사용.
+            volume_type: 수량구분. ``"0"``: 전체, ``"1"``: 1000주 이상 등.
+            price_type: 가격구분. ``"0"``: 전체, ``"1"``: 1천원 미만 등.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            거래원순간거래량 리스트 ``BrokerInstantVolume``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "mmcm_cd": broker_code,
+                "stk_cd": stock_code,
+                "mrkt_tp": market_type,
+                "qty_tp": volume_type,
+                "pric_tp": price_type,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10052"),
+        ))
+        items = _SCHEMAS["ka10052"].decode(raw)
+        return BrokerInstantVolume(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10054 — 변동성완화장치발동종목요청
+    # -----------------------------------------------------------------------
+
+    def get_vi_triggered_stocks(
+        self,
+        market_type: "MrktType3" = "all",
+        exchange: "MrkcondExchangeType" = "all",
+        stock_code: str = "",
+        trigger_type: str = "0",
+        trigger_direction: str = "0",
+        pre_market_type: str = "0",
+        skip_stocks: str = "000000000",
+    ) -> VIStocks:
+        """변동성완화장치(VI) 발동 종목을 조회한다 (ka10054).
+
+        Args:
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+            stock_code: 종목코드. 공백이면 전체 시장 조회.
+            trigger_type: 발동구분. ``"0"``: 전체, ``"1"``: 정적VI, ``"2"``: 동적VI, ``"3"``: 동적+정적VI.
+            trigger_direction: 발동방향. ``"0"``: 전체, ``"1"``: 상승, ``"2"``: 하락.
+            pre_market_type: 장전구분. ``"0"``: 전체, ``"1"``: 정규시장, ``"2"``: 시간외단일가.
+            skip_stocks: 제외종목 (9자리). 전종목포함: ``"000000000"``.
+
+        Returns:
+            VI 발동종목 리스트 ``VIStocks``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "bf_mkrt_tp": pre_market_type,
+                "stk_cd": stock_code,
+                "motn_tp": trigger_type,
+                "skip_stk": skip_stocks,
+                "trde_qty_tp": "0",
+                "min_trde_qty": "0",
+                "max_trde_qty": "0",
+                "trde_prica_tp": "0",
+                "min_trde_prica": "0",
+                "max_trde_prica": "0",
+                "motn_drc": trigger_direction,
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10054"),
+        ))
+        items = _SCHEMAS["ka10054"].decode(raw)
+        return VIStocks(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10055 — 당일전일체결량요청
+    # -----------------------------------------------------------------------
+
+    def get_today_prev_execution_qty(
+        self,
+        stock_code: str,
+        day_type: "TodayPrevType" = "today",
+    ) -> TodayPrevExecutionQty:
+        """당일·전일 체결량 시계열을 조회한다 (ka10055).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            day_type: 당일전일구분. ``"today"``: 당일, ``"prev"``: 전일.
+
+        Returns:
+            당일전일체결량 리스트 ``TodayPrevExecutionQty``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "stk_cd": stock_code,
+                "tdy_pred": _TODAY_PREV_CODE[day_type],
+            },
+            headers=self._headers("ka10055"),
+        ))
+        items = _SCHEMAS["ka10055"].decode(raw)
+        return TodayPrevExecutionQty(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10058 — 투자자별일별매매종목요청
+    # -----------------------------------------------------------------------
+
+    def get_investor_daily_stocks(
+        self,
+        start_date: str,
+        end_date: str,
+        trade_type: "InstitutionTradeType",
+        investor_type: "InvestorType2",
+        market_type: "MrktType3" = "all",
+        exchange: "MrkcondExchangeType" = "all",
+    ) -> InvestorDailyStocks:
+        """투자자별 일별 매매 상위 종목을 조회한다 (ka10058).
+
+        Args:
+            start_date: 시작일자 (``YYYYMMDD`` 형식).
+            end_date: 종료일자 (``YYYYMMDD`` 형식).
+            trade_type: 매매구분. ``"sell"``: 순매도, ``"buy"``: 순매수.
+            investor_type: 투자자구분.
+                ``"individual"``: 개인, ``"foreign"``: 외국인, ``"financial_inv"``: 금융투자,
+                ``"trust"``: 투신, ``"private_fund"``: 사모펀드, ``"other_fin"``: 기타금융,
+                ``"bank"``: 은행, ``"insurance"``: 보험, ``"pension"``: 연기금,
+                ``"gov"``: 국가, ``"other_corp"``: 기타법인, ``"institution"``: 기관계.
+            market_type: 시장구분. ``"all"``, ``"kospi"``, ``"kosdaq"``.
+            exchange: 거래소구분. ``"krx"``, ``"nxt"``, ``"all"``.
+
+        Returns:
+            투자자별일별매매종목 리스트 ``InvestorDailyStocks``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "strt_dt": start_date,
+                "end_dt": end_date,
+                "trde_tp": _INSTITUTION_TRADE_CODE[trade_type],
+                "mrkt_tp": _MRKT_TYPE3_CODE[market_type],
+                "invsr_tp": _INVESTOR2_CODE[investor_type],
+                "stex_tp": _MRKCOND_EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka10058"),
+        ))
+        items = _SCHEMAS["ka10058"].decode(raw)
+        return InvestorDailyStocks(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10059 — 종목별투자자기관별요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_investor_by_day(
+        self,
+        date: str,
+        stock_code: str,
+        trade_type: "InvestorTradeType" = "net_buy",
+        amount_qty_type: "AmtQtyType" = "amount",
+        unit_type: "UnitType" = "thousand",
+    ) -> StockInvestorByDay:
+        """종목별 투자자·기관별 일별 매매 현황을 조회한다 (ka10059).
+
+        Args:
+            date: 조회일자 (``YYYYMMDD`` 형식).
+            stock_code: 거래소별 종목코드.
+            trade_type: 매매구분. ``"net_buy"``: 순매수, ``"buy"``: 매수, ``"sell"``: 매도.
+            amount_qty_type: 금액수량구분. ``"amount"``: 금액, ``"qty"``: 수량.
+            unit_type: 단위구분. ``"thousand"``: 천주, ``"single"``: 단주.
+
+        Returns:
+            종목별투자자기관별 일별 리스트 ``StockInvestorByDay``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "dt": date,
+                "stk_cd": stock_code,
+                "amt_qty_tp": _AMT_QTY_CODE[amount_qty_type],
+                "trde_tp": _INVESTOR_TRADE_CODE[trade_type],
+                "unit_tp": _UNIT_CODE[unit_type],
+            },
+            headers=self._headers("ka10059"),
+        ))
+        items = _SCHEMAS["ka10059"].decode(raw)
+        return StockInvestorByDay(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10061 — 종목별투자자기관별합계요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_investor_total(
+        self,
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+        trade_type: "InvestorTradeType" = "net_buy",
+        amount_qty_type: "AmtQtyType" = "amount",
+        unit_type: "UnitType" = "thousand",
+    ) -> StockInvestorTotal:
+        """종목별 투자자·기관별 기간 합계를 조회한다 (ka10061).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            start_date: 시작일자 (``YYYYMMDD`` 형식).
+            end_date: 종료일자 (``YYYYMMDD`` 형식).
+            trade_type: 매매구분. ``"net_buy"``: 순매수, ``"buy"``: 매수, ``"sell"``: 매도.
+            amount_qty_type: 금액수량구분. ``"amount"``: 금액, ``"qty"``: 수량.
+            unit_type: 단위구분. ``"thousand"``: 천주, ``"single"``: 단주.
+
+        Returns:
+            투자자·기관별 합계 ``StockInvestorTotal``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "stk_cd": stock_code,
+                "strt_dt": start_date,
+                "end_dt": end_date,
+                "amt_qty_tp": _AMT_QTY_CODE[amount_qty_type],
+                "trde_tp": _INVESTOR_TRADE_CODE[trade_type],
+                "unit_tp": _UNIT_CODE[unit_type],
+            },
+            headers=self._headers("ka10061"),
+        ))
+        first = raw.get("stk_invsr_orgn_tot", [{}])[0] if raw.get("stk_invsr_orgn_tot") else {}
+        return StockInvestorTotal(
+            ind_invsr=first.get("ind_invsr", ""),
+            frgnr_invsr=first.get("frgnr_invsr", ""),
+            orgn=first.get("orgn", ""),
+            fnnc_invt=first.get("fnnc_invt", ""),
+            bank=first.get("bank", ""),
+            penfnd_etc=first.get("penfnd_etc", ""),
+            samo_fund=first.get("samo_fund", ""),
+            natn=first.get("natn", ""),
+            etc_corp=first.get("etc_corp", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10084 — 당일전일체결요청
+    # -----------------------------------------------------------------------
+
+    def get_today_prev_execution(
+        self,
+        stock_code: str,
+        day_type: "TodayPrevType" = "today",
+        tick_min: "TickMinType" = "tick",
+        time: str = "",
+    ) -> TodayPrevExecution:
+        """당일·전일 체결 데이터를 조회한다 (ka10084).
+
+        Args:
+            stock_code: 거래소별 종목코드.
+            day_type: 당일전일구분. ``"today"``: 당일, ``"prev"``: 전일.
+            tick_min: 틱분. ``"tick"``: 틱, ``"minute"``: 분.
+            time: 조회시간 (4자리 ``HHMM``). 예) 오전 9시 → ``"0900"``. 공백이면 전체.
+
+        Returns:
+            당일전일체결 리스트 ``TodayPrevExecution``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {
+                "stk_cd": stock_code,
+                "tdy_pred": _TODAY_PREV_CODE[day_type],
+                "tic_min": _TICK_MIN_CODE[tick_min],
+                "tm": time,
+            },
+            headers=self._headers("ka10084"),
+        ))
+        items = _SCHEMAS["ka10084"].decode(raw)
+        return TodayPrevExecution(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10095 — 관심종목정보요청
+    # -----------------------------------------------------------------------
+
+    def get_watchlist_info(self, stock_codes: str) -> WatchlistInfo:
+        """관심종목 정보(현재가·호가·시가총액 등)를 조회한다 (ka10095).
+
+        Args:
+            stock_codes: 종목코드. 여러 종목은 ``"|"`` 로 구분.
+                예) ``"005930|000660|035720"``.
+
+        Returns:
+            관심종목 정보 리스트 ``WatchlistInfo``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {"stk_cd": stock_codes},
+            headers=self._headers("ka10095"),
+        ))
+        items = _SCHEMAS["ka10095"].decode(raw)
+        return WatchlistInfo(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10099 — 종목정보 리스트
+    # -----------------------------------------------------------------------
+
+    def get_stock_list(self, market_type: "StkMarketType" = "kospi") -> StockList:
+        """시장별 상장 종목 리스트를 조회한다 (ka10099).
+
+        Args:
+            market_type: 시장구분.
+                ``"kospi"``: 코스피, ``"kosdaq"``: 코스닥, ``"etf"``: ETF,
+                ``"elw"``: ELW, ``"konex"``: 코넥스, ``"gold"``: 금현물 등.
+
+        Returns:
+            종목정보 리스트 ``StockList``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {"mrkt_tp": _STK_MARKET_CODE[market_type]},
+            headers=self._headers("ka10099"),
+        ))
+        items = _SCHEMAS["ka10099"].decode(raw)
+        return StockList(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10100 — 종목정보 조회
+    # -----------------------------------------------------------------------
+
+    def get_stock_detail(self, stock_code: str) -> StockDetail:
+        """단일 종목의 상세 정보를 조회한다 (ka10100).
+
+        Args:
+            stock_code: 종목코드 (6자리 단축코드).
+
+        Returns:
+            종목 상세정보 ``StockDetail``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {"stk_cd": stock_code},
+            headers=self._headers("ka10100"),
+        ))
+        return StockDetail(
+            code=raw.get("code", ""),
+            name=raw.get("name", ""),
+            list_count=raw.get("listCount", ""),
+            reg_day=raw.get("regDay", ""),
+            last_price=raw.get("lastPrice", ""),
+            state=raw.get("state", ""),
+            market_code=raw.get("marketCode", ""),
+            market_name=raw.get("marketName", ""),
+            up_name=raw.get("upName", ""),
+            up_size_name=raw.get("upSizeName", ""),
+            nxt_enable=raw.get("nxtEnable", ""),
+        )
+
+    # -----------------------------------------------------------------------
+    # ka10101 — 업종코드 리스트
+    # -----------------------------------------------------------------------
+
+    def get_sector_list(self, market_type: "SectorMarketType" = "kospi") -> SectorList:
+        """시장별 업종코드 리스트를 조회한다 (ka10101).
+
+        Args:
+            market_type: 시장구분.
+                ``"kospi"``: 코스피(거래소), ``"kosdaq"``: 코스닥,
+                ``"kospi200"``: KOSPI200, ``"kospi100"``: KOSPI100, ``"krx100"``: KRX100.
+
+        Returns:
+            업종코드 리스트 ``SectorList``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {"mrkt_tp": _SECTOR_MARKET_CODE[market_type]},
+            headers=self._headers("ka10101"),
+        ))
+        items = _SCHEMAS["ka10101"].decode(raw)
+        return SectorList(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10102 — 회원사 리스트
+    # -----------------------------------------------------------------------
+
+    def get_broker_list(self) -> BrokerList:
+        """키움 API 회원사 리스트를 조회한다 (ka10102).
+
+        Returns:
+            회원사 리스트 ``BrokerList``.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류 또는 조회 실패.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {},
+            headers=self._headers("ka10102"),
+        ))
+        items = _SCHEMAS["ka10102"].decode(raw)
+        return BrokerList(items=items)
+
+    # ──────────────────────────────────────────────────────────
+    # 신용주문 관련 종목정보 (kt20xxx)
+    # ──────────────────────────────────────────────────────────
+
+    def credit_loan_stocks(
+        self,
+        mrkt_deal_tp: CreditMarketType,
+        *,
+        crd_stk_grde_tp: CreditStockGradeType = "%",
+        stk_cd: str = "",
+    ) -> CreditLoanStocks:
+        """신용융자 가능종목을 조회한다 (kt20016).
+
+        Args:
+            mrkt_deal_tp: 시장거래구분.
+                ``"%"`` (전체), ``"1"`` (코스피), ``"0"`` (코스닥).
+            crd_stk_grde_tp: 신용종목등급구분 (기본값 ``"%"`` — 전체).
+                ``"A"`` ~ ``"E"`` 로 등급 필터 가능.
+            stk_cd: 종목코드. 빈 문자열이면 전체 조회.
+
+        Returns:
+            :class:`~kiwoompy.models.CreditLoanStocks` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        body: dict = {"mrkt_deal_tp": mrkt_deal_tp, "crd_stk_grde_tp": crd_stk_grde_tp}
+        if stk_cd:
+            body["stk_cd"] = stk_cd
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            body,
+            headers=self._headers("kt20016"),
+        ))
+        items = _SCHEMAS["kt20016"].decode(raw)
+        return CreditLoanStocks(
+            crd_loan_able=raw.get("crd_loan_able", ""),
+            items=items,
+        )
+
+    def credit_loan_availability(self, stk_cd: str) -> CreditLoanAvailability:
+        """종목의 신용융자 가능 여부를 조회한다 (kt20017).
+
+        Args:
+            stk_cd: 종목코드 (예: ``"039490"``).
+
+        Returns:
+            :class:`~kiwoompy.models.CreditLoanAvailability` 인스턴스.
+
+        Raises:
+            KiwoomAuthError: 토큰 미발급 또는 인증 실패.
+            KiwoomApiError: 서버 오류.
+        """
+        raw = _check(self._post(
+            self._STKINFO_PATH,
+            {"stk_cd": stk_cd},
+            headers=self._headers("kt20017"),
+        ))
+        return CreditLoanAvailability(crd_alow_yn=raw.get("crd_alow_yn", ""))
@@ -0,0 +1,166 @@
+"""대차거래 조회 — 대차거래 추이·상위·내역 (``slb``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    SlbMrktType,
+    StockLoanByStock,
+    StockLoanByStockItem,
+    StockLoanHistory,
+    StockLoanHistoryItem,
+    StockLoanItem,
+    StockLoanTop10,
+    StockLoanTop10Item,
+    StockLoanTrend,
+)
+from kiwoompy.query._base import _SLB_MRKT_CODE, _QueryBase, _check
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka10068", _QueryBase._SLB_PATH, "dbrt_trde_trnsn", StockLoanItem),
+    TrSchema("ka10069", _QueryBase._SLB_PATH, "dbrt_trde_upper_10stk", StockLoanTop10Item),
+    TrSchema("ka20068", _QueryBase._SLB_PATH, "dbrt_trde_trnsn", StockLoanByStockItem),
+    TrSchema("ka90012", _QueryBase._SLB_PATH, "dbrt_trde_prps", StockLoanHistoryItem),
+)
+
+
+class StockLoanQuery(_QueryBase):
+    """대차거래 조회 클라이언트.
+
+    ``KiwoomQuery.stock_loan``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka10068 — 대차거래추이요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_loan_trend(
+        self,
+        start_date: str = "",
+        end_date: str = "",
+    ) -> StockLoanTrend:
+        """전체 대차거래 추이를 조회한다 (ka10068).
+
+        Args:
+            start_date: 시작일자 (``"YYYYMMDD"``).
+            end_date: 종료일자 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.StockLoanTrend` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SLB_PATH,
+            {
+                "strt_dt": start_date,
+                "end_dt":  end_date,
+                "all_tp":  "1",
+            },
+            headers=self._headers("ka10068"),
+        ))
+        items = _SCHEMAS["ka10068"].decode(raw)
+        return StockLoanTrend(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka10069 — 대차거래상위10종목요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_loan_top10(
+        self,
+        start_date: str,
+        market: "SlbMrktType",
+        end_date: str = "",
+    ) -> StockLoanTop10:
+        """대차거래 상위 10종목을 조회한다 (ka10069).
+
+        Args:
+            start_date: 시작일자 (``"YYYYMMDD"``).
+            market: 시장구분 (``"kospi"`` / ``"kosdaq"``).
+            end_date: 종료일자 (``"YYYYMMDD"``). 생략 가능.
+
+        Returns:
+            :class:`~kiwoompy.models.StockLoanTop10` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SLB_PATH,
+            {
+                "strt_dt": start_date,
+                "end_dt":  end_date,
+                "mrkt_tp": _SLB_MRKT_CODE[market],
+            },
+            headers=self._headers("ka10069"),
+        ))
+        items = _SCHEMAS["ka10069"].decode(raw)
+        return StockLoanTop10(
+            dbrt_trde_cntrcnt_sum=raw.get("dbrt_trde_cntrcnt_sum", ""),
+            dbrt_trde_rpy_sum=raw.get("dbrt_trde_rpy_sum", ""),
+            rmnd_sum=raw.get("rmnd_sum", ""),
+            remn_amt_sum=raw.get("remn_amt_sum", ""),
+            dbrt_trde_cntrcnt_rt=raw.get("dbrt_trde_cntrcnt_rt", ""),
+            dbrt_trde_rpy_rt=raw.get("dbrt_trde_rpy_rt", ""),
+            rmnd_rt=raw.get("rmnd_rt", ""),
+            remn_amt_rt=raw.get("remn_amt_rt", ""),
+            items=items,
+        )
+
+    # -----------------------------------------------------------------------
+    # ka20068 — 대차거래추이요청(종목별)
+    # -----------------------------------------------------------------------
+
+    def get_stock_loan_trend_by_stock(
+        self,
+        stock_code: str,
+        start_date: str = "",
+        end_date: str = "",
+    ) -> StockLoanByStock:
+        """종목별 대차거래 추이를 조회한다 (ka20068).
+
+        Args:
+            stock_code: 종목코드 (예: ``"005930"``).
+            start_date: 시작일자 (``"YYYYMMDD"``).
+            end_date: 종료일자 (``"YYYYMMDD"``).
+
+        Returns:
+            :class:`~kiwoompy.models.StockLoanByStock` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SLB_PATH,
+            {
+                "strt_dt": start_date,
+                "end_dt":  end_date,
+                "all_tp":  "0",
+                "stk_cd":  stock_code,
+            },
+            headers=self._headers("ka20068"),
+        ))
+        items = _SCHEMAS["ka20068"].decode(raw)
+        return StockLoanByStock(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90012 — 대차거래내역요청
+    # -----------------------------------------------------------------------
+
+    def get_stock_loan_history(
+        self,
+        date: str,
+        market: "SlbMrktType",
+    ) -> StockLoanHistory:
+        """일자별 대차거래 내역을 조회한다 (ka90012).
+
+        Args:
+            date: 조회일자 (``"YYYYMMDD"``).
+            market: 시장구분 (``"kospi"`` / ``"kosdaq"``).
+
+        Returns:
+            :class:`~kiwoompy.models.StockLoanHistory` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._SLB_PATH,
+            {
+                "dt":      date,
+                "mrkt_tp": _SLB_MRKT_CODE[market],
+            },
+            headers=self._headers("ka90012"),
+        ))
+        items = _SCHEMAS["ka90012"].decode(raw)
+        return StockLoanHistory(items=items)
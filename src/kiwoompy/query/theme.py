@@ -0,0 +1,109 @@
+"""테마 조회 — 테마그룹·테마구성종목 (``thme``)."""
+
+from __future__ import annotations
+
+from kiwoompy.models import (
+    ThemeGroup,
+    ThemeGroupItem,
+    ThemeSearchType,
+    ThemeStockItem,
+    ThemeStocks,
+)
+from kiwoompy.query._base import (
+    _EXCHANGE_CODE,
+    _THEME_SEARCH_CODE,
+    ExchangeType,
+    _QueryBase,
+    _check,
+)
+from kiwoompy.query._schema import TrSchema, register
+
+_SCHEMAS = register(
+    TrSchema("ka90001", _QueryBase._THME_PATH, "thema_grp", ThemeGroupItem),
+    TrSchema("ka90002", _QueryBase._THME_PATH, "thema_comp_stk", ThemeStockItem),
+)
+
+
+class ThemeQuery(_QueryBase):
+    """테마 조회 클라이언트.
+
+    ``KiwoomQuery.theme``에 처음 접근할 때 만들어지며, 같은 ``KiwoomApi``와 응답 캐시를 공유한다.
+    인자는 ``KiwoomQuery``와 같다.
+    """
+
+    # -----------------------------------------------------------------------
+    # ka90001 — 테마그룹별요청
+    # -----------------------------------------------------------------------
+
+    def get_theme_group(
+        self,
+        search_type: "ThemeSearchType",
+        days: str,
+        profit_type: str,
+        exchange: "ExchangeType",
+        stock_code: str = "",
+        theme_name: str = "",
+    ) -> ThemeGroup:
+        """테마 그룹별 정보를 조회한다 (ka90001).
+
+        Args:
+            search_type: 검색구분 (``"all"`` / ``"theme"`` / ``"stock"``).
+            days: 날짜구분 — n일 전 (``"1"`` ~ ``"99"``).
+            profit_type: 등락수익구분 (``"1"``상위기간수익률 / ``"2"``하위기간수익률 / ``"3"``상위등락률 / ``"4"``하위등락률).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+            stock_code: 검색 종목코드 (종목검색 시 사용, 기본값: ``""``).
+            theme_name: 검색 테마명 (테마검색 시 사용, 기본값: ``""``).
+
+        Returns:
+            :class:`~kiwoompy.models.ThemeGroup` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._THME_PATH,
+            {
+                "qry_tp":       _THEME_SEARCH_CODE[search_type],
+                "stk_cd":       stock_code,
+                "date_tp":      days,
+                "thema_nm":     theme_name,
+                "flu_pl_amt_tp": profit_type,
+                "stex_tp":      _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka90001"),
+        ))
+        items = _SCHEMAS["ka90001"].decode(raw)
+        return ThemeGroup(items=items)
+
+    # -----------------------------------------------------------------------
+    # ka90002 — 테마구성종목요청
+    # -----------------------------------------------------------------------
+
+    def get_theme_stocks(
+        self,
+        theme_group_code: str,
+        exchange: "ExchangeType",
+        days: str = "",
+    ) -> ThemeStocks:
+        """테마 구성 종목을 조회한다 (ka90002).
+
+        Args:
+            theme_group_code: 테마그룹코드 (예: ``"100"``).
+            exchange: 거래소구분 (``"krx"`` / ``"nxt"`` / ``"all"``).
+            days: 날짜구분 — n일 전 (기본값: ``""``).
+
+        Returns:
+            :class:`~kiwoompy.models.ThemeStocks` 인스턴스.
+        """
+        raw = _check(self._post(
+            self._THME_PATH,
+            {
+                "date_tp":      days,
+                "thema_grp_cd": theme_group_code,
+                "stex_tp":      _EXCHANGE_CODE[exchange],
+            },
+            headers=self._headers("ka90002"),
+        ))
+        items = _SCHEMAS["ka90002"].decode(raw)
+        return ThemeStocks(
+            flu_rt=raw.get("flu_rt", ""),
+            dt_prft_rt=raw.get("dt_prft_rt", ""),
+            items=items,
+        )
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from collections.abc import Callable, Coroutine
-from typing import Any
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable
+from dataclasses import dataclass
+from typing import Any, Literal
 
 import websockets
 from websockets.asyncio.client import connect, ClientConnection
 
-from kiwoompy.api import KiwoomApi
+from kiwoompy.api import AsyncKiwoomApi, KiwoomApi
+from kiwoompy.codec import json_dumps, json_loads
 from kiwoompy.exceptions import KiwoomApiError
 from kiwoompy.models import RealtimeEvent
 
@@ -22,9 +25,15 @@ _WS_URLS: dict[str, str] = {
     "demo": "wss://mockapi.kiwoom.com:10000/api/dostk/websocket",
 }
 
-# 최대 구독 건수 (키움 공식 정책)
+# 최대 구독 건수 (키움 공식 정책). (type, item) 쌍 단위로 센다
 _MAX_SUBSCRIPTIONS = 100
 
+# 풀의 기본 최대 연결 수. 앱키당 허용 연결 수 안에서 조정한다
+_POOL_MAX_CONNECTIONS = 3
+
+# 구독자별 기본 큐 크기 (이벤트 수)
+_QUEUE_SIZE = 1000
+
 # 재연결 백오프 (초)
 _RECONNECT_WAIT_MIN = 1.0
 _RECONNECT_WAIT_MAX = 30.0
@@ -32,41 +41,273 @@ _RECONNECT_WAIT_MAX = 30.0
 type RealtimeCallback = Callable[[RealtimeEvent], Coroutine[Any, Any, None]]
 """실시간 이벤트 콜백 타입. ``RealtimeEvent``를 인자로 받는 async 함수."""
 
+type OverflowPolicy = Literal["block", "drop_oldest", "conflate"]
+"""구독자 큐가 가득 찼을 때의 처리 방식.
+
+- ``"block"``: 자리가 날 때까지 수신 루프가 기다린다. 이벤트를 잃지 않는다.
+- ``"drop_oldest"``: 가장 오래된 이벤트를 버린다.
+- ``"conflate"``: (type, item)마다 최신 이벤트 하나만 남긴다. 같은 종목의 대기 중 이벤트는
+  새 이벤트로 바뀌고(순서 유지), 새 종목이 들어올 자리가 없으면 가장 오래된 종목을 버린다.
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriberStats:
+    """구독자(콜백 또는 ``events()`` 스트림) 하나의 큐 상태.
+
+    Attributes:
+        name: 콜백 이름 (``__qualname__``). 스트림은 ``"events()"``.
+        overflow: 큐 초과 처리 방식.
+        maxsize: 큐 크기.
+        depth: 현재 대기 중인 이벤트 수.
+        delivered: 구독자에게 전달한 이벤트 수.
+        dropped: 버리거나 최신 이벤트로 대체한 이벤트 수.
+        errors: 콜백에서 발생한 예외 수.
+    """
+
+    name: str
+    overflow: OverflowPolicy
+    maxsize: int
+    depth: int
+    delivered: int
+    dropped: int
+    errors: int = 0
+
+
+class _EventQueue:
+    """초과 처리 방식을 고를 수 있는 단일 소비자용 이벤트 큐."""
+
+    __slots__ = (
+        "maxsize", "overflow", "delivered", "dropped", "_events", "_latest", "_ready", "_space"
+    )
+
+    def __init__(self, maxsize: int, overflow: OverflowPolicy) -> None:
+        if maxsize < 1:
+            raise ValueError("queue_size는 1 이상이어야 합니다.")
+        if overflow not in ("block", "drop_oldest", "conflate"):
+            raise ValueError(f"알 수 없는 overflow 방식: {overflow!r}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.delivered = 0
+        self.dropped = 0
+        self._events: deque[RealtimeEvent] = deque()
+        self._latest: dict[tuple[str, str], RealtimeEvent] = {}  # conflate 전용. 삽입 순서 유지
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._latest) if self.overflow == "conflate" else len(self._events)
+
+    async def put(self, event: RealtimeEvent) -> None:
+        """이벤트를 넣는다. ``"block"``만 자리가 날 때까지 기다린다."""
+        if self.overflow == "conflate":
+            key = (event.type, event.item)
+            latest = self._latest
+            if key in latest:
+                self.dropped += 1
+            elif len(latest) >= self.maxsize:
+                del latest[next(iter(latest))]
+                self.dropped += 1
+            latest[key] = event
+        else:
+            events = self._events
+            if len(events) >= self.maxsize:
+                if self.overflow == "drop_oldest":
+                    events.popleft()
+                    self.dropped += 1
+                else:
+                    while len(events) >= self.maxsize:
+                        self._space.clear()
+                        await self._space.wait()
+            events.append(event)
+        self._ready.set()
+
+    async def get(self) -> RealtimeEvent:
+        """가장 오래된 이벤트를 꺼낸다. 비어 있으면 기다린다."""
+        await self.wait()
+        if self.overflow == "conflate":
+            event = self._latest.pop(next(iter(self._latest)))
+        else:
+            event = self._events.popleft()
+            self._space.set()
+        self.delivered += 1
+        return event
+
+    async def wait(self) -> None:
+        """이벤트가 들어올 때까지 기다린다."""
+        while not len(self):
+            self._ready.clear()
+            await self._ready.wait()
+
+    def drain(self) -> list[RealtimeEvent]:
+        """대기 중인 이벤트를 모두 꺼낸다. 기다리지 않는다."""
+        if self.overflow == "conflate":
+            events = list(self._latest.values())
+            self._latest.clear()
+        else:
+            events = list(self._events)
+            self._events.clear()
+            self._space.set()
+        self.delivered += len(events)
+        return events
+
+    def stats(self, name: str, errors: int = 0) -> SubscriberStats:
+        return SubscriberStats(
+            name, self.overflow, self.maxsize, len(self), self.delivered, self.dropped, errors
+        )
 
-class _Subscription:
-    """단일 구독 정보를 담는 내부 클래스."""
 
-    __slots__ = ("type", "items", "callback", "grp_no", "refresh")
+class LatestEvents:
+    """(type, item)별 최신 이벤트 슬롯. ``subscribe_latest()``가 반환한다.
+
+    수신 루프는 종목마다 최신 이벤트 하나만 남기고, 소비 태스크 없이 호출하는 쪽이
+    원할 때 ``take()``로 꺼낸다. 꺼낸 뒤 다시 들어온 종목만 다음 ``take()``에 나온다.
+
+    Example:
+        >>> latest = await rt.subscribe_latest("0B", items=codes)
+        >>> while True:
+        ...     for event in latest.take():          # 마지막 호출 이후 바뀐 종목만
+        ...         book[event.item] = event.values
+        ...     await asyncio.sleep(0.02)             # 50 Hz 전략 루프
+    """
+
+    __slots__ = ("_queue",)
+
+    def __init__(self, maxsize: int = _MAX_SUBSCRIPTIONS) -> None:
+        self._queue = _EventQueue(maxsize, "conflate")
+
+    def __len__(self) -> int:
+        """꺼내지 않은 종목 수."""
+        return len(self._queue)
+
+    def take(self) -> list[RealtimeEvent]:
+        """마지막 ``take()`` 이후 갱신된 종목의 최신 이벤트를 처음 갱신된 순서로 꺼낸다."""
+        return self._queue.drain()
+
+    async def wait(self) -> list[RealtimeEvent]:
+        """갱신된 종목이 생길 때까지 기다렸다가 ``take()``한다."""
+        await self._queue.wait()
+        return self._queue.drain()
+
+    def stats(self) -> SubscriberStats:
+        """슬롯 상태. ``dropped``는 꺼내기 전에 새 이벤트로 대체된 수다."""
+        return self._queue.stats("LatestEvents")
+
+
+class _Subscriber:
+    """콜백 하나의 이벤트 큐와 소비 태스크. 여러 (type, item) 구독이 공유한다.
+
+    ``interval``이 있으면 큐를 그 간격마다 한꺼번에 비워 전달한다. ``LatestEvents``는
+    소비 태스크 없이 큐만 쓴다.
+    """
+
+    __slots__ = ("callback", "queue", "interval", "refs", "errors", "_task")
 
     def __init__(
         self,
-        type: str,
-        items: list[str],
-        callback: RealtimeCallback,
-        grp_no: str,
-        refresh: str,
+        callback: RealtimeCallback | LatestEvents,
+        queue: _EventQueue,
+        interval: float | None = None,
     ) -> None:
-        self.type = type
-        self.items = list(items)
         self.callback = callback
+        self.queue = queue
+        self.interval = interval
+        self.refs = 0  # 이 구독자를 가진 (type, item) 구독 수
+        self.errors = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """소비 태스크가 없으면 시작한다."""
+        if isinstance(self.callback, LatestEvents):
+            return
+        if self._task is None or self._task.done():
+            name = getattr(self.callback, "__qualname__", repr(self.callback))
+            self._task = asyncio.create_task(self._consume(), name=f"kiwoom-realtime:{name}")
+
+    def stop(self) -> asyncio.Task[None] | None:
+        """소비 태스크를 취소하고 반환한다. 대기 중인 이벤트는 큐에 남는다."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+        return task
+
+    async def _consume(self) -> None:
+        if self.interval is not None:
+            await self._consume_batches(self.interval)
+        while True:
+            await self._deliver(await self.queue.get())
+
+    async def _consume_batches(self, interval: float) -> None:
+        """``interval``초마다 쌓인 이벤트를 모두 전달한다. 종목별로 간격당 최대 한 번이다."""
+        while True:
+            await self.queue.wait()
+            started = time.monotonic()
+            for event in self.queue.drain():
+                await self._deliver(event)
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    async def _deliver(self, event: RealtimeEvent) -> None:
+        try:
+            await self.callback(event)  # type: ignore[operator]
+        except Exception:
+            self.errors += 1
+            logger.exception(
+                "실시간 콜백 처리 중 예외 발생 (type=%s, item=%s)", event.type, event.item
+            )
+
+    def stats(self) -> SubscriberStats:
+        name = getattr(self.callback, "__qualname__", type(self.callback).__name__)
+        return self.queue.stats(name, self.errors)
+
+
+class _Subscription:
+    """(type, item) 하나의 구독 정보를 담는 내부 클래스.
+
+    ``subscribers``는 튜플로 두고 변경할 때 통째로 바꾼다. 구독이 바뀌어도 수신 루프가
+    순회하는 튜플은 그대로다.
+    """
+
+    __slots__ = ("type", "item", "grp_no", "subscribers")
+
+    def __init__(self, type: str, item: str, grp_no: str) -> None:
+        self.type = type
+        self.item = item
         self.grp_no = grp_no
-        self.refresh = refresh
+        self.subscribers: tuple[_Subscriber, ...] = ()
+
+
+def _group_data(subs: list[_Subscription]) -> dict[str, list[dict[str, list[str]]]]:
+    """구독 목록을 그룹번호별 REG/REMOVE ``data`` 배열로 묶는다. 같은 type의 item은 한 항목에 모은다."""
+    grouped: dict[str, dict[str, list[str]]] = {}
+    for sub in subs:
+        grouped.setdefault(sub.grp_no, {}).setdefault(sub.type, []).append(sub.item)
+    return {
+        grp_no: [{"item": items, "type": [type]} for type, items in by_type.items()]
+        for grp_no, by_type in grouped.items()
+    }
 
 
 class KiwoomRealtime:
     """키움 REST API 실시간 데이터 WebSocket 클라이언트.
 
     단일 WebSocket 연결을 유지하면서 여러 TR 타입의 실시간 데이터를 구독한다.
-    수신된 메시지는 TR 타입별로 등록된 콜백에 라우팅된다.
+    구독은 (TR 타입, 종목) 쌍 단위로 관리하며, 수신된 메시지는 해당 쌍에 등록된 콜백에
+    모두 라우팅된다. 같은 종목을 여러 콜백이 구독해도 서버에는 한 번만 등록한다.
 
-    **구독 제한**: 최대 100건 (키움 공식 정책).
+    **구독 제한**: (TR 타입, 종목) 쌍 기준 최대 100건 (키움 공식 정책).
 
     **재연결**: 연결이 끊기면 지수 백오프로 자동 재연결하고 기존 구독을 복원한다.
 
+    **전달**: 콜백마다 크기가 정해진 큐와 소비 태스크를 두고, 수신 루프는 큐에 넣기만 한다.
+    느린 콜백은 자기 큐만 채우며, 큐가 가득 차면 ``overflow`` 방식대로 처리한다.
+    큐 상태는 ``subscriber_stats()``로 확인한다.
+
     Args:
-        api: 접근토큰·환경 정보를 담은 ``KiwoomApi`` 인스턴스.
+        api: 접근토큰·환경 정보를 담은 ``KiwoomApi`` 또는 ``AsyncKiwoomApi`` 인스턴스.
         env: 환경 구분. ``"real"`` (운영) 또는 ``"demo"`` (모의투자).
         reconnect: 자동 재연결 여부. 기본값 ``True``.
+        queue_size: 콜백별 기본 큐 크기. 기본값 ``1000``.
+        overflow: 큐가 가득 찼을 때의 기본 처리 방식. 기본값 ``"block"``.
 
     Example:
         >>> import asyncio
@@ -88,17 +329,23 @@ class KiwoomRealtime:
 
     def __init__(
         self,
-        api: KiwoomApi,
+        api: KiwoomApi | AsyncKiwoomApi,
         env: str = "demo",
         *,
         reconnect: bool = True,
+        queue_size: int = _QUEUE_SIZE,
+        overflow: OverflowPolicy = "block",
     ) -> None:
+        _EventQueue(queue_size, overflow)  # 잘못된 설정을 구독 전에 드러낸다
         self._api = api
         self._ws_url = _WS_URLS[env]
         self._reconnect = reconnect
+        self._queue_size = queue_size
+        self._overflow: OverflowPolicy = overflow
 
-        self._subscriptions: dict[str, _Subscription] = {}  # type → _Subscription
-        self._sub_count: int = 0
+        self._subscriptions: dict[tuple[str, str], _Subscription] = {}  # (type, item) → 구독
+        # 콜백(또는 LatestEvents) → 큐·소비 태스크
+        self._subscribers: dict[RealtimeCallback | LatestEvents, _Subscriber] = {}
 
         self._ws: ClientConnection | None = None
         self._recv_task: asyncio.Task[None] | None = None
@@ -120,6 +367,8 @@ class KiwoomRealtime:
         if self._recv_task is not None and not self._recv_task.done():
             return
         self._closed = False
+        for subscriber in self._subscribers.values():
+            subscriber.start()
         self._recv_task = asyncio.create_task(self._run_loop(), name="kiwoom-realtime")
         await self._connected.wait()
 
@@ -131,67 +380,128 @@ class KiwoomRealtime:
         *,
         grp_no: str = "1",
         refresh: str = "1",
+        queue_size: int | None = None,
+        overflow: OverflowPolicy | None = None,
+        interval: float | None = None,
     ) -> None:
         """실시간 데이터 구독을 등록한다.
 
-        동일 ``type``이 이미 등록된 경우 기존 구독을 덮어쓴다(items·callback 갱신).
+        ``callback``을 ``type``의 각 종목에 추가한다. 이미 구독 중인 종목은 서버에 다시
+        등록하지 않고 콜백만 추가하며, 새 종목만 REG로 보낸다. 같은 종목·콜백을 두 번
+        등록해도 콜백은 한 번만 호출된다.
 
         Args:
             type: 실시간 항목 TR명. (예: ``"0B"`` — 주식체결, ``"00"`` — 주문체결)
             items: 구독할 종목코드 목록. 계좌 기반 타입(``"00"``, ``"04"``)은 ``[""]`` 전달.
             callback: 이벤트 수신 시 호출할 async 콜백.
-            grp_no: 그룹번호. 기본값 ``"1"``.
-            refresh: 기존 등록 유지 여부. ``"1"``: 유지 (기본값), ``"0"``: 해지 후 재등록.
+            grp_no: 그룹번호. 기본값 ``"1"``. 이미 구독 중인 종목은 기존 그룹번호를 유지한다.
+            refresh: 기존 등록 유지 여부. ``"1"``: 유지 (기본값), ``"0"``: 같은 그룹의 기존
+                구독을 모두 해지하고 ``items``만 등록한다 (다른 콜백의 구독도 해지된다).
+            queue_size: 이 콜백의 큐 크기. ``None``이면 생성자 설정.
+            overflow: 이 콜백의 큐 초과 처리 방식. ``None``이면 생성자 설정.
+                큐 설정은 콜백을 처음 구독할 때 정해지며, 이후 호출에서는 무시된다.
+            interval: 전달 간격(초). 지정하면 큐에 쌓인 이벤트를 간격마다 한꺼번에 전달하며,
+                ``overflow``의 기본값이 ``"conflate"``가 되어 종목별로 간격당 최신 이벤트
+                하나만 전달한다.
 
         Raises:
-            KiwoomApiError: 최대 구독 수(100건) 초과 또는 WebSocket 미연결.
+            KiwoomApiError: 최대 구독 수(100건) 초과. 이 경우 구독 상태는 바뀌지 않는다.
+            ValueError: ``queue_size``가 1 미만, 알 수 없는 ``overflow``, ``interval``이 0 이하.
         """
-        is_new = type not in self._subscriptions
-        if is_new and self._sub_count >= _MAX_SUBSCRIPTIONS:
-            raise KiwoomApiError(
-                f"실시간 구독 한도 초과: 최대 {_MAX_SUBSCRIPTIONS}건까지 구독 가능합니다."
+        if interval is not None and interval <= 0:
+            raise ValueError("interval은 0보다 커야 합니다.")
+        subscriber = self._subscribers.get(callback)
+        if subscriber is None:
+            queue = _EventQueue(
+                queue_size or self._queue_size,
+                overflow or ("conflate" if interval is not None else self._overflow),
             )
+            subscriber = _Subscriber(callback, queue, interval)
+        await self._add(type, items, subscriber, grp_no, refresh)
 
-        sub = _Subscription(type, items, callback, grp_no, refresh)
-        self._subscriptions[type] = sub
-        if is_new:
-            self._sub_count += 1
+    async def subscribe_latest(
+        self,
+        type: str,
+        items: list[str],
+        *,
+        grp_no: str = "1",
+        latest: LatestEvents | None = None,
+    ) -> LatestEvents:
+        """종목별 최신 이벤트만 남기는 구독을 등록하고, 필요할 때 꺼내 쓰는 슬롯을 반환한다.
 
-        if self._ws is not None:
-            await self._send_reg(sub)
+        콜백과 소비 태스크 없이 수신 루프가 슬롯을 바로 갱신한다. 전략 루프가 자기 주기에
+        맞춰 ``take()``하면 그 사이 쌓인 오래된 이벤트를 하나씩 처리하지 않아도 된다.
 
-    async def unsubscribe(self, type: str, items: list[str] | None = None) -> None:
+        Args:
+            type: 실시간 항목 TR명. (예: ``"0B"`` — 주식체결, ``"0D"`` — 주식호가잔량)
+            items: 구독할 종목코드 목록.
+            grp_no: 그룹번호. 기본값 ``"1"``.
+            latest: 종목을 추가할 기존 슬롯. ``None``이면 새로 만든다.
+
+        Returns:
+            ``LatestEvents``. 해지할 때는 ``unsubscribe(type, items, callback=latest)``.
+
+        Raises:
+            KiwoomApiError: 최대 구독 수(100건) 초과.
+        """
+        latest = latest if latest is not None else LatestEvents()
+        subscriber = self._subscribers.get(latest) or _Subscriber(latest, latest._queue)
+        await self._add(type, items, subscriber, grp_no, "1")
+        return latest
+
+    async def unsubscribe(
+        self,
+        type: str,
+        items: list[str] | None = None,
+        callback: RealtimeCallback | LatestEvents | None = None,
+    ) -> None:
         """실시간 데이터 구독을 해제한다.
 
+        ``callback``을 지정하면 그 콜백만 떼어내고, 남은 콜백이 없는 종목만 서버에서
+        해지한다. 다른 콜백이 구독 중인 종목은 계속 수신된다.
+
         Args:
             type: 해제할 실시간 항목 TR명.
-            items: 해제할 종목코드 목록. ``None``이면 해당 타입 전체 해제.
-
-        Raises:
-            KiwoomApiError: WebSocket 미연결.
+            items: 해제할 종목코드 목록. ``None``이면 해당 타입 전체.
+            callback: 해제할 콜백 또는 ``LatestEvents``. ``None``이면 해당 종목의 모든 구독자.
         """
-        if type not in self._subscriptions:
-            return
+        if items is None:
+            keys = [key for key in self._subscriptions if key[0] == type]
+        else:
+            keys = [(type, item) for item in dict.fromkeys(items)]
 
-        sub = self._subscriptions[type]
-        target_items = items if items is not None else sub.items
+        removed: list[_Subscription] = []
+        for key in keys:
+            sub = self._subscriptions.get(key)
+            if sub is None:
+                continue
+            if callback is not None:
+                kept = tuple(s for s in sub.subscribers if s.callback != callback)
+                self._release(s for s in sub.subscribers if s.callback == callback)
+                sub.subscribers = kept
+                if kept:
+                    continue
+            else:
+                self._release(sub.subscribers)
+            removed.append(self._subscriptions.pop(key))
 
         if self._ws is not None:
-            await self._send_remove(type, target_items, sub.grp_no)
+            for grp_no, data in _group_data(removed).items():
+                await self._send({"trnm": "REMOVE", "grp_no": grp_no, "data": data})
 
-        if items is None or set(items) >= set(sub.items):
-            del self._subscriptions[type]
-            self._sub_count -= 1
-        else:
-            remaining = [i for i in sub.items if i not in items]
-            self._subscriptions[type] = _Subscription(
-                type, remaining, sub.callback, sub.grp_no, sub.refresh
-            )
+    def subscriber_stats(self) -> list[SubscriberStats]:
+        """콜백별 큐 깊이·전달·버림·예외 수를 반환한다."""
+        return [subscriber.stats() for subscriber in self._subscribers.values()]
 
     async def close(self) -> None:
-        """WebSocket 연결을 종료하고 수신 루프를 멈춘다."""
+        """WebSocket 연결을 종료하고 수신 루프와 콜백 소비 태스크를 멈춘다.
+
+        구독과 대기 중인 이벤트는 남아 ``connect()``로 다시 시작할 수 있다.
+        """
         self._closed = True
         self._connected.clear()
+        tasks = [t for s in self._subscribers.values() if (t := s.stop()) is not None]
+        await asyncio.gather(*tasks, return_exceptions=True)
         if self._recv_task is not None:
             self._recv_task.cancel()
             try:
@@ -219,40 +529,81 @@ class KiwoomRealtime:
     # 내부 구현
     # ------------------------------------------------------------------ #
 
+    async def _add(
+        self,
+        type: str,
+        items: list[str],
+        subscriber: _Subscriber,
+        grp_no: str,
+        refresh: str,
+    ) -> None:
+        """구독자를 ``type``의 각 종목에 붙이고 새 종목만 서버에 등록한다."""
+        keys = [(type, item) for item in dict.fromkeys(items)]
+        dropped: list[tuple[str, str]] = []
+        if refresh == "0":
+            wanted = set(keys)
+            dropped = [
+                key for key, sub in self._subscriptions.items()
+                if sub.grp_no == grp_no and key not in wanted
+            ]
+        new_keys = [key for key in keys if key not in self._subscriptions]
+        if len(self._subscriptions) - len(dropped) + len(new_keys) > _MAX_SUBSCRIPTIONS:
+            raise KiwoomApiError(
+                f"실시간 구독 한도 초과: 최대 {_MAX_SUBSCRIPTIONS}건까지 구독 가능합니다. "
+                f"(현재 {len(self._subscriptions)}건, 추가 {len(new_keys)}건)"
+            )
+
+        for key in dropped:
+            self._release(self._subscriptions.pop(key).subscribers)
+        self._subscribers.setdefault(subscriber.callback, subscriber)
+        for key in keys:
+            sub = self._subscriptions.get(key)
+            if sub is None:
+                sub = self._subscriptions[key] = _Subscription(type, key[1], grp_no)
+            if subscriber not in sub.subscribers:
+                sub.subscribers = (*sub.subscribers, subscriber)
+                subscriber.refs += 1
+        if subscriber.refs:
+            subscriber.start()
+        else:
+            del self._subscribers[subscriber.callback]  # items가 비어 있던 경우
+
+        if refresh == "0":
+            await self._send_reg(grp_no, [self._subscriptions[key] for key in keys], refresh)
+        elif new_keys:
+            await self._send_reg(grp_no, [self._subscriptions[key] for key in new_keys], refresh)
+
+    def _release(self, subscribers: Iterable[_Subscriber]) -> None:
+        """구독에서 떼어낸 구독자의 참조를 줄이고, 더 이상 쓰이지 않으면 소비 태스크를 멈춘다."""
+        for subscriber in subscribers:
+            subscriber.refs -= 1
+            if subscriber.refs == 0:
+                subscriber.stop()
+                del self._subscribers[subscriber.callback]
+
     def _auth_headers(self) -> dict[str, str]:
         """Authorization 헤더를 반환한다."""
         return self._api.get_auth_header()
 
-    async def _send_reg(self, sub: _Subscription) -> None:
-        """REG 메시지를 현재 WebSocket 연결에 전송한다."""
+    async def _send(self, payload: dict) -> None:
+        """메시지를 현재 WebSocket 연결에 전송한다. 연결이 없으면 버린다."""
         if self._ws is None:
             return
-        payload = {
-            "trnm": "REG",
-            "grp_no": sub.grp_no,
-            "refresh": sub.refresh,
-            "data": [{"item": sub.items, "type": [sub.type]}],
-        }
-        await self._ws.send(json.dumps(payload))
-
-    async def _send_remove(self, type: str, items: list[str], grp_no: str) -> None:
-        """REMOVE 메시지를 현재 WebSocket 연결에 전송한다."""
-        if self._ws is None:
-            return
-        payload = {
-            "trnm": "REMOVE",
-            "grp_no": grp_no,
-            "data": [{"item": items, "type": [type]}],
-        }
-        await self._ws.send(json.dumps(payload))
+        await self._ws.send(json_dumps(payload).decode())
+
+    async def _send_reg(self, grp_no: str, subs: list[_Subscription], refresh: str) -> None:
+        """REG 메시지를 현재 WebSocket 연결에 전송한다."""
+        data = _group_data(subs).get(grp_no, [])
+        if data:
+            await self._send({"trnm": "REG", "grp_no": grp_no, "refresh": refresh, "data": data})
 
     async def _restore_subscriptions(self) -> None:
-        """재연결 후 기존 구독을 모두 서버에 다시 등록한다."""
-        for sub in list(self._subscriptions.values()):
-            await self._send_reg(sub)
+        """재연결 후 기존 구독을 그룹번호별로 묶어 서버에 다시 등록한다."""
+        for grp_no, data in _group_data(list(self._subscriptions.values())).items():
+            await self._send({"trnm": "REG", "grp_no": grp_no, "refresh": "1", "data": data})
 
     async def _handle_message(self, raw: dict) -> None:
-        """수신된 메시지를 파싱해 콜백에 라우팅한다."""
+        """수신된 메시지를 파싱해 구독자 큐에 넣는다. ``"block"`` 큐가 가득 차면 기다린다."""
         trnm = raw.get("trnm", "")
 
         if trnm in ("REG", "REMOVE"):
@@ -265,22 +616,20 @@ class KiwoomRealtime:
         if trnm != "REAL":
             return
 
+        subscriptions = self._subscriptions
         for entry in raw.get("data", []):
             event_type = entry.get("type", "")
-            sub = self._subscriptions.get(event_type)
+            item = entry.get("item", "")
+            # 계좌 기반 타입은 item ""로 구독하고 이벤트에는 계좌·주문 식별자가 올 수 있다
+            sub = subscriptions.get((event_type, item)) or subscriptions.get((event_type, ""))
             if sub is None:
                 continue
 
-            event = RealtimeEvent(
-                type=event_type,
-                name=entry.get("name", ""),
-                item=entry.get("item", ""),
-                values=dict(entry.get("values", {})),
-            )
-            try:
-                await sub.callback(event)
-            except Exception:
-                logger.exception("실시간 콜백 처리 중 예외 발생 (type=%s)", event_type)
+            # 수신 메시지는 이 루프만 가지므로 values를 복사하지 않고 이벤트에 넘긴다
+            values = entry.get("values") or {}
+            event = RealtimeEvent(event_type, entry.get("name", ""), item, values)
+            for subscriber in sub.subscribers:
+                await subscriber.queue.put(event)
 
     async def _run_loop(self) -> None:
         """WebSocket 수신 루프. 재연결 로직 포함."""
@@ -302,10 +651,11 @@ class KiwoomRealtime:
                         if self._closed:
                             break
                         try:
-                            raw: dict = json.loads(raw_msg)
-                            await self._handle_message(raw)
-                        except json.JSONDecodeError:
+                            raw: dict = json_loads(raw_msg)
+                        except ValueError:
                             logger.warning("WebSocket 메시지 파싱 실패: %r", raw_msg)
+                            continue
+                        await self._handle_message(raw)
 
             except asyncio.CancelledError:
                 break
@@ -324,3 +674,314 @@ class KiwoomRealtime:
             await asyncio.sleep(wait)
             wait = min(wait * 2, _RECONNECT_WAIT_MAX)
             self._connected.clear()
+
+
+class KiwoomRealtimePool:
+    """여러 WebSocket 연결에 구독을 나눠 담는 실시간 클라이언트 풀.
+
+    연결 하나의 구독 한도(100건)를 넘는 종목을 구독할 때 쓴다. 새 (TR 타입, 종목) 쌍은
+    구독 수가 가장 적은 연결에 배정하고, 모든 연결이 가득 차면 ``max_connections``까지
+    연결을 새로 연다. 이미 구독 중인 쌍은 그 쌍을 가진 연결에 콜백만 추가한다.
+    구독 해제로 비게 된 연결은 닫는다 (첫 연결은 유지). 연결 사이에서 기존 구독을
+    옮기지는 않는다. 옮기는 동안 이벤트가 빠질 수 있기 때문이다.
+
+    콜백 없이 구독한 이벤트는 모든 연결에서 모아 ``events()`` 스트림 하나로 전달한다.
+
+    Args:
+        api: 접근토큰·환경 정보를 담은 ``KiwoomApi`` 또는 ``AsyncKiwoomApi`` 인스턴스.
+        env: 환경 구분. ``"real"`` (운영) 또는 ``"demo"`` (모의투자).
+        max_connections: 최대 WebSocket 연결 수. 기본값 ``3`` (최대 300건).
+        reconnect: 연결별 자동 재연결 여부. 기본값 ``True``.
+        queue_size: 콜백·``events()`` 구독자별 기본 큐 크기. 기본값 ``1000``.
+        overflow: 큐가 가득 찼을 때의 기본 처리 방식. 기본값 ``"block"``.
+
+    Example:
+        >>> async with KiwoomRealtimePool(api, env="real", max_connections=4) as pool:
+        ...     await pool.subscribe("0B", items=codes)   # 수백 종목
+        ...     await pool.subscribe("0D", items=codes)
+        ...     async for event in pool.events():
+        ...         print(event.type, event.item, event.values.get("10", ""))
+    """
+
+    def __init__(
+        self,
+        api: KiwoomApi | AsyncKiwoomApi,
+        env: str = "demo",
+        *,
+        max_connections: int = _POOL_MAX_CONNECTIONS,
+        reconnect: bool = True,
+        queue_size: int = _QUEUE_SIZE,
+        overflow: OverflowPolicy = "block",
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections는 1 이상이어야 합니다.")
+        _EventQueue(queue_size, overflow)  # 잘못된 설정을 구독 전에 드러낸다
+        self._api = api
+        self._env = env
+        self._max_connections = max_connections
+        self._reconnect = reconnect
+        self._queue_size = queue_size
+        self._overflow: OverflowPolicy = overflow
+
+        self._members: list[KiwoomRealtime] = []
+        self._owners: dict[tuple[str, str], KiwoomRealtime] = {}  # (type, item) → 담당 연결
+        self._streams: list[_EventQueue] = []  # events() 구독자별 큐
+        self._connected = False
+
+    # ------------------------------------------------------------------ #
+    # 공개 API
+    # ------------------------------------------------------------------ #
+
+    @property
+    def capacity(self) -> int:
+        """풀 전체의 최대 구독 건수."""
+        return self._max_connections * _MAX_SUBSCRIPTIONS
+
+    @property
+    def subscription_count(self) -> int:
+        """현재 구독 중인 (TR 타입, 종목) 쌍의 수."""
+        return len(self._owners)
+
+    @property
+    def connection_count(self) -> int:
+        """현재 열려 있거나 예약된 연결 수."""
+        return len(self._members)
+
+    async def connect(self) -> None:
+        """첫 WebSocket 연결을 연다. 이후 연결은 구독이 늘어날 때 연다.
+
+        이미 연결된 상태면 아무 동작도 하지 않는다.
+        """
+        self._connected = True
+        if not self._members:
+            self._members.append(self._new_member())
+        for member in self._members:
+            await member.connect()
+
+    async def subscribe(
+        self,
+        type: str,
+        items: list[str],
+        callback: RealtimeCallback | None = None,
+        *,
+        grp_no: str = "1",
+        interval: float | None = None,
+    ) -> None:
+        """실시간 데이터 구독을 등록한다.
+
+        ``KiwoomRealtime.subscribe()``와 같지만 ``refresh``는 항상 ``"1"``(기존 등록 유지)이다.
+        등록 중 예외가 나면 이번 호출로 새로 배정한 종목과 새로 만든 연결은 되돌린다.
+
+        Args:
+            type: 실시간 항목 TR명. (예: ``"0B"`` — 주식체결, ``"0D"`` — 주식호가잔량)
+            items: 구독할 종목코드 목록.
+            callback: 이벤트 수신 시 호출할 async 콜백. ``None``이면 ``events()``로 받는다.
+            grp_no: 그룹번호. 기본값 ``"1"``.
+            interval: 콜백 전달 간격(초). ``KiwoomRealtime.subscribe()`` 참고.
+                간격은 연결마다 따로 잰다.
+
+        Raises:
+            KiwoomApiError: 풀 전체 구독 한도(``max_connections`` × 100건) 초과.
+                이 경우 구독 상태는 바뀌지 않는다.
+            ValueError: ``interval``이 0 이하.
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError("interval은 0보다 커야 합니다.")
+        handler = callback if callback is not None else self._publish
+        plan = self._place(type, items)
+        try:
+            for member, member_items in plan.items():
+                await self._open(member)
+                await member.subscribe(type, member_items, handler, grp_no=grp_no, interval=interval)
+        except BaseException:
+            await self._prune(type, plan)
+            raise
+
+    async def subscribe_latest(
+        self,
+        type: str,
+        items: list[str],
+        *,
+        grp_no: str = "1",
+        latest: LatestEvents | None = None,
+    ) -> LatestEvents:
+        """종목별 최신 이벤트만 남기는 구독을 등록한다. 모든 연결이 슬롯 하나를 함께 쓴다.
+
+        ``KiwoomRealtime.subscribe_latest()`` 참고.
+
+        Raises:
+            KiwoomApiError: 풀 전체 구독 한도(``max_connections`` × 100건) 초과.
+        """
+        latest = latest if latest is not None else LatestEvents(self.capacity)
+        plan = self._place(type, items)
+        try:
+            for member, member_items in plan.items():
+                await self._open(member)
+                await member.subscribe_latest(type, member_items, grp_no=grp_no, latest=latest)
+        except BaseException:
+            await self._prune(type, plan)
+            raise
+        return latest
+
+    async def unsubscribe(
+        self,
+        type: str,
+        items: list[str] | None = None,
+        callback: RealtimeCallback | LatestEvents | None = None,
+    ) -> None:
+        """실시간 데이터 구독을 해제한다. 비게 된 연결은 닫는다 (첫 연결은 유지).
+
+        Args:
+            type: 해제할 실시간 항목 TR명.
+            items: 해제할 종목코드 목록. ``None``이면 해당 타입 전체.
+            callback: 해제할 콜백 또는 ``LatestEvents``. ``None``이면 해당 종목의 모든 구독자.
+        """
+        if items is None:
+            keys = [key for key in self._owners if key[0] == type]
+        else:
+            keys = [(type, item) for item in dict.fromkeys(items)]
+
+        plan: dict[KiwoomRealtime, list[str]] = {}
+        for key in keys:
+            member = self._owners.get(key)
+            if member is not None:
+                plan.setdefault(member, []).append(key[1])
+
+        try:
+            for member, member_items in plan.items():
+                await member.unsubscribe(type, member_items, callback)
+        finally:
+            await self._prune(type, plan)
+
+    async def events(
+        self,
+        *,
+        queue_size: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> AsyncIterator[RealtimeEvent]:
+        """콜백 없이 구독한 이벤트를 모든 연결에서 모아 수신 순서대로 내보낸다.
+
+        여러 곳에서 동시에 순회하면 각자 자기 큐로 모든 이벤트를 받는다. 순회를 중간에
+        멈출 때는 ``contextlib.aclosing()``으로 감싸야 큐가 바로 해제된다.
+
+        Args:
+            queue_size: 이 스트림의 큐 크기. ``None``이면 생성자 설정.
+            overflow: 이 스트림의 큐 초과 처리 방식. ``None``이면 생성자 설정.
+
+        Example:
+            >>> async for event in pool.events(overflow="conflate"):
+            ...     handle(event)
+        """
+        queue = _EventQueue(queue_size or self._queue_size, overflow or self._overflow)
+        self._streams.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._streams.remove(queue)
+
+    def subscriber_stats(self) -> list[SubscriberStats]:
+        """모든 연결의 콜백별 큐 상태와 ``events()`` 스트림별 큐 상태를 반환한다."""
+        stats = [stat for member in self._members for stat in member.subscriber_stats()]
+        stats.extend(queue.stats("events()") for queue in self._streams)
+        return stats
+
+    async def close(self) -> None:
+        """모든 WebSocket 연결을 닫는다. 구독 정보는 유지되어 ``connect()``로 다시 열 수 있다."""
+        self._connected = False
+        for member in self._members:
+            await member.close()
+
+    # ------------------------------------------------------------------ #
+    # 컨텍스트 매니저
+    # ------------------------------------------------------------------ #
+
+    async def __aenter__(self) -> KiwoomRealtimePool:
+        """컨텍스트 진입 시 첫 WebSocket 연결을 연다."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """컨텍스트 종료 시 모든 연결을 닫는다."""
+        await self.close()
+
+    # ------------------------------------------------------------------ #
+    # 내부 구현
+    # ------------------------------------------------------------------ #
+
+    def _place(self, type: str, items: list[str]) -> dict[KiwoomRealtime, list[str]]:
+        """각 종목을 담당 연결에 배정하고 연결 → 종목 목록을 반환한다. 필요하면 연결을 만든다.
+
+        배정만 기록하며 연결을 열거나 구독을 등록하지는 않는다. 등록에 실패하면
+        ``_prune()``으로 되돌린다.
+
+        Raises:
+            KiwoomApiError: 풀 전체 구독 한도 초과. 이 경우 아무것도 배정하지 않는다.
+        """
+        keys = [(type, item) for item in dict.fromkeys(items)]
+        new_keys = [key for key in keys if key not in self._owners]
+        if len(self._owners) + len(new_keys) > self.capacity:
+            raise KiwoomApiError(
+                f"실시간 구독 한도 초과: 풀 전체 최대 {self.capacity}건까지 구독 가능합니다. "
+                f"(현재 {len(self._owners)}건, 추가 {len(new_keys)}건)"
+            )
+
+        load = {member: len(member._subscriptions) for member in self._members}
+        plan: dict[KiwoomRealtime, list[str]] = {}
+        for key in keys:
+            member = self._owners.get(key)
+            if member is None:
+                member = self._owners[key] = self._assign(load)
+                load[member] += 1
+            plan.setdefault(member, []).append(key[1])
+        return plan
+
+    async def _open(self, member: KiwoomRealtime) -> None:
+        """풀이 연결된 상태면 ``member``의 연결을 연다. 이미 열려 있으면 아무 동작도 하지 않는다."""
+        if self._connected:
+            await member.connect()
+
+    async def _prune(self, type: str, plan: dict[KiwoomRealtime, list[str]]) -> None:
+        """``plan``의 종목 중 담당 연결에 구독이 없는 것을 풀에서 지우고, 빈 연결을 닫는다.
+
+        구독 해제 뒤 정리와, 등록에 실패한 배정을 되돌리는 데 함께 쓴다. 첫 연결은 유지한다.
+        """
+        for member, member_items in plan.items():
+            for item in member_items:
+                if (type, item) not in member._subscriptions:
+                    self._owners.pop((type, item), None)
+        for member in self._members[1:]:
+            if not member._subscriptions:
+                self._members.remove(member)
+                await member.close()
+
+    def _new_member(self) -> KiwoomRealtime:
+        """풀 설정으로 연결 하나를 만든다. 연결은 ``connect()`` 전까지 열지 않는다."""
+        # _WS_URLS 조회로 잘못된 env를 바로 드러낸다
+        return KiwoomRealtime(
+            self._api,
+            self._env,
+            reconnect=self._reconnect,
+            queue_size=self._queue_size,
+            overflow=self._overflow,
+        )
+
+    def _assign(self, load: dict[KiwoomRealtime, int]) -> KiwoomRealtime:
+        """새 구독을 담을 연결을 고른다. 남은 자리가 가장 많은 연결, 없으면 새 연결.
+
+        Args:
+            load: 연결 → 배정된 구독 수. 새 연결을 만들면 0으로 추가한다.
+        """
+        if load:
+            member = min(load, key=load.__getitem__)
+            if load[member] < _MAX_SUBSCRIPTIONS:
+                return member
+        member = self._new_member()
+        self._members.append(member)
+        load[member] = 0
+        return member
+
+    async def _publish(self, event: RealtimeEvent) -> None:
+        """``events()`` 구독자 큐에 이벤트를 넣는다. 연결의 소비 태스크에서 실행된다."""
+        for queue in tuple(self._streams):
+            await queue.put(event)
@@ -0,0 +1,306 @@
+"""프로세스 간 공유 저장소 — 유량 제어 상태와 접근토큰을 파일로 공유한다.
+
+같은 계좌·앱 키로 여러 프로세스를 띄우면 프로세스마다 유량 제어기와 토큰을 따로 갖게 되어
+계좌 단위 한도(실전 20건/초)를 함께 초과하거나 토큰을 프로세스 수만큼 발급하게 된다.
+이 모듈의 저장소를 ``KiwoomApi``·``KiwoomAuth``에 넘기면 같은 디렉터리를 쓰는
+프로세스끼리 상태를 공유한다. 파일 잠금으로 동기화하므로 같은 호스트 안에서만 유효하다.
+
+저장소 파일은 기본적으로 현재 사용자만 접근할 수 있는 사용자 캐시 디렉터리에 두므로
+접근토큰도 재시작 후에 재사용할 수 있다. 토큰은 ``cryptography``
+(``pip install "kiwoompy[crypto]"``)가 있으면 암호화할 수 있다.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import struct
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from kiwoompy.models import TokenResponse
+
+_TAT_FORMAT = "d"  # 이론적 도착 시각(float, epoch 초)
+_TAT_SIZE = struct.calcsize(_TAT_FORMAT)
+
+
+class RateLimitStore(Protocol):
+    """토큰 버킷(GCRA) 상태 저장소 인터페이스.
+
+    ``reserve()``는 원자적으로 동작해야 한다. 구현은 프로세스 안에서는
+    ``TokenBucket``의 잠금 아래에서만 호출되므로 프로세스 간 동기화만 책임진다.
+    """
+
+    def reserve(self, interval: float, tolerance: float) -> float:
+        """토큰 하나를 예약한다.
+
+        Args:
+            interval: 토큰 간격(초). ``1/rate``.
+            tolerance: 허용 burst 폭(초). ``(capacity - 1) * interval``.
+
+        Returns:
+            예약에 성공하면 ``0.0``, 아니면 다음 토큰까지 남은 시간(초).
+        """
+        ...
+
+
+class TokenStore(Protocol):
+    """접근토큰 공유 저장소 인터페이스. ``key``는 환경·앱 키 조합이다."""
+
+    def lock(self, key: str) -> contextlib.AbstractContextManager[None]:
+        """``key``의 토큰을 발급·갱신하는 동안 다른 프로세스를 막는 잠금."""
+        ...
+
+    def load(self, key: str) -> TokenResponse | None:
+        """저장된 토큰을 반환한다. 없거나 읽을 수 없으면 ``None``."""
+        ...
+
+    def save(self, key: str, token: TokenResponse) -> None:
+        """토큰을 저장한다."""
+        ...
+
+    def clear(self, key: str) -> None:
+        """저장된 토큰을 삭제한다."""
+        ...
+
+
+def _default_directory() -> Path:
+    """저장소·응답 캐시 기본 디렉터리. 재부팅 후에도 남고 다른 사용자가 접근할 수 없는 사용자 캐시.
+
+    Windows는 ``%LOCALAPPDATA%\\kiwoompy``, 그 밖에는 ``$XDG_CACHE_HOME/kiwoompy``
+    (기본 ``~/.cache/kiwoompy``).
+    """
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "kiwoompy"
+
+
+def _prepare_directory(directory: str | os.PathLike[str] | None) -> Path:
+    """저장소 디렉터리를 만들고 현재 사용자 전용인지 확인한다. ``None``이면 기본 디렉터리.
+
+    Raises:
+        PermissionError: 디렉터리 소유자가 현재 사용자가 아닌 경우.
+    """
+    path = Path(directory).expanduser() if directory is not None else _default_directory()
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _ensure_private(path)
+    return path
+
+
+def _ensure_private(path: Path) -> None:
+    """디렉터리가 현재 사용자 소유인지 확인하고 다른 사용자의 접근 권한을 없앤다.
+
+    다른 사용자가 미리 만들어 둔 디렉터리에 토큰·응답을 쓰지 않도록 한다.
+
+    Raises:
+        PermissionError: 디렉터리 소유자가 현재 사용자가 아닌 경우.
+    """
+    if os.name == "nt":
+        return
+    st = path.stat()
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"저장소 디렉터리의 소유자가 현재 사용자가 아닙니다: {path}")
+    if st.st_mode & 0o077:
+        path.chmod(0o700)
+
+
+def _file_name(key: str) -> str:
+    """키(앱 키·계좌번호)가 파일 이름에 그대로 드러나지 않도록 해시한다."""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+@contextlib.contextmanager
+def _locked(fd: int) -> Iterator[None]:
+    """파일 디스크립터에 배타적 잠금을 건다. 다른 프로세스는 해제될 때까지 대기한다."""
+    if os.name == "nt":
+        import msvcrt
+
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileRateLimitStore:
+    """파일 잠금으로 여러 프로세스가 공유하는 토큰 버킷 상태.
+
+    같은 ``key``·``directory``로 만든 저장소를 쓰는 모든 ``KiwoomApi``가 하나의 유량
+    한도를 나눠 쓴다. 대기 순서(우선순위·FIFO)는 프로세스 안에서만 보장된다.
+
+    Args:
+        key: 한도를 공유할 단위. 보통 계좌번호 또는 앱 키.
+        directory: 상태 파일을 둘 디렉터리. ``None``이면 사용자 캐시 디렉터리
+            (``FileTokenStore``와 같은 위치).
+
+    Raises:
+        PermissionError: ``directory``의 소유자가 현재 사용자가 아닌 경우.
+
+    Example:
+        >>> from kiwoompy import FileRateLimitStore, KiwoomApi
+        >>> store = FileRateLimitStore(key="12345678")
+        >>> api = KiwoomApi(env="real", rate_limit_store=store)
+    """
+
+    def __init__(self, key: str, directory: str | os.PathLike[str] | None = None) -> None:
+        self._path = _prepare_directory(directory) / f"{_file_name(key)}.rate"
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    @property
+    def path(self) -> Path:
+        """상태 파일 경로."""
+        return self._path
+
+    def reserve(self, interval: float, tolerance: float) -> float:
+        """토큰 하나를 예약한다. ``RateLimitStore.reserve()`` 참고."""
+        with _locked(self._fd):
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            data = os.read(self._fd, _TAT_SIZE)
+            stored = struct.unpack(_TAT_FORMAT, data)[0] if len(data) == _TAT_SIZE else 0.0
+
+            # 프로세스 간 비교가 가능한 벽시계를 사용한다. 시계가 뒤로 돌아가
+            # 정상 범위를 벗어난 TAT는 버리고 현재 시각부터 다시 센다.
+            now = time.time()
+            if stored > now + tolerance + interval:
+                stored = now
+            tat = max(stored, now)
+            delay = tat - tolerance - now
+            if delay > 0:
+                return delay
+
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            os.write(self._fd, struct.pack(_TAT_FORMAT, tat + interval))
+            return 0.0
+
+    def close(self) -> None:
+        """상태 파일을 닫는다."""
+        os.close(self._fd)
+
+    def __enter__(self) -> FileRateLimitStore:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def _fernet() -> Any:
+    """``cryptography.fernet.Fernet`` 클래스를 반환한다. ``cryptography``는 선택 의존성이다."""
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError as exc:
+        raise ImportError(
+            "토큰 암호화에는 cryptography 패키지가 필요합니다: pip install \"kiwoompy[crypto]\""
+        ) from exc
+    return Fernet
+
+
+class FileTokenStore:
+    """여러 프로세스·재시작 간에 공유하는 접근토큰 파일 저장소.
+
+    ``KiwoomAuth``에 넘기면 아직 유효한 토큰이 저장돼 있을 때 새로 발급하지 않고
+    재사용한다. 발급은 키별 잠금 아래에서 이루어지므로 동시에 시작한 프로세스들도
+    토큰을 한 번만 발급한다. 토큰은 환경·앱 키별로 저장되며, 파일 이름은 앱 키의 해시다.
+
+    기본 디렉터리는 사용자 캐시 디렉터리(``~/.cache/kiwoompy`` 등)이므로 재부팅 후에도
+    유효한 토큰을 재사용한다. 디렉터리는 현재 사용자 소유여야 하며 ``0700``으로, 토큰
+    파일은 ``0600``으로 만든다. ``encryption_key``를 주면 토큰을 Fernet으로 암호화해
+    저장한다. 키가 다르거나 손상된 파일은 없는 것으로 보고 새로 발급한다.
+
+    Args:
+        directory: 토큰 파일을 둘 디렉터리. ``None``이면 사용자 캐시 디렉터리.
+        encryption_key: Fernet 키 (``FileTokenStore.generate_key()``로 생성).
+            ``None``이면 평문으로 저장한다. ``cryptography`` 패키지가 필요하다.
+
+    Raises:
+        PermissionError: ``directory``의 소유자가 현재 사용자가 아닌 경우.
+        ImportError: ``encryption_key``를 줬는데 ``cryptography``가 없는 경우.
+
+    Example:
+        >>> from kiwoompy import FileTokenStore, KiwoomClient
+        >>> client = KiwoomClient(env="real", appkey="...", secretkey="...",
+        ...                       token_store=FileTokenStore(encryption_key=os.environ["KIWOOM_TOKEN_KEY"]))
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        encryption_key: str | bytes | None = None,
+    ) -> None:
+        self._directory = _prepare_directory(directory)
+        self._cipher = _fernet()(encryption_key) if encryption_key is not None else None
+
+    @staticmethod
+    def generate_key() -> str:
+        """``encryption_key``로 쓸 새 Fernet 키를 만든다. 환경 변수 등 안전한 곳에 보관한다."""
+        return _fernet().generate_key().decode("ascii")
+
+    @property
+    def directory(self) -> Path:
+        """토큰 파일 디렉터리."""
+        return self._directory
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self._directory / f"{_file_name(key)}{suffix}"
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """``key``의 토큰 발급 구간을 다른 프로세스와 직렬화한다."""
+        fd = os.open(self._path(key, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            with _locked(fd):
+                yield
+        finally:
+            os.close(fd)
+
+    def load(self, key: str) -> TokenResponse | None:
+        """저장된 토큰을 반환한다. 없거나 손상됐거나 복호화할 수 없으면 ``None``."""
+        from kiwoompy.models import TokenResponse
+
+        try:
+            content = self._path(key, ".token").read_bytes()
+            if self._cipher is not None:
+                content = self._cipher.decrypt(content)
+            data = json.loads(content)
+            return TokenResponse(
+                token=data["token"],
+                token_type=data["token_type"],
+                expires_dt=data["expires_dt"],
+            )
+        except Exception:
+            # 파일 없음·손상·키 불일치(InvalidToken) — 새로 발급하면 된다.
+            return None
+
+    def save(self, key: str, token: TokenResponse) -> None:
+        """토큰을 원자적으로 저장한다 (임시 파일 작성 후 교체)."""
+        path = self._path(key, ".token")
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        content = json.dumps(
+            {"token": token.token, "token_type": token.token_type, "expires_dt": token.expires_dt},
+        ).encode("utf-8")
+        if self._cipher is not None:
+            content = self._cipher.encrypt(content)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+
+    def clear(self, key: str) -> None:
+        """저장된 토큰을 삭제한다."""
+        self._path(key, ".token").unlink(missing_ok=True)
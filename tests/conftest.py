@@ -0,0 +1,53 @@
+"""공통 픽스처 — 네트워크 없이 ``httpx.MockTransport``로 응답을 흉내 낸다."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from kiwoompy.api import AsyncKiwoomApi, KiwoomApi
+
+type Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def token_body(token: str, *, hours: int = 24) -> dict:
+    """``/oauth2/token`` 정상 응답 본문."""
+    expires = datetime.now() + timedelta(hours=hours)
+    return {
+        "return_code": 0,
+        "return_msg": "정상적으로 처리되었습니다",
+        "token": token,
+        "token_type": "Bearer",
+        "expires_dt": expires.strftime("%Y%m%d%H%M%S"),
+    }
+
+
+@pytest.fixture
+def make_api() -> Callable[..., KiwoomApi]:
+    """``handler``로 응답하는 ``KiwoomApi``를 만든다. 유량 제한은 사실상 끈다."""
+
+    def factory(handler: Handler, **kwargs) -> KiwoomApi:
+        kwargs.setdefault("rps", 1000.0)
+        api = KiwoomApi(**kwargs)
+        api._client = httpx.Client(base_url=api._base_url, transport=httpx.MockTransport(handler))
+        return api
+
+    return factory
+
+
+@pytest.fixture
+def make_async_api() -> Callable[..., AsyncKiwoomApi]:
+    """``handler``(동기 또는 async 함수)로 응답하는 ``AsyncKiwoomApi``를 만든다."""
+
+    def factory(handler: Handler, **kwargs) -> AsyncKiwoomApi:
+        kwargs.setdefault("rps", 1000.0)
+        api = AsyncKiwoomApi(**kwargs)
+        api._client = httpx.AsyncClient(
+            base_url=api._base_url, transport=httpx.MockTransport(handler)
+        )
+        return api
+
+    return factory
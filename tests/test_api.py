@@ -0,0 +1,595 @@
+"""HTTP 클라이언트 — 유량 제어·요청 병합·토큰 갱신 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import inspect
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from kiwoompy.api import (
+    _AIMD_DECREASE,
+    _AIMD_MIN_RATIO,
+    _AIMD_STEP,
+    ApiResponse,
+    HttpConfig,
+    KiwoomApi,
+    PageIterator,
+    TokenBucket,
+    _AsyncFacade,
+    _is_rate_limited_body,
+    _is_token_error,
+)
+from kiwoompy.exceptions import KiwoomApiError, KiwoomAuthError, KiwoomRateLimitError
+
+pytestmark = pytest.mark.mock
+
+_OK = {"return_code": 0, "return_msg": "정상적으로 처리되었습니다"}
+_RATE_LIMITED = {"return_code": 5, "return_msg": "[1700:허용된 요청 개수를 초과하였습니다. API ID=ka10001]"}
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (_RATE_LIMITED, True),
+        ({"return_code": 1700, "return_msg": ""}, True),
+        ({"return_code": 5, "return_msg": "허용된 요청 개수를 초과하였습니다"}, True),
+        ({"return_code": 2, "return_msg": "[2000:주문수량 1700주가 한도를 초과했습니다]"}, False),
+        ({"return_code": 2, "return_msg": "[2000:허용된 요청 개수를 초과한 주문]"}, False),
+        ({"return_code": 0, "return_msg": "[1700:정상]"}, False),
+    ],
+)
+def test_is_rate_limited_body_matches_code_not_substring(body, expected):
+    assert _is_rate_limited_body(body) is expected
+
+
+def test_http_429_halves_rate_and_retries(make_api):
+    responses = iter([httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json=_OK)])
+    api = make_api(lambda request: next(responses), rps=10.0)
+
+    api.post("/api/dostk/stkinfo", {}, headers={"api-id": "ka10001"})
+
+    assert api._rate_limiter.rate == pytest.approx(10.0 * _AIMD_DECREASE + _AIMD_STEP)
+
+
+def test_body_1700_decreases_rate_to_floor_then_recovers(make_api):
+    api = make_api(lambda request: httpx.Response(200, json=_OK), rps=10.0)
+    throttled = httpx.Response(200, json=_RATE_LIMITED)
+
+    for _ in range(20):
+        with pytest.raises(KiwoomRateLimitError):
+            api._handle_response(throttled)
+    assert api._rate_limiter.rate == pytest.approx(10.0 * _AIMD_MIN_RATIO)
+
+    for _ in range(200):
+        api._handle_response(httpx.Response(200, json=_OK))
+    assert api._rate_limiter.rate == pytest.approx(10.0)
+
+
+def test_non_adaptive_keeps_rate(make_api):
+    api = make_api(lambda request: httpx.Response(200, json=_OK), rps=10.0, adaptive=False)
+
+    with pytest.raises(KiwoomRateLimitError):
+        api._handle_response(httpx.Response(200, json=_RATE_LIMITED))
+
+    assert api._rate_limiter.rate == pytest.approx(10.0)
+
+
+def _auth_handler(requests: list[str], *, valid: str = "new", body_error: bool = False):
+    """``valid`` 토큰이 실린 요청만 받아들이는 응답 함수."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        requests.append(token)
+        if token == valid:
+            return httpx.Response(200, json=_OK)
+        if body_error:
+            return httpx.Response(200, json={"return_code": 3, "return_msg": "[8005:Token이 유효하지 않습니다]"})
+        return httpx.Response(401, text="unauthorized")
+
+    return handler
+
+
+@pytest.mark.parametrize("body_error", [False, True])
+def test_expired_token_refreshes_and_retries_once(make_api, body_error):
+    requests: list[str] = []
+    api = make_api(_auth_handler(requests, body_error=body_error))
+    api.set_token("old")
+    refreshes = []
+    api.set_token_refresher(lambda: (refreshes.append(1), api.set_token("new")))
+
+    api.post("/api/dostk/stkinfo", {}, headers={**api.get_auth_header(), "api-id": "ka10001"})
+
+    assert requests == ["old", "new"]
+    assert len(refreshes) == 1
+
+
+def test_rejected_refreshed_token_is_not_retried_again(make_api):
+    requests: list[str] = []
+    api = make_api(_auth_handler(requests, valid="never"))
+    api.set_token("old")
+    api.set_token_refresher(lambda: api.set_token("new"))
+
+    with pytest.raises(KiwoomAuthError):
+        api.post("/api/dostk/stkinfo", {}, headers={**api.get_auth_header(), "api-id": "ka10001"})
+
+    assert requests == ["old", "new"]
+
+
+def test_concurrent_async_requests_share_one_refresh(make_async_api):
+    requests: list[str] = []
+    api = make_async_api(_auth_handler(requests))
+    api.set_token("old")
+    refreshes = 0
+
+    async def refresh() -> None:
+        nonlocal refreshes
+        refreshes += 1
+        await asyncio.sleep(0.01)
+        api.set_token("new")
+
+    api.set_token_refresher(refresh)
+
+    async def main() -> None:
+        headers = {**api.get_auth_header(), "api-id": "ka10001"}
+        await asyncio.gather(*(api.post("/api/dostk/stkinfo", {"n": n}, headers=headers) for n in range(5)))
+
+    asyncio.run(main())
+
+    assert refreshes == 1
+    assert sorted(requests) == ["new"] * 5 + ["old"] * 5
+
+
+def test_token_error_matches_code_not_substring():
+    assert _is_token_error(KiwoomAuthError("인증 오류", status_code=401))
+    assert _is_token_error(KiwoomAuthError("접근토큰 만료·무효 (return_code=3): [8005:Token이 유효하지 않습니다]"))
+    assert not _is_token_error(KiwoomAuthError("인증 오류: [8030:앱키 8005번 거래 권한이 없습니다]", status_code=400))
+
+
+def _acquire_order(bucket: TokenBucket, priorities: list[int]) -> list[int]:
+    """토큰을 하나 소진한 뒤 ``priorities`` 순서로 대기시키고, 토큰을 받은 순서(인덱스)를 반환한다."""
+    order: list[int] = []
+
+    async def waiter(index: int, priority: int) -> None:
+        await bucket.acquire_async(priority)
+        order.append(index)
+
+    async def main() -> None:
+        await bucket.acquire_async()
+        await asyncio.gather(*(waiter(i, p) for i, p in enumerate(priorities)))
+
+    asyncio.run(main())
+    return order
+
+
+def test_token_bucket_serves_waiters_in_arrival_order():
+    assert _acquire_order(TokenBucket(50.0), [0, 0, 0, 0]) == [0, 1, 2, 3]
+
+
+def test_token_bucket_spaces_acquisitions_by_rate():
+    bucket = TokenBucket(100.0)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+
+    assert time.monotonic() - started >= 5 * 0.01 * 0.9
+
+
+def test_cancelled_head_waiter_does_not_stall_queue():
+    bucket = TokenBucket(20.0)
+
+    async def main() -> None:
+        await bucket.acquire_async()
+        head = asyncio.create_task(bucket.acquire_async())
+        await asyncio.sleep(0)
+        tail = asyncio.create_task(bucket.acquire_async())
+        await asyncio.sleep(0)
+        head.cancel()
+        async with asyncio.timeout(1.0):
+            await tail
+
+    asyncio.run(main())
+
+    assert bucket._waiters == []
+
+
+def test_token_bucket_serves_higher_priority_first():
+    assert _acquire_order(TokenBucket(50.0), [3, 2, 0, 1, 0]) == [2, 4, 3, 1, 0]
+
+
+def test_requests_wait_in_priority_lanes(make_async_api):
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers["api-id"])
+        return httpx.Response(200, json=_OK)
+
+    api = make_async_api(handler, rps=20.0)
+    api.set_token("tok")
+
+    async def main() -> None:
+        await api.post("/api/dostk/stkinfo", {}, headers={"api-id": "ka10001"})
+        await asyncio.gather(*(
+            api.post("/api/dostk/x", {}, headers={**api.get_auth_header(), "api-id": api_id})
+            for api_id in ("ka10060", "ka10001", "kt00018", "kt10000")
+        ))
+
+    asyncio.run(main())
+
+    # 첫 요청이 토큰을 쓴 뒤 대기한 요청은 order → account → market → bulk 순서로 나간다
+    assert sent == ["ka10001", "kt10000", "kt00018", "ka10001", "ka10060"]
+
+
+def test_priority_rank_defaults_and_overrides(make_api):
+    api = make_api(lambda request: httpx.Response(200, json=_OK), priorities={"ka10001": "bulk"})
+
+    assert api._priority_rank(None, None) == 0  # 토큰 발급
+    assert api._priority_rank({"api-id": "ka10001"}, None) == 3
+    assert api._priority_rank({"api-id": "ka99999"}, None) == 2
+    assert api._priority_rank({"api-id": "ka10060"}, "order") == 0
+
+
+def test_identical_async_requests_share_one_flight(make_async_api):
+    sent: list[dict] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={**_OK, "n": len(sent)})
+
+    api = make_async_api(handler, coalesce=True)
+    api.set_token("tok")
+    headers = {**api.get_auth_header(), "api-id": "ka10001"}
+
+    async def main() -> list[dict]:
+        return await asyncio.gather(
+            *(api.post("/api/dostk/stkinfo", {"stk_cd": "005930"}, headers=headers) for _ in range(5)),
+            api.post("/api/dostk/stkinfo", {"stk_cd": "000660"}, headers=headers),
+        )
+
+    bodies = asyncio.run(main())
+
+    assert len(sent) == 2
+    assert all(body is bodies[0] for body in bodies[:5])
+    assert bodies[5] is not bodies[0]
+    assert api._inflight == {}
+
+
+def test_order_requests_are_never_coalesced(make_async_api):
+    sent = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json=_OK)
+
+    api = make_async_api(handler, coalesce=True)
+    api.set_token("tok")
+    headers = {**api.get_auth_header(), "api-id": "kt10000"}
+
+    async def main() -> None:
+        await asyncio.gather(*(api.post("/api/dostk/ordr", {"qty": "1"}, headers=headers) for _ in range(3)))
+
+    asyncio.run(main())
+
+    assert sent == 3
+
+
+def test_cancelled_follower_does_not_cancel_shared_request(make_async_api):
+    sent = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=_OK)
+
+    api = make_async_api(handler, coalesce=True)
+    api.set_token("tok")
+    headers = {**api.get_auth_header(), "api-id": "ka10001"}
+
+    async def main() -> dict:
+        leader = asyncio.create_task(api.post("/api/dostk/stkinfo", {}, headers=headers))
+        follower = asyncio.create_task(api.post("/api/dostk/stkinfo", {}, headers=headers))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(main()) == _OK
+    assert sent == 1
+
+
+def test_identical_sync_requests_share_one_flight_and_error(make_api):
+    entered = threading.Event()
+    release = threading.Event()
+    sent = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        entered.set()
+        release.wait(5)
+        return httpx.Response(400, text="bad request")
+
+    api = make_api(handler, coalesce=True)
+    api.set_token("tok")
+    headers = {**api.get_auth_header(), "api-id": "ka10001"}
+    errors: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            api.post("/api/dostk/stkinfo", {}, headers=headers)
+        except KiwoomAuthError as exc:
+            errors.append(exc)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    entered.wait(5)
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in (leader, *followers):
+        thread.join(5)
+
+    assert sent == 1
+    assert len(errors) == 4
+    assert all(exc is errors[0] for exc in errors)
+
+
+class _TwoStepQuery:
+    """요청을 두 번 보내는 동기 TR 클래스. 메서드 본문이 몇 번 실행됐는지 센다."""
+
+    def __init__(self, api) -> None:
+        self._api = api
+        self.runs = 0
+
+    def get_two(self, code: str) -> list[str]:
+        self.runs += 1
+        headers = {**self._api.get_auth_header(), "api-id": "ka10001"}
+        first = self._api.post("/api/dostk/stkinfo", {"stk_cd": code}, headers=headers)
+        second = self._api.post("/api/dostk/stkinfo", {"stk_cd": first["next"]}, headers=headers)
+        return [first["next"], second["next"]]
+
+    def iter_pages(self) -> PageIterator[dict]:
+        headers = {"api-id": "ka10001"}
+        return PageIterator(self._api, "/api/dostk/stkinfo", {}, lambda: headers, lambda body: [body])
+
+
+class _InheritedQuery(_TwoStepQuery):
+    pass
+
+
+class _AsyncTwoStepQuery(_AsyncFacade, sync=_InheritedQuery):
+    pass
+
+
+def test_async_facade_runs_sync_method_once(make_async_api):
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={**_OK, "next": f"{bodies[-1]['stk_cd']}+"})
+
+    api = make_async_api(handler)
+    api.set_token("tok")
+    query = _AsyncTwoStepQuery(api)
+
+    assert inspect.iscoroutinefunction(_AsyncTwoStepQuery.get_two)  # 상속한 메서드
+    assert asyncio.run(query.get_two("005930")) == ["005930+", "005930++"]
+    assert query._sync.runs == 1
+    assert bodies == [{"stk_cd": "005930"}, {"stk_cd": "005930+"}]
+
+
+def test_async_facade_iterator_sends_through_async_api(make_async_api):
+    api = make_async_api(lambda request: httpx.Response(200, json=_OK))
+    api.set_token("tok")
+    query = _AsyncTwoStepQuery(api)
+
+    pages = query.iter_pages()
+
+    async def main():
+        return [body async for body in pages]
+
+    assert pages._api is api
+    assert asyncio.run(main()) == [_OK]
+
+
+def test_async_facade_does_not_block_event_loop(make_async_api):
+    class SlowQuery(_TwoStepQuery):
+        def get_two(self, code: str) -> list[str]:
+            time.sleep(0.1)  # 파일 캐시 같은 동기 I/O
+            return super().get_two(code)
+
+    class AsyncSlowQuery(_AsyncFacade, sync=SlowQuery):
+        pass
+
+    api = make_async_api(lambda request: httpx.Response(200, json={**_OK, "next": "x"}))
+    api.set_token("tok")
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def main() -> list[str]:
+        task = asyncio.create_task(ticker())
+        try:
+            return await AsyncSlowQuery(api).get_two("005930")
+        finally:
+            task.cancel()
+
+    assert asyncio.run(main()) == ["x", "x"]
+    assert ticks >= 5
+
+
+def test_cancelled_async_facade_call_sends_no_further_requests(make_async_api):
+    sent = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={**_OK, "next": "x"})
+
+    api = make_async_api(handler)
+    api.set_token("tok")
+    query = _AsyncTwoStepQuery(api)
+
+    async def main() -> None:
+        call = asyncio.create_task(query.get_two("005930"))
+        await asyncio.sleep(0.05)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        await asyncio.sleep(0.05)  # 워커 스레드가 취소를 받고 끝날 시간
+
+    asyncio.run(main())
+
+    assert sent == 1
+    assert query._sync.runs == 1
+
+
+def _numbered_pages(last: int):
+    """``page`` 본문에 페이지 번호를 담고, ``last`` 페이지까지 ``next-key``로 이어지는 응답."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.headers.get("next-key", "1"))
+        headers = {"cont-yn": "Y", "next-key": str(page + 1)} if page < last else {"cont-yn": "N"}
+        return httpx.Response(200, json={**_OK, "page": page}, headers=headers)
+
+    return handler, requests
+
+
+def _page_iterator(api, *, max_pages: int | None = None) -> PageIterator[int]:
+    return PageIterator(
+        api,
+        "/api/dostk/chart",
+        {"stk_cd": "005930"},
+        lambda: {**api.get_auth_header(), "api-id": "ka10081"},
+        lambda body: [body["page"]],
+        max_pages=max_pages,
+    )
+
+
+def test_page_iterator_follows_next_key_until_last_page(make_api):
+    handler, requests = _numbered_pages(3)
+    api = make_api(handler)
+    api.set_token("tok")
+
+    assert list(_page_iterator(api)) == [1, 2, 3]
+    assert [r.headers.get("cont-yn") for r in requests] == [None, "Y", "Y"]
+    assert [r.headers.get("next-key") for r in requests] == [None, "2", "3"]
+    assert all(json.loads(r.content) == {"stk_cd": "005930"} for r in requests)
+
+
+def test_page_iterator_stops_at_max_pages(make_api):
+    handler, requests = _numbered_pages(5)
+    api = make_api(handler)
+    api.set_token("tok")
+
+    assert list(_page_iterator(api, max_pages=2)) == [1, 2]
+    assert len(requests) == 2
+
+
+def test_page_iterator_requests_lazily(make_api):
+    handler, requests = _numbered_pages(5)
+    api = make_api(handler)
+    api.set_token("tok")
+
+    pages = iter(_page_iterator(api))
+    assert requests == []
+    assert next(pages) == 1
+    assert len(requests) == 1
+
+
+def test_page_iterator_apages_follow_next_key(make_async_api):
+    handler, requests = _numbered_pages(3)
+    api = make_async_api(handler)
+    api.set_token("tok")
+
+    async def main():
+        bodies = [response.body["page"] async for response in _page_iterator(api).apages()]
+        limited = [page async for page in _page_iterator(api, max_pages=2)]
+        return bodies, limited
+
+    assert asyncio.run(main()) == ([1, 2, 3], [1, 2])
+    assert len(requests) == 5
+
+
+@pytest.mark.parametrize(
+    ("headers", "has_next"),
+    [
+        ({"cont-yn": "Y", "next-key": "k"}, True),
+        ({"cont-yn": "Y", "next-key": ""}, False),
+        ({"cont-yn": "N", "next-key": "k"}, False),
+        ({}, False),
+    ],
+)
+def test_api_response_has_next(headers, has_next):
+    assert ApiResponse({}, headers).has_next is has_next
+
+
+def test_http_config_client_kwargs():
+    config = HttpConfig(
+        max_connections=8,
+        max_keepalive_connections=4,
+        keepalive_expiry=90.0,
+        connect_timeout=1.0,
+        read_timeout=2.0,
+        write_timeout=3.0,
+        pool_timeout=4.0,
+    )
+
+    kwargs = config.client_kwargs()
+
+    assert kwargs["http2"] is False
+    assert kwargs["limits"] == httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=90.0)
+    assert kwargs["timeout"] == httpx.Timeout(connect=1.0, read=2.0, write=3.0, pool=4.0)
+    with KiwoomApi(env="demo", http=config) as api:
+        assert api._client.timeout == kwargs["timeout"]
+
+
+def test_http2_without_h2_package_raises_import_error(monkeypatch):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *a: None if name == "h2" else find_spec(name, *a))
+
+    assert HttpConfig().client_kwargs()["http2"] is False  # HTTP/1.1은 h2가 필요 없다
+    with pytest.raises(ImportError, match="kiwoompy\\[http2\\]"):
+        HttpConfig(http2=True).client_kwargs()
+    with pytest.raises(ImportError):
+        KiwoomApi(env="demo", http=HttpConfig(http2=True))
+
+
+def test_warmup_opens_connection_without_a_tr_request(make_api, make_async_api):
+    seen: list[tuple[str, str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.headers.get("api-id")))
+        return httpx.Response(404)  # 상태 코드와 관계없이 연결이 열리면 성공이다
+
+    make_api(handler).warmup()
+    asyncio.run(make_async_api(handler).warmup())
+
+    assert seen == [("HEAD", "/", None), ("HEAD", "/", None)]
+
+
+def test_warmup_connection_failure_raises_api_error(make_api, make_async_api):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("연결 거부", request=request)
+
+    with pytest.raises(KiwoomApiError, match="네트워크 오류"):
+        make_api(handler).warmup()
+    with pytest.raises(KiwoomApiError, match="네트워크 오류"):
+        asyncio.run(make_async_api(handler).warmup())
@@ -0,0 +1,95 @@
+"""접근토큰 발급·공유 저장소 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from conftest import token_body
+
+from kiwoompy import AsyncKiwoomAuth, FileTokenStore, KiwoomAuth
+
+pytestmark = pytest.mark.mock
+
+
+def test_concurrent_async_auth_sharing_store_issues_once(make_async_api, tmp_path):
+    posts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal posts
+        assert request.url.path == "/oauth2/token"
+        posts += 1
+        await asyncio.sleep(0.05)  # 발급이 진행되는 동안 다른 인스턴스가 잠금에 도달하게 한다
+        return httpx.Response(200, json=token_body(f"tok-{posts}"))
+
+    async def main() -> list[str | None]:
+        store = FileTokenStore(tmp_path)
+        apis = [make_async_api(handler) for _ in range(2)]
+        auths = [AsyncKiwoomAuth(api, token_store=store) for api in apis]
+        await asyncio.gather(*(auth.issue_token("app", "secret") for auth in auths))
+        return [api.token for api in apis]
+
+    tokens = asyncio.run(main())
+
+    assert posts == 1
+    assert tokens == ["tok-1", "tok-1"]
+
+
+def test_async_store_lock_does_not_block_event_loop(make_async_api, tmp_path):
+    store = FileTokenStore(tmp_path)
+    api = make_async_api(lambda request: httpx.Response(200, json=token_body("tok")))
+    auth = AsyncKiwoomAuth(api, token_store=store)
+    key = f"{api.env}:app"
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def main() -> None:
+        release = threading.Event()
+        held = threading.Event()
+
+        def hold_lock() -> None:
+            with store.lock(key):
+                held.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait()
+        task = asyncio.create_task(ticker())
+        issuing = asyncio.create_task(auth.issue_token("app", "secret"))
+        await asyncio.sleep(0.1)
+        assert not issuing.done()
+        release.set()
+        await issuing
+        task.cancel()
+        holder.join()
+
+    asyncio.run(main())
+
+    assert ticks >= 5
+    assert api.token == "tok"
+
+
+def test_sync_auth_reuses_stored_token(make_api, tmp_path):
+    posts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal posts
+        posts += 1
+        return httpx.Response(200, json=token_body("tok"))
+
+    store = FileTokenStore(tmp_path)
+    first, second = make_api(handler), make_api(handler)
+    KiwoomAuth(first, token_store=store).issue_token("app", "secret")
+    KiwoomAuth(second, token_store=store).issue_token("app", "secret")
+
+    assert posts == 1
+    assert second.token == "tok"
+    assert first.appkey == second.appkey == "app"  # 응답 캐시의 계좌 구분
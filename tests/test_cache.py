@@ -0,0 +1,210 @@
+"""응답 캐시 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import stat
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from kiwoompy import (
+    AsyncKiwoomQuery,
+    FileResponseCache,
+    KiwoomQuery,
+    MemoryResponseCache,
+)
+from kiwoompy import cache as cache_module
+from kiwoompy.exceptions import KiwoomApiError
+
+pytestmark = pytest.mark.mock
+
+posix_only = pytest.mark.skipif(os.name == "nt", reason="POSIX 권한 비트")
+
+_LIST = {"return_code": 0, "list": [{"code": "005930", "name": "삼성전자"}]}
+_MIN_CHART = {"return_code": 0, "stk_cd": "005930", "stk_min_pole_chart_qry": []}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """캐시 모듈의 ``time.monotonic()``·``time.time()``을 직접 움직이는 시계."""
+    now = SimpleNamespace(value=1_000.0)
+    monkeypatch.setattr(
+        cache_module, "time", SimpleNamespace(monotonic=lambda: now.value, time=lambda: now.value)
+    )
+    return now
+
+
+@pytest.fixture(params=["memory", "file"])
+def response_cache(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryResponseCache(max_entries=2)
+    else:
+        with FileResponseCache(tmp_path, max_entries=2) as cache:
+            yield cache
+
+
+def test_cache_returns_entry_until_ttl_expires(response_cache, clock):
+    response_cache.set("key", "ka10099", _LIST, ttl=60)
+
+    clock.value += 59
+    assert response_cache.get("key") == _LIST
+    clock.value += 1
+    assert response_cache.get("key") is None
+    assert response_cache.get("missing") is None
+
+
+def test_cache_evicts_least_recently_used(response_cache, clock):
+    response_cache.set("a", "ka10099", {"n": 1}, ttl=60)
+    clock.value += 1
+    response_cache.set("b", "ka10099", {"n": 2}, ttl=60)
+    clock.value += 1
+    assert response_cache.get("a") == {"n": 1}  # b가 가장 오래 쓰지 않은 항목이 된다
+    clock.value += 1
+    response_cache.set("c", "ka10099", {"n": 3}, ttl=60)
+
+    assert response_cache.get("b") is None
+    assert response_cache.get("a") == {"n": 1}
+    assert response_cache.get("c") == {"n": 3}
+
+
+def test_cache_invalidates_by_api_id(response_cache):
+    response_cache.set("a", "ka10099", {"n": 1}, ttl=60)
+    response_cache.set("b", "ka10100", {"n": 2}, ttl=60)
+
+    response_cache.invalidate("ka10099")
+    assert response_cache.get("a") is None
+    assert response_cache.get("b") == {"n": 2}
+    response_cache.invalidate()
+    assert response_cache.get("b") is None
+
+
+def test_file_cache_survives_reopen(tmp_path):
+    with FileResponseCache(tmp_path) as cache:
+        cache.set("key", "ka10099", _LIST, ttl=60)
+
+    with FileResponseCache(tmp_path) as cache:
+        assert cache.get("key") == _LIST
+
+
+def _counting_api(make_api, body: dict, sent: list[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers["api-id"])
+        return httpx.Response(200, json=body)
+
+    api = make_api(handler)
+    api.set_token("tok", "app-a")
+    return api
+
+
+def test_query_reuses_cached_reference_tr(make_api):
+    sent: list[str] = []
+    cache = MemoryResponseCache()
+    query = KiwoomQuery(_counting_api(make_api, _LIST, sent), cache=cache)
+
+    first = query.get_stock_list("kospi")
+    second = query.get_stock_list("kospi")
+    query.get_stock_list("kosdaq")
+
+    assert first == second
+    assert [item.code for item in first.items] == ["005930"]
+    assert sent == ["ka10099", "ka10099"]
+    assert len(cache) == 2
+
+
+def test_query_never_caches_tr_without_ttl(make_api):
+    sent: list[str] = []
+    cache = MemoryResponseCache()
+    query = KiwoomQuery(_counting_api(make_api, _MIN_CHART, sent), cache=cache)
+
+    query.get_stock_min_chart("005930", "1")
+    query.get_stock_min_chart("005930", "1")
+
+    assert sent == ["ka10080", "ka10080"]
+    assert len(cache) == 0
+
+
+def test_query_does_not_cache_error_response(make_api):
+    sent: list[str] = []
+    query = KiwoomQuery(
+        _counting_api(make_api, {"return_code": 1, "return_msg": "오류"}, sent),
+        cache=MemoryResponseCache(),
+    )
+
+    for _ in range(2):
+        with pytest.raises(KiwoomApiError, match="오류"):
+            query.get_stock_list("kospi")
+
+    assert sent == ["ka10099", "ka10099"]
+
+
+def test_query_cache_is_separated_by_appkey(make_api):
+    sent: list[str] = []
+    api = _counting_api(make_api, _LIST, sent)
+    query = KiwoomQuery(api, cache=MemoryResponseCache())
+
+    query.get_stock_list("kospi")
+    api.set_token("tok", "app-b")
+    query.get_stock_list("kospi")
+    api.set_token("tok", "app-a")
+    query.get_stock_list("kospi")
+
+    assert len(sent) == 2
+
+
+@posix_only
+def test_file_cache_key_does_not_store_appkey(make_api, tmp_path):
+    with FileResponseCache(tmp_path) as cache:
+        KiwoomQuery(_counting_api(make_api, _LIST, []), cache=cache).get_stock_list("kospi")
+
+    for path in tmp_path.iterdir():
+        assert b"app-a" not in path.read_bytes(), path.name
+
+
+def test_async_query_uses_file_cache(make_async_api, tmp_path):
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers["api-id"])
+        return httpx.Response(200, json=_LIST)
+
+    api = make_async_api(handler)
+    api.set_token("tok", "app-a")
+
+    async def main() -> None:
+        with FileResponseCache(tmp_path) as cache:
+            query = AsyncKiwoomQuery(api, cache=cache)
+            await query.get_stock_list("kospi")
+            await query.get_stock_list("kospi")
+
+    asyncio.run(main())
+
+    assert sent == ["ka10099"]
+
+
+@posix_only
+def test_file_cache_defaults_to_private_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    with FileResponseCache() as cache:
+        cache.set("key", "ka10099", {"return_code": 0, "list": [1]}, ttl=60)
+        assert cache.get("key") == {"return_code": 0, "list": [1]}
+
+        assert cache.path.parent == tmp_path / "kiwoompy"
+        assert stat.S_IMODE(cache.path.parent.stat().st_mode) == 0o700
+        for path in cache.path.parent.iterdir():
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600, path.name
+
+
+@posix_only
+def test_file_cache_tightens_existing_directory(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir(mode=0o777)
+    directory.chmod(0o777)
+
+    with FileResponseCache(directory):
+        pass
+
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
@@ -0,0 +1,95 @@
+"""JSON 코덱 테스트."""
+
+from __future__ import annotations
+
+import importlib.util
+from decimal import Decimal
+
+import pytest
+
+from kiwoompy import codec
+from kiwoompy.codec import (
+    JsonCodec,
+    get_json_codec,
+    json_dumps,
+    json_key,
+    json_loads,
+    set_json_codec,
+)
+
+pytestmark = pytest.mark.mock
+
+_MESSAGE = {"trnm": "REAL", "data": [{"type": "0B", "name": "주식체결", "values": {"10": "+60700"}}]}
+
+
+@pytest.fixture(autouse=True)
+def _restore_codec():
+    saved = get_json_codec()
+    yield
+    set_json_codec(saved)
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request) -> str:
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    set_json_codec(request.param)
+    return request.param
+
+
+def test_round_trip_keeps_non_ascii_unescaped(backend):
+    data = json_dumps(_MESSAGE)
+
+    assert isinstance(data, bytes)
+    assert "주식체결".encode() in data
+    assert json_loads(data) == _MESSAGE
+    assert json_loads(data.decode()) == _MESSAGE
+
+
+def test_invalid_json_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        json_loads(b"{not json")
+
+
+def test_auto_falls_back_to_stdlib_json(monkeypatch):
+    monkeypatch.setattr(codec.importlib.util, "find_spec", lambda name: None)
+
+    assert set_json_codec("auto").name == "json"
+
+
+def test_unknown_or_missing_backend():
+    with pytest.raises(ValueError):
+        set_json_codec("yaml")  # type: ignore[arg-type]
+    if importlib.util.find_spec("orjson") is None:
+        with pytest.raises(ImportError, match=r"kiwoompy\[orjson\]"):
+            set_json_codec("orjson")
+
+
+def test_custom_codec_replaces_backend():
+    calls = []
+    custom = JsonCodec("custom", lambda data: calls.append(data) or {}, lambda obj: b"{}")
+
+    set_json_codec(custom)
+
+    assert json_dumps({"a": 1}) == b"{}"
+    assert json_loads(b"[]") == {}
+    assert calls == [b"[]"]
+
+
+def test_json_key_is_order_independent(backend):
+    body = {"stk_cd": "005930", "base_dt": "20250102", "nested": {"b": [1, 2], "a": "가"}}
+    reordered = {"nested": {"a": "가", "b": (1, 2)}, "base_dt": "20250102", "stk_cd": "005930"}
+
+    assert json_key(body) == json_key(reordered)
+    assert json_key({"n": Decimal("1.5")}) == json_key({"n": "1.5"})
+
+
+def test_request_keys_go_through_the_codec(make_async_api):
+    calls = []
+    stdlib = codec._stdlib_codec()
+    set_json_codec(JsonCodec("spy", stdlib.loads, lambda obj: calls.append(obj) or stdlib.dumps(obj)))
+    api = make_async_api(lambda request: None, coalesce=True)
+
+    api._flight_key("/api/dostk/stkinfo", {"stk_cd": "005930"}, {"api-id": "ka10001"}, None)
+
+    assert calls == [{"stk_cd": "005930"}]
@@ -0,0 +1,103 @@
+"""지연 import 테스트 — 쓰지 않는 하위 모듈과 의존 패키지를 불러오지 않는다."""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import kiwoompy
+
+pytestmark = pytest.mark.mock
+
+
+def _loaded_after(code: str) -> set[str]:
+    """새 인터프리터에서 ``code``를 실행한 뒤 불러온 모듈 이름을 반환한다."""
+    script = textwrap.dedent(code) + "\nimport sys\nprint('\\n'.join(sys.modules))\n"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return set(result.stdout.split())
+
+
+def _under(modules: set[str], *packages: str) -> set[str]:
+    """``packages``와 그 하위 모듈만 남긴다."""
+    return {m for m in modules if any(m == p or m.startswith(f"{p}.") for p in packages)}
+
+
+def test_import_kiwoompy_loads_no_submodules_or_dependencies():
+    loaded = _loaded_after("import kiwoompy")
+
+    assert _under(loaded, "kiwoompy") == {"kiwoompy"}
+    assert not _under(loaded, "httpx", "websockets", "tenacity", "numpy")
+
+
+def test_query_domain_is_loaded_on_first_access():
+    loaded = _loaded_after("""
+        from kiwoompy import KiwoomApi, KiwoomQuery
+        KiwoomQuery(KiwoomApi(env="demo")).chart
+    """)
+
+    assert "kiwoompy.query.chart" in loaded
+    assert not _under(loaded, "kiwoompy.query.ranking", "kiwoompy.query.account", "kiwoompy.realtime")
+
+
+def test_public_names_resolve():
+    missing = [name for name in kiwoompy.__all__ if not hasattr(kiwoompy, name)]
+
+    assert missing == []
+    assert set(kiwoompy.__all__) <= set(dir(kiwoompy))
+
+
+def _type_checking_names() -> list[str]:
+    """``kiwoompy/__init__.py``의 ``TYPE_CHECKING`` 블록이 import하는 이름.
+
+    지연 로딩 이전의 즉시 import 목록을 그대로 옮긴 블록이므로, 예전에
+    ``kiwoompy``에서 가져올 수 있던 이름 전체와 같다.
+    """
+    tree = ast.parse(inspect.getsource(kiwoompy))
+    block = next(node for node in tree.body if isinstance(node, ast.If))
+    return [alias.asname or alias.name for node in block.body for alias in node.names]
+
+
+def test_previously_exported_names_still_resolve():
+    names = _type_checking_names()
+    missing = [name for name in names if not hasattr(kiwoompy, name)]
+
+    assert "GoldBalance" in names
+    assert missing == []
+    assert set(names) == set(kiwoompy.__all__)
+
+
+def _cumulative_import_us(code: str) -> dict[str, int]:
+    """``-X importtime``으로 ``code``를 실행해 모듈별 누적 import 시간(µs)을 반환한다."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        *_, cumulative_us, module = (part.strip() for part in line.split("|"))
+        if cumulative_us.isdigit():
+            times[module] = int(cumulative_us)
+    return times
+
+
+def test_import_kiwoompy_costs_a_fraction_of_the_models():
+    # 절대 시간은 기계마다 다르므로 같은 프로세스에서 잰 models import 비용과 비교한다.
+    # 지연 로딩 이전에는 ``import kiwoompy``가 models 전체를 포함했다.
+    times = _cumulative_import_us("import kiwoompy; import kiwoompy.models")
+
+    assert times["kiwoompy"] * 5 < times["kiwoompy.models"]
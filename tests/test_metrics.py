@@ -0,0 +1,81 @@
+"""요청 계측 테스트."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from kiwoompy import KiwoomAuthError, LatencyHistogram, MetricsRecorder, RequestMetrics
+
+pytestmark = pytest.mark.mock
+
+_OK = {"return_code": 0, "return_msg": "정상적으로 처리되었습니다"}
+
+
+def test_hook_reports_attempts_sizes_and_errors(make_api):
+    responses = iter([
+        httpx.Response(200, json=_OK),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json=_OK),
+        httpx.Response(400, text="bad request"),
+    ])
+    reported: list[RequestMetrics] = []
+    api = make_api(lambda request: next(responses), metrics=reported.append)
+    headers = {"api-id": "ka10001"}
+
+    api.post("/api/dostk/stkinfo", {"stk_cd": "005930"}, headers=headers)
+    api.post("/api/dostk/stkinfo", {"stk_cd": "005930"}, headers=headers)
+    with pytest.raises(KiwoomAuthError):
+        api.post("/api/dostk/stkinfo", {"stk_cd": "005930"}, headers=headers)
+
+    assert [(m.api_id, m.attempts, m.error) for m in reported] == [
+        ("ka10001", 1, None),
+        ("ka10001", 2, None),
+        ("ka10001", 1, "KiwoomAuthError"),
+    ]
+    first = reported[0]
+    assert first.path == "/api/dostk/stkinfo"
+    assert first.request_bytes == len(b'{"stk_cd":"005930"}')
+    assert first.response_bytes > 0
+    assert min(first.queue_wait, first.latency, first.parse_time) >= 0
+
+
+def test_failing_hook_does_not_affect_request(make_api):
+    def hook(metrics: RequestMetrics) -> None:
+        raise RuntimeError("hook")
+
+    api = make_api(lambda request: httpx.Response(200, json=_OK), metrics=hook)
+
+    assert api.post("/api/dostk/stkinfo", {}, headers={"api-id": "ka10001"}) == _OK
+
+
+def test_recorder_aggregates_per_api_id():
+    recorder = MetricsRecorder()
+    for latency in (0.01, 0.02, 0.03, 0.04):
+        recorder(RequestMetrics("ka10001", "/p", 0.0, latency, 0.001, 10, 100, 1))
+    recorder(RequestMetrics("ka10001", "/p", 0.0, 0.5, 0.001, 10, 0, 3, "KiwoomApiError"))
+
+    snapshot = recorder.snapshot()["ka10001"]
+
+    assert snapshot["count"] == 5
+    assert snapshot["retries"] == 2
+    assert snapshot["errors"] == {"KiwoomApiError": 1}
+    assert snapshot["request_bytes"] == 50
+    assert snapshot["latency"]["p50"] == 0.03
+    assert snapshot["latency"]["p99"] == 0.5
+    assert recorder.percentile("ka99999", "latency", 50) == 0.0
+    json.dumps(recorder.snapshot())
+    with pytest.raises(ValueError):
+        recorder.percentile("ka10001", "size", 50)
+
+
+def test_histogram_keeps_recent_window():
+    histogram = LatencyHistogram(window=3)
+    for value in (9.0, 1.0, 2.0, 3.0):
+        histogram.add(value)
+
+    assert len(histogram) == 3
+    assert histogram.percentile(100) == 3.0
+    assert histogram.summary() == {"count": 3, "p50": 2.0, "p95": 3.0, "p99": 3.0}
@@ -0,0 +1,63 @@
+"""응답 모델 테스트."""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import pickle
+import tracemalloc
+
+import pytest
+
+import kiwoompy.models
+from kiwoompy.models import StockDayChartItem
+
+pytestmark = pytest.mark.mock
+
+_MODELS = [
+    cls
+    for cls in vars(kiwoompy.models).values()
+    if inspect.isclass(cls) and cls.__module__ == kiwoompy.models.__name__ and dataclasses.is_dataclass(cls)
+]
+
+
+def test_response_models_are_frozen_slots_dataclasses():
+    assert _MODELS
+    no_slots = [cls.__name__ for cls in _MODELS if "__slots__" not in vars(cls)]
+    not_frozen = [cls.__name__ for cls in _MODELS if not cls.__dataclass_params__.frozen]
+
+    assert no_slots == []
+    assert not_frozen == []
+
+
+def test_slots_model_behaves_like_a_dataclass():
+    item = StockDayChartItem("-70000", "123", "1000", "20250102", "69000", "71000", "68000", "-500", "5", "0.12")
+
+    assert not hasattr(item, "__dict__")
+    assert pickle.loads(pickle.dumps(item)) == item
+    assert dataclasses.replace(item, cur_prc="1").cur_prc == "1"
+    assert dataclasses.asdict(item)["dt"] == "20250102"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        item.cur_prc = "1"  # type: ignore[misc]
+
+
+def _bytes_per_row(model: type, rows: int = 2_000) -> float:
+    """``model`` 행 ``rows``개가 차지하는 메모리(행당 바이트). 필드 값 문자열은 공유한다."""
+    values = [str(n) for n in range(len(dataclasses.fields(model)))]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [model(*values) for _ in range(rows)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(items)
+
+
+def test_slots_models_use_less_memory_per_row():
+    plain = dataclasses.make_dataclass(
+        "PlainDayChartItem", [(f.name, str) for f in dataclasses.fields(StockDayChartItem)], frozen=True
+    )
+
+    # slots 객체는 필드 포인터만 가지며 __dict__ 몫이 없다 (CPython 3.13 기준 120 vs 168 B)
+    assert _bytes_per_row(StockDayChartItem) < 0.8 * _bytes_per_row(plain)
@@ -0,0 +1,243 @@
+"""숫자 변환 테스트."""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import pkgutil
+import sys
+
+import pytest
+
+import kiwoompy.query
+from kiwoompy import models
+from kiwoompy._field_kinds import _FIELD_KINDS, _MODEL_FIELD_KINDS, _RESPONSE_KEYS
+from kiwoompy.models import (
+    AfterCloseInvestorItem,
+    ElwDailySensItem,
+    ElwSearchItem,
+    GoldBalanceItem,
+    GoldBidItem,
+    GoldContractTrendItem,
+    OrderHistoryDetailItem,
+    SectorPriceTmItem,
+    StockDayChart,
+    StockDayChartItem,
+    StockInfo,
+    ThemeStockItem,
+)
+from kiwoompy.numeric import (
+    _kind_of,
+    numeric_fields,
+    parse_number,
+    to_arrays,
+    to_columns,
+)
+from kiwoompy.query._schema import _SCHEMAS
+
+pytestmark = pytest.mark.mock
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("+60700", 60700),
+        ("-000123", -123),
+        ("1,234,567", 1234567),
+        (" -12.5 ", -12.5),
+        ("", None),
+    ],
+)
+def test_parse_number(text, expected):
+    assert parse_number(text) == expected
+
+
+def test_parse_number_rejects_non_numeric():
+    with pytest.raises(ValueError):
+        parse_number("N/A")
+
+
+@pytest.mark.parametrize(
+    ("model", "expected"),
+    [
+        (
+            StockDayChartItem,
+            {
+                "cur_prc": "price",
+                "trde_qty": "int",
+                "trde_prica": "int",
+                "open_pric": "price",
+                "high_pric": "price",
+                "low_pric": "price",
+                "pred_pre": "int",
+                "trde_tern_rt": "float",
+            },
+        ),
+        (
+            ElwDailySensItem,
+            {
+                "iv": "float",
+                "delta": "float",
+                "gam": "float",
+                "theta": "float",
+                "vega": "float",
+                "law": "float",
+                "lp": "int",
+            },
+        ),
+        (
+            SectorPriceTmItem,
+            {
+                "cur_prc_n": "price",
+                "pred_pre_n": "int",
+                "flu_rt_n": "float",
+                "trde_qty_n": "int",
+                "acc_trde_qty_n": "int",
+            },
+        ),
+    ],
+)
+def test_numeric_fields_of_item_models(model, expected):
+    assert dict(numeric_fields(model)) == expected
+
+
+def _model_str_fields() -> dict[str, set[str]]:
+    """모델 이름 → 문자열 필드 이름."""
+    fields = {}
+    for name, obj in vars(models).items():
+        if isinstance(obj, type) and dataclasses.is_dataclass(obj) and obj.__module__ == models.__name__:
+            fields[name] = {f.name for f in dataclasses.fields(obj) if f.type in ("str", str)}
+    return fields
+
+
+def test_every_model_str_field_is_classified():
+    by_model = _model_str_fields()
+    names = set().union(*by_model.values())
+
+    assert sorted(names - set(_FIELD_KINDS)) == []  # 표에 없는 필드
+    assert sorted(set(_FIELD_KINDS) - names) == []  # 모델에서 사라진 필드
+    for model, name in _MODEL_FIELD_KINDS:
+        assert name in by_model[model]
+    assert set(_RESPONSE_KEYS.values()) <= names
+
+
+def test_schema_response_keys_have_the_field_kind():
+    for module in pkgutil.iter_modules(kiwoompy.query.__path__):
+        importlib.import_module(f"kiwoompy.query.{module.name}")
+
+    renamed = [(schema, field, key) for schema in _SCHEMAS.values() for field, key in schema.renames.items()]
+    assert renamed
+    for schema, field, key in renamed:
+        assert key in _RESPONSE_KEYS or key in _FIELD_KINDS
+        assert _kind_of(key) == numeric_fields(schema.model).get(field)
+
+
+def test_numeric_fields_of_fields_without_a_unit_suffix():
+    info = numeric_fields(StockInfo)
+    assert info["per"] == "float"
+    assert info["mac"] == "int"
+    assert info["oyr_hgst"] == "price"
+    assert "stk_cd" not in info
+    assert "stk_nm" not in info
+    assert numeric_fields(GoldContractTrendItem)["trde_pre"] == "float"
+    assert numeric_fields(ThemeStockItem)["dt_prft_rt_n"] == "float"
+    assert numeric_fields(AfterCloseInvestorItem)["ind_invsr"] == "int"
+    balance = numeric_fields(GoldBalanceItem)
+    assert balance["book_amt2"] == "int"
+    assert balance["est_lspft"] == "int"
+
+
+def test_numeric_fields_of_text_and_per_model_fields():
+    assert numeric_fields(OrderHistoryDetailItem)["cond_uv"] == "int"  # 주문 조건값, 부호 유지
+    assert "pred_pre_sig" not in numeric_fields(StockDayChartItem)
+    assert numeric_fields(GoldBidItem)["lpmmcm_nm_1"] == "float"  # K.O 접근도
+    assert "lpmmcm_nm_1" not in numeric_fields(ElwSearchItem)  # LP회원사명1
+
+
+def test_to_columns_maps_renamed_response_keys():
+    cols = to_columns([{"code": "005930", "listCount": "0000005969782550", "lastPrice": "00060700"}])
+
+    assert cols == {"code": ["005930"], "listCount": [5969782550], "lastPrice": [60700]}
+
+
+def test_to_columns_parses_by_kind():
+    items = [
+        StockDayChartItem("-70000", "000123", "1,000", "20250102", "+69000", "71000", "68000", "-500", "5", "0.12"),
+    ]
+
+    cols = to_columns(items, fields=["dt", "cur_prc", "trde_qty", "pred_pre", "trde_tern_rt"])
+
+    assert cols == {
+        "dt": ["20250102"],
+        "cur_prc": [70000],
+        "trde_qty": [123],
+        "pred_pre": [-500],
+        "trde_tern_rt": [0.12],
+    }
+
+
+def _day_chart_body() -> dict:
+    rows = [
+        ("-70000", "000123", "1,000", "20250102", "+69000", "71000", "68000", "-500", "5", "0.12"),
+        ("+69500", "000456", "2,000", "20250103", "69800", "70000", "69000", "+100", "2", "-0.25"),
+    ]
+    keys = [f.name for f in dataclasses.fields(StockDayChartItem)]
+    return {"return_code": 0, "stk_cd": "005930", "stk_dt_pole_chart_qry": [dict(zip(keys, row)) for row in rows]}
+
+
+def test_to_arrays_builds_typed_columns_from_raw_body():
+    np = pytest.importorskip("numpy")
+
+    arrays = to_arrays(_day_chart_body(), fields=["dt", "cur_prc", "trde_qty", "pred_pre", "trde_tern_rt", "pred_pre_sig"])
+
+    assert arrays["dt"].dtype == np.dtype("datetime64[D]")
+    assert arrays["dt"].tolist() == [np.datetime64("2025-01-02").item(), np.datetime64("2025-01-03").item()]
+    assert arrays["cur_prc"].dtype == np.int64
+    assert arrays["cur_prc"].tolist() == [70000, 69500]
+    assert arrays["trde_qty"].tolist() == [123, 456]
+    assert arrays["pred_pre"].tolist() == [-500, 100]
+    assert arrays["trde_tern_rt"].dtype == np.float64
+    assert arrays["trde_tern_rt"].tolist() == [0.12, -0.25]
+    assert arrays["pred_pre_sig"].tolist() == ["5", "2"]
+
+
+def test_to_arrays_accepts_models_and_item_lists():
+    pytest.importorskip("numpy")
+    body = _day_chart_body()
+    items = [StockDayChartItem(**item) for item in body["stk_dt_pole_chart_qry"]]
+
+    from_model = to_arrays(StockDayChart(stk_cd="005930", items=items))
+    from_list = to_arrays(items)
+    from_raw = to_arrays(body)
+
+    assert from_model.keys() == from_list.keys() == from_raw.keys()
+    for name in from_raw:
+        assert from_model[name].tolist() == from_list[name].tolist() == from_raw[name].tolist()
+    assert from_raw["trde_prica"].tolist() == [1000, 2000]  # 쉼표는 느린 경로에서 처리한다
+
+
+def test_to_arrays_blank_values_become_nan_and_nat():
+    np = pytest.importorskip("numpy")
+    items = [{"cntr_tm": "20250102090000", "cur_prc": "-70000"}, {"cntr_tm": "", "cur_prc": ""}]
+
+    arrays = to_arrays(items)
+
+    assert arrays["cntr_tm"].dtype == np.dtype("datetime64[s]")
+    assert np.isnat(arrays["cntr_tm"][1])
+    assert arrays["cur_prc"].dtype == np.float64
+    assert arrays["cur_prc"][0] == 70000
+    assert np.isnan(arrays["cur_prc"][1])
+
+
+def test_to_arrays_rejects_ambiguous_raw_body():
+    pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError, match="항목 목록"):
+        to_arrays({"return_code": 0, "a": [], "b": []})
+
+
+def test_to_arrays_without_numpy_raises_import_error(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match="kiwoompy\\[numpy\\]"):
+        to_arrays([])
@@ -0,0 +1,142 @@
+"""도메인별 조회 클라이언트 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+import json
+import pkgutil
+import typing
+
+import httpx
+import pytest
+
+import kiwoompy.query
+from kiwoompy import AsyncKiwoomQuery, KiwoomQuery
+from kiwoompy.query.chart import ChartQuery
+
+pytestmark = pytest.mark.mock
+
+
+def _query_methods():
+    for info in pkgutil.iter_modules(kiwoompy.query.__path__):
+        if info.name == "_schema":
+            continue
+        module = importlib.import_module(f"kiwoompy.query.{info.name}")
+        for cls in vars(module).values():
+            if not inspect.isclass(cls) or cls.__module__ != module.__name__:
+                continue
+            for name, func in vars(cls).items():
+                if inspect.isfunction(func) and not name.startswith("__"):
+                    yield f"{cls.__qualname__}.{name}", func
+
+
+def test_query_method_annotations_resolve():
+    unresolved = {}
+    for name, func in _query_methods():
+        try:
+            typing.get_type_hints(func)
+        except NameError as exc:
+            unresolved[name] = str(exc)
+    assert unresolved == {}
+
+
+def test_iter_stock_min_chart_sends_request_body(make_api):
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={"return_code": 0, "stk_cd": "005930", "stk_min_pole_chart_qry": [{"cur_prc": "-70000"}]},
+        )
+
+    api = make_api(handler)
+    api.set_token("tok")
+    items = list(ChartQuery(api).iter_stock_min_chart("005930", "1", base_date="20250102"))
+
+    assert [item.cur_prc for item in items] == ["-70000"]
+    assert bodies == [
+        {"stk_cd": "005930", "tic_scope": "1", "upd_stkpc_tp": "1", "base_dt": "20250102"}
+    ]
+
+
+def test_raw_mode_returns_checked_body(make_api):
+    body = {"return_code": 0, "stk_cd": "005930", "stk_min_pole_chart_qry": [{"cur_prc": "-70000"}]}
+    api = make_api(lambda request: httpx.Response(200, json=body))
+    api.set_token("tok")
+
+    assert ChartQuery(api, raw=True).get_stock_min_chart("005930", "1") == body
+    assert ChartQuery(api, fields=["stk_cd"]).get_stock_min_chart("005930", "1") == {"stk_cd": "005930"}
+
+
+def test_raw_response_escapes_except_exception(make_api):
+    class SwallowingQuery(ChartQuery):
+        def get_first_price(self, stock_code: str) -> str | None:
+            try:
+                raw = self._post(self._CHART_PATH, {"stk_cd": stock_code}, self._headers("ka10080"))
+            except Exception:  # noqa: BLE001 — 원시 응답이 여기에 잡히지 않아야 한다
+                return None
+            return raw["stk_min_pole_chart_qry"][0]["cur_prc"]
+
+    body = {"return_code": 0, "stk_cd": "005930", "stk_min_pole_chart_qry": []}
+    api = make_api(lambda request: httpx.Response(200, json=body))
+    api.set_token("tok")
+
+    assert SwallowingQuery(api, raw=True).get_first_price("005930") == body
+
+
+_MIN_CHART = {"return_code": 0, "stk_cd": "005930", "stk_min_pole_chart_qry": [{"cur_prc": "-70000"}]}
+
+
+def _min_chart_pages(request: httpx.Request) -> httpx.Response:
+    """ka10080 응답 두 페이지. 첫 페이지는 ``cont-yn: Y``로 다음 페이지를 알린다."""
+    if request.headers.get("next-key") == "p2":
+        return httpx.Response(200, json={**_MIN_CHART, "stk_min_pole_chart_qry": [{"cur_prc": "-69900"}]})
+    return httpx.Response(200, json=_MIN_CHART, headers={"cont-yn": "Y", "next-key": "p2"})
+
+
+def test_async_query_matches_sync_query(make_api, make_async_api):
+    api = make_api(_min_chart_pages)
+    api.set_token("tok")
+    async_api = make_async_api(_min_chart_pages)
+    async_api.set_token("tok")
+
+    async def main():
+        query = AsyncKiwoomQuery(async_api)
+        flat = await query.get_stock_min_chart("005930", "1")
+        domain = await query.chart.get_stock_min_chart("005930", "1")
+        items = [item async for item in query.chart.iter_stock_min_chart("005930", "1")]
+        return flat, domain, items
+
+    flat, domain, items = asyncio.run(main())
+    sync = KiwoomQuery(api)
+
+    assert flat == domain == sync.get_stock_min_chart("005930", "1")
+    assert items == list(sync.chart.iter_stock_min_chart("005930", "1"))
+    assert [item.cur_prc for item in items] == ["-70000", "-69900"]
+
+
+def test_async_queries_run_concurrently(make_async_api):
+    active = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return httpx.Response(200, json=_MIN_CHART)
+
+    api = make_async_api(handler)
+    api.set_token("tok")
+    query = AsyncKiwoomQuery(api)
+
+    async def main():
+        return await asyncio.gather(*(query.get_stock_min_chart(code, "1") for code in ("005930", "000660", "035420")))
+
+    charts = asyncio.run(main())
+
+    assert len(charts) == 3
+    assert peak == 3
@@ -0,0 +1,399 @@
+"""실시간 WebSocket 클라이언트 — 이벤트 전달·큐·구독 관리 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+
+import pytest
+
+from kiwoompy import (
+    KiwoomApi,
+    KiwoomApiError,
+    KiwoomRealtime,
+    KiwoomRealtimePool,
+    RealtimeEvent,
+)
+from kiwoompy.realtime import _EventQueue
+
+pytestmark = pytest.mark.mock
+
+
+def _real(type: str, item: str, values: dict[str, str]) -> dict:
+    """``REAL`` 수신 메시지."""
+    return {"trnm": "REAL", "data": [{"type": type, "name": "", "item": item, "values": values}]}
+
+
+def test_event_keeps_received_values_and_parses_on_demand():
+    values = {"10": "+60700", "15": "-000123", "20": ""}
+
+    async def main():
+        rt = KiwoomRealtime(KiwoomApi(env="demo"))
+        latest = await rt.subscribe_latest("0B", ["005930"])
+        await rt._handle_message(_real("0B", "005930", values))
+        return latest.take()
+
+    [event] = asyncio.run(main())
+
+    assert event.values is values
+    assert event._numbers is None
+    assert event.price("10") == 60700
+    assert event.number("15") == -123
+    assert event.number("20") is None
+    assert event._numbers == {"10": 60700, "15": -123, "20": None}
+
+
+def _event(item: str, price: str = "+1", type: str = "0B") -> RealtimeEvent:
+    return RealtimeEvent(type, "", item, {"10": price})
+
+
+def test_block_queue_waits_for_space_and_loses_nothing():
+    async def main():
+        queue = _EventQueue(2, "block")
+        await queue.put(_event("A", "1"))
+        await queue.put(_event("A", "2"))
+        blocked = asyncio.create_task(queue.put(_event("A", "3")))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        first = await queue.get()
+        await asyncio.wait_for(blocked, 1)
+        return [first, *queue.drain()], queue.stats("cb")
+
+    events, stats = asyncio.run(main())
+
+    assert [e.values["10"] for e in events] == ["1", "2", "3"]
+    assert (stats.delivered, stats.dropped, stats.depth) == (3, 0, 0)
+
+
+def test_drop_oldest_queue_keeps_newest_events():
+    async def main():
+        queue = _EventQueue(2, "drop_oldest")
+        for price in "1234":
+            await queue.put(_event("A", price))
+        return queue.drain(), queue.stats("cb")
+
+    events, stats = asyncio.run(main())
+
+    assert [e.values["10"] for e in events] == ["3", "4"]
+    assert stats.dropped == 2
+
+
+@pytest.mark.parametrize(("maxsize", "overflow"), [(0, "block"), (10, "latest")])
+def test_event_queue_rejects_invalid_settings(maxsize, overflow):
+    with pytest.raises(ValueError):
+        _EventQueue(maxsize, overflow)
+
+
+def test_slow_subscriber_does_not_hold_back_others():
+    fast: list[str] = []
+    release = asyncio.Event()
+
+    async def slow_cb(event: RealtimeEvent) -> None:
+        await release.wait()
+
+    async def fast_cb(event: RealtimeEvent) -> None:
+        fast.append(event.values["10"])
+
+    async def main():
+        rt = KiwoomRealtime(KiwoomApi(env="demo"))
+        await rt.subscribe("0B", ["005930"], slow_cb, queue_size=2, overflow="drop_oldest")
+        await rt.subscribe("0B", ["005930"], fast_cb)
+        for price in "12345":
+            await rt._handle_message(_real("0B", "005930", {"10": price}))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        stats = {s.name: s for s in rt.subscriber_stats()}
+        release.set()
+        await rt.close()
+        return stats
+
+    stats = asyncio.run(main())
+
+    assert fast == list("12345")
+    slow = stats[slow_cb.__qualname__]
+    assert (slow.delivered, slow.depth, slow.dropped) == (1, 2, 2)
+
+
+def test_callback_errors_are_counted_and_delivery_continues():
+    seen: list[str] = []
+
+    async def flaky(event: RealtimeEvent) -> None:
+        seen.append(event.values["10"])
+        if event.values["10"] == "1":
+            raise RuntimeError("boom")
+
+    async def main():
+        rt = KiwoomRealtime(KiwoomApi(env="demo"))
+        await rt.subscribe("0B", ["005930"], flaky)
+        for price in "12":
+            await rt._handle_message(_real("0B", "005930", {"10": price}))
+        await asyncio.sleep(0.01)
+        [stats] = rt.subscriber_stats()
+        await rt.close()
+        return stats
+
+    stats = asyncio.run(main())
+
+    assert seen == ["1", "2"]
+    assert (stats.delivered, stats.errors) == (2, 1)
+
+
+def test_conflate_queue_keeps_latest_per_item_in_first_seen_order():
+    async def main():
+        queue = _EventQueue(2, "conflate")
+        await queue.put(_event("A", "1"))
+        await queue.put(_event("B", "1"))
+        await queue.put(_event("A", "2"))  # A 자리 유지, 값만 최신으로
+        first = queue.drain()
+        await queue.put(_event("A", "3"))
+        await queue.put(_event("B", "3"))
+        await queue.put(_event("C", "3"))  # 가득 참 — 가장 오래된 A를 버린다
+        return first, queue.drain(), queue.stats("cb")
+
+    first, second, stats = asyncio.run(main())
+
+    assert [(e.item, e.values["10"]) for e in first] == [("A", "2"), ("B", "1")]
+    assert [(e.item, e.values["10"]) for e in second] == [("B", "3"), ("C", "3")]
+    assert stats.dropped == 2
+
+
+def test_subscribe_latest_returns_changed_items_only():
+    async def main():
+        rt = KiwoomRealtime(KiwoomApi(env="demo"))
+        latest = await rt.subscribe_latest("0B", ["005930", "000660"])
+        for item, price in [("005930", "1"), ("000660", "1"), ("005930", "2")]:
+            await rt._handle_message(_real("0B", item, {"10": price}))
+        first = latest.take()
+        await rt._handle_message(_real("0B", "000660", {"10": "3"}))
+        second = await asyncio.wait_for(latest.wait(), 1)
+        return first, second, latest.take(), latest.stats()
+
+    first, second, third, stats = asyncio.run(main())
+
+    assert [(e.item, e.values["10"]) for e in first] == [("005930", "2"), ("000660", "1")]
+    assert [(e.item, e.values["10"]) for e in second] == [("000660", "3")]
+    assert third == []
+    assert (stats.delivered, stats.dropped) == (3, 1)
+
+
+def test_interval_subscription_delivers_latest_per_tick():
+    batches: list[list[str]] = []
+    batch: list[str] = []
+
+    async def on_event(event: RealtimeEvent) -> None:
+        batch.append(event.values["10"])
+
+    async def main():
+        rt = KiwoomRealtime(KiwoomApi(env="demo"))
+        await rt.subscribe("0B", ["005930"], on_event, interval=0.05)
+        await rt._handle_message(_real("0B", "005930", {"10": "1"}))
+        await asyncio.sleep(0.01)
+        batches.append(batch.copy())
+        for price in "234":
+            await rt._handle_message(_real("0B", "005930", {"10": price}))
+        await asyncio.sleep(0.1)
+        batches.append(batch.copy())
+        await rt.close()
+
+    asyncio.run(main())
+
+    assert batches == [["1"], ["1", "4"]]
+
+
+class _FakeWebSocket:
+    """보낸 메시지를 기록하는 WebSocket 대역."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+    async def close(self) -> None:
+        pass
+
+
+def _connected() -> tuple[KiwoomRealtime, _FakeWebSocket]:
+    rt = KiwoomRealtime(KiwoomApi(env="demo"))
+    ws = rt._ws = _FakeWebSocket()
+    return rt, ws
+
+
+def _sent(ws: _FakeWebSocket) -> list[tuple[str, str, list[str]]]:
+    """보낸 REG/REMOVE 메시지를 (trnm, type, items) 목록으로 바꾸고 기록을 비운다."""
+    sent = [(m["trnm"], d["type"][0], d["item"]) for m in ws.sent for d in m["data"]]
+    ws.sent.clear()
+    return sent
+
+
+def test_shared_items_are_registered_and_removed_once():
+    received: dict[str, list[str]] = {"a": [], "b": []}
+
+    async def cb_a(event: RealtimeEvent) -> None:
+        received["a"].append(event.item)
+
+    async def cb_b(event: RealtimeEvent) -> None:
+        received["b"].append(event.item)
+
+    async def main():
+        rt, ws = _connected()
+        await rt.subscribe("0B", ["005930", "000660"], cb_a)
+        await rt.subscribe("0B", ["005930", "035420"], cb_b)
+        await rt.subscribe("0B", ["005930"], cb_b)  # 중복 등록
+        registered = _sent(ws)
+
+        await rt.unsubscribe("0B", ["005930", "000660"], cb_a)
+        removed_a = _sent(ws)
+        for item in ("005930", "000660", "035420"):
+            await rt._handle_message(_real("0B", item, {}))
+        await asyncio.sleep(0.01)
+
+        await rt.unsubscribe("0B", callback=cb_b)
+        removed_b = _sent(ws)
+        state = (set(rt._subscriptions), len(rt._subscribers))
+        await rt.close()
+        return registered, removed_a, removed_b, state
+
+    registered, removed_a, removed_b, state = asyncio.run(main())
+
+    assert registered == [("REG", "0B", ["005930", "000660"]), ("REG", "0B", ["035420"])]
+    assert removed_a == [("REMOVE", "0B", ["000660"])]
+    assert received == {"a": [], "b": ["005930", "035420"]}
+    assert removed_b == [("REMOVE", "0B", ["005930", "035420"])]
+    assert state == (set(), 0)
+
+
+def test_account_events_route_to_empty_item_subscription():
+    async def main():
+        rt, _ = _connected()
+        latest = await rt.subscribe_latest("00", [""])
+        await rt._handle_message(_real("00", "8012345611", {"9203": "0001"}))
+        await rt._handle_message(_real("0B", "005930", {}))  # 구독하지 않은 타입
+        return latest.take()
+
+    [event] = asyncio.run(main())
+
+    assert (event.type, event.item) == ("00", "8012345611")
+
+
+def test_subscription_limit_leaves_state_unchanged():
+    async def cb(event: RealtimeEvent) -> None:
+        pass
+
+    async def main():
+        rt, ws = _connected()
+        await rt.subscribe("0B", [f"{n:06d}" for n in range(99)], cb)
+        ws.sent.clear()
+        with pytest.raises(KiwoomApiError):
+            await rt.subscribe("0D", ["000001", "000002"], cb)
+        state = (len(rt._subscriptions), rt._subscribers[cb].refs, ws.sent)
+        await rt.close()
+        return state
+
+    assert asyncio.run(main()) == (99, 99, [])
+
+
+@pytest.fixture
+def fake_connect(monkeypatch):
+    """``KiwoomRealtime.connect()``가 서버 대신 ``_FakeWebSocket``에 연결하게 한다."""
+
+    async def connect(self: KiwoomRealtime) -> None:
+        if self._ws is None:
+            self._ws = _FakeWebSocket()
+
+    monkeypatch.setattr(KiwoomRealtime, "connect", connect)
+
+
+def test_pool_shards_and_releases_subscriptions(fake_connect):
+    codes = [f"{n:06d}" for n in range(150)]
+
+    async def cb(event: RealtimeEvent) -> None:
+        pass
+
+    async def main():
+        pool = KiwoomRealtimePool(KiwoomApi(env="demo"), max_connections=2)
+        await pool.connect()
+        await pool.subscribe("0B", codes)
+        await pool.subscribe("0B", codes[120:], cb)  # 기존 담당 연결에 콜백만 추가
+        first, second = pool._members
+        sharded = (len(first._subscriptions), len(second._subscriptions), pool.connection_count)
+        second_ws = second._ws
+
+        with pytest.raises(KiwoomApiError):
+            await pool.subscribe("0D", codes[:51])
+        after_limit = (pool.subscription_count, pool.connection_count)
+
+        await pool.unsubscribe("0B", codes[100:], cb)
+        after_cb = (pool.subscription_count, pool.connection_count)
+        await pool.unsubscribe("0B", codes[100:])
+        after_all = (pool.subscription_count, pool.connection_count, pool._members == [first])
+        removed = [m for m in second_ws.sent if m["trnm"] == "REMOVE"]
+        return sharded, after_limit, after_cb, after_all, removed
+
+    sharded, after_limit, after_cb, after_all, removed = asyncio.run(main())
+
+    assert sharded == (100, 50, 2)
+    assert after_limit == (150, 2)
+    assert after_cb == (150, 2)  # events() 구독이 남아 있다
+    assert after_all == (100, 1, True)
+    assert [item for m in removed for d in m["data"] for item in d["item"]] == codes[100:]
+
+
+def test_pool_events_merge_all_connections(fake_connect):
+    codes = [f"{n:06d}" for n in range(101)]
+
+    async def main():
+        pool = KiwoomRealtimePool(KiwoomApi(env="demo"), max_connections=2)
+        await pool.connect()
+        await pool.subscribe("0B", codes)
+        received = []
+        async with contextlib.aclosing(pool.events()) as events:
+            reader = asyncio.create_task(anext(events))
+            await asyncio.sleep(0)
+            await pool._members[1]._handle_message(_real("0B", codes[100], {"10": "1"}))
+            received.append(await asyncio.wait_for(reader, 1))
+            await pool._members[0]._handle_message(_real("0B", codes[0], {"10": "2"}))
+            received.append(await asyncio.wait_for(anext(events), 1))
+        await pool.close()
+        return received, pool._streams
+
+    received, streams = asyncio.run(main())
+
+    assert [(e.item, e.values["10"]) for e in received] == [(codes[100], "1"), (codes[0], "2")]
+    assert streams == []
+
+
+def test_pool_rejected_subscribe_leaves_no_assignment():
+    async def cb(event: RealtimeEvent) -> None:
+        pass
+
+    async def main():
+        pool = KiwoomRealtimePool(KiwoomApi(env="demo"))
+        with pytest.raises(ValueError):
+            await pool.subscribe("0B", ["005930"], cb, interval=0)
+        return pool.subscription_count, [len(m._subscriptions) for m in pool._members]
+
+    assert asyncio.run(main()) == (0, [])
+
+
+def test_pool_rolls_back_new_connection_when_it_fails_to_open(monkeypatch, fake_connect):
+    codes = [f"{n:06d}" for n in range(110)]
+
+    async def main():
+        pool = KiwoomRealtimePool(KiwoomApi(env="demo"), max_connections=2)
+        await pool.connect()
+        await pool.subscribe("0B", codes[:100])
+
+        async def refuse(self: KiwoomRealtime) -> None:
+            if self._ws is None:
+                raise OSError("connection refused")
+
+        monkeypatch.setattr(KiwoomRealtime, "connect", refuse)
+        with pytest.raises(OSError):
+            await pool.subscribe("0B", codes[100:])
+        state = (pool.subscription_count, pool.connection_count)
+        await pool.close()
+        return state
+
+    assert asyncio.run(main()) == (100, 1)
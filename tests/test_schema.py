@@ -0,0 +1,135 @@
+"""TR 응답 스키마 레지스트리·디코더 테스트."""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import pkgutil
+from dataclasses import dataclass
+
+import pytest
+
+import kiwoompy.query
+from kiwoompy.models import StockDayChartItem
+from kiwoompy.query import _schema
+from kiwoompy.query._schema import TrSchema, get_schema, register
+
+pytestmark = pytest.mark.mock
+
+
+@dataclass(frozen=True, slots=True)
+class _One:
+    code: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Two:
+    code: str
+    name: str
+
+
+def _all_schemas() -> list[TrSchema]:
+    for module in pkgutil.iter_modules(kiwoompy.query.__path__):
+        importlib.import_module(f"kiwoompy.query.{module.name}")
+    return sorted(_schema._SCHEMAS.values(), key=lambda schema: schema.api_id)
+
+
+# ka10081(주식일봉차트조회) 응답 본문 — 서버가 보내는 키·값 형식 그대로
+_KA10081_BODY = {
+    "stk_cd": "005930",
+    "stk_dt_pole_chart_qry": [
+        {
+            "cur_prc": "70100",
+            "trde_qty": "9263135",
+            "trde_prica": "648525",
+            "dt": "20250908",
+            "open_pric": "69800",
+            "high_pric": "70500",
+            "low_pric": "69600",
+            "pred_pre": "+600",
+            "pred_pre_sig": "2",
+            "trde_tern_rt": "+0.16",
+        },
+        {
+            "cur_prc": "69500",
+            "trde_qty": "11526724",
+            "trde_prica": "804033",
+            "dt": "20250905",
+            "open_pric": "70300",
+            "high_pric": "70400",
+            "low_pric": "69500",
+            "pred_pre": "-800",
+            "pred_pre_sig": "5",
+            "trde_tern_rt": "+0.19",
+        },
+    ],
+    "return_code": 0,
+    "return_msg": "정상적으로 처리되었습니다",
+}
+
+
+def test_decode_recorded_day_chart_body():
+    importlib.import_module("kiwoompy.query.chart")
+
+    items = get_schema("ka10081").decode(_KA10081_BODY)
+
+    assert items == [
+        StockDayChartItem("70100", "9263135", "648525", "20250908", "69800", "70500", "69600", "+600", "2", "+0.16"),
+        StockDayChartItem("69500", "11526724", "804033", "20250905", "70300", "70400", "69500", "-800", "5", "+0.19"),
+    ]
+
+
+@pytest.mark.parametrize("schema", _all_schemas(), ids=lambda schema: schema.api_id)
+def test_every_registered_schema_round_trips(schema):
+    fields = [f.name for f in dataclasses.fields(schema.model)]
+    expected = schema.model(*(f"{name}-value" for name in fields))
+    item = {schema.renames.get(name, name): f"{name}-value" for name in fields}
+
+    assert schema.decode({schema.list_key: [item, {**item, "extra": "무시"}]}) == [expected, expected]
+
+
+@pytest.mark.parametrize(
+    ("model", "renames", "item", "expected"),
+    [
+        (_One, {}, {"code": "005930"}, _One("005930")),
+        (_Two, {}, {"code": "005930", "name": "삼성전자"}, _Two("005930", "삼성전자")),
+        (_Two, {"name": "stk_nm"}, {"code": "005930", "stk_nm": "삼성전자"}, _Two("005930", "삼성전자")),
+    ],
+    ids=["single-key", "multi-key", "renamed"],
+)
+def test_decoder_shapes_round_trip(model, renames, item, expected):
+    schema = TrSchema("zz0001", "/api/test", "list", model, renames)
+
+    assert schema.decode({"list": [item]}) == [expected]
+    assert schema.decode({"list": [item, {}]}) == [expected, model(*[""] * len(dataclasses.fields(model)))]
+
+
+def test_missing_keys_fall_back_to_empty_string():
+    schema = TrSchema("zz0001", "/api/test", "list", _Two, {"name": "stk_nm"})
+
+    items = schema.decode({"list": [{"code": "005930", "stk_nm": "삼성전자"}, {"code": "000660"}]})
+
+    assert items == [_Two("005930", "삼성전자"), _Two("000660", "")]
+
+
+def test_missing_list_key_decodes_to_empty_list():
+    schema = TrSchema("zz0001", "/api/test", "list", _Two)
+
+    assert schema.decode({"return_code": 0}) == []
+
+
+def test_rename_of_unknown_field_is_rejected():
+    with pytest.raises(ValueError, match="nm"):
+        TrSchema("zz0001", "/api/test", "list", _Two, {"nm": "stk_nm"})
+
+
+def test_duplicate_registration_is_rejected(monkeypatch):
+    monkeypatch.setattr(_schema, "_SCHEMAS", {})
+    first = TrSchema("zz0001", "/api/test", "list", _One)
+
+    with pytest.raises(ValueError, match="zz0001"):
+        register(first, TrSchema("zz0001", "/api/test", "other", _Two))
+    assert get_schema("zz0001") is None
+
+    assert register(first) == {"zz0001": first}
+    assert get_schema("zz0001") is first
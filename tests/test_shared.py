@@ -0,0 +1,160 @@
+"""프로세스 간 공유 저장소 테스트."""
+
+from __future__ import annotations
+
+import os
+import stat
+import time
+
+import pytest
+from conftest import token_body
+
+from kiwoompy import FileRateLimitStore, FileTokenStore, KiwoomClient
+from kiwoompy.api import KiwoomApi, TokenBucket
+from kiwoompy.models import TokenResponse
+
+pytestmark = pytest.mark.mock
+
+posix_only = pytest.mark.skipif(os.name == "nt", reason="POSIX 권한 비트")
+
+
+@posix_only
+def test_rate_limit_store_defaults_to_private_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    with FileRateLimitStore("12345678") as store:
+        assert store.path.parent == tmp_path / "kiwoompy"
+        assert "12345678" not in store.path.name
+        assert stat.S_IMODE(store.path.parent.stat().st_mode) == 0o700
+        assert stat.S_IMODE(store.path.stat().st_mode) == 0o600
+
+
+@posix_only
+def test_rate_limit_store_refuses_foreign_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "getuid", lambda: tmp_path.stat().st_uid + 1)
+
+    with pytest.raises(PermissionError):
+        FileRateLimitStore("12345678", tmp_path)
+
+
+def test_rate_limit_stores_with_same_key_share_one_budget(tmp_path):
+    with (
+        FileRateLimitStore("acct", tmp_path) as first,
+        FileRateLimitStore("acct", tmp_path) as second,
+        FileRateLimitStore("other", tmp_path) as other,
+    ):
+        assert first.reserve(interval=10.0, tolerance=0.0) == 0.0
+        assert 9.0 < second.reserve(interval=10.0, tolerance=0.0) <= 10.0
+        assert other.reserve(interval=10.0, tolerance=0.0) == 0.0
+
+
+def test_rate_limit_store_allows_burst_within_tolerance(tmp_path):
+    with FileRateLimitStore("acct", tmp_path) as store:
+        delays = [store.reserve(interval=10.0, tolerance=20.0) for _ in range(4)]
+
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] > 0
+
+
+def test_token_buckets_sharing_a_file_store_space_requests(tmp_path):
+    with FileRateLimitStore("acct", tmp_path) as a, FileRateLimitStore("acct", tmp_path) as b:
+        buckets = [TokenBucket(20.0, store=a), TokenBucket(20.0, store=b)]
+        started = time.monotonic()
+        for n in range(4):
+            buckets[n % 2].acquire()
+        elapsed = time.monotonic() - started
+
+    assert elapsed >= 3 * 0.05 * 0.9
+
+
+def _token(name: str = "tok") -> TokenResponse:
+    body = token_body(name)
+    return TokenResponse(token=body["token"], token_type=body["token_type"], expires_dt=body["expires_dt"])
+
+
+def test_token_store_round_trip_and_clear(tmp_path):
+    store = FileTokenStore(tmp_path)
+    token = _token()
+
+    assert store.load("real:app") is None
+    store.save("real:app", token)
+    assert store.load("real:app") == token
+    assert store.load("demo:app") is None
+    store.clear("real:app")
+    assert store.load("real:app") is None
+
+
+def test_token_store_save_replaces_file_atomically(tmp_path, monkeypatch):
+    store = FileTokenStore(tmp_path)
+    store.save("real:app", _token("old"))
+
+    def fail_replace(src, dst):
+        raise OSError("디스크 오류")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        store.save("real:app", _token("new"))
+    monkeypatch.undo()
+
+    assert store.load("real:app").token == "old"  # 쓰다 만 파일로 기존 토큰을 덮지 않는다
+    store.save("real:app", _token("new"))
+    assert store.load("real:app").token == "new"
+    assert sorted(p.suffix for p in tmp_path.iterdir() if p.suffix != ".tmp") == [".token"]
+
+
+def test_encrypted_token_store_round_trip(tmp_path):
+    pytest.importorskip("cryptography")
+    key = FileTokenStore.generate_key()
+    token = _token()
+
+    FileTokenStore(tmp_path, encryption_key=key).save("real:app", token)
+
+    (path,) = tmp_path.glob("*.token")
+    assert token.token.encode() not in path.read_bytes()
+    assert FileTokenStore(tmp_path, encryption_key=key).load("real:app") == token
+    assert FileTokenStore(tmp_path, encryption_key=FileTokenStore.generate_key()).load("real:app") is None
+    assert FileTokenStore(tmp_path).load("real:app") is None
+
+
+@posix_only
+def test_token_store_files_are_private(tmp_path):
+    directory = tmp_path / "tokens"
+    directory.mkdir(mode=0o775)
+    directory.chmod(0o775)  # 그룹 쓰기 가능
+
+    store = FileTokenStore(directory)
+    store.save("real:app", _token())
+
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+    for path in directory.iterdir():
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600, path.name
+
+
+@posix_only
+def test_token_store_refuses_foreign_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "getuid", lambda: tmp_path.stat().st_uid + 1)
+
+    with pytest.raises(PermissionError):
+        FileTokenStore(tmp_path)
+
+
+def test_client_token_cache_reuses_token_across_clients(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    posts = []
+
+    def post(self, path, body, headers=None, priority=None):
+        posts.append(path)
+        return token_body(f"tok-{len(posts)}")
+
+    monkeypatch.setattr(KiwoomApi, "post", post)
+
+    with KiwoomClient(env="demo", appkey="app", secretkey="secret", token_cache=True) as first:
+        pass
+    with KiwoomClient(env="demo", appkey="app", secretkey="secret", token_cache=True) as second:
+        assert second.api.token == first.api.token == "tok-1"
+    with KiwoomClient(env="demo", appkey="app", secretkey="secret") as uncached:
+        assert uncached.api.token == "tok-2"
+
+    assert posts == ["/oauth2/token", "/oauth2/token"]
+    assert list((tmp_path / "kiwoompy").glob("*.token"))